@@ -2,14 +2,14 @@ import os
 import re
 import time
 
-import bmesh
 import bpy
 from bpy.types import Operator
 
-from ..bmesh_operations.mesh_edit import bmesh_join
+from ..bmesh_operations.vertex_arrays import mesh_join
 from ..collider_shapes.add_bounding_primitive import OBJECT_OT_add_bounding_object, _remove_draw_handle
+from .job_scheduler import JobScheduler, default_max_jobs
 
-# How often the V-HACD subprocess is polled for completion while it's
+# How often the V-HACD subprocesses are polled for completion while they're
 # running. Polling (rather than Popen.wait()) is what keeps Blender's UI
 # thread responsive - see COACD_OT_convex_decomposition/#660, which this
 # mirrors: V-HACD ran synchronously the same way CoACD used to, and can take
@@ -21,11 +21,16 @@ from ..collider_shapes.add_bounding_primitive import OBJECT_OT_add_bounding_obje
 # check if it's done yet" poll alone would need.
 VHACD_POLL_INTERVAL_SECONDS = 1 / 60
 
+# Cores a single V-HACD process keeps busy. The number of concurrent jobs
+# defaults to the physical cores divided by this (see
+# preferences.auto_convex_max_jobs).
+VHACD_THREADS_PER_JOB = 1
+
 # V-HACD prints its own progress to stdout as e.g.
 # "[PERFORMING_DECOMPOSITION] : 50% : 0% : Performing recursive decomposition
 # of convex hulls", using '\r' between updates the way a terminal progress
-# bar would (see OBJECT_OT_add_bounding_object._launch_async_process()'s
-# reader, which splits on '\r' as well as '\n' for exactly this). Parsed by
+# bar would (see DecompositionJob.start() in job_scheduler.py, whose
+# reader splits on '\r' as well as '\n' for exactly this). Parsed by
 # _parse_progress_line() into a short status string for the shared overlay.
 _VHACD_PROGRESS_RE = re.compile(r'^\[(\S+)\s*\]\s*:\s*(\d+)%\s*:\s*(\d+)%\s*:\s*(.+)$')
 
@@ -78,21 +83,22 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         self.shape = 'convex_shape'
 
         # Async V-HACD job state, mirroring COACD_OT_convex_decomposition
-        # (#660). _async_process/_async_start_time are the generic names the
+        # (#660). _async_jobs/_async_start_time are the generic names the
         # shared status overlay (draw_async_job_overlay() in
         # add_bounding_primitive) looks for via getattr() - CoACD uses the
-        # same names so both backends drive the same overlay.
-        self._async_process = None
+        # same names so both backends drive the same overlay. _async_jobs is
+        # the JobScheduler running the V-HACD processes of the current run,
+        # None while no run is in flight.
+        self._async_jobs = None
         self._async_start_time = 0.0
         self._async_job_label = 'V-HACD'
         self._vhacd_exe = None
-        self._vhacd_data_path = None
-        self._vhacd_pending_jobs = []
-        self._vhacd_results = []
-        self._vhacd_job_ctx = None
+        # Results per job index, so the colliders are named and ordered the
+        # same no matter in which order the concurrent jobs finish.
+        self._vhacd_results = {}
         self._status_area = None
 
-        # bpy.app.timers callbacks (see _poll_vhacd_process()) have no
+        # bpy.app.timers callbacks (see _poll_vhacd_jobs()) have no
         # guaranteed context - see the identical note in
         # COACD_OT_convex_decomposition.__init__() for why this is captured
         # here and overridden into for every downstream async step.
@@ -108,8 +114,8 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         return super().invoke(context, event)
 
     def modal(self, context, event):
-        if self._async_process is not None:
-            # A V-HACD job is in flight: swallow all input except viewport
+        if self._async_jobs is not None:
+            # V-HACD jobs are in flight: swallow all input except viewport
             # navigation (still allowed so the user isn't locked out of
             # looking around while it runs) and cancel. Everything else -
             # including LEFTMOUSE/RET confirm - is intentionally ignored,
@@ -193,15 +199,16 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
                 meshes.append(new_mesh)
                 matrices.append(obj.matrix_world)
 
-        if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
+        if self.creation_mode[self.creation_mode_idx] == 'SELECTION' and meshes:
             convex_collision_data = {'parent': self.active_obj, 'mtx_world': self.active_obj.matrix_world.copy()}
-            bmeshes = [bmesh.new() for mesh in meshes]
-            for bm, mesh in zip(bmeshes, meshes):
-                bm.from_mesh(mesh)
-            joined_mesh = bmesh_join(bmeshes, matrices)
+            joined_mesh = mesh_join(meshes, matrices, name='joined_mesh')
+            for mesh in meshes:
+                bpy.data.meshes.remove(mesh)
             convex_collision_data['mesh'] = joined_mesh
             collider_data = [convex_collision_data]
 
+        collider_data = self.merge_duplicate_jobs(collider_data)
+
         bpy.ops.object.mode_set(mode='OBJECT')
         return collider_data
 
@@ -225,7 +232,7 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
         return obj_filename
 
-    def _parse_progress_line(self, line):
+    def _parse_progress_line(self, job, line):
         """Override of the base class hook (see _drain_async_progress()):
         V-HACD's stdout format - see _VHACD_PROGRESS_RE above."""
         m = _VHACD_PROGRESS_RE.match(line.strip())
@@ -233,22 +240,15 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             return None
         overall_pct = m.group(2)
         description = m.group(4).strip()
+        job.fraction = int(overall_pct) / 100
         return f'{description} {overall_pct}%'
 
-    def _start_next_vhacd_job(self, context):
-        """Pop the next collider off the queue and launch V-HACD on it
-        without blocking. If the queue is empty, the whole run is done."""
-        if not self._vhacd_pending_jobs:
-            self._finish_vhacd_run(context)
-            return
-
-        convex_collision_data = self._vhacd_pending_jobs.pop(0)
-        parent = convex_collision_data['parent']
-        mesh = convex_collision_data['mesh']
-        mtx_world = convex_collision_data['mtx_world']
-
-        obj_filename = self.export_mesh_for_vhacd(context, parent, mesh, self._vhacd_data_path)
-        export_time = time.time()
+    def _start_vhacd_job(self, context, job):
+        """Export the mesh of a queued job into the job's directory and launch
+        V-HACD on it without blocking (see JobScheduler.start_jobs())."""
+        parent = job.data['parent']
+        obj_filename = self.export_mesh_for_vhacd(context, parent, job.data['mesh'], job.directory)
+        job.data['obj_filename'] = obj_filename
 
         col_settings = context.scene.simple_collider
         prefs = self.prefs
@@ -265,48 +265,52 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         ]
 
         print('Running V-HACD...\n{}\n'.format(' '.join(cmd)))
-        print(f"Using data path for V-HACD: {self._vhacd_data_path}")
-
-        # No shell=True: V-HACD is launched directly (not via an intermediate
-        # cmd.exe/sh -c) so that killing this Popen on cancel actually kills
-        # the V-HACD process itself rather than leaving it running detached.
-        process = self._launch_async_process(cmd, self._vhacd_data_path)
-
-        self._async_process = process
-        self._vhacd_job_ctx = {
-            'parent': parent,
-            'mesh': mesh,
-            'mtx_world': mtx_world,
-            'obj_filename': obj_filename,
-            'export_time': export_time,
-        }
-        self._async_start_time = time.time()
-        bpy.app.timers.register(self._poll_vhacd_process, first_interval=VHACD_POLL_INTERVAL_SECONDS)
-
-    def _poll_vhacd_process(self):
-        """bpy.app.timers callback: check whether the current V-HACD
-        subprocess has finished, without blocking Blender's main thread.
-        Re-arms itself via its return value for as long as the process is
-        still running."""
+        print(f"Using data path for V-HACD: {job.directory}")
+
+        # V-HACD writes its output files to the working directory, which is
+        # the job's own directory.
+        job.start(cmd, threads=VHACD_THREADS_PER_JOB)
+
+    def _start_vhacd_jobs(self, context):
+        """Launch queued jobs until the configured number of V-HACD processes
+        is running. If nothing is left to run, the whole run is done: it's
+        finished and False returned."""
+        jobs = self._async_jobs
+        jobs.start_jobs(lambda job: self._start_vhacd_job(context, job))
+        if not jobs.is_idle():
+            return True
+
+        self._async_jobs = None
+        jobs.close()
+        self._finish_vhacd_run(context)
+        return False
+
+    def _poll_vhacd_jobs(self):
+        """bpy.app.timers callback: import the results of the V-HACD
+        subprocesses that have finished and start queued jobs in their place,
+        without blocking Blender's main thread. Re-arms itself via its return
+        value for as long as jobs are running."""
         global _vhacd_run_in_progress
         try:
-            process = self._async_process
-            if process is None:
+            jobs = self._async_jobs
+            if jobs is None:
                 return None
 
-            if process.poll() is None:
-                self._drain_async_progress()
-                if self._status_area is not None:
-                    self._status_area.tag_redraw()
-                return VHACD_POLL_INTERVAL_SECONDS
-
-            self._async_process = None
-
-            # bpy.context here has no guaranteed space_data - see the
-            # identical note in COACD_OT_convex_decomposition._poll_coacd_process().
-            with bpy.context.temp_override(window=self._invoke_window, area=self._invoke_area,
-                                           region=self._invoke_region):
-                self._handle_vhacd_job_finished(bpy.context)
+            finished = jobs.finished_jobs()
+            if finished:
+                # bpy.context here has no guaranteed space_data - see the
+                # identical note in COACD_OT_convex_decomposition._poll_coacd_jobs().
+                with bpy.context.temp_override(window=self._invoke_window, area=self._invoke_area,
+                                               region=self._invoke_region):
+                    for job in finished:
+                        self._handle_vhacd_job_finished(bpy.context, job)
+                    if not self._start_vhacd_jobs(bpy.context):
+                        return None
+
+            self._drain_async_progress()
+            if self._status_area is not None:
+                self._status_area.tag_redraw()
+            return VHACD_POLL_INTERVAL_SECONDS
         except ReferenceError:
             # operator has already finished/cancelled and its RNA was freed
             _vhacd_run_in_progress = False
@@ -319,22 +323,22 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             raise
         return None
 
-    def _collect_vhacd_output_files(self, obj_filename, export_time):
-        """Collect newly created OBJ files V-HACD wrote to the data path."""
-        dir_files = os.listdir(self._vhacd_data_path)
-        obj_list = []
-        for file in dir_files:
-            if file.endswith('.obj'):
-                obj_path = os.path.join(self._vhacd_data_path, file)
-                file_time = os.path.getmtime(obj_path)
-                if file_time > export_time:
-                    obj_list.append(obj_path)
+    @staticmethod
+    def collect_output_files(job_directory, obj_filename):
+        """
+        The OBJ files V-HACD wrote to the directory of a job.
 
+        Parameters:
+        job_directory (str): Directory V-HACD ran in, only used by this job.
+        obj_filename (str): The exported input mesh.
+
+        Returns:
+        list: Paths of the output files, sorted by name.
+        """
         # Exclude the input OBJ file and any variants (e.g., Cube000.obj)
         input_basename = os.path.splitext(os.path.basename(obj_filename))[0]
-        obj_list = [p for p in obj_list if not os.path.basename(p).startswith(input_basename)]
-
-        return obj_list
+        return [os.path.join(job_directory, file) for file in sorted(os.listdir(job_directory))
+                if file.endswith('.obj') and not file.startswith(input_basename)]
 
     def import_decomposed_meshes(self, obj_list):
         """Import the decomposed meshes from OBJ files."""
@@ -349,59 +353,48 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
         return imported
 
-    def _handle_vhacd_job_finished(self, context):
+    def _handle_vhacd_job_finished(self, context, job):
         """Called once the decomposition subprocess for one collider has
-        exited. Imports whatever V-HACD produced and moves on to the next
-        queued collider, or finishes the run if none are left."""
-        job = self._vhacd_job_ctx
-        parent = job['parent']
-        mesh = job['mesh']
-        mtx_world = job['mtx_world']
-        obj_filename = job['obj_filename']
-        export_time = job['export_time']
-
-        obj_list = self._collect_vhacd_output_files(obj_filename, export_time)
+        exited. Imports whatever V-HACD produced and removes the job's
+        directory."""
+        data = job.data
+
+        obj_list = self.collect_output_files(job.directory, data['obj_filename'])
         imported = self.import_decomposed_meshes(obj_list)
 
-        self._vhacd_results.append({'colliders': imported, 'parent': parent, 'mtx_world': mtx_world})
-        bpy.data.meshes.remove(mesh)
-        self._vhacd_job_ctx = None
-        self._start_next_vhacd_job(context)
+        results = [{'colliders': imported, 'parent': data['parent'], 'mtx_world': data['mtx_world']}]
+        results.extend(self.instance_results(data, imported))
+        self._vhacd_results[job.index] = results
+        bpy.data.meshes.remove(data['mesh'])
+        job.remove_directory()
 
     def _cancel_vhacd_job(self, context):
-        """Kill any in-flight V-HACD subprocess and drop all queued/partial
+        """Kill all in-flight V-HACD subprocesses and drop all queued/partial
         state for the current run. Called from modal()'s ESC/RIGHTMOUSE
         handling and from cancel()."""
         global _vhacd_run_in_progress
         _vhacd_run_in_progress = False
 
-        if self._async_process is not None:
-            try:
-                self._async_process.kill()
-                self._async_process.wait(timeout=5)
-            except Exception:
-                pass
-            self._async_process = None
-
-        if self._vhacd_job_ctx is not None:
-            mesh = self._vhacd_job_ctx.get('mesh')
-            if mesh is not None:
+        if self._async_jobs is not None:
+            for job in self._async_jobs.cancel():
                 try:
-                    bpy.data.meshes.remove(mesh)
+                    bpy.data.meshes.remove(job.data['mesh'])
                 except ReferenceError:
                     pass
-            self._vhacd_job_ctx = None
+            self._async_jobs = None
 
-        for result in self._vhacd_results:
-            self.remove_objects(result['colliders'])
+        for results in self._vhacd_results.values():
+            for result in results:
+                self.remove_objects(result['colliders'])
 
-        self._vhacd_pending_jobs = []
-        self._vhacd_results = []
+        self._vhacd_results = {}
 
     def postprocess_colliders(self, context, convex_decomposition_data):
         """Postprocess the imported colliders: naming, parenting, and final setup."""
         context.view_layer.objects.active = self.active_obj
 
+        colliders = []
+        parents = []
         for convex_collisions_data in convex_decomposition_data:
             convex_collision = convex_collisions_data['colliders']
             parent = convex_collisions_data['parent']
@@ -416,9 +409,11 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
                     self.apply_transform(new_collider, rotation=True, scale=True)
 
                 self.custom_set_parent(context, parent, new_collider)
-                collections = parent.users_collection
-                self.primitive_postprocessing(context, new_collider, collections)
-                self.new_colliders_list.append(new_collider)
+                colliders.append(new_collider)
+                parents.append(parent)
+
+        self.batch_postprocessing(context, colliders, parents)
+        self.new_colliders_list.extend(colliders)
 
     def _finish_vhacd_run(self, context):
         """Called once every queued collider has been decomposed. Mirrors
@@ -427,8 +422,9 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         global _vhacd_run_in_progress
         _vhacd_run_in_progress = False
 
-        self.postprocess_colliders(context, self._vhacd_results)
-        self._vhacd_results = []
+        results = [result for index in sorted(self._vhacd_results) for result in self._vhacd_results[index]]
+        self._vhacd_results = {}
+        self.postprocess_colliders(context, results)
 
         if len(self.new_colliders_list) < 1:
             self.report({'WARNING'}, 'No meshes to process!')
@@ -449,10 +445,10 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
     def execute(self, context):
         """Kick off convex decomposition for the current selection. Does not
-        block: it launches the first V-HACD job and returns immediately,
-        with _poll_vhacd_process() (via bpy.app.timers) driving the rest."""
+        block: it launches the first V-HACD jobs and returns immediately,
+        with _poll_vhacd_jobs() (via bpy.app.timers) driving the rest."""
         global _vhacd_run_in_progress
-        if self._async_process is not None:
+        if self._async_jobs is not None:
             # Already running (e.g. a hotkey re-triggered execute() while a
             # previous run is still in flight) - ignore rather than
             # overlapping a second subprocess run.
@@ -468,15 +464,21 @@ class VHACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             obj.select_set(False)
 
         self._vhacd_exe = vhacd_exe
-        self._vhacd_data_path = data_path
         self._status_area = context.area
         self._invoke_window = context.window
         self._invoke_area = context.area
         self._invoke_region = next((r for r in context.area.regions if r.type == 'WINDOW'), None)
-        self._vhacd_pending_jobs = self.preprocess_objects_and_collect_data(context)
-        self._vhacd_results = []
+        self._vhacd_results = {}
+
+        max_jobs = self.prefs.auto_convex_max_jobs or default_max_jobs(VHACD_THREADS_PER_JOB)
+        jobs = JobScheduler(data_path, 'simple_collider_vhacd_', max_jobs)
+        for convex_collision_data in self.preprocess_objects_and_collect_data(context):
+            jobs.submit(convex_collision_data)
 
         _vhacd_run_in_progress = True
-        self._start_next_vhacd_job(context)
+        self._async_jobs = jobs
+        self._async_start_time = time.time()
+        if self._start_vhacd_jobs(context):
+            bpy.app.timers.register(self._poll_vhacd_jobs, first_interval=VHACD_POLL_INTERVAL_SECONDS)
 
         return {'RUNNING_MODAL'}
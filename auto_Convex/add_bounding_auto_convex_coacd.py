@@ -2,14 +2,14 @@ import os
 import re
 import time
 
-import bmesh
 import bpy
 from bpy.types import Operator
 
-from ..bmesh_operations.mesh_edit import bmesh_join
+from ..bmesh_operations.vertex_arrays import mesh_join
 from ..collider_shapes.add_bounding_primitive import OBJECT_OT_add_bounding_object, _remove_draw_handle
+from .job_scheduler import JobScheduler, default_max_jobs
 
-# How often the CoACD subprocess is polled for completion while it's
+# How often the CoACD subprocesses are polled for completion while they're
 # running. Polling (rather than Popen.wait()) is what keeps Blender's UI
 # thread responsive - CoACD's own MCTS search can take anywhere from
 # fractions of a second to many minutes depending on mesh complexity, and
@@ -21,6 +21,12 @@ from ..collider_shapes.add_bounding_primitive import OBJECT_OT_add_bounding_obje
 # poll alone would need.
 COACD_POLL_INTERVAL_SECONDS = 1 / 60
 
+# Cores a single CoACD process keeps busy. The number of concurrent jobs
+# defaults to the physical cores divided by this (see
+# preferences.auto_convex_max_jobs); its OpenMP threads are limited to the
+# same number (see DecompositionJob.start()).
+COACD_THREADS_PER_JOB = 1
+
 # CoACD already prints its own progress to stdout - section headers like
 # " - Decomposition (MCTS)" and per-candidate "Processing [62.3%]" lines -
 # it just wasn't being read (the subprocess inherited the console instead
@@ -39,8 +45,9 @@ _COACD_PCT_RE = re.compile(r'Processing \[([\d.]+)%\]')
 # guard against exactly this: the user physically couldn't trigger the
 # operator a second time while the first call was still blocking. Now that
 # Blender stays responsive during a run, nothing else prevents overlapping
-# invocations - which would race on the same parent-name-derived temp
-# filenames (see _job_file_prefix()) and corrupt each other's output.
+# invocations - which would each fill every core with their own jobs (see
+# job_scheduler.py; their files can't clash, every run and job has its own
+# directory) and each try to finalize the same selection.
 _coacd_run_in_progress = False
 
 
@@ -89,15 +96,17 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         # with no progress feedback and no way to cancel - for as long as
         # the CLI took, which for non-trivial/non-manifold real-world meshes
         # can be many minutes even with default settings. See
-        # _start_next_coacd_job()/_poll_coacd_process() below: the CLI is
-        # now driven from bpy.app.timers, one polled step at a time, the
-        # same pattern already used for the debounce timers above.
+        # _start_coacd_jobs()/_poll_coacd_jobs() below: the CLI is now
+        # driven from bpy.app.timers, one polled step at a time, the same
+        # pattern already used for the debounce timers above.
         #
-        # _async_process/_async_start_time are the generic names the shared
+        # _async_jobs/_async_start_time are the generic names the shared
         # status overlay (draw_async_job_overlay() in add_bounding_primitive)
         # looks for via getattr() - VHACD_OT_convex_decomposition uses the
-        # same names so both backends drive the same overlay.
-        self._async_process = None
+        # same names so both backends drive the same overlay. _async_jobs is
+        # the JobScheduler running the CoACD processes of the current run,
+        # None while no run is in flight.
+        self._async_jobs = None
         self._async_start_time = 0.0
         self._async_job_label = 'CoACD'
         # CoACD's MCTS search is much slower than V-HACD on non-trivial
@@ -105,26 +114,16 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         # multi-minute run doesn't read as hung.
         self._async_hint_text = 'This can take a few minutes for complex meshes'
         self._coacd_exe = None
-        self._coacd_data_path = None
-        self._coacd_pending_jobs = []
-        self._coacd_results = []
-        self._coacd_stage = None  # 'decompose' | 'decimate'
-        self._coacd_job_ctx = None
-        self._coacd_decimate_ctx = None
-        self._coacd_hull_queue = []
-        self._coacd_decimated_hulls = []
-        self._coacd_hull_index = 0
+        # Results per decomposition job index, so the colliders are named
+        # and ordered the same no matter in which order the concurrent jobs
+        # finish.
+        self._coacd_results = {}
+        # Decomposed colliders whose hulls are still being decimated, per
+        # decomposition job index (see _submit_decimate_jobs()).
+        self._coacd_decimating = {}
         self._status_area = None
-        self._coacd_run_id = None
-
-        # Live progress, parsed from the running subprocess's stdout via
-        # _parse_progress_line() (see OBJECT_OT_add_bounding_object -
-        # _launch_async_process()/_drain_async_progress()) and the module
-        # docstring on _COACD_PHASE_RE above.
-        self._coacd_progress_phase = ''
-        self._coacd_progress_pct = ''
 
-        # bpy.app.timers callbacks (see _poll_coacd_process()) have no
+        # bpy.app.timers callbacks (see _poll_coacd_jobs()) have no
         # guaranteed context - bpy.context.space_data is None (or belongs to
         # whatever editor the mouse happens to be over) unless the pointer
         # is currently over this operator's own VIEW_3D, which is unlikely
@@ -147,8 +146,8 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         return super().invoke(context, event)
 
     def modal(self, context, event):
-        if self._async_process is not None:
-            # A CoACD job is in flight: swallow all input except viewport
+        if self._async_jobs is not None:
+            # CoACD jobs are in flight: swallow all input except viewport
             # navigation (still allowed so the user isn't locked out of
             # looking around while it runs) and cancel. Everything else -
             # including LEFTMOUSE/RET confirm - is intentionally ignored,
@@ -232,15 +231,16 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
                 meshes.append(new_mesh)
                 matrices.append(obj.matrix_world)
 
-        if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
+        if self.creation_mode[self.creation_mode_idx] == 'SELECTION' and meshes:
             convex_collision_data = {'parent': self.active_obj, 'mtx_world': self.active_obj.matrix_world.copy()}
-            bmeshes = [bmesh.new() for mesh in meshes]
-            for bm, mesh in zip(bmeshes, meshes):
-                bm.from_mesh(mesh)
-            joined_mesh = bmesh_join(bmeshes, matrices)
+            joined_mesh = mesh_join(meshes, matrices, name='joined_mesh')
+            for mesh in meshes:
+                bpy.data.meshes.remove(mesh)
             convex_collision_data['mesh'] = joined_mesh
             collider_data = [convex_collision_data]
 
+        collider_data = self.merge_duplicate_jobs(collider_data)
+
         bpy.ops.object.mode_set(mode='OBJECT')
         return collider_data
 
@@ -249,13 +249,8 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         joined_obj = bpy.data.objects.new('debug_joined_mesh', mesh.copy())
         context.scene.collection.objects.link(joined_obj)
 
-        # _coacd_run_id makes this filename unique per run (see execute()):
-        # belt-and-suspenders against the _coacd_run_in_progress guard above
-        # missing some edge case and two runs sharing the same data_path
-        # ever overlapping - without it, two runs on a similarly-named
-        # object would silently clobber each other's export/output files.
         filename = ''.join(c for c in parent.name if c.isalnum() or c in (' ', '.', '_')).rstrip()
-        obj_filename = os.path.join(data_path, f'{filename}_{self._coacd_run_id}.obj')
+        obj_filename = os.path.join(data_path, f'{filename}.obj')
 
         print(f'\nExporting mesh for CoACD: {obj_filename}...')
 
@@ -269,41 +264,39 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
         return obj_filename
 
-    def _parse_progress_line(self, line):
+    def _parse_progress_line(self, job, line):
         """Override of the base class hook (see _drain_async_progress()):
-        CoACD's stdout format - see _COACD_PHASE_RE / _COACD_PCT_RE above."""
+        CoACD's stdout format - see _COACD_PHASE_RE / _COACD_PCT_RE above.
+        The percentage is the one of the current phase only, so it doesn't
+        set job.fraction."""
         m = _COACD_PHASE_RE.search(line)
         if m:
-            self._coacd_progress_phase = m.group(1).strip()
-            self._coacd_progress_pct = ''  # new phase - stale % no longer applies
-            return self._coacd_progress_phase
+            # new phase - stale % no longer applies
+            job.data['progress_phase'] = m.group(1).strip()
+            return job.data['progress_phase']
         m = _COACD_PCT_RE.search(line)
         if m:
-            self._coacd_progress_pct = f'{m.group(1)}%'
-            parts = [p for p in (self._coacd_progress_phase, self._coacd_progress_pct) if p]
+            parts = [p for p in (job.data.get('progress_phase', ''), f'{m.group(1)}%') if p]
             return ' '.join(parts)
         return None
 
-    def _start_next_coacd_job(self, context):
-        """Pop the next collider off the queue and launch CoACD on it
-        without blocking. If the queue is empty, the whole run is done."""
-        if not self._coacd_pending_jobs:
-            self._finish_coacd_run(context)
+    def _start_coacd_job(self, context, job):
+        """Export the mesh of a queued job into the job's directory and launch
+        CoACD (or, for a decimate job, CoACD's decimation of one hull) on it
+        without blocking (see JobScheduler.start_jobs())."""
+        if job.data['stage'] == 'decimate':
+            self._start_decimate_job(context, job)
             return
 
-        convex_collision_data = self._coacd_pending_jobs.pop(0)
-        parent = convex_collision_data['parent']
-        mesh = convex_collision_data['mesh']
-        mtx_world = convex_collision_data['mtx_world']
-
-        obj_filename = self.export_mesh_for_coacd(context, parent, mesh, self._coacd_data_path)
+        obj_filename = self.export_mesh_for_coacd(context, job.data['parent'], job.data['mesh'], job.directory)
 
         col_settings = context.scene.simple_collider
         prefs = self.prefs
 
         basename = os.path.splitext(os.path.basename(obj_filename))[0]
-        output_filename = os.path.join(self._coacd_data_path, f'{basename}_coacd.obj')
-        remesh_filename = os.path.join(self._coacd_data_path, f'{basename}_coacd_remesh.obj')
+        output_filename = job.path(f'{basename}_coacd.obj')
+        remesh_filename = job.path(f'{basename}_coacd_remesh.obj')
+        job.data['output_filename'] = output_filename
 
         cmd = [
             self._coacd_exe, '-i', obj_filename, '-o', output_filename, '-ro', remesh_filename,
@@ -316,64 +309,66 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         # -d/-dt is intentionally never combined with manifold preprocessing here: the CoACD 1.0.11
         # CLI silently produces an empty output when both are active on the same pass (preprocess
         # collapses to 0 points). Hull vertex limiting is instead applied afterwards, per-hull, via
-        # the decimate stage below, where -pm off is safe because each hull is already convex/manifold.
+        # the decimate jobs below, where -pm off is safe because each hull is already convex/manifold.
         if prefs.coacd_noMerge:
             cmd.append('-nm')
         if prefs.coacd_pca:
             cmd.append('--pca')
 
         print('Running CoACD...\n{}\n'.format(' '.join(cmd)))
-        print(f"Using data path for CoACD: {self._coacd_data_path}")
-
-        # No shell=True: CoACD is launched directly (not via an intermediate
-        # cmd.exe/sh -c) so that killing this Popen on cancel actually kills
-        # the CoACD process itself rather than leaving it running detached.
-        process = self._launch_async_process(cmd, self._coacd_data_path)
-
-        self._async_process = process
-        self._coacd_stage = 'decompose'
-        self._coacd_job_ctx = {
-            'parent': parent,
-            'mesh': mesh,
-            'mtx_world': mtx_world,
-            'output_filename': output_filename,
-        }
-        self._async_start_time = time.time()
-        bpy.app.timers.register(self._poll_coacd_process, first_interval=COACD_POLL_INTERVAL_SECONDS)
-
-    def _poll_coacd_process(self):
-        """bpy.app.timers callback: check whether the current CoACD/decimate
-        subprocess has finished, without blocking Blender's main thread.
-        Re-arms itself via its return value for as long as the process is
-        still running."""
+        print(f"Using data path for CoACD: {job.directory}")
+
+        job.start(cmd, threads=COACD_THREADS_PER_JOB)
+
+    def _start_coacd_jobs(self, context):
+        """Launch queued jobs until the configured number of CoACD processes
+        is running. If nothing is left to run, the whole run is done: it's
+        finished and False returned."""
+        jobs = self._async_jobs
+        jobs.start_jobs(lambda job: self._start_coacd_job(context, job))
+        if not jobs.is_idle():
+            return True
+
+        self._async_jobs = None
+        jobs.close()
+        self._finish_coacd_run(context)
+        return False
+
+    def _poll_coacd_jobs(self):
+        """bpy.app.timers callback: handle the CoACD/decimate subprocesses
+        that have finished and start queued jobs in their place, without
+        blocking Blender's main thread. Re-arms itself via its return value
+        for as long as jobs are running."""
         global _coacd_run_in_progress
         try:
-            process = self._async_process
-            if process is None:
+            jobs = self._async_jobs
+            if jobs is None:
                 return None
 
-            if process.poll() is None:
-                self._drain_async_progress()
-                if self._status_area is not None:
-                    self._status_area.tag_redraw()
-                return COACD_POLL_INTERVAL_SECONDS
-
-            self._async_process = None
-
-            # bpy.context here has no guaranteed space_data - it reflects
-            # whatever the mouse happens to be over (or nothing) at the
-            # moment this timer fires, not this operator's own viewport.
-            # postprocess_colliders() -> primitive_postprocessing() needs a
-            # real VIEW_3D context (context.space_data.shading), so override
-            # into the window/area/region captured back in execute() rather
-            # than trusting ambient context.
-            with bpy.context.temp_override(window=self._invoke_window, area=self._invoke_area,
-                                           region=self._invoke_region):
-                context = bpy.context
-                if self._coacd_stage == 'decompose':
-                    self._handle_decompose_finished(context)
-                else:
-                    self._handle_decimate_finished(context)
+            finished = jobs.finished_jobs()
+            if finished:
+                # bpy.context here has no guaranteed space_data - it reflects
+                # whatever the mouse happens to be over (or nothing) at the
+                # moment this timer fires, not this operator's own viewport.
+                # postprocess_colliders() -> primitive_postprocessing() needs a
+                # real VIEW_3D context (context.space_data.shading), so override
+                # into the window/area/region captured back in execute() rather
+                # than trusting ambient context.
+                with bpy.context.temp_override(window=self._invoke_window, area=self._invoke_area,
+                                               region=self._invoke_region):
+                    context = bpy.context
+                    for job in finished:
+                        if job.data['stage'] == 'decompose':
+                            self._handle_decompose_finished(context, job)
+                        else:
+                            self._handle_decimate_finished(context, job)
+                    if not self._start_coacd_jobs(context):
+                        return None
+
+            self._drain_async_progress()
+            if self._status_area is not None:
+                self._status_area.tag_redraw()
+            return COACD_POLL_INTERVAL_SECONDS
         except ReferenceError:
             # operator has already finished/cancelled and its RNA was freed
             _coacd_run_in_progress = False
@@ -399,73 +394,62 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
         return imported
 
-    def _handle_decompose_finished(self, context):
+    def _add_coacd_result(self, index, data, colliders):
+        """Store the colliders of a finished decomposition job (and its
+        instances) and free its mesh."""
+        results = [{'colliders': colliders, 'parent': data['parent'], 'mtx_world': data['mtx_world']}]
+        results.extend(self.instance_results(data, colliders))
+        self._coacd_results[index] = results
+        bpy.data.meshes.remove(data['mesh'])
+
+    def _handle_decompose_finished(self, context, job):
         """Called once the main decomposition subprocess for one collider
-        has exited. Imports the result (if any) and either kicks off the
-        per-hull decimate pass or finalizes this collider's job."""
-        job = self._coacd_job_ctx
-        output_filename = job['output_filename']
-        parent = job['parent']
-        mesh = job['mesh']
-        mtx_world = job['mtx_world']
+        has exited. Imports the result (if any) and either queues the
+        per-hull decimate jobs or finalizes this collider's job."""
+        data = job.data
+        output_filename = data['output_filename']
 
         if not os.path.isfile(output_filename) or os.path.getsize(output_filename) == 0:
-            self.report({'WARNING'}, f'CoACD failed to generate colliders for {parent.name}')
-            bpy.data.meshes.remove(mesh)
-            self._coacd_job_ctx = None
-            self._start_next_coacd_job(context)
+            self.report({'WARNING'}, f"CoACD failed to generate colliders for {data['parent'].name}")
+            bpy.data.meshes.remove(data['mesh'])
+            job.remove_directory()
             return
 
         imported = self.import_decomposed_meshes(output_filename)
+        job.remove_directory()
 
-        if context.scene.simple_collider.coacd_decimate:
-            self._coacd_hull_queue = list(imported)
-            self._coacd_decimated_hulls = []
-            self._coacd_hull_index = 0
-            self._start_next_decimate_hull(context)
+        if context.scene.simple_collider.coacd_decimate and imported:
+            self._submit_decimate_jobs(job.index, data, imported)
         else:
-            self._coacd_results.append({'colliders': imported, 'parent': parent, 'mtx_world': mtx_world})
-            bpy.data.meshes.remove(mesh)
-            self._coacd_job_ctx = None
-            self._start_next_coacd_job(context)
-
-    def _start_next_decimate_hull(self, context):
-        """Limit the vertex count of each convex hull individually, one hull
-        at a time, without blocking. CoACD's own -d/-dt decimation is run
-        here as a second, per-hull pass instead of alongside the main
-        decomposition: feeding it a fresh manifold single-hull mesh with
-        preprocessing forced off avoids the empty-output bug noted in
-        _start_next_coacd_job(), and (unlike feeding it the combined
-        multi-hull file) doesn't crash the CLI."""
-        if not self._coacd_hull_queue:
-            job = self._coacd_job_ctx
-            self._coacd_results.append({
-                'colliders': self._coacd_decimated_hulls,
-                'parent': job['parent'],
-                'mtx_world': job['mtx_world'],
-            })
-            bpy.data.meshes.remove(job['mesh'])
-            self._coacd_job_ctx = None
-            self._coacd_decimated_hulls = []
-            self._start_next_coacd_job(context)
-            return
-
+            self._add_coacd_result(job.index, data, imported)
+
+    def _submit_decimate_jobs(self, index, data, hulls):
+        """Queue one job per convex hull that limits its vertex count. CoACD's
+        own -d/-dt decimation is run as a second, per-hull pass instead of
+        alongside the main decomposition: feeding it a fresh manifold
+        single-hull mesh with preprocessing forced off avoids the empty-output
+        bug noted in _start_coacd_job(), and (unlike feeding it the combined
+        multi-hull file) doesn't crash the CLI. The hulls of a collider are
+        decimated concurrently like any other job."""
+        owner = {'data': data, 'hulls': [[hull] for hull in hulls], 'remaining': len(hulls)}
+        self._coacd_decimating[index] = owner
+        for slot, hull in enumerate(hulls):
+            self._async_jobs.submit({'stage': 'decimate', 'index': index, 'slot': slot, 'hull_obj': hull})
+
+    def _start_decimate_job(self, context, job):
+        """Export the hull of a decimate job into the job's directory and
+        launch CoACD's decimation of it without blocking."""
         col_settings = context.scene.simple_collider
-        hull_obj = self._coacd_hull_queue.pop(0)
+        hull_obj = job.data['hull_obj']
 
         for ob in context.selected_objects:
             ob.select_set(False)
         hull_obj.select_set(True)
         context.view_layer.objects.active = hull_obj
 
-        i = self._coacd_hull_index
-        self._coacd_hull_index += 1
-
-        basename = ''.join(c for c in hull_obj.name if c.isalnum() or c in (' ', '.', '_')).rstrip()
-        hull_filename = os.path.join(self._coacd_data_path, f'{basename}_{self._coacd_run_id}_hull_{i}.obj')
-        decimated_filename = os.path.join(self._coacd_data_path, f'{basename}_{self._coacd_run_id}_hull_{i}_dec.obj')
-        remesh_filename = os.path.join(self._coacd_data_path,
-                                       f'{basename}_{self._coacd_run_id}_hull_{i}_dec_remesh.obj')
+        hull_filename = job.path('hull.obj')
+        decimated_filename = job.path('hull_dec.obj')
+        remesh_filename = job.path('hull_dec_remesh.obj')
 
         bpy.ops.wm.obj_export(filepath=hull_filename, check_existing=False, export_selected_objects=True,
                               export_materials=False, export_uv=False, export_normals=False,
@@ -476,28 +460,15 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             '-t', str(col_settings.coacd_threshold), '-c', '-1', '-pm', 'off',
             '-d', '-dt', str(col_settings.coacd_maxHullVertCount),
         ]
-        process = self._launch_async_process(cmd, self._coacd_data_path)
+        job.start(cmd, threads=COACD_THREADS_PER_JOB)
 
         hull_obj.select_set(False)
 
-        self._async_process = process
-        self._coacd_stage = 'decimate'
-        self._coacd_decimate_ctx = {
-            'hull_obj': hull_obj,
-            'hull_filename': hull_filename,
-            'decimated_filename': decimated_filename,
-            'remesh_filename': remesh_filename,
-        }
-        self._async_start_time = time.time()
-        bpy.app.timers.register(self._poll_coacd_process, first_interval=COACD_POLL_INTERVAL_SECONDS)
-
-    def _handle_decimate_finished(self, context):
-        """Called once a single hull's decimate subprocess has exited."""
-        d = self._coacd_decimate_ctx
-        hull_obj = d['hull_obj']
-        hull_filename = d['hull_filename']
-        decimated_filename = d['decimated_filename']
-        remesh_filename = d['remesh_filename']
+    def _handle_decimate_finished(self, context, job):
+        """Called once a single hull's decimate subprocess has exited. The
+        collider is done once all its hulls are."""
+        hull_obj = job.data['hull_obj']
+        decimated_filename = job.path('hull_dec.obj')
 
         if os.path.isfile(decimated_filename) and os.path.getsize(decimated_filename) > 0:
             bpy.data.objects.remove(hull_obj)
@@ -505,63 +476,56 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             new_hulls = context.selected_objects[:]
             for ob in new_hulls:
                 ob.select_set(False)
-            self._coacd_decimated_hulls.extend(new_hulls)
         else:
             self.report({'WARNING'}, f'CoACD hull decimation failed for {hull_obj.name}, keeping original hull')
-            self._coacd_decimated_hulls.append(hull_obj)
-
-        for f in (hull_filename, decimated_filename, remesh_filename):
-            if os.path.isfile(f):
-                os.remove(f)
+            new_hulls = [hull_obj]
+        job.remove_directory()
 
-        self._coacd_decimate_ctx = None
-        self._start_next_decimate_hull(context)
+        index = job.data['index']
+        owner = self._coacd_decimating[index]
+        owner['hulls'][job.data['slot']] = new_hulls
+        owner['remaining'] -= 1
+        if owner['remaining'] == 0:
+            del self._coacd_decimating[index]
+            self._add_coacd_result(index, owner['data'], [hull for hulls in owner['hulls'] for hull in hulls])
 
     def _cancel_coacd_job(self, context):
-        """Kill any in-flight CoACD subprocess and drop all queued/partial
+        """Kill all in-flight CoACD subprocesses and drop all queued/partial
         state for the current run. Called from modal()'s ESC/RIGHTMOUSE
         handling and from cancel()."""
         global _coacd_run_in_progress
         _coacd_run_in_progress = False
 
-        if self._async_process is not None:
+        if self._async_jobs is not None:
+            for job in self._async_jobs.cancel():
+                if job.data['stage'] == 'decompose':
+                    try:
+                        bpy.data.meshes.remove(job.data['mesh'])
+                    except ReferenceError:
+                        pass
+            self._async_jobs = None
+
+        # Hulls still waiting for (or in) their decimate job, or already
+        # decimated, of colliders that aren't complete yet.
+        for owner in self._coacd_decimating.values():
+            self.remove_objects([hull for hulls in owner['hulls'] for hull in hulls])
             try:
-                self._async_process.kill()
-                self._async_process.wait(timeout=5)
-            except Exception:
+                bpy.data.meshes.remove(owner['data']['mesh'])
+            except ReferenceError:
                 pass
-            self._async_process = None
-
-        if self._coacd_job_ctx is not None:
-            mesh = self._coacd_job_ctx.get('mesh')
-            if mesh is not None:
-                try:
-                    bpy.data.meshes.remove(mesh)
-                except ReferenceError:
-                    pass
-            self._coacd_job_ctx = None
-
-        if self._coacd_decimate_ctx is not None:
-            hull_obj = self._coacd_decimate_ctx.get('hull_obj')
-            if hull_obj is not None:
-                self.remove_objects([hull_obj])
-            self._coacd_decimate_ctx = None
-
-        self.remove_objects(self._coacd_hull_queue)
-        self.remove_objects(self._coacd_decimated_hulls)
-        for result in self._coacd_results:
-            self.remove_objects(result['colliders'])
-
-        self._coacd_pending_jobs = []
-        self._coacd_results = []
-        self._coacd_hull_queue = []
-        self._coacd_decimated_hulls = []
-        self._coacd_stage = None
+        for results in self._coacd_results.values():
+            for result in results:
+                self.remove_objects(result['colliders'])
+
+        self._coacd_results = {}
+        self._coacd_decimating = {}
 
     def postprocess_colliders(self, context, convex_decomposition_data):
         """Postprocess the imported colliders: naming, parenting, and final setup."""
         context.view_layer.objects.active = self.active_obj
 
+        colliders = []
+        parents = []
         for convex_collisions_data in convex_decomposition_data:
             convex_collision = convex_collisions_data['colliders']
             parent = convex_collisions_data['parent']
@@ -576,9 +540,11 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
                     self.apply_transform(new_collider, rotation=True, scale=True)
 
                 self.custom_set_parent(context, parent, new_collider)
-                collections = parent.users_collection
-                self.primitive_postprocessing(context, new_collider, collections)
-                self.new_colliders_list.append(new_collider)
+                colliders.append(new_collider)
+                parents.append(parent)
+
+        self.batch_postprocessing(context, colliders, parents)
+        self.new_colliders_list.extend(colliders)
 
     def _finish_coacd_run(self, context):
         """Called once every queued collider has been decomposed (and
@@ -587,8 +553,9 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
         global _coacd_run_in_progress
         _coacd_run_in_progress = False
 
-        self.postprocess_colliders(context, self._coacd_results)
-        self._coacd_results = []
+        results = [result for index in sorted(self._coacd_results) for result in self._coacd_results[index]]
+        self._coacd_results = {}
+        self.postprocess_colliders(context, results)
 
         if len(self.new_colliders_list) < 1:
             self.report({'WARNING'}, 'No meshes to process!')
@@ -609,10 +576,10 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
 
     def execute(self, context):
         """Kick off convex decomposition for the current selection. Does not
-        block: it launches the first CoACD job and returns immediately,
-        with _poll_coacd_process() (via bpy.app.timers) driving the rest."""
+        block: it launches the first CoACD jobs and returns immediately,
+        with _poll_coacd_jobs() (via bpy.app.timers) driving the rest."""
         global _coacd_run_in_progress
-        if self._async_process is not None:
+        if self._async_jobs is not None:
             # Already running (e.g. a hotkey re-triggered execute() while a
             # previous run is still in flight) - ignore rather than
             # overlapping a second subprocess run.
@@ -628,16 +595,23 @@ class COACD_OT_convex_decomposition(OBJECT_OT_add_bounding_object, Operator):
             obj.select_set(False)
 
         self._coacd_exe = coacd_exe
-        self._coacd_data_path = data_path
         self._status_area = context.area
         self._invoke_window = context.window
         self._invoke_area = context.area
         self._invoke_region = next((r for r in context.area.regions if r.type == 'WINDOW'), None)
-        self._coacd_run_id = str(id(self))
-        self._coacd_pending_jobs = self.preprocess_objects_and_collect_data(context)
-        self._coacd_results = []
+        self._coacd_results = {}
+        self._coacd_decimating = {}
+
+        max_jobs = self.prefs.auto_convex_max_jobs or default_max_jobs(COACD_THREADS_PER_JOB)
+        jobs = JobScheduler(data_path, 'simple_collider_coacd_', max_jobs)
+        for convex_collision_data in self.preprocess_objects_and_collect_data(context):
+            convex_collision_data['stage'] = 'decompose'
+            jobs.submit(convex_collision_data)
 
         _coacd_run_in_progress = True
-        self._start_next_coacd_job(context)
+        self._async_jobs = jobs
+        self._async_start_time = time.time()
+        if self._start_coacd_jobs(context):
+            bpy.app.timers.register(self._poll_coacd_jobs, first_interval=COACD_POLL_INTERVAL_SECONDS)
 
         return {'RUNNING_MODAL'}
@@ -0,0 +1,228 @@
+"""Run the external decomposition processes of an Auto Convex run (V-HACD,
+CoACD) concurrently instead of one after another.
+
+Every job gets its own working directory below a per-run directory in the
+temporary data path, so its input and output files can use fixed names and
+the results of concurrent jobs (or runs) can't be mixed up. No bpy in here:
+the operators export the meshes, build the command lines and import the
+results, the scheduler only decides when a job starts and tracks its process.
+"""
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
+
+
+def physical_core_count():
+    """
+    Number of physical CPU cores. Hyper-threads don't speed up the mostly
+    floating point bound decomposition, so they aren't counted.
+
+    Returns:
+    int: Physical cores, or the number of logical CPUs where the platform doesn't tell.
+    """
+    logical = os.cpu_count() or 1
+    cores = 0
+    try:
+        if sys.platform.startswith('linux'):
+            core_ids = set()
+            physical_id = None
+            with open('/proc/cpuinfo') as cpuinfo:
+                for line in cpuinfo:
+                    key, _, value = line.partition(':')
+                    key = key.strip()
+                    if key == 'physical id':
+                        physical_id = value.strip()
+                    elif key == 'core id':
+                        core_ids.add((physical_id, value.strip()))
+            cores = len(core_ids)
+        elif sys.platform == 'darwin':
+            cores = int(subprocess.check_output(['sysctl', '-n', 'hw.physicalcpu'], text=True).strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        cores = 0
+    return min(cores, logical) if cores > 0 else logical
+
+
+def default_max_jobs(threads_per_job=1):
+    """
+    Number of jobs to run at once when the preferences don't set one.
+
+    Parameters:
+    threads_per_job (int): Threads a single decomposition process keeps busy.
+
+    Returns:
+    int: Physical cores divided by the threads per job, at least 1.
+    """
+    return max(1, physical_core_count() // max(1, threads_per_job))
+
+
+class DecompositionJob:
+    """One external process with its own working directory. 'data' is
+    whatever the operator needs to import the result, e.g. the parent and
+    mesh of the collider."""
+
+    def __init__(self, index, directory, data):
+        self.index = index
+        self.directory = directory
+        self.data = data
+        self.process = None
+        self.status = ''
+        # Progress of the job from 0 to 1, if its output tells.
+        self.fraction = 0.0
+        self._output = None
+
+    def start(self, cmd, threads=1):
+        """Launch cmd in the job directory with its stdout/stderr piped
+        through a daemon reader thread into a queue, instead of letting it
+        inherit the console. read_output() then pulls from that queue on
+        Blender's main thread without ever blocking it.
+
+        No shell=True: the executable is launched directly (not via an
+        intermediate cmd.exe/sh -c) so that kill() actually kills it rather
+        than leaving it running detached.
+
+        The reader splits on '\\r' as well as '\\n': some CLIs (V-HACD) print
+        progress updates separated only by carriage returns, the same way a
+        terminal progress bar would - readline() alone would buffer all of
+        those into one giant line until a real newline eventually showed up.
+        """
+        # OpenMP builds would otherwise start one thread per core in every
+        # one of the concurrent processes.
+        env = dict(os.environ, OMP_NUM_THREADS=str(threads))
+        process = subprocess.Popen(cmd, cwd=self.directory, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, bufsize=1, env=env)
+        output = queue.Queue()
+
+        def _reader():
+            try:
+                buf = ''
+                while True:
+                    ch = process.stdout.read(1)
+                    if not ch:
+                        break
+                    if ch in ('\n', '\r'):
+                        if buf:
+                            output.put(buf)
+                            buf = ''
+                    else:
+                        buf += ch
+                if buf:
+                    output.put(buf)
+            except Exception:
+                pass
+            finally:
+                process.stdout.close()
+
+        threading.Thread(target=_reader, daemon=True).start()
+
+        self.process = process
+        self._output = output
+
+    def read_output(self):
+        """The lines the process printed since the last call."""
+        lines = []
+        if self._output is None:
+            return lines
+        while True:
+            try:
+                lines.append(self._output.get_nowait())
+            except queue.Empty:
+                return lines
+
+    def path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def kill(self):
+        if self.process is None:
+            return
+        try:
+            self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+
+    def remove_directory(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class JobScheduler:
+    """Queue of decomposition jobs of which at most max_jobs run at once.
+
+    The operator polls it from a bpy.app.timers callback: finished_jobs()
+    hands over the jobs whose process exited, start_jobs() then fills the
+    free slots with pending jobs. Jobs can be submitted while the run is
+    going, e.g. CoACD's per-hull decimate jobs once a decomposition is done.
+    """
+
+    def __init__(self, data_path, prefix, max_jobs):
+        self.run_directory = tempfile.mkdtemp(prefix=prefix, dir=data_path)
+        self.max_jobs = max(1, max_jobs)
+        self.pending = deque()
+        self.running = []
+        self.total = 0
+        self.done = 0
+
+    def submit(self, data):
+        """Queue a job. Its directory is job_<index> in the run directory."""
+        job = DecompositionJob(self.total, os.path.join(self.run_directory, f'job_{self.total:04d}'), data)
+        self.total += 1
+        self.pending.append(job)
+        return job
+
+    def start_jobs(self, start):
+        """
+        Start pending jobs until max_jobs are running.
+
+        Parameters:
+        start (callable): Called with each job once its directory exists. Writes the input files and calls
+            job.start(), or leaves job.process None to skip the job.
+        """
+        while self.pending and len(self.running) < self.max_jobs:
+            job = self.pending.popleft()
+            os.makedirs(job.directory, exist_ok=True)
+            start(job)
+            if job.process is None:
+                self.done += 1
+            else:
+                self.running.append(job)
+
+    def finished_jobs(self):
+        """The running jobs whose process has exited since the last call, in submission order."""
+        finished = [job for job in self.running if job.process.poll() is not None]
+        for job in finished:
+            self.running.remove(job)
+        self.done += len(finished)
+        return finished
+
+    def is_idle(self):
+        return not self.pending and not self.running
+
+    def progress_text(self):
+        """Progress of the whole run for the status overlay: the share of finished work, counting the progress of
+        the running jobs, and the job counts. A run of a single job shows that job's own status instead."""
+        if self.total == 1 and self.running:
+            return self.running[0].status
+        progress = (self.done + sum(job.fraction for job in self.running)) / max(1, self.total)
+        text = f'{progress:.0%} - {self.done} of {self.total} jobs done'
+        if self.running:
+            text += f', {len(self.running)} running'
+        return text
+
+    def close(self):
+        """Remove the run directory once all results are imported."""
+        shutil.rmtree(self.run_directory, ignore_errors=True)
+
+    def cancel(self):
+        """Kill all running processes, drop the pending jobs and remove the run directory. Returns the jobs that
+        didn't finish, so the operator can free their data."""
+        unfinished = self.running + list(self.pending)
+        for job in self.running:
+            job.kill()
+        self.running = []
+        self.pending.clear()
+        self.close()
+        return unfinished
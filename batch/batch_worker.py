@@ -0,0 +1,113 @@
+"""Generate the colliders of a single asset file, started by run_batch.py::
+
+    blender --background --factory-startup --python batch/batch_worker.py -- \\
+        --input chair.fbx --output out/chair.fbx --result result.json --preset UE-default --shape BOX
+
+Writes the timings, collider count or error to the --result JSON file. A
+missing result file means that Blender crashed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+import addon_utils
+import bpy
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+
+def enable_addon():
+    """Enable the add-on, unless it's enabled already, e.g. as an extension. Returns its module."""
+    for key in bpy.context.preferences.addons.keys():
+        if key == _ADDON_NAME or key.endswith('.' + _ADDON_NAME):
+            return sys.modules[key]
+    addon = addon_utils.enable(_ADDON_NAME, default_set=True)
+    if addon is None:
+        raise RuntimeError(f"Could not enable the add-on '{_ADDON_NAME}'")
+    return addon
+
+
+def load_asset(filepath):
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension == '.blend':
+        bpy.ops.wm.open_mainfile(filepath=filepath)
+        return
+
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    if extension == '.fbx':
+        bpy.ops.import_scene.fbx(filepath=filepath)
+    else:
+        bpy.ops.import_scene.gltf(filepath=filepath)
+
+
+def save_asset(filepath):
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension == '.blend':
+        bpy.ops.wm.save_as_mainfile(filepath=filepath)
+    elif extension == '.fbx':
+        bpy.ops.export_scene.fbx(filepath=filepath)
+    else:
+        bpy.ops.export_scene.gltf(filepath=filepath, export_format='GLB' if extension == '.glb' else 'GLTF_SEPARATE')
+
+
+def process(args):
+    """Load, generate and save. Returns the result entry of the file."""
+    timings = {}
+
+    t0 = time.time()
+    addon = enable_addon()
+    load_asset(args.input)
+    timings['load'] = time.time() - t0
+
+    if args.preset:
+        bpy.ops.object.set_simple_collider_prefs(preset_name=args.preset)
+
+    objects = [obj for obj in bpy.context.view_layer.objects
+               if obj.type == 'MESH' and obj.visible_get() and not obj.get('isCollider')]
+
+    t0 = time.time()
+    colliders = addon.collider_shapes.generate.generate_colliders(objects, args.shape, json.loads(args.settings))
+    timings['generate'] = time.time() - t0
+
+    t0 = time.time()
+    save_asset(args.output)
+    timings['save'] = time.time() - t0
+
+    return {'status': 'ok', 'objects': len(objects), 'colliders': len(colliders), 'timings': timings}
+
+
+def main():
+    # Strip Blender's argv; everything after '--' is for the worker.
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--input', required=True)
+    parser.add_argument('--output', required=True)
+    parser.add_argument('--result', required=True)
+    parser.add_argument('--preset', default='')
+    parser.add_argument('--shape', default='CONVEX_HULL')
+    parser.add_argument('--settings', default='{}')
+    args = parser.parse_args(argv)
+
+    try:
+        result = process(args)
+    except Exception as ex:
+        traceback.print_exc()
+        result = {'status': 'failed', 'error': f"{type(ex).__name__}: {ex}"}
+
+    with open(args.result, 'w') as f:
+        json.dump(result, f)
+
+
+if __name__ == '__main__':
+    main()
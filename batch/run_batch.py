@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Generate colliders for a whole asset library with a pool of headless Blender processes.
+
+Every .blend, .fbx, .glb and .gltf file found in the inputs is opened by its own
+background Blender running batch_worker.py, which applies a collider preset from
+presets/presets_data.py, generates colliders for all mesh objects and saves the
+result in the same format to the output directory. A crashing or hanging file
+only takes down its own Blender::
+
+    python batch/run_batch.py assets/ -o build/colliders -j 8 --preset UE-default \\
+        --shape CONVEX_HULL --summary build/colliders.json
+
+The summary lists the timings, collider count and error of every file. The exit
+code is 1 if any file failed.
+"""
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BATCH_DIR = Path(__file__).resolve().parent
+WORKER_SCRIPT = BATCH_DIR / 'batch_worker.py'
+
+ASSET_EXTENSIONS = ('.blend', '.fbx', '.glb', '.gltf')
+
+# Lines of a crashed worker's output kept in its summary entry.
+OUTPUT_TAIL_LINES = 20
+
+
+def physical_core_count():
+    """Number of physical CPU cores, see auto_Convex/job_scheduler.py. Loaded by path, importing the add-on package
+    needs bpy."""
+    spec = importlib.util.spec_from_file_location('simple_collider_job_scheduler',
+                                                  BATCH_DIR.parent / 'auto_Convex' / 'job_scheduler.py')
+    job_scheduler = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(job_scheduler)
+    return job_scheduler.physical_core_count()
+
+
+def discover_inputs(paths):
+    """
+    Find the asset files to process.
+
+    Parameters:
+    paths (list of str): Asset files and directories, searched recursively.
+
+    Returns:
+    list: (file, path relative to its input) tuples, sorted per input.
+    """
+    inputs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files = sorted(f for f in path.rglob('*') if f.suffix.lower() in ASSET_EXTENSIONS and f.is_file())
+            inputs.extend((f, f.relative_to(path)) for f in files)
+        elif path.suffix.lower() in ASSET_EXTENSIONS:
+            inputs.append((path, Path(path.name)))
+    return inputs
+
+
+def worker_command(blender, source, target, result, preset, shape, settings):
+    """The command line of the Blender process generating the colliders of one file."""
+    cmd = [
+        blender,
+        '--background',
+        '--factory-startup',
+        # One core per Blender, the pool runs one Blender per core.
+        '--threads', '1',
+        '--python', str(WORKER_SCRIPT),
+        '--',
+        '--input', str(source),
+        '--output', str(target),
+        '--result', str(result),
+        '--shape', shape,
+        '--settings', json.dumps(settings),
+    ]
+    if preset:
+        cmd.extend(['--preset', preset])
+    return cmd
+
+
+def run_file(source, target, args):
+    """
+    Run one worker and return its summary entry. Crashes and timeouts of the worker end up in the entry instead of
+    raising.
+    """
+    t0 = time.time()
+    entry = {'input': str(source), 'output': str(target)}
+
+    with tempfile.TemporaryDirectory(prefix='simple_collider_batch_') as tmp_dir:
+        result_path = Path(tmp_dir) / 'result.json'
+        cmd = worker_command(args.blender, source, target, result_path, args.preset, args.shape, args.settings)
+
+        try:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                     errors='replace', timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            entry.update(status='timeout', error=f"No result after {args.timeout} s")
+        else:
+            if result_path.is_file():
+                entry.update(json.loads(result_path.read_text()))
+            else:
+                tail = process.stdout.splitlines()[-OUTPUT_TAIL_LINES:]
+                entry.update(status='crashed', error=f"Blender exited with code {process.returncode}",
+                             output='\n'.join(tail))
+
+    entry['wall_time'] = time.time() - t0
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('inputs', nargs='+', help="Asset files or directories to search for assets.")
+    parser.add_argument('-o', '--output', required=True, help="Directory to save the processed assets to.")
+    parser.add_argument('-j', '--jobs', type=int, default=physical_core_count(),
+                        help="Number of Blender processes to run at once (default: number of physical cores).")
+    parser.add_argument('--blender', default='blender',
+                        help="Path to the Blender executable (default: 'blender' on PATH).")
+    parser.add_argument('--preset', default='',
+                        help="Name of a collider preset in presets/presets_data.py, e.g. 'UE-default'.")
+    parser.add_argument('--shape', default='CONVEX_HULL',
+                        help="Collider shape, see collider_shapes/generate.py (default: CONVEX_HULL).")
+    parser.add_argument('--settings', type=json.loads, default={},
+                        help="JSON object of generate_colliders() settings, e.g. '{\"creation_mode\": \"SELECTION\"}'.")
+    parser.add_argument('--timeout', type=float, default=None, help="Seconds after which a file counts as failed.")
+    parser.add_argument('--summary', help="File to write the JSON summary to (default: standard output).")
+    args = parser.parse_args()
+
+    inputs = discover_inputs(args.inputs)
+    if not inputs:
+        print("No .blend, .fbx, .glb or .gltf files found.", file=sys.stderr)
+        return 1
+
+    output_dir = Path(args.output)
+    t0 = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [pool.submit(run_file, source, output_dir / relative, args) for source, relative in inputs]
+        entries = []
+        for future in futures:
+            entry = future.result()
+            print(f"{entry['status'].upper():8} {entry['input']}", file=sys.stderr)
+            entries.append(entry)
+
+    failures = [entry for entry in entries if entry['status'] != 'ok']
+    summary = {
+        'files': entries,
+        'processed': len(entries),
+        'failed': len(failures),
+        'colliders': sum(entry.get('colliders', 0) for entry in entries),
+        'wall_time': time.time() - t0,
+    }
+
+    text = json.dumps(summary, indent=2)
+    if args.summary:
+        Path(args.summary).write_text(text)
+    else:
+        print(text)
+
+    print(f"{len(entries) - len(failures)} of {len(entries)} file(s) processed.", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
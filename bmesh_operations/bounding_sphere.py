@@ -0,0 +1,182 @@
+from itertools import combinations
+
+import numpy as np
+
+# Relative to the largest extent of the point cloud. Points within this
+# distance outside of a sphere count as enclosed.
+SPHERE_TOLERANCE = 1e-9
+
+# Upper bound for the number of support updates of the exact solver and the
+# sample refinements of the approximate one. Both converge long before that in
+# practice; if not, the sphere is inflated to the farthest point or solved
+# exactly, so the result always encloses every point.
+MAX_SPHERE_ITERATIONS = 512
+
+# Number of evenly strided points the approximate sphere is first fitted to.
+APPROXIMATE_SPHERE_SAMPLE_SIZE = 4096
+
+# The approximate sphere is at most this many times the minimum radius.
+APPROXIMATE_SPHERE_RADIUS_BOUND = 1.05
+
+
+def _circumsphere(support):
+    """
+    Smallest sphere with all support points on its surface, i.e. the circumsphere with its center in the affine hull
+    of the points.
+
+    Args:
+        support (np.array): 1 to 4 points, shape (K, 3).
+
+    Returns:
+        tuple: (center, radius), or None if the points are affinely dependent (e.g. 3 collinear points).
+    """
+    origin = support[0]
+    if len(support) == 1:
+        return origin.copy(), 0.0
+
+    edges = support[1:] - origin
+    gram = edges @ edges.T
+    # det(gram) / prod(diag(gram)) is 1 for orthogonal edges and 0 for
+    # dependent ones (Hadamard's inequality).
+    scale = np.prod(np.diag(gram))
+    if scale <= 0.0 or np.linalg.det(gram) <= 1e-12 * scale:
+        return None
+
+    weights = np.linalg.solve(gram, 0.5 * np.einsum('ij,ij->i', edges, edges))
+    offset = weights @ edges
+    return origin + offset, float(np.sqrt(offset @ offset))
+
+
+def _update_support(support, point, tolerance):
+    """
+    Minimum enclosing sphere of the support points plus a new point outside of their minimum sphere. The new point
+    is always on the surface of the result, so only the spheres through it and at most 3 of the old support points
+    need to be checked; the smallest of them that encloses every old support point is the minimum sphere.
+
+    Returns:
+        tuple: (center, radius, support) of the new sphere, or None if no candidate sphere was found.
+    """
+    best = None
+    for size in range(min(len(support), 3) + 1):
+        for subset in combinations(range(len(support)), size):
+            candidate = np.vstack((support[list(subset)], point))
+            sphere = _circumsphere(candidate)
+            if sphere is None:
+                continue
+
+            center, radius = sphere
+            if best is not None and radius >= best[1]:
+                continue
+
+            if np.all(np.linalg.norm(support - center, axis=1) <= radius + tolerance):
+                best = (center, radius, candidate)
+
+    return best
+
+
+def _prepare_points(points):
+    """
+    Move the points to their bounding box center and precompute their squared lengths.
+
+    Returns:
+        tuple: (origin, points relative to origin, squared lengths of those, tolerance). See SPHERE_TOLERANCE for
+            the tolerance.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        return np.zeros(3), points, np.zeros(0), 0.0
+
+    # Reducing one column at a time is several times faster than
+    # min(axis=0) on an (N, 3) array.
+    lower = np.array([points[:, i].min() for i in range(3)])
+    upper = np.array([points[:, i].max() for i in range(3)])
+    origin = (lower + upper) / 2.0
+    local = points - origin
+    return origin, local, np.einsum('ij,ij->i', local, local), SPHERE_TOLERANCE * float((upper - lower).max())
+
+
+def _farthest_point(points, sqr_norms, center):
+    """Index of and distance to the point farthest away from center. |p - c|^2 = |p|^2 - 2 p.c + |c|^2, so with
+    the precomputed |p|^2 a whole pass is a single matrix-vector product."""
+    index = int((sqr_norms - 2.0 * (points @ center)).argmax())
+    diff = points[index] - center
+    return index, float(np.sqrt(diff @ diff))
+
+
+def minimum_enclosing_sphere(points):
+    """
+    Compute the exact minimum enclosing sphere of a point cloud.
+
+    Move-to-front style pivoting on a support set of at most 4 points: the point farthest outside of the current
+    sphere is found for all points at once, and the sphere is replaced by the minimum sphere of the support set plus
+    that point. The radius grows with every step, so the loop ends when no point is left outside.
+
+    Only convex hull vertices can touch the sphere, so running the point cloud through prefilter_hull_candidates()
+    first gives the same result.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+
+    Returns:
+        tuple: (center, radius) with center as np.array of shape (3,).
+    """
+    origin, points, sqr_norms, tolerance = _prepare_points(points)
+    if len(points) == 0:
+        return origin, 0.0
+
+    center, radius = _minimum_sphere(points, sqr_norms, tolerance)
+    return center + origin, radius
+
+
+def _minimum_sphere(points, sqr_norms, tolerance):
+    """The pivoting loop of minimum_enclosing_sphere() on prepared points, see _prepare_points()."""
+    support = points[:1]
+    center, radius = points[0].copy(), 0.0
+
+    for _ in range(MAX_SPHERE_ITERATIONS):
+        index, distance = _farthest_point(points, sqr_norms, center)
+        if distance <= radius + tolerance:
+            return center, radius
+
+        update = _update_support(support, points[index], tolerance)
+        if update is None or update[1] <= radius:
+            # Numerically stuck, fall back to growing the sphere below.
+            break
+        center, radius, support = update
+
+    return center, max(radius, _farthest_point(points, sqr_norms, center)[1])
+
+
+def approximate_enclosing_sphere(points):
+    """
+    Compute an enclosing sphere close to the minimum one, in a few passes over the points.
+
+    The exact minimum sphere is fitted to an evenly strided sample of APPROXIMATE_SPHERE_SAMPLE_SIZE points plus the
+    extreme points along the axes. The sample's minimum radius r is at most the minimum radius of all points, so
+    while the farthest point is more than APPROXIMATE_SPHERE_RADIUS_BOUND * r away from the center, it is added to
+    the sample and the sample is fitted again. The radius is then the distance to the farthest point, so the result
+    always encloses every point and is at most APPROXIMATE_SPHERE_RADIUS_BOUND times the minimum radius.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+
+    Returns:
+        tuple: (center, radius) with center as np.array of shape (3,).
+    """
+    origin, points, sqr_norms, tolerance = _prepare_points(points)
+    if len(points) == 0:
+        return origin, 0.0
+
+    step = max(1, len(points) // APPROXIMATE_SPHERE_SAMPLE_SIZE)
+    extremes = [int(points[:, i].argmin()) for i in range(3)] + [int(points[:, i].argmax()) for i in range(3)]
+    sample = np.append(np.arange(0, len(points), step), extremes)
+
+    for _ in range(MAX_SPHERE_ITERATIONS):
+        center, radius = _minimum_sphere(points[sample], sqr_norms[sample], tolerance)
+        index, distance = _farthest_point(points, sqr_norms, center)
+        if distance <= APPROXIMATE_SPHERE_RADIUS_BOUND * radius + tolerance:
+            return center + origin, max(radius, distance)
+        sample = np.append(sample, index)
+
+    center, radius = _minimum_sphere(points, sqr_norms, tolerance)
+    return center + origin, radius
@@ -1,5 +1,6 @@
 import bmesh
 import bpy
+import numpy as np
 
 from bpy_extras.object_utils import object_data_add
 
@@ -15,6 +16,32 @@ face_order = [
     (4, 0, 3, 7),
 ]
 
+# corners of a box in the order of face_order, as picked from (min, max) per axis
+box_corner_order = np.array([
+    (1, 1, 0),
+    (1, 0, 0),
+    (0, 0, 0),
+    (0, 1, 0),
+    (1, 1, 1),
+    (1, 0, 1),
+    (0, 0, 1),
+    (0, 1, 1),
+])
+
+
+def box_corners(boxes):
+    """
+    Get the corners of axis-aligned boxes in the vertex order used for box colliders.
+
+    Parameters:
+    boxes (numpy.ndarray): Minimum and maximum corner of every box, shape (K, 2, 3).
+
+    Returns:
+    numpy.ndarray: The 8 corners of every box, shape (K, 8, 3).
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 2, 3)
+    return boxes[:, box_corner_order, np.arange(3)]
+
 
 def add_box_object(context, vertices):
     """
@@ -1,350 +1,150 @@
 import numpy as np
 
+from .bounding_sphere import SPHERE_TOLERANCE, minimum_enclosing_sphere
+from .point_prefilter import PREFILTER_CHUNK_SIZE
 
-class ProjectorStack:
-    """
-    Stack of points that are shifted / projected to put the first one at origin.
-    """
-
-    def __init__(self, vec):
-        """
-        Initialize the ProjectorStack with a list of vectors.
-
-        Args:
-            vec (list): List of vectors.
-        """
-        self.vs = np.array(vec)
-
-    def push(self, v):
-        """
-        Add a new vector to the stack.
-
-        Args:
-            v (np.array): Vector to add.
-
-        Returns:
-            ProjectorStack: Updated stack.
-        """
-        if len(self.vs) == 0:
-            self.vs = np.array([v])
-        else:
-            self.vs = np.append(self.vs, [v], axis=0)
-        return self
-
-    def pop(self):
-        """
-        Remove the last vector from the stack.
-
-        Returns:
-            np.array: The removed vector.
-        """
-        if len(self.vs) > 0:
-            ret, self.vs = self.vs[-1], self.vs[:-1]
-            return ret
-
-    def __mul__(self, v):
-        """
-        Multiply the stack of vectors by a given vector.
-
-        Args:
-            v (np.array): Vector to multiply with.
-
-        Returns:
-            np.array: Resulting vector after multiplication.
-        """
-        s = np.zeros(len(v))
-        for vi in self.vs:
-            s = s + vi * np.dot(vi, v)
-        return s
-
-
-class GaertnerBoundary:
-    """
-    GärtnerBoundary
-
-    Manages the boundary conditions based on Gärtner's paper.
-
-    Attributes:
-        projector (ProjectorStack): Projector stack for managing points.
-        centers (np.array): Array of center points.
-        square_radii (np.array): Array of squared radii.
-        empty_center (np.array): Empty center array.
-    """
-
-    def __init__(self, pts):
-        """
-        Initialize the GärtnerBoundary with a list of points.
-
-        Args:
-            pts (list): List of points.
-        """
-        self.projector = ProjectorStack([])
-        self.centers, self.square_radii = np.array([]), np.array([])
-        self.empty_center = np.array([np.nan for _ in pts[0]])
-
-
-def push_if_stable(bound, pt):
-    """
-    Attempts to push a point into the boundary if stable.
-
-    Args:
-        bound (GaertnerBoundary): The boundary to push into.
-        pt (np.array): The point to push.
-
-    Returns:
-        bool: True if the point was successfully pushed, False otherwise.
-    """
-
-    if len(bound.centers) == 0:
-        bound.square_radii = np.append(bound.square_radii, 0.0)
-        bound.centers = np.array([pt])
-        return True
-    q0, center = bound.centers[0], bound.centers[-1]
-    C, r2 = center - q0, bound.square_radii[-1]
-    Qm, M = pt - q0, bound.projector
-    Qm_bar = M * Qm
-    residue, e = Qm - Qm_bar, sqr_dist(Qm, C) - r2
-    z, tol = 2 * sqr_norm(residue), np.finfo(float).eps * max(r2, 1.0)
-    is_stable = np.abs(z) > tol
-    if is_stable:
-        center_new = center + (e / z) * residue
-        r2new = r2 + (e * e) / (2 * z)
-        bound.projector.push(residue / np.linalg.norm(residue))
-        bound.centers = np.append(
-            bound.centers, np.array([center_new]), axis=0)
-        bound.square_radii = np.append(bound.square_radii, r2new)
-    return is_stable
-
-
-def pop(bound):
-    """
-    Removes the last point from the boundary.
-
-    Args:
-        bound (GaertnerBoundary): The boundary to remove the point from.
-
-    Returns:
-        GaertnerBoundary: Updated boundary.
-    """
-    n = len(bound.centers)
-    bound.centers = bound.centers[:-1]
-    bound.square_radii = bound.square_radii[:-1]
-    if n >= 2:
-        bound.projector.pop()
-    return bound
-
-
-class NSphere:
-    """
-    Represents a hypersphere with a center and squared radius.
-
-    Attributes:
-        center (np.array): Center of the n-sphere.
-        sqr_radius (float): Squared radius of the n-sphere.
-    """
-
-    def __init__(self, c, sqr):
-        """
-        Initialize the NSphere with a center and squared radius.
-
-        Args:
-            c (np.array): Center of the n-sphere.
-            sqr (float): Squared radius of the n-sphere.
-        """
-        self.center = np.array(c)
-        self.sqr_radius = sqr
-
-
-def is_inside(pt, nsphere, atol=1e-6, rtol=0.0):
-    """
-    Checks if a point is inside the n-sphere.
-
-    Args:
-        pt (np.array): The point to check.
-        nsphere (NSphere): The n-sphere to check against.
-        atol (float): Absolute tolerance for closeness check.
-        rtol (float): Relative tolerance for closeness check.
+# Extreme point directions of the 2D cull in front of the convex hull, in
+# counterclockwise order of their angle: the axes and the diagonals. The
+# extreme points along them span an octagon inside the convex hull.
+CULL_DIRECTIONS_2D = np.array([
+    (1, 0), (1, 1), (0, 1), (-1, 1),
+    (-1, 0), (-1, -1), (0, -1), (1, -1),
+], dtype=np.float64)
 
-    Returns:
-        bool: True if the point is inside the n-sphere, False otherwise.
-    """
-    r2, R2 = sqr_dist(pt, nsphere.center), nsphere.sqr_radius
-    return r2 <= R2 or np.isclose(r2, R2, atol=atol ** 2, rtol=rtol ** 2)
 
-
-def all_inside(pts, nsphere, atol=1e-6, rtol=0.0):
+def _octagon_candidate_mask(points, tolerance):
     """
-    Checks if all points are inside the n-sphere.
+    Mark the points that aren't strictly inside the octagon spanned by the extreme points along CULL_DIRECTIONS_2D.
 
     Args:
-        pts (list): List of points to check.
-        nsphere (NSphere): The n-sphere to check against.
-        atol (float): Absolute tolerance for closeness check.
-        rtol (float): Relative tolerance for closeness check.
+        points (np.array): Points, shape (N, 2).
+        tolerance (float): Points closer than this to an octagon edge are kept.
 
     Returns:
-        bool: True if all points are inside the n-sphere, False otherwise.
+        np.array: Boolean mask, shape (N,). True for the points that are kept.
     """
-    return all(is_inside(p, nsphere, atol, rtol) for p in pts)
+    corners = points[(points @ CULL_DIRECTIONS_2D.T).argmax(axis=0)]
+    edges = np.roll(corners, -1, axis=0) - corners
+    lengths = np.linalg.norm(edges, axis=1)
 
+    # Several directions can share one extreme point, which leaves zero length
+    # edges that don't bound anything.
+    valid = lengths > tolerance
+    if valid.sum() < 3:
+        return np.ones(len(points), dtype=bool)
 
-def move_to_front(pts, i):
-    """
-    Moves a point to the front of the list.
+    # Inward facing unit normals of the counterclockwise edges.
+    normals = np.column_stack((-edges[valid, 1], edges[valid, 0])) / lengths[valid, None]
+    offsets = np.einsum('ij,ij->i', normals, corners[valid])
 
-    Args:
-        pts (list): List of points.
-        i (int): Index of the point to move.
-
-    Returns:
-        list: Updated list of points.
-    """
-    pt = pts[i]
-    for j in range(len(pts)):
-        pts[j], pt = pt, np.array(pts[j])
-        if j == i:
-            break
-    return pts
+    keep = np.ones(len(points), dtype=bool)
+    for start in range(0, len(points), PREFILTER_CHUNK_SIZE):
+        chunk = points[start:start + PREFILTER_CHUNK_SIZE]
+        keep[start:start + len(chunk)] = ((chunk @ normals.T - offsets).min(axis=1) <= tolerance)
+    return keep
 
 
-def dist(p1, p2):
-    """
-    Calculates the Euclidean distance between two points.
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
 
-    Args:
-        p1 (np.array): First point.
-        p2 (np.array): Second point.
 
-    Returns:
-        float: Euclidean distance between the points.
+def convex_hull_2d(points):
     """
-    return np.linalg.norm(p1 - p2)
+    Computes the convex hull of 2D points.
 
-
-def sqr_dist(p1, p2):
-    """
-    Calculates the squared distance between two points.
+    Points strictly inside the octagon of the extreme points are culled with a few array operations first, the
+    remaining points are snapped to a grid of SPHERE_TOLERANCE times the largest extent to merge duplicates (e.g.
+    the vertex rings along a pipe, which all project to the same cross-section) and then run through Andrew's
+    monotone chain.
 
     Args:
-        p1 (np.array): First point.
-        p2 (np.array): Second point.
+        points (np.array): Points, shape (N, 2).
 
     Returns:
-        float: Squared distance between the points.
+        np.array: The hull vertices in counterclockwise order, shape (H, 2). Fewer than 3 vertices for degenerate
+            input.
     """
-    return sqr_norm(p1 - p2)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 3:
+        return points.copy()
 
+    lo = points.min(axis=0)
+    extent = float((points.max(axis=0) - lo).max())
+    if extent == 0.0:
+        return points[:1].copy()
+    tolerance = SPHERE_TOLERANCE * extent
 
-def sqr_norm(p):
-    """
-    Calculates the squared norm of a point.
+    candidates = points[_octagon_candidate_mask(points, tolerance)]
+    # Grid cells along each axis stay below 1 / SPHERE_TOLERANCE, so both
+    # cell indices fit into one int64 key. Sorting the keys orders the points
+    # lexicographically, which is the order the monotone chain needs.
+    cells = np.round((candidates - lo) / tolerance).astype(np.int64)
+    keys = cells[:, 0] * (int(cells[:, 1].max()) + 1) + cells[:, 1]
+    _, unique_idx = np.unique(keys, return_index=True)
+    candidates = candidates[unique_idx].tolist()
+    if len(candidates) < 3:
+        return np.array(candidates)
 
-    Args:
-        p (np.array): Point to calculate the squared norm for.
+    lower = []
+    for p in candidates:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0.0:
+            lower.pop()
+        lower.append(p)
 
-    Returns:
-        float: Squared norm of the point.
-    """
-    return np.sum(np.array([x * x for x in p]))
+    upper = []
+    for p in reversed(candidates):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0.0:
+            upper.pop()
+        upper.append(p)
 
+    return np.array(lower[:-1] + upper[:-1])
 
-def is_max_length(bound):
-    """
-    Checks if the boundary has reached its maximum length.
-
-    Args:
-        bound (GaertnerBoundary): The boundary to check.
 
-    Returns:
-        bool: True if the boundary is at maximum length, False otherwise.
+def minimum_enclosing_circle(points):
     """
-    len(bound.centers) == len(bound.empty_center) + 1
+    Computes the smallest circle enclosing 2D points.
 
-
-def makeNSphere(bound):
-    """
-    Creates an n-sphere from the boundary.
+    Only convex hull vertices can touch the circle, so it is solved on convex_hull_2d() only, with the sphere
+    engine of bounding_sphere.py (the minimum sphere of points in a plane is their minimum circle). The radius is
+    measured against every input point, so the circle encloses them even where the hull merged near duplicates.
 
     Args:
-        bound (GaertnerBoundary): The boundary to create the n-sphere from.
+        points (np.array): Points, shape (N, 2).
 
     Returns:
-        NSphere: The created n-sphere.
+        tuple: (center, radius) with center as np.array of shape (2,).
     """
-    if len(bound.centers) == 0:
-        return NSphere(bound.empty_center, 0.0)
-    return NSphere(bound.centers[-1], bound.square_radii[-1])
-
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return np.zeros(2), 0.0
 
-def _welzl(pts, pos, bdry):
-    """
-    Recursive helper function for Welzl's algorithm.
+    hull = convex_hull_2d(points)
+    center, _ = minimum_enclosing_sphere(np.column_stack((hull, np.zeros(len(hull)))))
+    center = center[:2]
+    diff = points - center
+    return center, float(np.sqrt(np.einsum('ij,ij->i', diff, diff).max()))
 
-    Args:
-        pts (list): List of points.
-        pos (int): Current position in the list of points.
-        bdry (GaertnerBoundary): Current boundary.
 
-    Returns:
-        tuple: The resulting n-sphere and support count.
-    """
-    support_count, nsphere = 0, makeNSphere(bdry)
-    if is_max_length(bdry):
-        return nsphere, 0
-    for i in range(pos):
-        if not is_inside(pts[i], nsphere):
-            is_stable = push_if_stable(bdry, pts[i])
-            if is_stable:
-                nsphere, s = _welzl(pts, i, bdry)
-                pop(bdry)
-                move_to_front(pts, i)
-                support_count = s + 1
-    return nsphere, support_count
-
-
-def find_max_excess(nsphere, pts, k1):
-    """
-    Finds the point with the maximum excess error.
-
-    Args:
-        nsphere (NSphere): The current n-sphere.
-        pts (list): List of points.
-        k1 (int): Starting index for the search.
-
-    Returns:
-        tuple: The maximum error and index of the point with maximum error.
-    """
-    err_max, k_max = -np.inf, k1 - 1
-    for (k, pt) in enumerate(pts[k_max:]):
-        err = sqr_dist(pt, nsphere.center) - nsphere.sqr_radius
-        if err > err_max:
-            err_max, k_max = err, k + k1
-    return err_max, k_max - 1
+# Height component and the two cross-section components of a point, per
+# cylinder/capsule axis.
+AXIS_COMPONENTS = {
+    'X': (0, (1, 2)),
+    'Y': (1, (0, 2)),
+    'Z': (2, (0, 1)),
+}
 
 
-def welzl(points, max_iterations=2000):
+def split_axis_coordinates(points, axis):
     """
-    Finds the smallest enclosing n-sphere for a set of points.
+    Split 3D points into their 2D cross-section and their height along an axis.
 
     Args:
-        points (list): List of points.
-        max_iterations (int): Maximum number of iterations.
+        points (np.array): Points, shape (N, 3).
+        axis (str): Cylinder axis, 'X', 'Y' or 'Z'.
 
     Returns:
-        NSphere: The resulting smallest enclosing n-sphere.
+        tuple: Cross-section coordinates, shape (N, 2), and heights, shape (N,).
     """
-    pts, eps = np.array(points, copy=True), np.finfo(float).eps
-    bdry, t = GaertnerBoundary(pts), 1
-    nsphere, s = _welzl(pts, t, bdry)
-    for i in range(max_iterations):
-        e, k = find_max_excess(nsphere, pts, t + 1)
-        if e <= eps:
-            break
-        pt = pts[k]
-        push_if_stable(bdry, pt)
-        nsphere_new, s_new = _welzl(pts, s, bdry)
-        pop(bdry)
-        move_to_front(pts, k)
-        nsphere = nsphere_new
-        t, s = s + 1, s_new + 1
-    return nsphere
+    height_idx, plane_idx = AXIS_COMPONENTS[axis]
+    points = np.asarray(points, dtype=np.float64)
+    return points[:, plane_idx], points[:, height_idx]
@@ -0,0 +1,130 @@
+import hashlib
+
+import numpy as np
+
+from .vertex_arrays import mesh_polygon_arrays, mesh_vertex_coordinates
+
+# Quantization step of the PCA spectrum ratios hashed by
+# geometry_fingerprint(). Coarse enough to absorb the float noise of applied
+# transforms; distinct meshes hashing the same are told apart by
+# similarity_transform().
+FINGERPRINT_PRECISION = 1e-3
+
+# Largest distance between a mapped vertex and its counterpart for two meshes
+# to count as the same geometry, relative to the RMS radius of the target.
+MATCH_TOLERANCE = 1e-4
+
+
+def geometry_fingerprint(coords, face_sizes, face_vertices, precision=FINGERPRINT_PRECISION):
+    """
+    Hash of a mesh that is the same for every copy moved, rotated or uniformly scaled (e.g. appended duplicates or
+    copies with applied transforms).
+
+    Copies keep the vertex order, so the topology is hashed as is. The geometry only adds the ratios of the
+    principal variances (PCA) of the vertices, which don't depend on the pose of the mesh. Per-vertex values aren't
+    hashed: with thousands of them, the float noise of an applied transform would round at least one differently.
+
+    Parameters:
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+    face_sizes (numpy.ndarray): Number of vertices of each face, shape (F,).
+    face_vertices (numpy.ndarray): Vertex indices of all faces, concatenated.
+    precision (float, optional): Quantization step of the variance ratios.
+
+    Returns:
+    str: The fingerprint, or None if the mesh has no extent.
+    """
+    if len(coords) == 0:
+        return None
+
+    centered = coords - coords.mean(axis=0)
+    variances = np.linalg.eigvalsh(centered.T @ centered / len(coords))
+    if variances[-1] <= 0.0:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(len(coords)).tobytes())
+    digest.update(np.round(variances[:2] / variances[-1] / precision).astype(np.int64).tobytes())
+    digest.update(np.ascontiguousarray(face_sizes, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(face_vertices, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def similarity_transform(source, target, tolerance=MATCH_TOLERANCE):
+    """
+    Rotation, uniform scale and translation mapping every source vertex onto the target vertex of the same index
+    (Umeyama's least squares fit).
+
+    Parameters:
+    source (numpy.ndarray): Vertex positions, shape (N, 3).
+    target (numpy.ndarray): Vertex positions, shape (N, 3).
+    tolerance (float, optional): Largest distance of a mapped vertex to its target, relative to the RMS radius of
+        the target.
+
+    Returns:
+    numpy.ndarray: The 4x4 matrix, or None if the vertex counts differ or the target isn't such a copy of the
+        source, e.g. its mirror image.
+    """
+    if source.shape != target.shape or len(source) == 0:
+        return None
+
+    source_center = source.mean(axis=0)
+    target_center = target.mean(axis=0)
+    centered_source = source - source_center
+    centered_target = target - target_center
+
+    source_variance = np.mean(np.einsum('ij,ij->i', centered_source, centered_source))
+    if source_variance == 0.0:
+        return None
+
+    u, singular, vt = np.linalg.svd(centered_target.T @ centered_source / len(source))
+    # Always fit a rotation; a mirrored target fails the residual test below.
+    signs = np.ones(3)
+    if np.linalg.det(u) * np.linalg.det(vt) < 0.0:
+        signs[2] = -1.0
+
+    linear = (u * signs) @ vt * (np.dot(singular, signs) / source_variance)
+    translation = target_center - linear @ source_center
+
+    target_radius = np.sqrt(np.mean(np.einsum('ij,ij->i', centered_target, centered_target)))
+    residual = np.linalg.norm(source @ linear.T + translation - target, axis=1).max()
+    if residual > tolerance * target_radius:
+        return None
+
+    matrix = np.identity(4)
+    matrix[:3, :3] = linear
+    matrix[:3, 3] = translation
+    return matrix
+
+
+def match_duplicate_meshes(meshes):
+    """
+    Find the meshes that are moved, rotated or uniformly scaled copies of an earlier mesh in the list.
+
+    Parameters:
+    meshes (list of bpy.types.Mesh): The meshes to compare.
+
+    Returns:
+    list: For every mesh, None if it's the first of its geometry, else a tuple of the index of that first mesh and
+        the 4x4 matrix (numpy.ndarray) mapping the first mesh onto this one.
+    """
+    references = {}
+    matches = []
+
+    for index, mesh in enumerate(meshes):
+        coords = mesh_vertex_coordinates(mesh)
+        fingerprint = geometry_fingerprint(coords, *mesh_polygon_arrays(mesh))
+
+        match = None
+        if fingerprint is not None:
+            candidates = references.setdefault(fingerprint, [])
+            for reference_index, reference_coords in candidates:
+                matrix = similarity_transform(reference_coords, coords)
+                if matrix is not None:
+                    match = (reference_index, matrix)
+                    break
+            else:
+                candidates.append((index, coords))
+
+        matches.append(match)
+
+    return matches
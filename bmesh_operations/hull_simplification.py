@@ -0,0 +1,206 @@
+from itertools import product
+
+import numpy as np
+
+from .kdop_generation import AXIS_DIRECTIONS, polytope_bmesh, support_distances
+from .oriented_box import convex_hull_arrays
+from .vertex_arrays import bmesh_from_polygons
+
+# Most physics engines reject convex hulls with more vertices than this, or
+# get much slower with them.
+DEFAULT_HULL_VERTEX_LIMIT = 255
+
+# A polytope needs at least 4 vertices.
+MIN_HULL_VERTICES = 4
+
+# Relative to the largest extent of the hull. Hull faces whose planes differ
+# by less than this are merged, and so are polytope vertices closer than
+# this to each other.
+HULL_PLANE_TOLERANCE = 1e-6
+
+# Face normals of a regular tetrahedron, the fallback for budgets below the
+# 8 corners of a box.
+TETRAHEDRON_DIRECTIONS = np.array([(1, 1, 1), (1, -1, -1), (-1, 1, -1), (-1, -1, 1)], dtype=np.float64) / np.sqrt(3.0)
+
+
+def hull_face_planes(points, triangles):
+    """
+    Planes of the faces of a convex hull, with the planes of coplanar triangles merged.
+
+    Args:
+        points (np.array): Hull vertex positions, shape (H, 3).
+        triangles (np.array): Hull triangles, shape (F, 3).
+
+    Returns:
+        tuple: Unit plane normals, shape (P, 3), and the area of each plane's face, shape (P,).
+    """
+    a, b, c = (points[triangles[:, i]] for i in range(3))
+    normals = np.cross(b - a, c - a)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 0.0
+    normals = normals[valid] / lengths[valid, None]
+    areas = lengths[valid] / 2.0
+
+    keys = np.round(normals / HULL_PLANE_TOLERANCE).astype(np.int64)
+    _, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    plane_areas = np.bincount(inverse, weights=areas)
+    plane_normals = np.zeros((len(plane_areas), 3))
+    np.add.at(plane_normals, inverse, normals * areas[:, None])
+    plane_normals /= np.linalg.norm(plane_normals, axis=1)[:, None]
+    return plane_normals, plane_areas
+
+
+def select_hull_planes(normals, areas, count):
+    """
+    Pick count of the hull planes that spread evenly over all directions, favouring large faces: farthest point
+    sampling on the unit normals, with the angular distance weighted by the face area.
+
+    Args:
+        normals (np.array): Unit plane normals, shape (P, 3).
+        areas (np.array): Face area of each plane, shape (P,).
+        count (int): Number of planes to pick.
+
+    Returns:
+        np.array: Indices of the picked planes, shape (count,).
+    """
+    count = min(count, len(normals))
+    weights = areas / areas.max()
+    selected = [int(areas.argmax())]
+    # 1 - cos of the angle to the nearest selected normal.
+    distance = 1.0 - normals @ normals[selected[0]]
+
+    for _ in range(count - 1):
+        index = int((distance * weights).argmax())
+        selected.append(index)
+        distance = np.minimum(distance, 1.0 - normals @ normals[index])
+
+    return np.array(selected, dtype=np.int64)
+
+
+def dual_polytope_vertices(normals, offsets, center, tolerance):
+    """
+    Vertices of the convex polytope {x : normals @ x <= offsets} through the convex hull of its dual, which scales
+    to many more planes than intersecting every plane triple.
+
+    Every plane is mapped to the dual point normal / (offset - normal @ center), and every face of the dual hull
+    corresponds to a polytope vertex where the planes of its 3 dual points meet.
+
+    Args:
+        normals (np.array): Unit plane normals, shape (K, 3).
+        offsets (np.array): Plane offsets, shape (K,).
+        center (np.array): A point strictly inside every half-space, shape (3,).
+        tolerance (float): Distance below which vertices are merged.
+
+    Returns:
+        np.array: Polytope vertices, shape (V, 3), or None if the polytope isn't bounded.
+    """
+    dual = normals / (offsets - normals @ center)[:, None]
+    dual_points, triangles, _ = convex_hull_arrays(dual)
+    if len(triangles) == 0:
+        return None
+
+    systems = dual_points[triangles]
+    solvable = np.abs(np.linalg.det(systems)) > 1e-12
+    vertices = np.linalg.solve(systems[solvable], np.ones((int(solvable.sum()), 3, 1)))[..., 0]
+
+    # The polytope is bounded if the center lies inside the dual hull. Then
+    # every dual face is a supporting plane y @ vertex <= 1 of all dual points.
+    if not solvable.any() or (dual @ vertices.T).max() > 1.0 + 1e-6:
+        return None
+
+    _, unique_idx = np.unique(np.round(vertices / tolerance).astype(np.int64), axis=0, return_index=True)
+    return vertices[np.sort(unique_idx)] + center
+
+
+def bounding_polytope(points, max_vertices):
+    """
+    Polytope with at most max_vertices vertices that encloses the points without fitting their hull faces: the 8
+    corners of their axis aligned bounding box, or their enclosing tetrahedron if max_vertices is below 8.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        max_vertices (int): Maximum number of vertices of the result, at least 4.
+
+    Returns:
+        np.array: Polytope vertices, shape (8, 3) or (4, 3).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if max_vertices >= 8:
+        return np.array(list(product(*zip(points.min(axis=0), points.max(axis=0)))), dtype=np.float64)
+
+    # Every corner is where 3 of the 4 planes meet, relative to the center.
+    center = points.mean(axis=0)
+    offsets = np.maximum(support_distances(points, TETRAHEDRON_DIRECTIONS) - TETRAHEDRON_DIRECTIONS @ center,
+                         HULL_PLANE_TOLERANCE)
+    corners = np.array([np.linalg.solve(np.delete(TETRAHEDRON_DIRECTIONS, i, axis=0), np.delete(offsets, i))
+                        for i in range(4)])
+    return corners + center
+
+
+def simplify_hull(points, triangles, max_vertices):
+    """
+    Compute a convex polytope with at most max_vertices vertices that encloses a convex hull.
+
+    A polytope with K faces has at most 2K - 4 vertices, so (max_vertices + 4) // 2 of the hull face planes are
+    kept with select_hull_planes() and intersected. Dropping planes only ever grows the polytope, so the result
+    always encloses the hull and is conservative as a collider. If no plane count fits the budget, the result is
+    bounding_polytope() of the hull.
+
+    Args:
+        points (np.array): Hull vertex positions, shape (H, 3).
+        triangles (np.array): Hull triangles, shape (F, 3).
+        max_vertices (int): Maximum number of vertices of the result.
+
+    Returns:
+        np.array: Vertices of the simplified polytope, shape (V, 3). The hull vertices if the hull already has at
+            most max_vertices vertices.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    max_vertices = max(int(max_vertices), MIN_HULL_VERTICES)
+    if len(points) <= max_vertices:
+        return points
+
+    normals, areas = hull_face_planes(points, triangles)
+    center = points.mean(axis=0)
+    tolerance = HULL_PLANE_TOLERANCE * max(float(np.ptp(points, axis=0).max()), 1e-6)
+
+    plane_count = (max_vertices + 4) // 2
+    while plane_count >= MIN_HULL_VERTICES:
+        planes = normals[select_hull_planes(normals, areas, plane_count)]
+        vertices = dual_polytope_vertices(planes, support_distances(points, planes), center, tolerance)
+        if vertices is None:
+            # The spread of the picked planes missed a direction: the axis
+            # directions always bound the polytope.
+            planes = np.vstack((AXIS_DIRECTIONS, planes[:max(plane_count - len(AXIS_DIRECTIONS), 0)]))
+            vertices = dual_polytope_vertices(planes, support_distances(points, planes), center, tolerance)
+
+        if vertices is not None and len(vertices) <= max_vertices:
+            return vertices
+        plane_count -= 1
+
+    return bounding_polytope(points, max_vertices)
+
+
+def convex_hull_bmesh(coords, max_vertices=None, vertex_ratio=1.0):
+    """
+    Build the convex hull of a point cloud as a BMesh from a coordinate array in one call, optionally simplified
+    to a vertex budget with simplify_hull().
+
+    Args:
+        coords (np.array): Points, shape (N, 3).
+        max_vertices (int, optional): Maximum number of hull vertices. Unlimited by default.
+        vertex_ratio (float): Fraction of the hull vertices to keep, like the ratio of a Decimate modifier.
+
+    Returns:
+        bmesh.types.BMesh: The hull. The caller is responsible for freeing it.
+    """
+    points, triangles, _ = convex_hull_arrays(coords)
+
+    budget = max(int(np.ceil(len(points) * vertex_ratio)), MIN_HULL_VERTICES)
+    if max_vertices is not None:
+        budget = min(budget, max_vertices)
+    if len(points) <= budget:
+        return bmesh_from_polygons(points, np.full(len(triangles), 3), triangles.ravel())
+
+    return polytope_bmesh(simplify_hull(points, triangles, budget))
@@ -0,0 +1,183 @@
+from itertools import combinations
+
+import bmesh
+import numpy as np
+
+from .oriented_box import principal_axes_frame
+from .point_prefilter import PREFILTER_CHUNK_SIZE
+from .vertex_arrays import bmesh_from_coordinates
+
+# Relative to the largest extent of the input points. Plane intersections
+# closer than this outside of a half-space still count as inside, and
+# polytope vertices closer than this to each other are merged.
+KDOP_TOLERANCE = 1e-6
+
+# Faces of the hull that are flatter than this (radians) are merged into the
+# single polygon of their k-DOP plane.
+KDOP_DISSOLVE_ANGLE = 1e-4
+
+AXIS_DIRECTIONS = np.array([
+    (1, 0, 0), (-1, 0, 0),
+    (0, 1, 0), (0, -1, 0),
+    (0, 0, 1), (0, 0, -1),
+], dtype=np.float64)
+
+EDGE_DIRECTIONS = np.array([
+    (1, 1, 0), (1, -1, 0), (-1, 1, 0), (-1, -1, 0),
+    (1, 0, 1), (1, 0, -1), (-1, 0, 1), (-1, 0, -1),
+    (0, 1, 1), (0, 1, -1), (0, -1, 1), (0, -1, -1),
+], dtype=np.float64) / np.sqrt(2.0)
+
+CORNER_DIRECTIONS = np.array([
+    (1, 1, 1), (1, 1, -1), (1, -1, 1), (1, -1, -1),
+    (-1, 1, 1), (-1, 1, -1), (-1, -1, 1), (-1, -1, -1),
+], dtype=np.float64) / np.sqrt(3.0)
+
+
+def get_10dop_normals():
+    # 5 slab directions = 10 half-space planes
+    return np.vstack((AXIS_DIRECTIONS, np.array([
+        (1, 1, 0), (-1, -1, 0),
+        (0, 1, 1), (0, -1, -1),
+    ], dtype=np.float64) / np.sqrt(2.0)))
+
+
+def get_18dop_normals():
+    return np.vstack((AXIS_DIRECTIONS, EDGE_DIRECTIONS))
+
+
+def get_26dop_normals():
+    return np.vstack((AXIS_DIRECTIONS, EDGE_DIRECTIONS, CORNER_DIRECTIONS))
+
+
+KDOP_NORMALS = {
+    '10': get_10dop_normals,
+    '18': get_18dop_normals,
+    '26': get_26dop_normals,
+}
+
+
+def principal_axes_normals(points, normals):
+    """
+    Rotate a direction set from the world axes into the principal axes of a point cloud, so that e.g. the slabs of
+    an 18-DOP follow a rotated object instead of the world axes.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        normals (np.array): Directions relative to the world axes, shape (K, 3).
+
+    Returns:
+        np.array: The rotated directions, shape (K, 3).
+    """
+    return np.asarray(normals, dtype=np.float64) @ principal_axes_frame(points)
+
+
+def _slab_directions(normals):
+    """
+    Unit length, deduplicated directions of a k-DOP. Every direction is treated as a slab, i.e. its opposite is
+    added, and the axis directions are added if the slabs don't span all 3 dimensions, so the intersection of the
+    half-spaces is bounded for any direction set.
+    """
+    normals = np.asarray(normals, dtype=np.float64).reshape(-1, 3)
+    lengths = np.linalg.norm(normals, axis=1)
+    normals = normals[lengths > 0.0] / lengths[lengths > 0.0, None]
+    if len(normals) < 3 or np.linalg.matrix_rank(normals, tol=1e-6) < 3:
+        normals = np.vstack((AXIS_DIRECTIONS, normals))
+
+    normals = np.vstack((normals, -normals))
+    _, unique_idx = np.unique(np.round(normals * 1e9).astype(np.int64), axis=0, return_index=True)
+    return normals[np.sort(unique_idx)]
+
+
+def support_distances(points, normals):
+    """
+    Distance of the supporting plane of a point cloud along each direction, i.e. max(points @ normals.T).
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        normals (np.array): Unit directions, shape (K, 3).
+
+    Returns:
+        np.array: Support distances, shape (K,).
+    """
+    offsets = np.full(len(normals), -np.inf)
+    normals_t = np.ascontiguousarray(normals.T)
+    for start in range(0, len(points), PREFILTER_CHUNK_SIZE):
+        chunk = points[start:start + PREFILTER_CHUNK_SIZE]
+        offsets = np.maximum(offsets, (chunk @ normals_t).max(axis=0))
+    return offsets
+
+
+def halfspace_vertices(normals, offsets, tolerance):
+    """
+    Vertices of the convex polytope {x : normals @ x <= offsets}: the intersection points of all plane triples
+    that lie inside every half-space.
+
+    Args:
+        normals (np.array): Unit plane normals, shape (K, 3).
+        offsets (np.array): Plane offsets, shape (K,).
+        tolerance (float): Allowed distance outside of a half-space, and the distance below which vertices are
+            merged.
+
+    Returns:
+        np.array: Polytope vertices, shape (V, 3).
+    """
+    triples = np.array(list(combinations(range(len(normals)), 3)), dtype=np.int64)
+    systems = normals[triples]
+    solvable = np.abs(np.linalg.det(systems)) > 1e-9
+    points = np.linalg.solve(systems[solvable], offsets[triples[solvable]][..., None])[..., 0]
+
+    inside = (points @ normals.T - offsets <= tolerance).all(axis=1)
+    points = points[inside]
+
+    # Where more than 3 planes meet (e.g. the corners of a box cut by the
+    # diagonal planes of a 26-DOP) every triple yields the same vertex.
+    _, unique_idx = np.unique(np.round(points / tolerance).astype(np.int64), axis=0, return_index=True)
+    return points[np.sort(unique_idx)]
+
+
+def generate_kdop(points, normals):
+    """
+    Generate the k-DOP of a point cloud for an arbitrary set of directions.
+
+    The support distances along all directions are one matrix product, the polytope vertices come straight from
+    the half-space intersection and the faces from their convex hull, with the triangles of each k-DOP plane
+    merged into one polygon.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        normals (np.array): Directions, shape (K, 3). Don't need to be unit length, and the opposite of each
+            direction is always used as well.
+
+    Returns:
+        bmesh.types.BMesh: The k-DOP. The caller is responsible for freeing it.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        return bmesh.new()
+
+    normals = _slab_directions(normals)
+    offsets = support_distances(points, normals)
+    tolerance = KDOP_TOLERANCE * max(float(np.ptp(points, axis=0).max()), 1e-6)
+    vertices = halfspace_vertices(normals, offsets, tolerance)
+
+    return polytope_bmesh(vertices)
+
+
+def polytope_bmesh(vertices):
+    """
+    Build the mesh of a convex polytope from its vertices: their convex hull, with the triangles of each flat face
+    merged into one polygon.
+
+    Args:
+        vertices (np.array): Polytope vertices, shape (V, 3).
+
+    Returns:
+        bmesh.types.BMesh: The polytope. The caller is responsible for freeing it.
+    """
+    bm = bmesh_from_coordinates(vertices)
+    bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+    # Vertices on a polytope edge aren't needed by the hull.
+    bmesh.ops.delete(bm, geom=[v for v in bm.verts if not v.link_faces], context='VERTS')
+    bmesh.ops.dissolve_limit(bm, angle_limit=KDOP_DISSOLVE_ANGLE, verts=bm.verts[:], edges=bm.edges[:])
+    return bm
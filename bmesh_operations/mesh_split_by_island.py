@@ -1,5 +1,8 @@
-import bmesh
 import bpy
+import numpy as np
+from mathutils import Matrix
+
+from .vertex_arrays import mesh_from_polygons, mesh_vertex_coordinates, transform_coordinates
 
 
 def _get_linked_faces(f):
@@ -103,6 +106,254 @@ def _get_face_islands(faces):
     return face_islands
 
 
+def mesh_topology_arrays(mesh):
+    """
+    Read the face topology of a mesh with one foreach_get() per attribute.
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to read.
+
+    Returns:
+    dict: A dictionary of numpy arrays.
+          - 'loop_verts': Vertex index of every face corner, shape (L,).
+          - 'loop_edges': Edge index of every face corner, shape (L,).
+          - 'face_sizes': Number of corners of every face, shape (F,).
+          - 'face_mat': Material index of every face, shape (F,).
+    """
+    loop_count = len(mesh.loops)
+    face_count = len(mesh.polygons)
+
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    face_sizes = np.empty(face_count, dtype=np.int32)
+    face_mat = np.empty(face_count, dtype=np.int32)
+    if loop_count:
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        mesh.loops.foreach_get('edge_index', loop_edges)
+    if face_count:
+        mesh.polygons.foreach_get('loop_total', face_sizes)
+        mesh.polygons.foreach_get('material_index', face_mat)
+
+    return {'loop_verts': loop_verts, 'loop_edges': loop_edges, 'face_sizes': face_sizes, 'face_mat': face_mat}
+
+
+def union_find_roots(count, pairs_a, pairs_b):
+    """
+    Label the connected components of a graph with vectorized union-find.
+
+    Every round hooks the root of the larger index onto the root of the smaller one for every pair that still
+    joins two components, then flattens all paths by pointer jumping, so each round is a few array passes.
+
+    Parameters:
+    count (int): Number of nodes.
+    pairs_a (numpy.ndarray): First node of every edge, shape (E,).
+    pairs_b (numpy.ndarray): Second node of every edge, shape (E,).
+
+    Returns:
+    numpy.ndarray: The smallest node index of the component of every node, shape (count,).
+    """
+    roots = np.arange(count)
+    pairs_a = np.asarray(pairs_a, dtype=np.int64)
+    pairs_b = np.asarray(pairs_b, dtype=np.int64)
+
+    while True:
+        root_a = roots[pairs_a]
+        root_b = roots[pairs_b]
+        joining = root_a != root_b
+        if not joining.any():
+            return roots
+
+        # Drop the pairs already inside one component for the next rounds.
+        pairs_a, pairs_b = pairs_a[joining], pairs_b[joining]
+        root_a, root_b = root_a[joining], root_b[joining]
+        np.minimum.at(roots, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                break
+            roots = jumped
+
+
+def label_face_islands(face_sizes, loop_edges):
+    """
+    Label the islands of faces connected through manifold edges, matching _get_face_islands(): faces only connect
+    through edges used by exactly 2 faces.
+
+    Parameters:
+    face_sizes (numpy.ndarray): Number of corners of every face, shape (F,).
+    loop_edges (numpy.ndarray): Edge index of every face corner, faces in order, shape (L,).
+
+    Returns:
+    numpy.ndarray: Island index of every face, shape (F,), numbered in the order of the first face of each island.
+    """
+    face_count = len(face_sizes)
+    if face_count == 0:
+        return np.empty(0, dtype=np.int64)
+
+    loop_faces = np.repeat(np.arange(face_count), face_sizes)
+    order = np.argsort(loop_edges, kind='stable')
+    sorted_edges = loop_edges[order]
+    edge_counts = np.bincount(sorted_edges)
+
+    # The corners of a manifold edge are next to each other after sorting.
+    first = np.flatnonzero(np.r_[True, sorted_edges[1:] != sorted_edges[:-1]])
+    manifold = first[edge_counts[sorted_edges[first]] == 2]
+    roots = union_find_roots(face_count, loop_faces[order[manifold]], loop_faces[order[manifold + 1]])
+
+    _, labels = np.unique(roots, return_inverse=True)
+    return labels.reshape(-1)
+
+
+def _select_faces(topology, face_mask):
+    """
+    Keep the faces of face_mask and their corners in topology arrays of mesh_topology_arrays().
+    """
+    loop_mask = np.repeat(face_mask, topology['face_sizes'])
+    return {
+        'loop_verts': topology['loop_verts'][loop_mask],
+        'loop_edges': topology['loop_edges'][loop_mask],
+        'face_sizes': topology['face_sizes'][face_mask],
+        'face_mat': topology['face_mat'][face_mask],
+    }
+
+
+def get_mesh_islands(mesh, matrix=None, selected_only=False):
+    """
+    Split a mesh into its face islands as arrays, without any BMesh traversal: the topology is read once with
+    mesh_topology_arrays(), the islands are labelled with label_face_islands() and each island's vertices and faces
+    are sliced out with numpy.
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to split.
+    matrix (mathutils.Matrix, optional): A 4x4 matrix to transform the vertex coordinates with.
+    selected_only (bool, optional): Only split the faces whose vertices are all selected, like after
+        delete_non_selected_verts(). Defaults to False.
+
+    Returns:
+    list: A list of dictionaries, one per island.
+          - 'verts': Vertex coordinates, shape (V, 3).
+          - 'face_sizes': Number of vertices of every face, shape (F,).
+          - 'face_verts': Vertex indices of all faces into 'verts', concatenated.
+          - 'face_mat': Material index of every face, shape (F,).
+    """
+    topology = mesh_topology_arrays(mesh)
+    if selected_only and len(topology['face_sizes']):
+        selected = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get('select', selected)
+        face_starts = np.cumsum(topology['face_sizes']) - topology['face_sizes']
+        topology = _select_faces(topology, np.logical_and.reduceat(selected[topology['loop_verts']], face_starts))
+
+    face_sizes = topology['face_sizes']
+    labels = label_face_islands(face_sizes, topology['loop_edges'])
+    if len(labels) == 0:
+        return []
+
+    coords = mesh_vertex_coordinates(mesh)
+    if matrix is not None:
+        coords = transform_coordinates(coords, matrix)
+
+    # Faces and their corners grouped by island, keeping their order.
+    face_order = np.argsort(labels, kind='stable')
+    face_starts = np.cumsum(face_sizes) - face_sizes
+    sorted_sizes = face_sizes[face_order]
+    loop_order = (np.repeat(face_starts[face_order] - (np.cumsum(sorted_sizes) - sorted_sizes), sorted_sizes)
+                  + np.arange(int(sorted_sizes.sum())))
+    loop_labels = np.repeat(labels[face_order], sorted_sizes)
+
+    # Vertices used per island, sorted by island then vertex index.
+    vert_count = len(coords)
+    keys = loop_labels.astype(np.int64) * vert_count + topology['loop_verts'][loop_order]
+    island_keys, loop_island_verts = np.unique(keys, return_inverse=True)
+    island_verts = coords[island_keys % vert_count]
+
+    island_count = int(labels.max()) + 1
+    vert_counts = np.bincount(island_keys // vert_count, minlength=island_count)
+    loop_counts = np.bincount(loop_labels, minlength=island_count)
+    vert_ends = np.cumsum(vert_counts)
+    loop_ends = np.cumsum(loop_counts)
+    face_ends = np.cumsum(np.bincount(labels, minlength=island_count))
+    # Make the vertex indices relative to the first vertex of their island.
+    loop_island_verts = loop_island_verts.reshape(-1) - np.repeat(vert_ends - vert_counts, loop_counts)
+    sorted_mat = topology['face_mat'][face_order]
+
+    islands = []
+    vert_start = face_start = loop_start = 0
+    for vert_end, face_end, loop_end in zip(vert_ends, face_ends, loop_ends):
+        islands.append({
+            'verts': island_verts[vert_start:vert_end],
+            'face_sizes': sorted_sizes[face_start:face_end],
+            'face_verts': loop_island_verts[loop_start:loop_end],
+            'face_mat': sorted_mat[face_start:face_end],
+        })
+        vert_start, face_start, loop_start = vert_end, face_end, loop_end
+
+    return islands
+
+
+class MeshIsland:
+    """
+    A face island held as arrays in place of a temporary island object. The shape operators only read the vertex
+    coordinates and matrix_world of their input objects, so they fit colliders to these directly and no scene object
+    has to be created, linked and removed again per island.
+
+    Attributes:
+    name (str): Name of the source object.
+    verts (numpy.ndarray): Vertex coordinates, shape (V, 3).
+    face_sizes (numpy.ndarray): Number of vertices of every face, shape (F,).
+    face_verts (numpy.ndarray): Vertex indices of all faces into verts, concatenated.
+    face_mat (numpy.ndarray): Material index of every face, shape (F,).
+    matrix_world (mathutils.Matrix): Transforms verts to world space. The identity for world space islands.
+    source_matrix (mathutils.Matrix): World matrix of the source object.
+    """
+    type = 'MESH'
+
+    def __init__(self, name, island, matrix_world, source_matrix):
+        self.name = name
+        self.verts = island['verts']
+        self.face_sizes = island['face_sizes']
+        self.face_verts = island['face_verts']
+        self.face_mat = island['face_mat']
+        self.matrix_world = matrix_world
+        self.source_matrix = source_matrix
+
+    def to_mesh(self, name='mesh'):
+        """
+        Create a mesh datablock of the island.
+
+        Parameters:
+        name (str, optional): Name of the new mesh.
+
+        Returns:
+        bpy.types.Mesh: The new mesh.
+        """
+        me = mesh_from_polygons(self.verts, self.face_sizes, self.face_verts, name=name)
+        me.polygons.foreach_set('material_index', self.face_mat)
+        return me
+
+
+def get_island_records(obj, use_world=True, mesh=None, selected_only=False):
+    """
+    Split an object into MeshIsland records without creating any datablocks.
+
+    Parameters:
+    obj (bpy.types.Object): The Blender object to process.
+    use_world (bool, optional): If True, the island coordinates are in world space. Defaults to True.
+    mesh (bpy.types.Mesh, optional): The mesh to split instead of obj.data, e.g. with the modifiers applied.
+    selected_only (bool, optional): Only split the selected faces, see get_mesh_islands(). Defaults to False.
+
+    Returns:
+    list of MeshIsland: The face islands of the object.
+    """
+    source_matrix = obj.matrix_world.copy()
+    matrix_world = Matrix.Identity(4) if use_world else source_matrix
+    if mesh is None:
+        mesh = obj.data
+
+    islands = get_mesh_islands(mesh, source_matrix if use_world else None, selected_only=selected_only)
+    return [MeshIsland(obj.name, island, matrix_world, source_matrix) for island in islands]
+
+
 def create_objs_from_island(obj, use_world=True):
     """
     Create separate objects from face islands of the given object.
@@ -115,30 +366,10 @@ def create_objs_from_island(obj, use_world=True):
     list of bpy.types.Object: A list of new objects created from the face islands.
     """
 
-    wld_mat = obj.matrix_world
-
-    bm = bmesh.new()
-    bm.from_mesh(obj.data)
-
-    face_islands = _get_face_islands(bm.faces)
-    bm.free()
-    # print('Face Islands: ' + str(face_islands))
     objs = []
 
-    for island in face_islands:
-        py_verts = island['py_verts']
-        py_faces = island['py_faces']
-        py_face_mat = island['py_face_mat']
-
-        name = 'Object'
-        me = bpy.data.meshes.new(name)
-        if use_world:
-            me.from_pydata([wld_mat @ x_co for x_co in py_verts], [], py_faces)
-        else:
-            me.from_pydata([x_co for x_co in py_verts], [], py_faces)
-
-        for f, f_mat_idx in zip(me.polygons, py_face_mat):
-            f.material_index = f_mat_idx
+    for island in get_island_records(obj, use_world):
+        me = island.to_mesh(name='Object')
 
         # create a new object, and link it to the current view layer for display
         ob = bpy.data.objects.new(name='output', object_data=me)
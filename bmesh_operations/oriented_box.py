@@ -0,0 +1,238 @@
+import bmesh
+import numpy as np
+
+from .vertex_arrays import bmesh_from_coordinates, bmesh_vertex_coordinates
+
+# Number of (point, frame) pairs projected at once when evaluating candidate
+# frames, i.e. the (frames, 3, points) intermediate stays around 24 MB.
+OBB_CHUNK_SIZE = 1 << 20
+
+# Above this many (point, frame) pairs the exhaustive search over every hull
+# face frame takes longer than the modal operator can afford per update, so
+# minimum_oriented_box() switches to the refinement search by default.
+OBB_EXACT_WORK_LIMIT = 50_000_000
+
+# Number of largest hull faces whose frames seed the refinement search, next
+# to the principal axes.
+OBB_REFINE_SEED_FACES = 32
+
+# Initial and final rotation step of the refinement search, in radians.
+OBB_REFINE_START_ANGLE = np.radians(8.0)
+OBB_REFINE_MIN_ANGLE = 1e-5
+
+# Face normals shorter than this are considered degenerate, like the
+# 0.00001 tolerance the operator has always used.
+_DEGENERATE_LENGTH = 1e-5
+
+
+def convex_hull_arrays(coords):
+    """
+    Compute the convex hull of a point cloud with bmesh.ops.convex_hull().
+
+    Args:
+        coords (np.array): Points, shape (N, 3).
+
+    Returns:
+        tuple: Hull vertex positions, shape (H, 3), hull triangles as indices into those, shape (F, 3), and the hull
+            volume. Faces that aren't triangles are skipped, like the candidate frames always did.
+    """
+    bm = bmesh_from_coordinates(coords)
+    try:
+        hull = bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+        bmesh.ops.delete(bm, geom=hull['geom_unused'], context='VERTS')
+        bm.verts.index_update()
+
+        volume = abs(bm.calc_volume(signed=False))
+        triangles = np.array([[v.index for v in face.verts] for face in bm.faces if len(face.verts) == 3],
+                             dtype=np.int64).reshape(-1, 3)
+        points = bmesh_vertex_coordinates(bm)
+    finally:
+        bm.free()
+
+    # Drop the interior vertices the hull didn't use.
+    used, triangles = np.unique(triangles, return_inverse=True)
+    return points[used], triangles.reshape(-1, 3), volume
+
+
+def _face_normals(points, triangles):
+    a, b, c = (points[triangles[:, i]] for i in range(3))
+    return np.cross(b - a, c - a)
+
+
+def hull_face_frames(points, triangles):
+    """
+    Candidate box orientations of a convex hull: for every triangle, the three frames with one axis along the face
+    normal and one along an edge of the face.
+
+    Frames are orthonormal with the axes as rows, so world coordinates are converted into a frame with
+    points @ frame.T. Frames that only differ in the sign or the order of their axes describe the same box and are
+    evaluated once: the many triangles of a flat hull face all produce the same frames.
+
+    Args:
+        points (np.array): Hull vertex positions, shape (H, 3).
+        triangles (np.array): Hull triangles, shape (F, 3).
+
+    Returns:
+        np.array: Right-handed frames, shape (M, 3, 3).
+    """
+    normals = _face_normals(points, triangles)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > _DEGENERATE_LENGTH
+    if not valid.any():
+        return np.empty((0, 3, 3))
+
+    triangles = triangles[valid]
+    normals = normals[valid] / lengths[valid, None]
+
+    # One frame per (face, edge) pair.
+    edges = points[triangles[:, [0, 1, 2]]] - points[triangles[:, [1, 2, 0]]]
+    edges /= np.linalg.norm(edges, axis=2, keepdims=True)
+    normals = np.repeat(normals[:, None, :], 3, axis=1)
+    frames = np.stack((edges, np.cross(normals, edges), normals), axis=2).reshape(-1, 3, 3)
+
+    # Canonical form for deduplication: flip every axis so that its first
+    # significant component is positive, then sort the axes. The frames
+    # themselves are kept as they are, so they stay right-handed.
+    significant = np.abs(frames) > _DEGENERATE_LENGTH
+    first = significant.argmax(axis=2)
+    signs = np.sign(np.take_along_axis(frames, first[..., None], axis=2))
+    canonical = np.round(frames * signs * 1e6).astype(np.int64)
+    order = np.lexsort((canonical[..., 2], canonical[..., 1], canonical[..., 0]))
+    canonical = np.take_along_axis(canonical, order[..., None], axis=1)
+
+    _, unique_idx = np.unique(canonical.reshape(-1, 9), axis=0, return_index=True)
+    return frames[np.sort(unique_idx)]
+
+
+def frame_box_extents(points, frames):
+    """
+    Bounds of a point cloud in each of a batch of frames.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        frames (np.array): Orthonormal frames with the axes as rows, shape (M, 3, 3).
+
+    Returns:
+        tuple: Box minima and maxima in frame coordinates, both shape (M, 3).
+    """
+    bb_min = np.empty((len(frames), 3))
+    bb_max = np.empty((len(frames), 3))
+    chunk = max(1, OBB_CHUNK_SIZE // max(len(points), 1))
+    points_t = np.ascontiguousarray(points.T)
+
+    for start in range(0, len(frames), chunk):
+        # (frames, 3, points) in one batched matrix multiply, reduced along
+        # the contiguous last axis. The transpose of an orthonormal frame is
+        # its inverse, so nothing needs to be inverted.
+        projected = frames[start:start + chunk] @ points_t
+        bb_min[start:start + chunk] = projected.min(axis=2)
+        bb_max[start:start + chunk] = projected.max(axis=2)
+
+    return bb_min, bb_max
+
+
+def _best_frame(points, frames):
+    bb_min, bb_max = frame_box_extents(points, frames)
+    volumes = np.prod(bb_max - bb_min, axis=1)
+    best = int(volumes.argmin())
+    return frames[best], bb_min[best], bb_max[best], float(volumes[best])
+
+
+def principal_axes_frame(points):
+    """
+    Right-handed frame of the principal axes of a point cloud.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+
+    Returns:
+        np.array: Frame with the axes as rows, shape (3, 3).
+    """
+    centered = points - points.mean(axis=0)
+    _, vectors = np.linalg.eigh(centered.T @ centered)
+    frame = vectors.T
+    if np.linalg.det(frame) < 0.0:
+        frame[2] *= -1.0
+    return frame
+
+
+def _axis_rotations(angle):
+    """The 6 rotations by +-angle around the x, y and z axis, shape (6, 3, 3)."""
+    rotations = []
+    for sign in (1.0, -1.0):
+        c, s = np.cos(sign * angle), np.sin(sign * angle)
+        rotations.append(((1, 0, 0), (0, c, -s), (0, s, c)))
+        rotations.append(((c, 0, s), (0, 1, 0), (-s, 0, c)))
+        rotations.append(((c, -s, 0), (s, c, 0), (0, 0, 1)))
+    return np.array(rotations, dtype=np.float64)
+
+
+def refine_frame(points, frame):
+    """
+    Local search for a smaller box around a start frame: the frame is rotated around each of its own axes in both
+    directions, all 6 rotations are evaluated at once, and the step is halved whenever none of them is an
+    improvement.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        frame (np.array): Start frame with the axes as rows, shape (3, 3).
+
+    Returns:
+        tuple: (frame, bb_min, bb_max, volume) of the best box found.
+    """
+    frame, bb_min, bb_max, volume = _best_frame(points, frame[None])
+    angle = OBB_REFINE_START_ANGLE
+
+    while angle > OBB_REFINE_MIN_ANGLE:
+        candidate = _best_frame(points, _axis_rotations(angle) @ frame)
+        if candidate[3] < volume:
+            frame, bb_min, bb_max, volume = candidate
+        else:
+            angle /= 2.0
+
+    return frame, bb_min, bb_max, volume
+
+
+def minimum_oriented_box(points, triangles, refine=None):
+    """
+    Compute the minimum volume oriented bounding box of a convex hull.
+
+    The exhaustive search evaluates every deduplicated frame of hull_face_frames() in chunked array operations.
+    The refinement search only evaluates the principal axes and the frames of the OBB_REFINE_SEED_FACES largest
+    hull faces, and improves the best of them with refine_frame(), which scales to hulls with many thousands of
+    faces.
+
+    Args:
+        points (np.array): Hull vertex positions, shape (H, 3).
+        triangles (np.array): Hull triangles, shape (F, 3).
+        refine (bool, optional): Use the refinement search. By default it is used when the exhaustive search would
+            exceed OBB_EXACT_WORK_LIMIT.
+
+    Returns:
+        tuple: (frame, bb_min, bb_max) with the frame axes as rows and the box bounds in frame coordinates, or
+            (None, None, None) if the hull has no valid face.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+    if refine is None:
+        # Upper bound, deduplication only ever removes frames.
+        refine = 3 * len(triangles) * len(points) > OBB_EXACT_WORK_LIMIT
+
+    if not refine:
+        frames = hull_face_frames(points, triangles)
+        if len(frames) == 0:
+            return None, None, None
+        frame, bb_min, bb_max, _ = _best_frame(points, frames)
+        return frame, bb_min, bb_max
+
+    areas = np.linalg.norm(_face_normals(points, triangles), axis=1)
+    largest = triangles[np.argsort(areas)[::-1][:OBB_REFINE_SEED_FACES]]
+    frames = hull_face_frames(points, largest)
+    if len(frames) == 0:
+        return None, None, None
+    seeds = np.concatenate((principal_axes_frame(points)[None], frames))
+
+    frame, _, _, _ = _best_frame(points, seeds)
+    frame, bb_min, bb_max, _ = refine_frame(points, frame)
+    return frame, bb_min, bb_max
@@ -0,0 +1,198 @@
+from itertools import combinations
+
+import numpy as np
+
+# Fixed support directions of the Akl-Toussaint style cull: the 3 axes, the
+# 6 face diagonals and the 4 corner diagonals (the 13 slab directions of a
+# 26-DOP). The extreme point along each direction and its negation are
+# always on the convex hull, and the polytope they span is used to throw
+# away every point strictly inside it.
+SUPPORT_DIRECTIONS = np.array([
+    (1, 0, 0), (0, 1, 0), (0, 0, 1),
+    (1, 1, 0), (1, -1, 0), (1, 0, 1), (1, 0, -1), (0, 1, 1), (0, 1, -1),
+    (1, 1, 1), (1, 1, -1), (1, -1, 1), (1, -1, -1),
+], dtype=np.float64)
+
+# Below this many points every fitter is already fast enough that the cull
+# itself would be the more expensive step.
+MIN_PREFILTER_POINTS = 64
+
+# The cull is first tried on an evenly strided sample of about this many
+# points, see hull_candidate_mask().
+PREFILTER_SAMPLE_SIZE = 4096
+
+# Share of the sample the cull has to drop for the full pass to pay off. On
+# surface meshes, e.g. scans of convex parts, nearly every point is on the
+# hull and the full pass would cost several times more than the fit.
+MIN_PREFILTER_CULL_FRACTION = 0.5
+
+# Points are projected in chunks of this many rows, so the (N, directions)
+# and (N, facets) intermediates stay a few MB even for multi-million vertex
+# scans.
+PREFILTER_CHUNK_SIZE = 1 << 16
+
+# Relative to the point cloud's bounding box. Points within this distance of
+# the extreme polytope's surface are kept, so rounding can only ever keep too
+# many points, never drop a real hull vertex.
+PREFILTER_TOLERANCE = 1e-7
+
+
+def _bounding_box(points):
+    """(lower, size) of the bounding box of points. Reducing one column at a time is several times faster than
+    min(axis=0) on an (N, 3) array."""
+    lower = np.array([points[:, i].min() for i in range(3)])
+    return lower, np.array([points[:, i].max() for i in range(3)]) - lower
+
+
+def _unit_box_chunks(points, lo, scale):
+    """Yield (start, chunk) with each chunk of points mapped into the unit box [0, 1]^3 of the point cloud."""
+    for start in range(0, len(points), PREFILTER_CHUNK_SIZE):
+        yield start, (points[start:start + PREFILTER_CHUNK_SIZE] - lo) * scale
+
+
+def support_point_indices(points, directions=SUPPORT_DIRECTIONS):
+    """
+    Find the indices of the extreme points of a point cloud along a set of directions.
+
+    The points are mapped into their unit bounding box first (an affine map, so the extreme points stay extreme
+    points), which keeps the fixed directions meaningful for long, thin or flat objects.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+        directions (np.array): Directions, shape (D, 3). Both the maximum and the minimum along each direction are
+            returned, so only one of each pair of opposite directions is needed.
+
+    Returns:
+        np.array: Sorted unique indices into points of the support points.
+    """
+    lo, size = _bounding_box(points)
+    scale = np.divide(1.0, size, out=np.zeros(3), where=size > 0)
+
+    best_max = np.full(len(directions), -np.inf)
+    best_min = np.full(len(directions), np.inf)
+    idx_max = np.zeros(len(directions), dtype=np.int64)
+    idx_min = np.zeros(len(directions), dtype=np.int64)
+    cols = np.arange(len(directions))
+
+    for start, chunk in _unit_box_chunks(points, lo, scale):
+        # (D, chunk) rather than (chunk, D): reducing along contiguous rows
+        # is several times faster.
+        proj = directions @ chunk.T
+
+        arg = proj.argmax(axis=1)
+        val = proj[cols, arg]
+        better = val > best_max
+        best_max[better] = val[better]
+        idx_max[better] = arg[better] + start
+
+        arg = proj.argmin(axis=1)
+        val = proj[cols, arg]
+        better = val < best_min
+        best_min[better] = val[better]
+        idx_min[better] = arg[better] + start
+
+    return np.unique(np.concatenate((idx_max, idx_min)))
+
+
+def _polytope_planes(corners, tolerance):
+    """Outward facing (normals, offsets) of the facets of the convex polytope spanned by a handful of points, or
+    None if the points don't span a volume. Brute force over all point triples, which is cheap for the <= 26
+    support points this is used with."""
+    triples = np.array(list(combinations(range(len(corners)), 3)), dtype=np.int64)
+    a, b, c = corners[triples[:, 0]], corners[triples[:, 1]], corners[triples[:, 2]]
+    normals = np.cross(b - a, c - a)
+    lengths = np.linalg.norm(normals, axis=1)
+
+    valid = lengths > tolerance * tolerance
+    if not valid.any():
+        return None
+    normals = normals[valid] / lengths[valid, None]
+    offsets = np.einsum('ij,ij->i', normals, a[valid])
+
+    # A triple spans a facet if every corner lies on one side of its plane.
+    side = corners @ normals.T - offsets
+    below = (side <= tolerance).all(axis=0)
+    above = (side >= -tolerance).all(axis=0)
+    normals = np.where(above[:, None] & ~below[:, None], -normals, normals)
+    offsets = np.where(above & ~below, -offsets, offsets)
+
+    # Both at once only happens when every corner is coplanar with the triple.
+    is_facet = below ^ above
+    if not is_facet.any():
+        return None
+
+    # Coplanar corner sets (e.g. a cube face with 4 support points) produce
+    # the same plane from several triples.
+    planes = np.unique(np.round(np.column_stack((normals[is_facet], offsets[is_facet])), 9), axis=0)
+    return planes[:, :3], planes[:, 3]
+
+
+def hull_candidate_mask(points):
+    """
+    Mark the points that can possibly be vertices of the convex hull of a point cloud.
+
+    Every point strictly inside the polytope spanned by the extreme points along SUPPORT_DIRECTIONS is dropped
+    (Akl-Toussaint heuristic). Only convex hull vertices can touch a minimum enclosing sphere, cylinder, capsule,
+    box or k-DOP, so every such fitter returns the same result for the candidates as for the full point cloud.
+    The cull is invariant under affine transforms, so it can run in either local or world space.
+
+    Large point clouds are culled on a sample of about PREFILTER_SAMPLE_SIZE points first. If that drops less than
+    MIN_PREFILTER_CULL_FRACTION of the sample, every point is kept without the full pass.
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+
+    Returns:
+        np.array: Boolean mask, shape (N,). True for the points that are kept.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    keep = np.ones(len(points), dtype=bool)
+    if len(points) < MIN_PREFILTER_POINTS:
+        return keep
+
+    lo, size = _bounding_box(points)
+    if (size <= 0.0).any():
+        # Flat or degenerate input, nothing is strictly inside a volume.
+        return keep
+    scale = 1.0 / size
+
+    step = len(points) // PREFILTER_SAMPLE_SIZE
+    if step > 1 and hull_candidate_mask(points[::step]).mean() > 1.0 - MIN_PREFILTER_CULL_FRACTION:
+        return keep
+
+    # Everything below works in the point cloud's unit bounding box, see
+    # support_point_indices(), so the tolerance is relative to its extent.
+    tolerance = PREFILTER_TOLERANCE
+    corners = (points[support_point_indices(points)] - lo) * scale
+    planes = _polytope_planes(corners, tolerance)
+    if planes is None:
+        return keep
+    normals, offsets = planes
+
+    # Largest sphere around the corners' centroid that fits inside the
+    # polytope. Most interior points of a dense scan fall inside it and are
+    # settled with a single distance instead of a test against every facet.
+    center = corners.mean(axis=0)
+    inner_sqr_radius = max(float(np.min(offsets - normals @ center)) - tolerance, 0.0) ** 2
+
+    for start, chunk in _unit_box_chunks(points, lo, scale):
+        inside = ((chunk - center) ** 2).sum(axis=1) < inner_sqr_radius
+        rest = np.flatnonzero(~inside)
+        inside[rest] = (normals @ chunk[rest].T - offsets[:, None]).max(axis=0) < -tolerance
+        keep[start:start + len(chunk)] = ~inside
+
+    return keep
+
+
+def prefilter_hull_candidates(points):
+    """
+    Drop the points of a point cloud that can't be convex hull vertices, see hull_candidate_mask().
+
+    Args:
+        points (np.array): Points, shape (N, 3).
+
+    Returns:
+        np.array: The remaining points, shape (M, 3) with M <= N.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    return points[hull_candidate_mask(points)]
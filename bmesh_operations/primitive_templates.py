@@ -0,0 +1,160 @@
+import bmesh
+import bpy
+import numpy as np
+
+from .capsule_generation import create_capsule_data
+from .vertex_arrays import write_polygons
+
+# Unit primitives by (shape, segments, rings). Only a handful of distinct
+# segment counts are ever used in a session, so the cache is never pruned.
+_TEMPLATES = {}
+
+UV_LAYER_NAME = 'UVMap'
+
+# create_capsule_data() clamps these to keep the capsule from degenerating.
+MIN_CAPSULE_RADIUS = 0.0001
+MIN_CAPSULE_DEPTH = 0.0002
+
+
+def _bmesh_template(bm, smooth=False):
+    """
+    Read the vertex, face and UV arrays of a BMesh into a template dictionary.
+
+    Parameters:
+    bm (bmesh.types.BMesh): The unit primitive.
+    smooth (bool, optional): Whether the faces are shaded smooth.
+
+    Returns:
+    dict: The template, see primitive_template().
+    """
+    bm.verts.index_update()
+    uv_layer = bm.loops.layers.uv.active
+    faces = list(bm.faces)
+
+    template = {
+        'coords': np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3),
+        'face_sizes': np.array([len(f.verts) for f in faces], dtype=np.int32),
+        'face_verts': np.array([v.index for f in faces for v in f.verts], dtype=np.int32),
+        'loop_uvs': None,
+        'depth_factor': None,
+        'smooth': smooth,
+    }
+    if uv_layer is not None:
+        template['loop_uvs'] = np.array([loop[uv_layer].uv for f in faces for loop in f.loops],
+                                        dtype=np.float32).reshape(-1, 2)
+    return template
+
+
+def _sphere_template(segments):
+    """Unit radius UV sphere with segments rings and segments * 2 columns, like create_sphere() always built."""
+    # v_segments below 2 crashes Blender's create_uvsphere with a divide by zero.
+    segments = max(2, segments)
+
+    bm = bmesh.new()
+    if bpy.app.version >= (3, 0, 0):
+        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, radius=1.0)
+    else:
+        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, diameter=1.0)
+
+    template = _bmesh_template(bm, smooth=True)
+    bm.free()
+    return template
+
+
+def _cylinder_template(segments):
+    """Cylinder of radius 1 and depth 1 along Z with triangle fan caps and UVs."""
+    bm = bmesh.new()
+    bm.loops.layers.uv.new(UV_LAYER_NAME)
+    if bpy.app.version >= (3, 0, 0):
+        bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=True, segments=segments, radius1=1.0, radius2=1.0,
+                              depth=1.0, calc_uvs=True)
+    else:
+        bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=True, segments=segments, diameter1=1.0, diameter2=1.0,
+                              depth=1.0, calc_uvs=True)
+
+    template = _bmesh_template(bm)
+    bm.free()
+    return template
+
+
+def _capsule_template(segments, rings):
+    """
+    Capsule of radius 1 with both hemispheres centered at the origin. 'depth_factor' moves the vertices of the north
+    (+1) and south (-1) hemisphere, and those of the middle rings in between, apart by half the depth of a capsule,
+    see write_primitive_mesh().
+    """
+    # With a depth of 2, the hemisphere vertices are at least 1 away from the
+    # equator plane and the middle rings lie in between.
+    data = create_capsule_data(longitudes=segments, latitudes=segments, rings=rings, depth=2.0, radius=1.0,
+                               uv_profile="FIXED")
+    coords = np.array(data['vs'], dtype=np.float64)
+    depth_factor = np.clip(coords[:, 2], -1.0, 1.0)
+    coords[:, 2] -= depth_factor
+
+    vts = np.array(data['vts'], dtype=np.float32)
+    return {
+        'coords': coords,
+        'face_sizes': np.array([len(face) for face in data['v_indices']], dtype=np.int32),
+        'face_verts': np.array([i for face in data['v_indices'] for i in face], dtype=np.int32),
+        'loop_uvs': vts[[i for face in data['vt_indices'] for i in face]],
+        'depth_factor': depth_factor,
+        'smooth': False,
+    }
+
+
+def primitive_template(shape, segments, rings=0):
+    """
+    Cached unit primitive as arrays, built once per (shape, segments, rings) and shared by every collider.
+
+    Parameters:
+    shape (str): 'sphere', 'cylinder' or 'capsule'.
+    segments (int): Number of segments of the primitive.
+    rings (int, optional): Number of rings of the middle section of a capsule.
+
+    Returns:
+    dict: The unit primitive. The arrays must not be modified.
+          - 'coords': Vertex positions, shape (V, 3).
+          - 'face_sizes': Number of vertices of every face, shape (F,).
+          - 'face_verts': Vertex indices of all faces, concatenated.
+          - 'loop_uvs': UV of every face corner, shape (L, 2), or None.
+          - 'depth_factor': Offset of every capsule vertex along Z in half depths, shape (V,), or None.
+          - 'smooth': Whether the faces are shaded smooth.
+    """
+    key = (shape, int(segments), int(rings))
+    template = _TEMPLATES.get(key)
+    if template is None:
+        if shape == 'sphere':
+            template = _sphere_template(key[1])
+        elif shape == 'cylinder':
+            template = _cylinder_template(key[1])
+        elif shape == 'capsule':
+            template = _capsule_template(key[1], key[2])
+        else:
+            raise ValueError(f"Unknown primitive shape: {shape}")
+        _TEMPLATES[key] = template
+    return template
+
+
+def write_primitive_mesh(mesh, template, scale, half_depth=0.0):
+    """
+    Replace the geometry of a mesh with a scaled primitive template, written with one foreach_set() per attribute.
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to write to.
+    template (dict): A template from primitive_template().
+    scale (tuple): Scale of the unit primitive along X, Y and Z.
+    half_depth (float, optional): Half the depth of the cylinder section of a capsule.
+    """
+    coords = template['coords'] * np.asarray(scale, dtype=np.float64)
+    if template['depth_factor'] is not None:
+        coords[:, 2] += template['depth_factor'] * half_depth
+    write_polygons(mesh, coords, template['face_sizes'], template['face_verts'])
+
+    if template['smooth']:
+        mesh.polygons.foreach_set('use_smooth', np.ones(len(mesh.polygons), dtype=bool))
+
+    if template['loop_uvs'] is not None:
+        uv_layer = mesh.uv_layers.get(UV_LAYER_NAME) or mesh.uv_layers.new(name=UV_LAYER_NAME)
+        uv_layer.data.foreach_set('uv', template['loop_uvs'].ravel())
+
+    mesh.update()
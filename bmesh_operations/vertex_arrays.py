@@ -0,0 +1,311 @@
+import bmesh
+import bpy
+import numpy as np
+
+
+def mesh_vertex_coordinates(mesh, selected_only=False):
+    """Return a mesh's vertex positions as an (N, 3) float64 array.
+
+    Reads `co` (and the `select` flags, when selected_only is set) with a
+    single foreach_get() each, instead of walking MeshVertex objects one at a
+    time - on multi-million vertex scans the per-vertex Python loop was the
+    entire cost of generating even a simple box collider.
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to read.
+    selected_only (bool, optional): Only return selected vertices. Defaults to False.
+
+    Returns:
+    numpy.ndarray: Local-space vertex coordinates, shape (N, 3).
+    """
+    count = len(mesh.vertices)
+    coords = np.empty((count, 3), dtype=np.float64)
+    if count == 0:
+        return coords
+
+    mesh.vertices.foreach_get('co', coords.ravel())
+
+    if selected_only:
+        mask = np.empty(count, dtype=bool)
+        mesh.vertices.foreach_get('select', mask)
+        coords = coords[mask]
+
+    return coords
+
+
+def bmesh_vertex_coordinates(bm, selected_only=False):
+    """Return a BMesh's vertex positions as an (N, 3) float64 array.
+
+    BMVertSeq has no foreach_get(), so the BMesh is written to a throwaway
+    mesh datablock first (bm.to_mesh() is a single C call and keeps the
+    selection flags) and read back through mesh_vertex_coordinates().
+
+    Parameters:
+    bm (bmesh.types.BMesh): The BMesh to read.
+    selected_only (bool, optional): Only return selected vertices. Defaults to False.
+
+    Returns:
+    numpy.ndarray: Vertex coordinates in the BMesh's own space, shape (N, 3).
+    """
+    tmp_mesh = bpy.data.meshes.new('tmp_vertex_array')
+    try:
+        bm.to_mesh(tmp_mesh)
+        return mesh_vertex_coordinates(tmp_mesh, selected_only=selected_only)
+    finally:
+        bpy.data.meshes.remove(tmp_mesh)
+
+
+def transform_coordinates(coords, matrix):
+    """Apply a 4x4 affine matrix to every row of an (N, 3) array with one matrix multiply.
+
+    Parameters:
+    coords (numpy.ndarray): Points, shape (N, 3).
+    matrix (mathutils.Matrix or numpy.ndarray): 4x4 transformation matrix.
+
+    Returns:
+    numpy.ndarray: The transformed points, shape (N, 3).
+    """
+    mtx = np.asarray(matrix, dtype=np.float64)
+    return np.asarray(coords, dtype=np.float64) @ mtx[:3, :3].T + mtx[:3, 3]
+
+
+def as_coordinate_array(vertices):
+    """Return vertex positions as an (N, 3) float64 array.
+
+    Accepts an (N, 3) array-like (returned as float64 unchanged), a
+    MeshVertex collection such as mesh.vertices (read with foreach_get()), or
+    any other sequence of objects with a `co` attribute (e.g. BMVerts).
+    """
+    if isinstance(vertices, np.ndarray):
+        return vertices.astype(np.float64, copy=False).reshape(-1, 3)
+
+    if hasattr(vertices, 'foreach_get'):
+        coords = np.empty((len(vertices), 3), dtype=np.float64)
+        if len(coords):
+            vertices.foreach_get('co', coords.ravel())
+        return coords
+
+    return np.array([v.co for v in vertices], dtype=np.float64).reshape(-1, 3)
+
+
+def mesh_from_coordinates(coords, name='mesh'):
+    """Create a new vertex-only mesh datablock from an (N, 3) array with a single foreach_set().
+
+    Parameters:
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+    name (str, optional): Name of the new mesh. Defaults to 'mesh'.
+
+    Returns:
+    bpy.types.Mesh: The new mesh.
+    """
+    coords = np.ascontiguousarray(coords, dtype=np.float32).reshape(-1, 3)
+    me = bpy.data.meshes.new(name)
+    me.vertices.add(len(coords))
+    me.vertices.foreach_set('co', coords.ravel())
+    me.update()
+    return me
+
+
+def bmesh_from_coordinates(coords):
+    """Create a new vertex-only BMesh from an (N, 3) array.
+
+    Goes through mesh_from_coordinates() and bm.from_mesh() instead of
+    calling bm.verts.new() once per point.
+
+    Parameters:
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+
+    Returns:
+    bmesh.types.BMesh: The new BMesh. The caller is responsible for freeing it.
+    """
+    tmp_mesh = mesh_from_coordinates(coords, name='tmp_vertex_array')
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(tmp_mesh)
+    finally:
+        bpy.data.meshes.remove(tmp_mesh)
+    return bm
+
+
+def mesh_polygon_arrays(mesh):
+    """Return a mesh's face sizes and face vertex indices with one foreach_get() each, see write_polygons().
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to read.
+
+    Returns:
+    tuple: The number of vertices of each face, shape (F,), and the vertex indices of all faces in loop order,
+        shape (L,).
+    """
+    face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', face_sizes)
+    face_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', face_vertices)
+    return face_sizes, face_vertices
+
+
+def write_polygons(mesh, coords, face_sizes, face_vertices, edges=None):
+    """Replace the geometry of a mesh with vertex and face index arrays with one foreach_set() per attribute.
+
+    Parameters:
+    mesh (bpy.types.Mesh): The mesh to write to. Its materials are kept, all other geometry and attributes are
+        removed.
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+    face_sizes (numpy.ndarray): Number of vertices of each face, shape (F,).
+    face_vertices (numpy.ndarray): Vertex indices of all faces, concatenated, shape (sum(face_sizes),).
+    edges (numpy.ndarray, optional): Vertex indices of edges to keep, e.g. loose edges, shape (E, 2). The edges of
+        the faces are always added.
+    """
+    coords = np.ascontiguousarray(coords, dtype=np.float32).reshape(-1, 3)
+    face_sizes = np.ascontiguousarray(face_sizes, dtype=np.int32)
+    face_vertices = np.ascontiguousarray(face_vertices, dtype=np.int32)
+
+    mesh.clear_geometry()
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', coords.ravel())
+    if edges is not None and len(edges):
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set('vertices', np.ascontiguousarray(edges, dtype=np.int32).ravel())
+    mesh.loops.add(len(face_vertices))
+    mesh.loops.foreach_set('vertex_index', face_vertices)
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set('loop_start', (np.cumsum(face_sizes) - face_sizes).astype(np.int32))
+    if bpy.app.version < (4, 0, 0):
+        # legacy support, loop_total is derived from loop_start since 4.0
+        mesh.polygons.foreach_set('loop_total', face_sizes)
+    mesh.update(calc_edges=True)
+
+
+def mesh_from_polygons(coords, face_sizes, face_vertices, name='mesh'):
+    """Create a new mesh datablock from vertex and face index arrays, see write_polygons().
+
+    Parameters:
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+    face_sizes (numpy.ndarray): Number of vertices of each face, shape (F,).
+    face_vertices (numpy.ndarray): Vertex indices of all faces, concatenated, shape (sum(face_sizes),).
+    name (str, optional): Name of the new mesh. Defaults to 'mesh'.
+
+    Returns:
+    bpy.types.Mesh: The new mesh.
+    """
+    me = bpy.data.meshes.new(name)
+    write_polygons(me, coords, face_sizes, face_vertices)
+    return me
+
+
+def bmesh_from_polygons(coords, face_sizes, face_vertices):
+    """Create a new BMesh from vertex and face index arrays, through mesh_from_polygons() and bm.from_mesh().
+
+    Parameters:
+    coords (numpy.ndarray): Vertex positions, shape (N, 3).
+    face_sizes (numpy.ndarray): Number of vertices of each face, shape (F,).
+    face_vertices (numpy.ndarray): Vertex indices of all faces, concatenated, shape (sum(face_sizes),).
+
+    Returns:
+    bmesh.types.BMesh: The new BMesh. The caller is responsible for freeing it.
+    """
+    tmp_mesh = mesh_from_polygons(coords, face_sizes, face_vertices, name='tmp_polygon_array')
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(tmp_mesh)
+    finally:
+        bpy.data.meshes.remove(tmp_mesh)
+    return bm
+
+
+def _reversed_face_loops(face_sizes):
+    """Loop order that reverses the winding of every face, shape (sum(face_sizes),)."""
+    starts = np.cumsum(face_sizes) - face_sizes
+    loop_face = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    loop_position = np.arange(len(loop_face)) - starts[loop_face]
+    return starts[loop_face] + face_sizes[loop_face] - 1 - loop_position
+
+
+def mesh_join(meshes, matrices, mesh=None, name='mesh'):
+    """Merge meshes into one with one foreach_get()/foreach_set() per attribute and mesh, instead of
+    bpy.ops.object.join(), which needs the objects selected and evaluates the depsgraph.
+
+    Like the join operator, the materials of all meshes are merged in the order of their first use and the material
+    index of every face is remapped. UV maps are merged by name, faces of a mesh without the map get (0, 0). Smooth
+    shading and loose edges are kept, all other attributes are dropped. Faces of a mesh whose matrix mirrors it are
+    flipped, so their normals keep pointing outward.
+
+    Parameters:
+    meshes (list of bpy.types.Mesh): The meshes to merge.
+    matrices (list of mathutils.Matrix): The matrix transforming each mesh into the space of the result.
+    mesh (bpy.types.Mesh, optional): The mesh to write the result to, which may be one of meshes. A new mesh is
+        created by default.
+    name (str, optional): Name of the new mesh. Defaults to 'mesh'.
+
+    Returns:
+    bpy.types.Mesh: The merged mesh.
+    """
+    materials = []
+    uv_names = []
+    parts = []
+    vertex_offset = 0
+
+    for part_mesh, matrix in zip(meshes, matrices):
+        coords = transform_coordinates(mesh_vertex_coordinates(part_mesh), matrix)
+        face_sizes, face_vertices = mesh_polygon_arrays(part_mesh)
+        loop_order = _reversed_face_loops(face_sizes) if matrix.is_negative else slice(None)
+
+        edges = np.empty(len(part_mesh.edges) * 2, dtype=np.int32)
+        part_mesh.edges.foreach_get('vertices', edges)
+        material_indices = np.empty(len(part_mesh.polygons), dtype=np.int32)
+        part_mesh.polygons.foreach_get('material_index', material_indices)
+        smooth = np.empty(len(part_mesh.polygons), dtype=bool)
+        part_mesh.polygons.foreach_get('use_smooth', smooth)
+
+        slots = []
+        for material in part_mesh.materials:
+            if material not in materials:
+                materials.append(material)
+            slots.append(materials.index(material))
+        if slots:
+            material_indices = np.asarray(slots, dtype=np.int32)[np.clip(material_indices, 0, len(slots) - 1)]
+
+        uvs = {}
+        for uv_layer in part_mesh.uv_layers:
+            if uv_layer.name not in uv_names:
+                uv_names.append(uv_layer.name)
+            loop_uvs = np.empty(len(part_mesh.loops) * 2, dtype=np.float32)
+            uv_layer.data.foreach_get('uv', loop_uvs)
+            uvs[uv_layer.name] = loop_uvs.reshape(-1, 2)[loop_order]
+
+        parts.append({
+            'coords': coords,
+            'face_sizes': face_sizes,
+            'face_vertices': face_vertices[loop_order] + vertex_offset,
+            'edges': edges.reshape(-1, 2) + vertex_offset,
+            'material_indices': material_indices,
+            'smooth': smooth,
+            'uvs': uvs,
+            'loop_count': len(face_vertices),
+        })
+        vertex_offset += len(coords)
+
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+
+    write_polygons(mesh,
+                   np.concatenate([part['coords'] for part in parts]),
+                   np.concatenate([part['face_sizes'] for part in parts]),
+                   np.concatenate([part['face_vertices'] for part in parts]),
+                   edges=np.concatenate([part['edges'] for part in parts]))
+
+    mesh.polygons.foreach_set('material_index', np.concatenate([part['material_indices'] for part in parts]))
+    mesh.polygons.foreach_set('use_smooth', np.concatenate([part['smooth'] for part in parts]))
+
+    for uv_name in uv_names:
+        loop_uvs = np.concatenate([part['uvs'].get(uv_name, np.zeros((part['loop_count'], 2), dtype=np.float32))
+                                   for part in parts])
+        uv_layer = mesh.uv_layers.get(uv_name) or mesh.uv_layers.new(name=uv_name)
+        uv_layer.data.foreach_set('uv', loop_uvs.ravel())
+
+    mesh.materials.clear()
+    for material in materials:
+        mesh.materials.append(material)
+
+    mesh.update()
+    return mesh
@@ -1,18 +1,66 @@
 import bmesh
 import numpy as np
-from collections import deque
 
-# Hard cap on cells per axis. The occupancy grid, flood-fill and greedy-mesh
-# passes are plain Python loops over the grid, so this bounds worst-case time
-# when a user drags voxel size down to something tiny relative to the object.
-MAX_GRID_AXIS_CELLS = 48
+from .vertex_arrays import bmesh_from_polygons
+
+# The grid is stored sparsely as cubes of BRICK_SIZE cells per side: only the
+# bricks the surface passes through hold their cells, every other brick is
+# entirely inside or outside and takes up a single cell of a coarse grid.
+BRICK_SIZE = 8
+
+# Bytes per cell of a brick (surface and outside flags), and per cell of the
+# coarse brick grid (brick index and outside flag).
+BRICK_CELL_BYTES = 2
+COARSE_CELL_BYTES = 5
+
+# Memory the occupancy of a voxel grid may take up. The voxel size is
+# coarsened until the grid fits, which bounds time and poly count when a user
+# drags voxel size down to something tiny relative to the object. Long, thin
+# objects only need a fraction of the memory of a bulky one at the same
+# voxel size, so they get much finer cells.
+DEFAULT_VOXEL_MEMORY_BUDGET = 2 * 1024 * 1024
+
+# Default upper bound for the number of boxes of a voxel box compound.
+DEFAULT_MAX_VOXEL_BOXES = 32
+
+# Upper bound for the tries to fit the grid into the memory budget; every try
+# coarsens the voxel size by at least 10%.
+MAX_BUDGET_PASSES = 16
 
 # Each of the 3 possible ramp planes as (a_axis, b_axis, e_axis): the cut is
 # made in the (a, b) cross-section and the wedge is extruded along e.
 RAMP_PLANES = ((0, 2, 1), (0, 1, 2), (1, 2, 0))
 
+# Every way to chamfer a cell as (a_axis, b_axis, e_axis, sa, sb): the corner
+# cut away is the one towards sa along a_axis and sb along b_axis.
+RAMP_ORIENTATIONS = tuple((a_axis, b_axis, e_axis, sa, sb)
+                          for a_axis, b_axis, e_axis in RAMP_PLANES
+                          for sa in (1, -1)
+                          for sb in (1, -1))
+
 DIRECTIONS = ((0, 1), (0, -1), (1, 1), (1, -1), (2, 1), (2, -1))
 
+# Corners of a cell face as offsets along its 2 in-plane axes, in order.
+QUAD_CORNERS = np.array(((0, 0), (1, 0), (1, 1), (0, 1)), dtype=np.int64)
+
+# In cells. Triangles are split until they span at most this many cells
+# along each axis before they are scan converted, which bounds the columns
+# their bounding rectangle wastes on long, diagonal triangles.
+SCAN_PIECE_EXTENT = 4.0
+
+# In cells. Every triangle is moved this far against its normal before it is
+# voxelized, and the cells are shrunk by half of it on every side, so a
+# surface merely touching a cell doesn't mark it (see _voxelize_surface).
+SURFACE_NUDGE = 2e-4
+SURFACE_EPSILON = 1e-4
+
+# Number of surface pieces voxelized at once.
+VOXELIZE_CHUNK_SIZE = 1 << 10
+
+# Upper bound for the longest-edge bisection; a triangle spanning the whole
+# grid is split into SCAN_PIECE_EXTENT sized pieces long before this.
+MAX_SUBDIVISION_LEVELS = 64
+
 
 def mesh_max_dimension(mesh):
     """Local-space bounding box max extent, for sizing voxel_size relative to the mesh."""
@@ -38,16 +86,6 @@ def _mesh_local_triangles(mesh):
     return verts, tris
 
 
-def _clamped_voxel_size(bbox_min, bbox_max, voxel_size, padding):
-    """Coarsen voxel_size if it would push the grid past MAX_GRID_AXIS_CELLS."""
-    max_extent = float(np.max(bbox_max - bbox_min))
-    if max_extent <= 0.0:
-        return voxel_size
-    usable_cells = max(MAX_GRID_AXIS_CELLS - 2 * padding, 1)
-    min_voxel_size = max_extent / usable_cells
-    return max(voxel_size, min_voxel_size)
-
-
 def _grid_dims_and_origin(bbox_min, bbox_max, voxel_size, padding):
     """Grid cell counts per axis, and the world position of cell (0, 0, 0).
 
@@ -61,207 +99,581 @@ def _grid_dims_and_origin(bbox_min, bbox_max, voxel_size, padding):
     instead of sitting flush on one side and bulging outward on the other.
     """
     size = bbox_max - bbox_min
-    core_cells = np.maximum(np.ceil(size / voxel_size).astype(int), 1)
-    dims = np.minimum(core_cells + 2 * padding, MAX_GRID_AXIS_CELLS)
+    core_cells = np.maximum(np.ceil(size / voxel_size).astype(np.int64), 1)
+    dims = core_cells + 2 * padding
     slack = core_cells * voxel_size - size
     origin = bbox_min - padding * voxel_size - slack / 2
     return tuple(int(d) for d in dims), origin
 
 
-def _mark_triangle(occupancy, origin, voxel_size, threshold, v0, v1, v2, max_depth=6):
-    """Rasterize a triangle into the occupancy grid via its (subdivided) AABB.
+class VoxelBricks:
+    """Sparse occupancy of a voxel grid.
 
-    Large triangles are recursively split at their edge midpoints until each
-    piece's AABB is within `threshold` of a single cell, then the whole AABB
-    of the small piece is marked. This avoids a full triangle/box SAT test at
-    the cost of being conservative (a few extra cells around thin/steep
-    triangles) -- acceptable for a simplified collider.
+    The grid is split into bricks of `brick_size` cells per side. Bricks the
+    surface passes through store their cells densely, in the (N, B, B, B)
+    `surface` and `outside` arrays; all other bricks contain free cells only,
+    so whether they are inside or outside is a single flag per brick in the
+    coarse `brick_outside` grid. Memory therefore grows with the surface area
+    of the voxelized object rather than with the volume of its bounding box.
+
+    Cells of the last bricks along an axis that lie beyond the end of the
+    grid are free and outside.
     """
-    dims = np.array(occupancy.shape)
-    inv = 1.0 / voxel_size
-    eps = voxel_size * 1e-4
 
-    # Used only to resolve the "flat on a grid line" case below -- computed
-    # once from the whole (undivided) triangle since every recursive piece
-    # stays coplanar with it.
-    normal = np.cross(v1 - v0, v2 - v0)
+    def __init__(self, dims, brick_coords, brick_size=BRICK_SIZE):
+        self.dims = tuple(int(d) for d in dims)
+        self.brick_size = brick_size
+        self.brick_dims = tuple(-(-d // brick_size) for d in self.dims)
+        self.coords = np.asarray(brick_coords, dtype=np.int64).reshape(-1, 3)
+
+        # Index into the brick arrays per brick of the coarse grid, -1 for
+        # bricks without surface.
+        self.index = np.full(self.brick_dims, -1, dtype=np.int32)
+        self.index[tuple(self.coords.T)] = np.arange(len(self.coords), dtype=np.int32)
+
+        shape = (len(self.coords),) + (brick_size,) * 3
+        self.surface = np.zeros(shape, dtype=bool)
+        self.outside = np.zeros(shape, dtype=bool)
+        self.brick_outside = np.zeros(self.brick_dims, dtype=bool)
+
+    @staticmethod
+    def occupancy_bytes(brick_count, brick_dims, brick_size=BRICK_SIZE):
+        """Memory taken up by a grid with brick_count bricks holding surface."""
+        return (brick_count * brick_size ** 3 * BRICK_CELL_BYTES
+                + int(np.prod(brick_dims, dtype=np.float64)) * COARSE_CELL_BYTES)
+
+    @property
+    def nbytes(self):
+        return self.surface.nbytes + self.outside.nbytes + self.index.nbytes + self.brick_outside.nbytes
+
+    def _locate(self, cells):
+        """Brick coordinates, brick index and position inside of the brick
+        of every cell."""
+        brick = cells // self.brick_size
+        return brick, self.index[tuple(brick.T)], cells - brick * self.brick_size
+
+    def flat_indices(self, cells):
+        """Indices of cells that lie in bricks holding surface into the
+        flattened `surface` and `outside` arrays."""
+        _, index, local = self._locate(cells)
+        b = self.brick_size
+        return ((index.astype(np.int64) * b + local[:, 0]) * b + local[:, 1]) * b + local[:, 2]
+
+    def cells(self, mask):
+        """Grid coordinates of the cells set in a (N, B, B, B) brick mask."""
+        brick, *local = np.nonzero(mask)
+        return self.coords[brick] * self.brick_size + np.stack(local, axis=1)
+
+    def filled(self, cells, fill=False):
+        """Whether each cell is part of the solid: a surface cell or a free
+        cell the outside doesn't reach. Cells outside of the grid are `fill`."""
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 3)
+        in_grid = np.all((cells >= 0) & (cells < self.dims), axis=1)
+        result = np.full(len(cells), fill, dtype=bool)
+
+        brick, index, local = self._locate(cells[in_grid])
+        values = ~self.brick_outside[tuple(brick.T)]
+        stored = index >= 0
+        local = local[stored]
+        values[stored] = ~self.outside[index[stored], local[:, 0], local[:, 1], local[:, 2]]
+        result[in_grid] = values
+        return result
+
+    def dense_filled(self):
+        """The filled flags of all cells as a dense (X, Y, Z) grid."""
+        b = self.brick_size
+        filled = np.empty(self.brick_dims + (b, b, b), dtype=bool)
+        filled[...] = ~self.brick_outside[..., np.newaxis, np.newaxis, np.newaxis]
+        filled[tuple(self.coords.T)] = ~self.outside
+        filled = filled.transpose(0, 3, 1, 4, 2, 5).reshape(tuple(d * b for d in self.brick_dims))
+        return filled[:self.dims[0], :self.dims[1], :self.dims[2]]
+
+    def prune(self):
+        """Drop the bricks that hold no surface cells."""
+        keep = self.surface.any(axis=(1, 2, 3))
+        if keep.all():
+            return
+        self.coords = self.coords[keep]
+        self.surface = self.surface[keep]
+        self.outside = self.outside[keep]
+        self.index.fill(-1)
+        self.index[tuple(self.coords.T)] = np.arange(len(self.coords), dtype=np.int32)
 
-    stack = [(v0, v1, v2, 0)]
-
-    while stack:
-        a, b, c, depth = stack.pop()
-        tri_min = np.minimum(np.minimum(a, b), c)
-        tri_max = np.maximum(np.maximum(a, b), c)
-
-        if depth < max_depth and np.max(tri_max - tri_min) > threshold:
-            ab = (a + b) * 0.5
-            bc = (b + c) * 0.5
-            ca = (c + a) * 0.5
-            stack.append((a, ab, ca, depth + 1))
-            stack.append((ab, b, bc, depth + 1))
-            stack.append((ca, bc, c, depth + 1))
-            stack.append((ab, bc, ca, depth + 1))
-            continue
 
-        rel_min = (tri_min - origin) * inv
-        rel_max = (tri_max - origin) * inv
-        # "Belongs to the cell above" and "belongs to the cell below" readings
-        # of the piece's span. These agree for any ordinary span; they can
-        # only disagree (lo > hi) when the piece is flat exactly on a grid
-        # line along that axis -- notably whenever voxel_size divides the
-        # mesh's own bbox evenly, since the grid is then aligned so bbox_min
-        # and bbox_max land exactly on grid lines. Marking both cells there is
-        # what used to push the whole collider outward by up to one voxel
-        # around every flat, grid-aligned face (e.g. any box-like source mesh).
-        lo = np.floor(rel_min + eps).astype(int)
-        hi = np.ceil(rel_max - eps).astype(int) - 1
-
-        flat = lo > hi
-        if flat.any():
-            # The face normal says which side the solid is actually on, so
-            # collapse to that single, correct cell instead of both.
-            for axis in np.nonzero(flat)[0]:
-                n = normal[axis]
-                if n > 1e-12:
-                    lo[axis] = hi[axis]
-                elif n < -1e-12:
-                    hi[axis] = lo[axis]
-                else:
-                    # Orientation inconclusive for this axis (e.g. a sliver
-                    # piece) -- fall back to the old, always-safe span.
-                    lo[axis], hi[axis] = hi[axis], lo[axis]
-
-        i0 = np.clip(lo, 0, dims - 1)
-        i1 = np.clip(hi, 0, dims - 1)
-        occupancy[i0[0]:i1[0] + 1, i0[1]:i1[1] + 1, i0[2]:i1[2] + 1] = True
-
-
-def _voxelize_surface(verts_local, tris, origin, voxel_size, dims):
-    occupancy = np.zeros(dims, dtype=bool)
-    threshold = voxel_size * 0.75
-    for tri in tris:
-        _mark_triangle(occupancy, origin, voxel_size, threshold,
-                       verts_local[tri[0]], verts_local[tri[1]], verts_local[tri[2]])
-    return occupancy
+def _subdivide_triangles(triangles, max_extent):
+    """Split triangles at the midpoint of their longest edge until the
+    bounding box of every piece is at most `max_extent` along each axis.
 
+    All triangles of a level are split at once. Bisecting only the longest
+    edge (instead of splitting into 4 at all edge midpoints) keeps long,
+    thin triangles from exploding into pieces far smaller than needed. The
+    winding of every piece matches its source triangle.
+    """
+    pieces = []
+    for _ in range(MAX_SUBDIVISION_LEVELS):
+        extent = (triangles.max(axis=1) - triangles.min(axis=1)).max(axis=1)
+        small = extent <= max_extent
+        pieces.append(triangles[small])
+        triangles = triangles[~small]
+        if len(triangles) == 0:
+            break
+
+        # Rotate the corners so the longest edge runs from corner 0 to 1.
+        edges = triangles[:, [1, 2, 0]] - triangles
+        longest = np.einsum('ijk,ijk->ij', edges, edges).argmax(axis=1)
+        order = (np.arange(3) + longest[:, None]) % 3
+        triangles = np.take_along_axis(triangles, order[..., None], axis=1)
+
+        mid = (triangles[:, 0] + triangles[:, 1]) * 0.5
+        triangles = np.concatenate((
+            np.stack((triangles[:, 0], mid, triangles[:, 2]), axis=1),
+            np.stack((mid, triangles[:, 1], triangles[:, 2]), axis=1),
+        ))
+    else:
+        # Only degenerate input (e.g. NaN coordinates) gets here.
+        pieces.append(triangles)
 
-def _flood_fill_outside(surface):
-    """BFS from the grid boundary through non-surface cells.
+    return np.concatenate(pieces)
 
-    Anything unreached (enclosed interior cells, plus the surface cells
-    themselves) ends up filled -- this is what makes the result watertight
-    even when the source mesh isn't a perfectly closed manifold.
+
+def _expand_ranges(lo, hi):
+    """For integer ranges lo[i]..hi[i] (inclusive), return the index of the
+    range each value belongs to and the values themselves, all ranges
+    concatenated. Empty ranges (hi < lo) contribute nothing."""
+    counts = np.maximum(hi - lo + 1, 0)
+    owner = np.repeat(np.arange(len(lo)), counts)
+    starts = np.cumsum(counts) - counts
+    return owner, lo[owner] + np.arange(len(owner)) - starts[owner]
+
+
+def _candidate_cells(pieces, dims):
+    """Conservative scan conversion: the cells each surface piece may overlap.
+
+    Every piece is projected along the axis its normal is closest to. For
+    each grid column its bounding rectangle covers, the range of the
+    piece's plane over the part of the column inside that rectangle
+    (clamped to the piece's own extent) gives the cells of the column it can
+    reach. Interior columns of a piece get exactly the right cells, the
+    columns along its edges a few too many, which the exact test in
+    _triangle_box_overlap() removes.
+
+    Returns:
+        tuple: (index of the piece, (C, 3) cell) per candidate.
     """
-    nx, ny, nz = surface.shape
-    outside = np.zeros_like(surface)
-    queue = deque()
+    dims = np.array(dims)
+    normals = np.cross(pieces[:, 1] - pieces[:, 0], pieces[:, 2] - pieces[:, 0])
+    dominant = np.abs(normals).argmax(axis=1)
+    piece_min = pieces.min(axis=1)
+    piece_max = pieces.max(axis=1)
+
+    owners = []
+    cells = []
+    for axis in range(3):
+        selected = np.nonzero(dominant == axis)[0]
+        if len(selected) == 0:
+            continue
+        ax_b, ax_c = (a for a in range(3) if a != axis)
+        p_min, p_max = piece_min[selected], piece_max[selected]
+
+        # Columns covered by the bounding rectangle of each piece.
+        lo_b = np.clip(np.floor(p_min[:, ax_b]).astype(np.int64), 0, dims[ax_b] - 1)
+        hi_b = np.clip(np.floor(p_max[:, ax_b]).astype(np.int64), 0, dims[ax_b] - 1)
+        lo_c = np.clip(np.floor(p_min[:, ax_c]).astype(np.int64), 0, dims[ax_c] - 1)
+        hi_c = np.clip(np.floor(p_max[:, ax_c]).astype(np.int64), 0, dims[ax_c] - 1)
+        width = hi_c - lo_c + 1
+        column_owner, column = _expand_ranges(np.zeros_like(lo_b), (hi_b - lo_b + 1) * width - 1)
+        col_b = lo_b[column_owner] + column // width[column_owner]
+        col_c = lo_c[column_owner] + column % width[column_owner]
+
+        # The part of each column inside the piece's bounding rectangle.
+        b0 = np.maximum(col_b, p_min[column_owner, ax_b])
+        b1 = np.minimum(col_b + 1, p_max[column_owner, ax_b])
+        c0 = np.maximum(col_c, p_min[column_owner, ax_c])
+        c1 = np.minimum(col_c + 1, p_max[column_owner, ax_c])
+
+        # The piece's plane as w = w0 + slope_b * (b - b0) + slope_c * (c - c0).
+        normal = normals[selected][column_owner]
+        anchor = pieces[selected, 0][column_owner]
+        n_w = normal[:, axis]
+        flat = np.abs(n_w) > 1e-12
+        safe_w = np.where(flat, n_w, 1.0)
+        slope_b = np.where(flat, -normal[:, ax_b] / safe_w, 0.0)
+        slope_c = np.where(flat, -normal[:, ax_c] / safe_w, 0.0)
+        w0 = anchor[:, axis] - slope_b * anchor[:, ax_b] - slope_c * anchor[:, ax_c]
+        w_lo = w0 + np.minimum(slope_b * b0, slope_b * b1) + np.minimum(slope_c * c0, slope_c * c1)
+        w_hi = w0 + np.maximum(slope_b * b0, slope_b * b1) + np.maximum(slope_c * c0, slope_c * c1)
+
+        piece_w_min = p_min[column_owner, axis]
+        piece_w_max = p_max[column_owner, axis]
+        w_lo = np.where(flat, np.maximum(w_lo, piece_w_min), piece_w_min)
+        w_hi = np.where(flat, np.minimum(w_hi, piece_w_max), piece_w_max)
+        lo_w = np.maximum(np.floor(w_lo).astype(np.int64), 0)
+        hi_w = np.minimum(np.floor(w_hi).astype(np.int64), dims[axis] - 1)
+
+        cell_owner, cell_w = _expand_ranges(lo_w, hi_w)
+        axis_cells = np.empty((len(cell_owner), 3), dtype=np.int64)
+        axis_cells[:, axis] = cell_w
+        axis_cells[:, ax_b] = col_b[cell_owner]
+        axis_cells[:, ax_c] = col_c[cell_owner]
+        owners.append(selected[column_owner[cell_owner]])
+        cells.append(axis_cells)
+
+    if not owners:
+        return np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(owners), np.concatenate(cells)
+
+
+def _triangle_box_overlap(tris, half_size):
+    """Exact triangle/box overlap test (Akenine-Moeller's separating axis
+    theorem), batched over (triangle, box) pairs.
+
+    `tris` is (P, 3, 3) with every triangle already moved relative to the
+    center of its box. Tests the 3 box normals, the triangle normal and the
+    9 cross products of the triangle edges with the box normals.
+    """
+    v0, v1, v2 = tris[:, 0], tris[:, 1], tris[:, 2]
+    overlap = np.all((np.minimum(np.minimum(v0, v1), v2) <= half_size)
+                     & (np.maximum(np.maximum(v0, v1), v2) >= -half_size), axis=1)
 
-    def try_add(idx):
-        if surface[idx] or outside[idx]:
-            return
-        outside[idx] = True
-        queue.append(idx)
+    normal = np.cross(v1 - v0, v2 - v0)
+    overlap &= np.abs(np.einsum('ij,ij->i', normal, v0)) <= half_size * np.abs(normal).sum(axis=1)
+
+    for edge, (p, q) in ((v1 - v0, (v0, v2)), (v2 - v1, (v1, v0)), (v0 - v2, (v2, v1))):
+        # The axis e x box_normal projects a triangle edge's end points onto
+        # the same value, so only one of them plus the opposite corner count.
+        for a, b in ((1, 2), (2, 0), (0, 1)):
+            # e x unit(axis) for the axis not in (a, b), e.g. e x x = (0, e_z, -e_y).
+            proj_p = edge[:, b] * p[:, a] - edge[:, a] * p[:, b]
+            proj_q = edge[:, b] * q[:, a] - edge[:, a] * q[:, b]
+            radius = half_size * (np.abs(edge[:, a]) + np.abs(edge[:, b]))
+            overlap &= (np.minimum(proj_p, proj_q) <= radius) & (np.maximum(proj_p, proj_q) >= -radius)
+
+    return overlap
+
+
+def _grid_triangles(verts_local, tris, origin, voxel_size):
+    """The triangles in grid units, each nudged a tiny bit against its normal
+    (see _voxelize_surface)."""
+    triangles = (verts_local[tris] - origin) / voxel_size
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    triangles -= (normals * (SURFACE_NUDGE / lengths)[:, None])[:, None, :]
+    return triangles
+
+
+def _piece_bricks(pieces, dims, brick_size):
+    """Coordinates of the bricks the bounding boxes of the surface pieces
+    touch. A piece spans fewer cells than a brick along every axis, so its
+    box touches at most 2 bricks per axis."""
+    max_cell = np.array(dims) - 1
+    lo = np.clip(np.floor(pieces.min(axis=1)).astype(np.int64), 0, max_cell) // brick_size
+    hi = np.clip(np.floor(pieces.max(axis=1)).astype(np.int64), 0, max_cell) // brick_size
+
+    brick_dims = tuple(-(-d // brick_size) for d in dims)
+    keys = [np.ravel_multi_index(tuple(np.where(np.array(corner, dtype=bool)[:, None], hi.T, lo.T)), brick_dims)
+            for corner in np.ndindex(2, 2, 2)]
+    return np.stack(np.unravel_index(np.unique(np.concatenate(keys)), brick_dims), axis=1)
+
+
+def _voxelize_surface(verts_local, tris, origin, voxel_size, dims, brick_size=BRICK_SIZE):
+    """Mark every grid cell the surface passes through.
+
+    All triangles are handled at once: they are converted to grid units and
+    split into pieces of a few cells, the cells each piece may overlap come
+    from a conservative scan conversion (_candidate_cells), and every
+    candidate is confirmed with an exact triangle/box test. Only the bricks
+    the pieces touch are allocated.
+
+    Cells the surface only touches count as empty. A face lying flat on a
+    grid plane -- e.g. every face of a box whose size the voxel size divides
+    evenly (#577) -- would otherwise mark the cells on both sides of it, so
+    each triangle is first nudged a tiny bit against its normal: such a face
+    then lies in the cells on its solid side only, and the collider hugs the
+    source instead of growing outward by a voxel.
+
+    Returns:
+        VoxelBricks: The grid, with the surface cells marked.
+    """
+    if len(tris) == 0:
+        return VoxelBricks(dims, np.empty((0, 3), dtype=np.int64), brick_size)
+
+    triangles = _grid_triangles(verts_local, tris, origin, voxel_size)
+    pieces = _subdivide_triangles(triangles, max_extent=SCAN_PIECE_EXTENT)
+    bricks = VoxelBricks(dims, _piece_bricks(pieces, dims, brick_size), brick_size)
+    surface = bricks.surface.reshape(-1)
+    half_size = 0.5 - SURFACE_EPSILON
+
+    for start in range(0, len(pieces), VOXELIZE_CHUNK_SIZE):
+        chunk_pieces = pieces[start:start + VOXELIZE_CHUNK_SIZE]
+        owners, cells = _candidate_cells(chunk_pieces, dims)
+        flat = bricks.flat_indices(cells)
+        # Neighbouring pieces share many candidate cells; skip the ones an
+        # earlier chunk already marked.
+        unmarked = ~surface[flat]
+        cells, owners, flat = cells[unmarked], owners[unmarked], flat[unmarked]
+        centered = chunk_pieces[owners] - (cells + 0.5)[:, None, :]
+        surface[flat[_triangle_box_overlap(centered, half_size)]] = True
+
+    bricks.prune()
+    return bricks
+
+
+def _budgeted_voxel_size(verts_local, tris, bbox_min, bbox_max, voxel_size, padding, memory_budget):
+    """Coarsen voxel_size until the occupancy of the grid fits into
+    `memory_budget` bytes.
+
+    The bricks the surface passes through are the cells it marks in a grid
+    BRICK_SIZE times coarser, so every try only voxelizes at that resolution.
+    """
+    for _ in range(MAX_BUDGET_PASSES):
+        dims, origin = _grid_dims_and_origin(bbox_min, bbox_max, voxel_size, padding)
+        brick_dims = tuple(-(-d // BRICK_SIZE) for d in dims)
+        needed = VoxelBricks.occupancy_bytes(0, brick_dims)
+        if needed <= memory_budget:
+            coarse = _voxelize_surface(verts_local, tris, origin, voxel_size * BRICK_SIZE, brick_dims)
+            needed = VoxelBricks.occupancy_bytes(int(coarse.surface.sum()), brick_dims)
+            if needed <= memory_budget:
+                return voxel_size
+            # The bricks with surface grow with the square of the resolution.
+            voxel_size *= max(np.sqrt(needed / memory_budget), 1.1)
+        else:
+            # The coarse grid alone grows with its cube.
+            voxel_size *= max(np.cbrt(needed / memory_budget), 1.1)
+    return voxel_size
+
+
+def _neighbour_view(padded, offset):
+    """View of a grid padded by one cell on every side of its last 3 axes,
+    shifted so that result[..., idx] is the grid's cell at idx + offset."""
+    return padded[(Ellipsis,) + tuple(slice(1 + o, padded.shape[axis - 3] - 1 + o)
+                                      for axis, o in enumerate(offset))]
 
-    for i in range(nx):
-        for j in range(ny):
-            try_add((i, j, 0))
-            try_add((i, j, nz - 1))
-    for i in range(nx):
-        for k in range(nz):
-            try_add((i, 0, k))
-            try_add((i, ny - 1, k))
-    for j in range(ny):
-        for k in range(nz):
-            try_add((0, j, k))
-            try_add((nx - 1, j, k))
 
-    neighbors = ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
-    while queue:
-        i, j, k = queue.popleft()
-        for di, dj, dk in neighbors:
-            ni, nj, nk = i + di, j + dj, k + dk
-            if 0 <= ni < nx and 0 <= nj < ny and 0 <= nk < nz:
-                try_add((ni, nj, nk))
+def _fill_runs(outside, barrier, axis):
+    """Spread `outside` along `axis` over whole runs of non-barrier cells:
+    every run between two barrier cells (or the grid boundary) that contains
+    an outside cell becomes outside entirely."""
+    length = barrier.shape[axis]
+    line_shape = list(barrier.shape)
+    line_shape[axis] = 1
 
-    return outside
+    # A run id per cell: the barrier count along the line so far, offset per
+    # line. A barrier cell shares its id with the run after it, which doesn't
+    # matter as barrier cells are never outside.
+    runs = np.cumsum(barrier, axis=axis, dtype=np.int32)
+    runs += (np.arange(barrier.size // length, dtype=np.int32) * (length + 1)).reshape(line_shape)
+    run_outside = np.zeros(barrier.size // length * (length + 1), dtype=bool)
+    run_outside[runs[outside]] = True
 
+    return run_outside[runs] & ~barrier
 
-def _in_bounds(idx, dims):
-    return 0 <= idx[0] < dims[0] and 0 <= idx[1] < dims[1] and 0 <= idx[2] < dims[2]
 
+def _spread_outside(outside, barrier):
+    """Grow `outside` over every non-barrier cell connected to it.
 
-def _compute_face_availability(filled, diagonal_fill):
-    """For every filled cell and each of the 6 face directions, decide whether
-    a flat square face may be generated there by the greedy mesher.
+    Works on the last 3 axes, so a stack of grids (like the bricks of
+    VoxelBricks) is handled all at once. For as long as free cells next to
+    the outside remain, outside-ness spreads over whole runs of free cells
+    along each axis in turn; every round follows the outside around one more
+    corner.
+    """
+    pad_width = ((0, 0),) * (outside.ndim - 3) + ((1, 1),) * 3
+    while True:
+        padded = np.pad(outside, pad_width, constant_values=False)
+        frontier = np.zeros_like(outside)
+        for axis, sign in DIRECTIONS:
+            offset = [0, 0, 0]
+            offset[axis] = sign
+            frontier |= _neighbour_view(padded, offset)
+        frontier &= ~(outside | barrier)
+        if not frontier.any():
+            return outside
+
+        outside = outside | frontier
+        for axis in range(-3, 0):
+            outside = _fill_runs(outside, barrier, axis)
+
+
+def _flood_fill_outside(surface):
+    """Mark every non-surface cell connected to the grid boundary.
+
+    Anything unreached (enclosed interior cells, plus the surface cells
+    themselves) ends up filled -- this is what makes the result watertight
+    even when the source mesh isn't a perfectly closed manifold.
+
+    Instead of a cell by cell BFS this works on whole-grid arrays. Every line
+    of cells along each axis is outside up to its first and after its last
+    surface cell, which already covers everything but concave pockets; the
+    rest is left to _spread_outside().
+    """
+    outside = np.zeros_like(surface)
+    for axis in range(3):
+        length = surface.shape[axis]
+        line_shape = [1, 1, 1]
+        line_shape[axis] = length
+        positions = np.arange(length).reshape(line_shape)
+
+        has_surface = surface.any(axis=axis, keepdims=True)
+        first = np.where(has_surface, surface.argmax(axis=axis, keepdims=True), length)
+        last = length - 1 - np.flip(surface, axis=axis).argmax(axis=axis, keepdims=True)
+        outside |= (positions < first) | (positions > last)
+
+    return _spread_outside(outside, surface)
+
+
+def _brick_layer(axis, index):
+    """Index of the layer of cells at `index` along `axis` of every brick."""
+    layer = [slice(None)] * 4
+    layer[axis + 1] = index
+    return tuple(layer)
+
+
+def _flood_fill_bricks(bricks):
+    """_flood_fill_outside() for a VoxelBricks grid, filling in its `outside`
+    and `brick_outside` flags.
+
+    The bricks without surface are flood filled on the coarse grid first.
+    Then the outside is exchanged across brick faces in rounds: every brick
+    takes the outside cells of its neighbours' facing layers (bricks without
+    surface count as all outside or all free) as seeds and spreads them
+    inside of itself, and a brick without surface next to an outside cell
+    becomes outside along with everything the coarse grid connects it to.
+    After the first round only the bricks next to a changed one are redone.
+    """
+    b = bricks.brick_size
+    count = len(bricks.coords)
+    has_surface = bricks.index >= 0
+    bricks.brick_outside = _flood_fill_outside(has_surface)
+
+    outside = np.zeros_like(bricks.surface)
+    for axis in range(3):
+        positions = bricks.coords[:, axis, None] * b + np.arange(b)
+        shape = [count, 1, 1, 1]
+        shape[axis + 1] = b
+        outside |= (positions >= bricks.dims[axis]).reshape(shape)
+
+    # The neighbour of every brick per direction: its brick coordinates, and
+    # its index, -1 for a brick without surface and -2 beyond the grid.
+    neighbours = []
+    for axis, sign in DIRECTIONS:
+        coords = bricks.coords.copy()
+        coords[:, axis] += sign
+        in_grid = (coords[:, axis] >= 0) & (coords[:, axis] < bricks.brick_dims[axis])
+        index = np.full(count, -2, dtype=np.int64)
+        index[in_grid] = bricks.index[tuple(coords[in_grid].T)]
+        neighbours.append((coords, index))
+
+    dirty = np.arange(count)
+    while len(dirty):
+        seeds = outside[dirty]
+        surface = bricks.surface[dirty]
+        for (axis, sign), (coords, index) in zip(DIRECTIONS, neighbours):
+            own_layer = _brick_layer(axis, b - 1 if sign > 0 else 0)
+            other_layer = _brick_layer(axis, 0 if sign > 0 else b - 1)
+            neighbour = index[dirty]
+            apron = np.ones((len(dirty), b, b), dtype=bool)
+            stored = neighbour >= 0
+            apron[stored] = outside[other_layer][neighbour[stored]]
+            empty = neighbour == -1
+            apron[empty] = bricks.brick_outside[tuple(coords[dirty[empty]].T)][:, None, None]
+            seeds[own_layer] |= apron & ~surface[own_layer]
+
+        spread = _spread_outside(seeds, surface)
+        changed = dirty[(spread != outside[dirty]).any(axis=(1, 2, 3))]
+        outside[dirty] = spread
+
+        # The neighbours of changed bricks see new seeds next round.
+        brick_seeds = np.zeros_like(bricks.brick_outside)
+        next_dirty = [np.empty(0, dtype=np.int64)]
+        for (axis, sign), (coords, index) in zip(DIRECTIONS, neighbours):
+            neighbour = index[changed]
+            next_dirty.append(neighbour[neighbour >= 0])
+            empty = changed[neighbour == -1]
+            facing = outside[empty][_brick_layer(axis, b - 1 if sign > 0 else 0)].any(axis=(1, 2))
+            brick_seeds[tuple(coords[empty[facing]].T)] = True
+
+        brick_seeds &= ~bricks.brick_outside
+        if brick_seeds.any():
+            grown = _spread_outside(bricks.brick_outside | brick_seeds, has_surface)
+            new_outside = grown & ~bricks.brick_outside
+            bricks.brick_outside = grown
+            # Bricks with surface next to a brick that just became outside.
+            new_coords = np.argwhere(new_outside)
+            for axis, sign in DIRECTIONS:
+                coords = new_coords.copy()
+                coords[:, axis] -= sign
+                in_grid = (coords[:, axis] >= 0) & (coords[:, axis] < bricks.brick_dims[axis])
+                neighbour = bricks.index[tuple(coords[in_grid].T)]
+                next_dirty.append(neighbour[neighbour >= 0].astype(np.int64))
+
+        dirty = np.unique(np.concatenate(next_dirty))
+
+    bricks.outside = outside
+
+
+def _classify_boundary_cells(bricks, diagonal_fill):
+    """Find the cells of the solid with an empty face neighbour -- the only
+    ones the collider surface touches -- and decide for each of their 6 face
+    directions whether a flat square face may be generated there.
+
+    All of them are surface cells: a free cell next to the outside would be
+    outside itself.
 
     Cube cells: all 6 directions available.
     Ramp cells (diagonal_fill only): a ramp chamfers one convex corner of the
     cell with a single 45-degree cut. Of its 6 faces, 2 (perpendicular to the
     extrusion axis) become triangular end caps handled separately, 2 (the
     corner being cut away) disappear entirely, and the remaining 2 stay full
-    squares and go through the same greedy pass as cubes.
+    squares like the faces of cubes.
+
+    A cell is a ramp if exactly one of the RAMP_ORIENTATIONS has its 3 cells
+    around the cut corner empty; cells outside of the grid count as filled.
+
+    Returns:
+        tuple: The (S, 3) cells, the (S, 6) availability and (S, 6) filled
+            neighbours per DIRECTIONS entry, and the (S,) index into
+            RAMP_ORIENTATIONS of every ramp cell, -1 for all other cells.
     """
-    dims = filled.shape
+    cells = bricks.cells(bricks.surface)
+    offsets = np.zeros((len(DIRECTIONS), 3), dtype=np.int64)
+    for d_idx, (axis, sign) in enumerate(DIRECTIONS):
+        offsets[d_idx, axis] = sign
 
+    neighbour_filled = np.stack([bricks.filled(cells + offset) for offset in offsets], axis=1)
+    boundary = ~neighbour_filled.all(axis=1)
+    cells, neighbour_filled = cells[boundary], neighbour_filled[boundary]
+
+    avail = np.ones(neighbour_filled.shape, dtype=bool)
+    orientation = np.full(len(cells), -1, dtype=np.int8)
     if not diagonal_fill:
-        avail = np.repeat(filled[..., np.newaxis], 6, axis=3)
-        return avail, {}
-
-    avail = np.zeros(dims + (6,), dtype=bool)
-    ramp_info = {}
-
-    def dir_index(axis, sign):
-        return 2 * axis + (0 if sign > 0 else 1)
-
-    for i, j, k in np.argwhere(filled):
-        i, j, k = int(i), int(j), int(k)
-        cell = (i, j, k)
-        candidates = []
-
-        for a_axis, b_axis, e_axis in RAMP_PLANES:
-            for sa in (1, -1):
-                for sb in (1, -1):
-                    na = [i, j, k]; na[a_axis] += sa
-                    nb = [i, j, k]; nb[b_axis] += sb
-                    nd = [i, j, k]; nd[a_axis] += sa; nd[b_axis] += sb
-
-                    if not _in_bounds(na, dims) or filled[tuple(na)]:
-                        continue
-                    if not _in_bounds(nb, dims) or filled[tuple(nb)]:
-                        continue
-                    if not _in_bounds(nd, dims) or filled[tuple(nd)]:
-                        continue
-                    candidates.append((a_axis, b_axis, e_axis, sa, sb))
-
-        if len(candidates) == 1:
-            a_axis, b_axis, e_axis, sa, sb = candidates[0]
-            ramp_info[cell] = (a_axis, b_axis, e_axis, sa, sb)
-            avail[i, j, k, dir_index(a_axis, -sa)] = True
-            avail[i, j, k, dir_index(b_axis, -sb)] = True
-        else:
-            avail[i, j, k, :] = True
+        return cells, avail, neighbour_filled, orientation
 
-    return avail, ramp_info
+    candidate_count = np.zeros(len(cells), dtype=np.int8)
+    for index, (a_axis, b_axis, _, sa, sb) in enumerate(RAMP_ORIENTATIONS):
+        offset_a = offsets[DIRECTIONS.index((a_axis, sa))]
+        offset_b = offsets[DIRECTIONS.index((b_axis, sb))]
+        candidate = np.ones(len(cells), dtype=bool)
+        for offset in (offset_a, offset_b, offset_a + offset_b):
+            candidate &= ~bricks.filled(cells + offset, fill=True)
+        candidate_count += candidate
+        orientation[candidate] = index
 
+    ramp = candidate_count == 1
+    orientation[~ramp] = -1
 
-def _emit_quad(bm, origin, voxel_size, axis, plane_idx, ax_b, b0, ax_c, c0):
-    def make_point(b_coord, c_coord):
-        p = [0.0, 0.0, 0.0]
-        p[axis] = origin[axis] + plane_idx * voxel_size
-        p[ax_b] = origin[ax_b] + b_coord * voxel_size
-        p[ax_c] = origin[ax_c] + c_coord * voxel_size
-        return tuple(p)
+    avail[ramp] = False
+    for index, (a_axis, b_axis, _, sa, sb) in enumerate(RAMP_ORIENTATIONS):
+        ramp_cells = orientation == index
+        avail[ramp_cells, DIRECTIONS.index((a_axis, -sa))] = True
+        avail[ramp_cells, DIRECTIONS.index((b_axis, -sb))] = True
 
-    verts = [bm.verts.new(make_point(b, c)) for b, c in
-            ((b0, c0), (b0 + 1, c0), (b0 + 1, c0 + 1), (b0, c0 + 1))]
-    try:
-        bm.faces.new(verts)
-    except ValueError:
-        pass
+    return cells, avail, neighbour_filled, orientation
 
 
-def _add_cell_quads(bm, filled, avail_dir, origin, voxel_size, axis, sign):
-    """Emit one quad per exposed cell face (no merging).
+def _cell_face_quads(cells, axis, sign):
+    """Lattice corners of one quad per exposed cell face (no merging), wound
+    so that the quads face outward.
 
     Rectangles are *not* greedily merged across cells here -- doing so at
     this stage risks T-junctions (an edge on a big merged quad with no
@@ -269,134 +681,313 @@ def _add_cell_quads(bm, filled, avail_dir, origin, voxel_size, axis, sign):
     a ramp cell's own diagonal/cap geometry, or simply between differently
     sized merges on perpendicular faces of an irregular blob). Instead every
     quad aligns exactly with the grid, guaranteeing shared edges everywhere,
-    and `bmesh.ops.dissolve_limited` safely collapses the coplanar interior
+    and `bmesh.ops.dissolve_limit` safely collapses the coplanar interior
     edges afterwards -- Blender's own implementation, not a hand-rolled one.
-    """
-    dims = filled.shape
-    neighbor_filled = np.zeros(dims, dtype=bool)
-
-    src = [slice(None)] * 3
-    dst = [slice(None)] * 3
-    if sign > 0:
-        src[axis] = slice(1, None)
-        dst[axis] = slice(0, -1)
-    else:
-        src[axis] = slice(0, -1)
-        dst[axis] = slice(1, None)
-    neighbor_filled[tuple(dst)] = filled[tuple(src)]
-
-    exposed = filled & avail_dir & (~neighbor_filled)
-    if not exposed.any():
-        return
 
+    Returns:
+        np.array: Integer lattice points, shape (Q, 4, 3).
+    """
     ax_b, ax_c = (a for a in range(3) if a != axis)
 
-    for layer in range(dims[axis]):
-        sl = [slice(None)] * 3
-        sl[axis] = layer
-        mask2d = exposed[tuple(sl)]
-        if not mask2d.any():
-            continue
-
-        plane_coord = layer + (1 if sign > 0 else 0)
-        for b0, c0 in np.argwhere(mask2d):
-            _emit_quad(bm, origin, voxel_size, axis, plane_coord, ax_b, int(b0), ax_c, int(c0))
-
-
-def _emit_ramp_cell(bm, origin, voxel_size, cell, a_axis, b_axis, e_axis, sa, sb,
-                    cap_min, cap_max, stitch_min, stitch_max):
-    i, j, k = cell
-    idx = [i, j, k]
-
-    def make_point(u, v, e):
-        p = [0.0, 0.0, 0.0]
-        p[a_axis] = origin[a_axis] + (idx[a_axis] + u) * voxel_size
-        p[b_axis] = origin[b_axis] + (idx[b_axis] + v) * voxel_size
-        p[e_axis] = origin[e_axis] + (idx[e_axis] + e) * voxel_size
-        return tuple(p)
-
-    # The cut removes exactly the corner at (u_cut, v_cut); `far` is the
-    # opposite corner and `hyp_a`/`hyp_b` are its two neighbours -- together
-    # they form the right-triangle cross-section kept after the 45° cut.
-    u_cut = 1 if sa > 0 else 0
-    v_cut = 1 if sb > 0 else 0
-    cut = (u_cut, v_cut)
-    far = (1 - u_cut, 1 - v_cut)
-    hyp_a = (u_cut, 1 - v_cut)
-    hyp_b = (1 - u_cut, v_cut)
-
-    if cap_min:
-        bm.faces.new([bm.verts.new(make_point(u, v, 0)) for u, v in (far, hyp_a, hyp_b)])
-    elif stitch_min:
-        # The e-neighbour here is solid but isn't an identically-oriented
-        # ramp (e.g. a plain cube corner), so its cross-section is a full
-        # square while this cell's is only the kept triangle. Fill the
-        # remaining corner triangle so the two sides meet without a gap.
-        bm.faces.new([bm.verts.new(make_point(u, v, 0)) for u, v in (hyp_a, cut, hyp_b)])
-
-    if cap_max:
-        bm.faces.new([bm.verts.new(make_point(u, v, 1)) for u, v in (far, hyp_a, hyp_b)])
-    elif stitch_max:
-        bm.faces.new([bm.verts.new(make_point(u, v, 1)) for u, v in (hyp_a, cut, hyp_b)])
-
-    diag = [bm.verts.new(make_point(u, v, e)) for u, v, e in
-            ((hyp_a[0], hyp_a[1], 0), (hyp_b[0], hyp_b[1], 0), (hyp_b[0], hyp_b[1], 1), (hyp_a[0], hyp_a[1], 1))]
-    bm.faces.new(diag)
-
-
-def build_voxel_bmesh(mesh, voxel_size, diagonal_fill=False, padding=2):
-    """Voxelize `mesh` (local space) into a watertight low-poly bmesh.
-
-    Returns None if the source has no triangles or ends up empty.
-    """
-    verts_local, tris = _mesh_local_triangles(mesh)
-    if len(tris) == 0:
-        return None
+    corners = np.repeat(cells[:, np.newaxis, :], 4, axis=1)
+    corners[:, :, axis] += 1 if sign > 0 else 0
+    corners[:, :, ax_b] += QUAD_CORNERS[:, 0]
+    corners[:, :, ax_c] += QUAD_CORNERS[:, 1]
 
-    bbox_min = verts_local.min(axis=0)
-    bbox_max = verts_local.max(axis=0)
+    # The corners run counter-clockwise around +axis for (ax_b, ax_c) =
+    # (y, z) and (x, y), but clockwise for (x, z).
+    if (sign > 0) != (axis != 1):
+        corners = corners[:, ::-1]
+    return corners
 
-    voxel_size = _clamped_voxel_size(bbox_min, bbox_max, voxel_size, padding)
-    dims, origin = _grid_dims_and_origin(bbox_min, bbox_max, voxel_size, padding)
 
-    surface = _voxelize_surface(verts_local, tris, origin, voxel_size, dims)
-    filled = ~_flood_fill_outside(surface)
-    if not filled.any():
-        return None
+def _ramp_faces(bricks, cells, orientation):
+    """Lattice corners of the ramp cells' geometry: the diagonal quad of
+    every ramp, plus a triangle at either end that either caps the ramp or
+    stitches it to a differently shaped solid neighbour.
 
-    avail, ramp_info = _compute_face_availability(filled, diagonal_fill)
+    Returns:
+        list: Arrays of integer lattice points, shape (F, 3, 3) for
+            triangles and (F, 4, 3) for quads.
+    """
+    faces = []
+    # Every ramp is a boundary cell, so the orientation of any cell can be
+    # looked up among those.
+    keys = np.ravel_multi_index(tuple(cells.T), bricks.dims)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+
+    def orientation_of(neighbours):
+        result = np.full(len(neighbours), -1, dtype=np.int8)
+        in_grid = np.all((neighbours >= 0) & (neighbours < bricks.dims), axis=1)
+        neighbour_keys = np.ravel_multi_index(tuple(neighbours[in_grid].T), bricks.dims)
+        position = np.minimum(np.searchsorted(sorted_keys, neighbour_keys), len(sorted_keys) - 1)
+        found = sorted_keys[position] == neighbour_keys
+        values = np.full(len(neighbour_keys), -1, dtype=np.int8)
+        values[found] = orientation[order[position[found]]]
+        result[in_grid] = values
+        return result
+
+    for index, (a_axis, b_axis, e_axis, sa, sb) in enumerate(RAMP_ORIENTATIONS):
+        ramp_cells = cells[orientation == index]
+        if len(ramp_cells) == 0:
+            continue
 
-    bm = bmesh.new()
+        # The cut removes exactly the corner at (u_cut, v_cut); `far` is the
+        # opposite corner and `hyp_a`/`hyp_b` are its two neighbours --
+        # together they form the right-triangle cross-section kept after the
+        # 45-degree cut.
+        u_cut = 1 if sa > 0 else 0
+        v_cut = 1 if sb > 0 else 0
+        cut = (u_cut, v_cut)
+        far = (1 - u_cut, 1 - v_cut)
+        hyp_a = (u_cut, 1 - v_cut)
+        hyp_b = (1 - u_cut, v_cut)
+
+        def lattice(points, subset=slice(None)):
+            offsets = np.zeros((len(points), 3), dtype=np.int64)
+            for i, (u, v, e) in enumerate(points):
+                offsets[i, a_axis] = u
+                offsets[i, b_axis] = v
+                offsets[i, e_axis] = e
+            return ramp_cells[subset, np.newaxis, :] + offsets
+
+        faces.append(lattice(((hyp_a + (0,)), (hyp_b + (0,)), (hyp_b + (1,)), (hyp_a + (1,)))))
+
+        for e, step in ((0, -1), (1, 1)):
+            neighbour = ramp_cells.copy()
+            neighbour[:, e_axis] += step
+            solid = bricks.filled(neighbour)
+            cap = ~solid
+            # The e-neighbour is solid but isn't an identically-oriented ramp
+            # (e.g. a plain cube corner), so its cross-section is a full
+            # square while this cell's is only the kept triangle. Fill the
+            # remaining corner triangle so the two sides meet without a gap.
+            stitch = solid & (orientation_of(neighbour) != index)
+            faces.append(lattice((far + (e,), hyp_a + (e,), hyp_b + (e,)), cap))
+            faces.append(lattice((hyp_a + (e,), cut + (e,), hyp_b + (e,)), stitch))
+
+    return faces
+
+
+def voxel_mesh_arrays(bricks, diagonal_fill, origin, voxel_size):
+    """Vertex and face index arrays of the voxel collider surface.
+
+    Every face corner lies on the integer lattice of cell corners, so shared
+    vertices are found exactly by hashing their lattice coordinates into a
+    single integer key; no distance based welding is needed.
+
+    Returns:
+        tuple: Vertex positions, shape (V, 3), the number of corners of every
+            face, shape (F,), and the vertex indices of all faces
+            concatenated.
+    """
+    cells, avail, neighbour_filled, orientation = _classify_boundary_cells(bricks, diagonal_fill)
+    exposed = avail & ~neighbour_filled
+    faces = [_cell_face_quads(cells[exposed[:, d_idx]], axis, sign)
+             for d_idx, (axis, sign) in enumerate(DIRECTIONS)]
+    faces.extend(_ramp_faces(bricks, cells, orientation))
+    faces = [f for f in faces if len(f)]
+    if not faces:
+        return np.empty((0, 3)), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    face_sizes = np.concatenate([np.full(len(f), f.shape[1], dtype=np.int64) for f in faces])
+    corners = np.concatenate([f.reshape(-1, 3) for f in faces])
+
+    radix = np.array(bricks.dims, dtype=np.int64) + 1
+    keys = (corners[:, 0] * radix[1] + corners[:, 1]) * radix[2] + corners[:, 2]
+    keys, first, face_vertices = np.unique(keys, return_index=True, return_inverse=True)
+    coords = origin + corners[first] * voxel_size
+    return coords, face_sizes, face_vertices.reshape(-1)
+
+
+class VoxelPyramid:
+    """The surface cells of a mesh at the finest voxel size, with the flood
+    filled grids of coarser voxel sizes derived from them.
+
+    Voxelizing the surface is by far the slowest step of building a voxel
+    collider. A coarser grid instead comes from OR-reducing the finest one:
+    a coarse cell holds surface if any of the fine cells inside of it does.
+    Coarse sizes are whole multiples of the finest voxel size, and every grid
+    is cached, so changing the voxel size of a live collider back and forth
+    only re-runs the meshing.
+    """
 
-    for d_idx, (axis, sign) in enumerate(DIRECTIONS):
-        _add_cell_quads(bm, filled, avail[..., d_idx], origin, voxel_size, axis, sign)
+    def __init__(self, mesh, voxel_size, padding=2, memory_budget=DEFAULT_VOXEL_MEMORY_BUDGET):
+        self.padding = padding
+        self.memory_budget = memory_budget
+        self.levels = {}
+        self.surface_cells = None
+        self.voxel_size = voxel_size
 
-    for cell, orientation in ramp_info.items():
-        a_axis, b_axis, e_axis, sa, sb = orientation
-        idx_neg = list(cell); idx_neg[e_axis] -= 1
-        idx_pos = list(cell); idx_pos[e_axis] += 1
+        verts_local, tris = _mesh_local_triangles(mesh)
+        if len(tris) == 0:
+            return
 
-        neg_filled = _in_bounds(idx_neg, dims) and filled[tuple(idx_neg)]
-        pos_filled = _in_bounds(idx_pos, dims) and filled[tuple(idx_pos)]
+        self.bbox_min = verts_local.min(axis=0)
+        self.bbox_max = verts_local.max(axis=0)
+        self.voxel_size = _budgeted_voxel_size(verts_local, tris, self.bbox_min, self.bbox_max, voxel_size, padding,
+                                               memory_budget)
+        self.dims, self.origin = _grid_dims_and_origin(self.bbox_min, self.bbox_max, self.voxel_size, padding)
+        finest = _voxelize_surface(verts_local, tris, self.origin, self.voxel_size, self.dims)
+        self.surface_cells = finest.cells(finest.surface)
+
+    def factor(self, voxel_size):
+        """The multiple of the finest voxel size closest to voxel_size, at
+        least 1."""
+        return max(int(round(voxel_size / self.voxel_size)), 1)
+
+    def level(self, voxel_size):
+        """The flood filled grid for the multiple of the finest voxel size
+        closest to voxel_size, at least the finest one.
+
+        Returns:
+            tuple: The VoxelBricks grid, the position of its cell (0, 0, 0)
+                and its voxel size.
+        """
+        factor = self.factor(voxel_size)
+        if factor not in self.levels:
+            self.levels[factor] = self._downsample(factor)
+        return self.levels[factor]
+
+    def _downsample(self, factor):
+        voxel_size = self.voxel_size * factor
+        dims, origin = _grid_dims_and_origin(self.bbox_min, self.bbox_max, voxel_size, self.padding)
+
+        # Both grids are centered on the bbox the same way, so a box whose
+        # size both voxel sizes divide lies on cell boundaries in both.
+        shift = np.round((self.origin - origin) / self.voxel_size).astype(np.int64)
+        cells = np.clip((self.surface_cells + shift) // factor, 0, np.array(dims) - 1)
+        keys = np.unique(np.ravel_multi_index(tuple(cells.T), dims))
+        cells = np.stack(np.unravel_index(keys, dims), axis=1)
+        brick_dims = tuple(-(-d // BRICK_SIZE) for d in dims)
+        brick_keys = np.unique(np.ravel_multi_index(tuple((cells // BRICK_SIZE).T), brick_dims))
+
+        bricks = VoxelBricks(dims, np.stack(np.unravel_index(brick_keys, brick_dims), axis=1))
+        bricks.surface.reshape(-1)[bricks.flat_indices(cells)] = True
+        _flood_fill_bricks(bricks)
+        return bricks, origin, voxel_size
+
+    def build_bmesh(self, voxel_size, diagonal_fill=False):
+        """Mesh the grid of level() into a watertight low-poly bmesh.
+
+        Returns None if the source has no triangles or the grid ends up
+        empty.
+        """
+        if self.surface_cells is None:
+            return None
+
+        bricks, origin, voxel_size = self.level(voxel_size)
+        coords, face_sizes, face_vertices = voxel_mesh_arrays(bricks, diagonal_fill, origin, voxel_size)
+        if len(face_sizes) == 0:
+            return None
+
+        bm = bmesh_from_polygons(coords, face_sizes, face_vertices)
+        # Every quad is emitted one-per-cell so edges always match exactly;
+        # this merges the coplanar interior edges of adjacent flat cells back
+        # into bigger n-gons (the actual poly-count reduction) without the
+        # T-junction risk a hand-rolled rectangle merge would have.
+        bmesh.ops.dissolve_limit(bm, angle_limit=0.001, verts=bm.verts, edges=bm.edges)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+
+        return bm
+
+    def build_boxes(self, voxel_size, max_boxes=DEFAULT_MAX_VOXEL_BOXES):
+        """Split the solid of level() into at most max_boxes axis-aligned
+        boxes with greedy_boxes().
+
+        The voxel size is coarsened by whole multiples of the finest one
+        until the boxes fit into max_boxes, and until the dense grid the
+        boxes are merged on fits into the memory budget. A grid of a single
+        cell inside of its padding is the coarsest one, its solid is one box.
+
+        Returns:
+            tuple: The minimum and maximum corners of the boxes in the local
+                space of the mesh, shape (K, 2, 3), and the voxel size used.
+                None if the source has no triangles.
+
+        Raises:
+            ValueError: If max_boxes is less than 1.
+        """
+        if max_boxes < 1:
+            raise ValueError(f"max_boxes must be at least 1, got {max_boxes}")
+        if self.surface_cells is None:
+            return None
+
+        factor = self.factor(voxel_size)
+        while True:
+            bricks, origin, size = self.level(self.voxel_size * factor)
+            coarsest = all(cells - 2 * self.padding <= 1 for cells in bricks.dims)
+            if coarsest or np.prod(bricks.dims, dtype=np.float64) <= self.memory_budget:
+                boxes = greedy_boxes(bricks.dense_filled(), max_boxes)
+                if boxes is not None or coarsest:
+                    break
+            factor = max(factor + 1, int(factor * 1.25))
+
+        if boxes is None:
+            boxes = greedy_boxes(bricks.dense_filled())
+        return origin + boxes * size, size
+
+
+def greedy_boxes(filled, max_boxes=None):
+    """Split the filled cells of a dense grid into non-overlapping
+    axis-aligned boxes.
+
+    Starting at the first remaining cell in x, y, z order, every box grows
+    as far as it covers remaining cells only: first along z, then y, then x.
+
+    Returns:
+        np.array: The first cell and one past the last cell of every box,
+            shape (K, 2, 3). None if more than max_boxes boxes are needed.
+    """
+    remaining = np.array(filled, dtype=bool, order='C')
+    flat = remaining.reshape(-1)
+    size_x, size_y, _ = remaining.shape
+    boxes = []
+    position = 0
+
+    while True:
+        # argmax stops at the first True cell.
+        position += int(flat[position:].argmax())
+        if not flat[position]:
+            break
+        if max_boxes is not None and len(boxes) >= max_boxes:
+            return None
+
+        x, y, z = (int(i) for i in np.unravel_index(position, remaining.shape))
+        line = remaining[x, y, z:]
+        z_end = z + (len(line) if line.all() else int(line.argmin()))
+        y_end = y + 1
+        while y_end < size_y and remaining[x, y_end, z:z_end].all():
+            y_end += 1
+        x_end = x + 1
+        while x_end < size_x and remaining[x_end, y:y_end, z:z_end].all():
+            x_end += 1
+
+        remaining[x:x_end, y:y_end, z:z_end] = False
+        boxes.append(((x, y, z), (x_end, y_end, z_end)))
+
+    return np.array(boxes, dtype=np.int64).reshape(-1, 2, 3)
+
+
+def build_voxel_bmesh(mesh, voxel_size, diagonal_fill=False, padding=2, memory_budget=DEFAULT_VOXEL_MEMORY_BUDGET):
+    """Voxelize `mesh` (local space) into a watertight low-poly bmesh.
 
-        cap_min = not neg_filled
-        cap_max = not pos_filled
-        stitch_min = neg_filled and ramp_info.get(tuple(idx_neg)) != orientation
-        stitch_max = pos_filled and ramp_info.get(tuple(idx_pos)) != orientation
+    `voxel_size` is coarsened as needed for the occupancy of the grid to fit
+    into `memory_budget` bytes. Use a VoxelPyramid instead to build the
+    collider at several voxel sizes.
 
-        _emit_ramp_cell(bm, origin, voxel_size, cell, a_axis, b_axis, e_axis, sa, sb,
-                        cap_min, cap_max, stitch_min, stitch_max)
+    Returns None if the source has no triangles or ends up empty.
+    """
+    return VoxelPyramid(mesh, voxel_size, padding, memory_budget).build_bmesh(voxel_size, diagonal_fill)
 
-    if len(bm.faces) == 0:
-        bm.free()
-        return None
 
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=voxel_size * 1e-4)
-    # Every quad above is emitted one-per-cell so edges always match exactly;
-    # this merges the coplanar interior edges of adjacent flat cells back
-    # into bigger n-gons (the actual poly-count reduction) without the
-    # T-junction risk a hand-rolled rectangle merge would have.
-    bmesh.ops.dissolve_limit(bm, angle_limit=0.001, verts=bm.verts, edges=bm.edges)
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+def build_voxel_boxes(mesh, voxel_size, max_boxes=DEFAULT_MAX_VOXEL_BOXES, padding=2,
+                      memory_budget=DEFAULT_VOXEL_MEMORY_BUDGET):
+    """Voxelize `mesh` (local space) into a compound of at most max_boxes
+    axis-aligned boxes, see VoxelPyramid.build_boxes().
 
-    return bm
+    Physics engines simulate a handful of boxes far cheaper than a concave
+    triangle mesh, at the cost of a blockier fit.
+    """
+    return VoxelPyramid(mesh, voxel_size, padding, memory_budget).build_boxes(voxel_size, max_boxes)
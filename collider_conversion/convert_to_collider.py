@@ -179,17 +179,11 @@ class OBJECT_OT_convert_to_collider(OBJECT_OT_add_bounding_object, Operator):
                     super().set_collider_name(new_collider, basename)
 
         else:  # self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-            # Deselect all objects
-            for obj in bpy.data.objects: obj.select_set(False)
-
-            # Select mesh objs
             for mesh_collider_data in collider_data:
                 basename = mesh_collider_data['basename']
                 new_collider = mesh_collider_data['new_collider']
-                new_collider.select_set(True)
 
-            context.view_layer.objects.active = new_collider
-            bpy.ops.object.join()
+            new_collider = self.join_colliders([data['new_collider'] for data in collider_data], target=new_collider)
 
             self.remove_all_modifiers(context, new_collider)
             self.primitive_postprocessing(context, new_collider, user_collections)
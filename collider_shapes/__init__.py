@@ -8,6 +8,8 @@ from . import add_collision_mesh
 from . import add_collision_remesh
 from . import add_minimum_bounding_box
 from . import add_bounding_kdop
+from . import generate
+from .generate import generate_colliders
 
 classes = (
     add_bounding_box.OBJECT_OT_add_bounding_box,
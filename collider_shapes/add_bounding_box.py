@@ -1,4 +1,5 @@
 import bpy
+import numpy as np
 from bpy.types import Operator
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
@@ -61,28 +62,41 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
         # List for storing dictionaries of data used to generate the collision meshes
         collider_data = []
         verts_co = []
+        # Linked duplicates are fitted once in local space, see shared_data_key()
+        shared_keys = set()
 
-        objs = self.get_pre_processed_mesh_objs(context, use_local=True, local_world_spc=False, default_world_spc=True)
+        objs = self.get_pre_processed_mesh_objs(context, use_local=True, local_world_spc=False, default_world_spc=True,
+                                                use_island_records=True)
+
+        creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
+            self.creation_mode_edit[self.creation_mode_idx]
 
         for base_ob, obj in objs:
 
-            context.view_layer.objects.active = obj
+            if not self.use_loose_mesh:
+                context.view_layer.objects.active = obj
             bounding_box_data = {}
 
-            # EDIT is only supported for 'MESH' type objects and only if the active object is a 'MESH'
-            if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-                # Use Mesh uses copies of edit mode meshes
-                used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-            else:  # self.obj_mode  == "OBJECT" or self.use_loose_mesh:
-                used_vertices = self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+            shared_key = None
+            if creation_mode in ['INDIVIDUAL'] and self.my_space == 'LOCAL':
+                shared_key = self.shared_data_key(base_ob)
+                if shared_key in shared_keys:
+                    bounding_box_data['parent'] = base_ob
+                    bounding_box_data['mtx_world'] = base_ob.matrix_world.copy()
+                    bounding_box_data['shared_key'] = shared_key
+                    collider_data.append(bounding_box_data)
+                    continue
+
+            # (N, 3) local space coordinates of the used (all or selected) vertices
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
 
             if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
 
-
-            creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
-                self.creation_mode_edit[self.creation_mode_idx]
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
+                if shared_key is not None:
+                    shared_keys.add(shared_key)
+                    bounding_box_data['shared_key'] = shared_key
 
                 # used_vertices uses local space.
                 co = self.get_vertex_coordinates(obj, self.my_space, used_vertices)
@@ -97,21 +111,29 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(bounding_box_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
-                collider_data = self.selection_bbox_data(verts_co)
+                # get array of all vertex coordinates in global space
+                verts_co.append(self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices))
+
+        if verts_co:
+            collider_data = self.selection_bbox_data(np.concatenate(verts_co))
 
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        shared_meshes = {}
+        parents = []
         for bounding_box_data in collider_data:
             # get data from dictionary
             parent = bounding_box_data['parent']
-            verts_loc = bounding_box_data['verts_loc']
-            center_point = bounding_box_data['center_point']
+            center_point = bounding_box_data.get('center_point')
             mtx_world = bounding_box_data['mtx_world']
+            shared_key = bounding_box_data.get('shared_key')
 
-            new_collider = verts_faces_to_bbox_collider(self, context, verts_loc)
+            if shared_key in shared_meshes:
+                new_collider = self.new_collider_object(context, shared_meshes[shared_key])
+            else:
+                new_collider = verts_faces_to_bbox_collider(self, context, bounding_box_data['verts_loc'])
+                if shared_key is not None:
+                    shared_meshes[shared_key] = new_collider.data
 
             if self.my_space == 'LOCAL':
                 new_collider.matrix_world = mtx_world
@@ -128,12 +150,12 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
 
             # save collision objects to delete when canceling the operation
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            parents.append(parent)
 
             parent_name = parent.name
             super().set_collider_name(new_collider, parent_name)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
 
         # Merge all collider objects
         if self.join_primitives:
@@ -145,7 +167,7 @@ class OBJECT_OT_add_bounding_box(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time("Box Collider", elapsed_time)
         self.report({'INFO'}, f"Box Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
 
     def selection_bbox_data(self, verts_co):
         if self.my_space == 'LOCAL':
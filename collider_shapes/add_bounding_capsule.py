@@ -3,12 +3,11 @@ from math import radians
 import bpy
 import numpy as np
 from bpy.types import Operator
-from mathutils import Vector
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
-from .utilities import get_sca_matrix
-from ..bmesh_operations.capsule_generation import create_capsule_data, mesh_data_to_bmesh
-from ..bmesh_operations.cylinder_generation import welzl
+from ..bmesh_operations.cylinder_generation import minimum_enclosing_circle, split_axis_coordinates
+from ..bmesh_operations.primitive_templates import MIN_CAPSULE_DEPTH, MIN_CAPSULE_RADIUS, primitive_template, \
+    write_primitive_mesh
 
 tmp_name = 'capsule_collider'
 
@@ -26,6 +25,7 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
 
         self.use_space = True
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.use_global_local_switches = True
 
         # Capsule specific
@@ -34,11 +34,24 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
         self.use_height_multiplier = True
         self.use_width_multiplier = True
 
-    def get_used_vertices(self, base_ob, obj):
-        if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-            return self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-        else:
-            return self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+    @staticmethod
+    def capsule_radius_depth(coordinates, height):
+        """Radius and cylinder section depth of the capsule enclosing points split into their (N, 2) cross-section
+        coordinates and (N,) heights. Each point only needs the hemispherical cap to reach it, so the depth is
+        reduced by each point's slack under the cap instead of spanning the full height range."""
+        circle_center, radius = minimum_enclosing_circle(coordinates)
+        d_perp = np.linalg.norm(coordinates - circle_center, axis=1)
+        slacks = np.sqrt(np.maximum(0.0, radius ** 2 - d_perp ** 2))
+        depth = max(0.0, float(np.max(height - slacks)) - float(np.min(height + slacks)))
+        return radius, depth
+
+    def build_collider_mesh(self, mesh, fit):
+        """Write a capsule with the fitted radius and depth scaled by the width and height multipliers, centered
+        at the origin along Z, into mesh."""
+        radius = max(MIN_CAPSULE_RADIUS, fit['radius'] * self.current_settings_dic['width_mult'])
+        depth = max(MIN_CAPSULE_DEPTH, fit['depth'] * self.current_settings_dic['height_mult'])
+        template = primitive_template('capsule', self.current_settings_dic['capsule_segments'])
+        write_primitive_mesh(mesh, template, (radius, radius, radius), half_depth=depth * 0.5)
 
     def set_modal_state(self, cylinder_segments_active=False, displace_active=False, decimate_active=False,
                         opacity_active=False, sphere_segments_active=False, capsule_segments_active=False,
@@ -98,19 +111,16 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
         # Initialize lists to store collider data and vertex coordinates
         collider_data = []
         verts_co = []
+        # Linked duplicates are fitted once in local space, see shared_data_key()
+        shared_fits = {}
 
         # Get the pre-processed mesh objects from the context
-        objs = self.get_pre_processed_mesh_objs(context)
+        objs = self.get_pre_processed_mesh_objs(context, use_island_records=True)
 
         for base_ob, obj in objs:
             # Initialize a dictionary to store data for the bounding capsule
             bounding_capsule_data = {}
 
-            used_vertices = self.get_used_vertices(base_ob, obj)
-
-            if not used_vertices:
-                continue
-
             # Decompose the object's world matrix into location, rotation, and scale components
             matrix_WS = obj.matrix_world
             _, _, sca = matrix_WS.decompose()
@@ -118,42 +128,47 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
 
-            if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
-                coordinates = []
-                height = []
+            shared_key = None
+            if creation_mode in ['INDIVIDUAL'] and self.my_space == 'LOCAL':
+                shared_key = self.shared_data_key(base_ob)
+                if shared_key is not None:
+                    # The fit is scaled, so only duplicates with the same scale share it.
+                    shared_key += (tuple(sca),)
+                if shared_key in shared_fits:
+                    radius, depth, local_center = shared_fits[shared_key]
+                    center = matrix_WS @ local_center
+                    bounding_capsule_data['parent'] = base_ob
+                    bounding_capsule_data['radius'] = radius
+                    bounding_capsule_data['depth'] = depth
+                    bounding_capsule_data['center_point'] = [center[0], center[1], center[2]]
+                    bounding_capsule_data['shared_key'] = shared_key
+                    collider_data.append(bounding_capsule_data)
+                    continue
+
+            # (N, 3) local space coordinates of the used (all or selected) vertices
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
+
+            if used_vertices is None:
+                continue
 
+            if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
                 co = self.get_vertex_coordinates(obj, self.my_space, used_vertices)
                 bounding_box, center = self.generate_bounding_box(co)
-
-                for vertex in used_vertices:
-
-                    # Ignore Scale
-                    if self.my_space == 'LOCAL':
-                        v = vertex.co @ get_sca_matrix(sca)
-                    else:
-                        v = Vector(matrix_WS @ vertex.co)
-
-                    if self.cylinder_axis == 'X':
-                        coordinates.append([v.y, v.z])
-                        height.append(v.x)
-                    elif self.cylinder_axis == 'Y':
-                        coordinates.append([v.x, v.z])
-                        height.append(v.y)
-                    elif self.cylinder_axis == 'Z':
-                        coordinates.append([v.x, v.y])
-                        height.append(v.z)
+                local_center = center
 
                 if self.my_space == 'LOCAL':
-                    center = sum((Vector(matrix_WS @ Vector(b)) for b in bounding_box), Vector()) / 8.0
+                    # Ignore rotation and location, the collider copies the parent's rotation instead
+                    v_co = used_vertices * np.array(sca)
+                    center = matrix_WS @ center
                 else:
-                    center = sum((Vector(b) for b in bounding_box), Vector()) / 8.0
+                    v_co = co
 
-                nsphere = welzl(np.array(coordinates))
-                radius = np.sqrt(nsphere.sqr_radius)
-                t_arr = np.asarray(height)
-                d_perp = np.linalg.norm(np.asarray(coordinates) - nsphere.center, axis=1)
-                slacks = np.sqrt(np.maximum(0.0, radius ** 2 - d_perp ** 2))
-                depth = max(0.0, float(np.max(t_arr - slacks)) - float(np.min(t_arr + slacks)))
+                coordinates, height = split_axis_coordinates(v_co, self.cylinder_axis)
+                radius, depth = self.capsule_radius_depth(coordinates, height)
+
+                if shared_key is not None:
+                    shared_fits[shared_key] = (radius, depth, local_center)
+                    bounding_capsule_data['shared_key'] = shared_key
 
                 bounding_capsule_data['parent'] = base_ob
                 bounding_capsule_data['radius'] = radius
@@ -162,75 +177,41 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(bounding_capsule_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                if self.shape == 'LOCAL':
-                    ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                    verts_co = verts_co + self.transform_vertex_space(ws_vtx_co, self.active_obj)
-                else:
-                    ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
-
-                coordinates = []
-                height = []
-
-                bounding_box, center = self.generate_bounding_box(verts_co)
-                center = sum((Vector(b) for b in bounding_box), Vector()) / 8.0
-
-                for v in verts_co:
-                    if self.cylinder_axis == 'X':
-                        coordinates.append([v.y, v.z])
-                        height.append(v.x)
-                    elif self.cylinder_axis == 'Y':
-                        coordinates.append([v.x, v.z])
-                        height.append(v.y)
-                    elif self.cylinder_axis == 'Z':
-                        coordinates.append([v.x, v.y])
-                        height.append(v.z)
-
-                nsphere = welzl(np.array(coordinates))
-                radius = np.sqrt(nsphere.sqr_radius)
-                t_arr = np.asarray(height)
-                d_perp = np.linalg.norm(np.asarray(coordinates) - nsphere.center, axis=1)
-                slacks = np.sqrt(np.maximum(0.0, radius ** 2 - d_perp ** 2))
-                depth = max(0.0, float(np.max(t_arr - slacks)) - float(np.min(t_arr + slacks)))
-
-                bounding_capsule_data['parent'] = self.active_obj
-                bounding_capsule_data['radius'] = radius
-                bounding_capsule_data['depth'] = depth
-                bounding_capsule_data['center_point'] = [center[0], center[1], center[2]]
-                collider_data = [bounding_capsule_data]
+                verts_co.append(self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices))
+
+        if verts_co:
+            verts_co = np.concatenate(verts_co)
+            bounding_capsule_data = {}
+
+            bounding_box, center = self.generate_bounding_box(verts_co)
+            coordinates, height = split_axis_coordinates(verts_co, self.cylinder_axis)
+            radius, depth = self.capsule_radius_depth(coordinates, height)
+
+            bounding_capsule_data['parent'] = self.active_obj
+            bounding_capsule_data['radius'] = radius
+            bounding_capsule_data['depth'] = depth
+            bounding_capsule_data['center_point'] = [center[0], center[1], center[2]]
+            collider_data = [bounding_capsule_data]
 
         bpy.context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        shared_meshes = {}
+        parents = []
         for bounding_capsule_data in collider_data:
             global tmp_name
 
             parent = bounding_capsule_data['parent']
-            radius = bounding_capsule_data['radius']
-            depth = bounding_capsule_data['depth']
             center = bounding_capsule_data['center_point']
+            shared_key = bounding_capsule_data.get('shared_key')
 
-            if self.my_space == 'GLOBAL':
-                capsule_data = create_capsule_data(longitudes=self.current_settings_dic['capsule_segments'],
-                                                   latitudes=int(self.current_settings_dic['capsule_segments']),
-                                                   radius=radius * self.current_settings_dic['width_mult'],
-                                                   depth=depth * self.current_settings_dic['height_mult'],
-                                                   uv_profile="FIXED")
-
-            else:  # if self.my_space == 'LOCAL':
-                capsule_data = create_capsule_data(longitudes=self.current_settings_dic['capsule_segments'],
-                                                   latitudes=int(self.current_settings_dic['capsule_segments']),
-                                                   radius=radius * self.current_settings_dic['width_mult'],
-                                                   depth=depth * self.current_settings_dic['height_mult'],
-                                                   uv_profile="FIXED")
-
-            bm = mesh_data_to_bmesh(vs=capsule_data["vs"], vts=capsule_data["vts"], vns=capsule_data["vns"],
-                                    v_indices=capsule_data["v_indices"], vt_indices=capsule_data["vt_indices"],
-                                    vn_indices=capsule_data["vn_indices"], )
-
-            mesh_data = bpy.data.meshes.new("Capsule")
-            bm.to_mesh(mesh_data)
-            bm.free()
+            if shared_key in shared_meshes:
+                mesh_data = shared_meshes[shared_key]
+            else:
+                mesh_data = bpy.data.meshes.new("Capsule")
+                self.build_collider_mesh(mesh_data, bounding_capsule_data)
+                if shared_key is not None:
+                    shared_meshes[shared_key] = mesh_data
 
             new_collider = bpy.data.objects.new(mesh_data.name, mesh_data)
 
@@ -247,12 +228,14 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
                 new_collider.rotation_euler.rotate_axis("X", radians(90))
 
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            self.fit_cache.append((new_collider, bounding_capsule_data))
+            parents.append(parent)
 
             super().set_collider_name(new_collider, parent.name)
             self.custom_set_parent(context, parent, new_collider)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -262,4 +245,4 @@ class OBJECT_OT_add_bounding_capsule(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time("Capsule Collider", elapsed_time)
         self.report({'INFO'}, f"Capsule Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
@@ -1,8 +1,9 @@
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
+from ..bmesh_operations.hull_simplification import convex_hull_bmesh
 
 
 class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
@@ -14,8 +15,11 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_decimation = True
-        self.use_geo_nodes_hull = True
+        # The hull is simplified in place and stays convex, so neither a
+        # Decimate modifier nor a Convex Hull node modifier is needed.
+        self.use_hull_simplification = True
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.shape = 'convex_shape'
         self.initial_shape = 'convex_shape'
         self.use_recenter_origin = True
@@ -50,27 +54,43 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
         # List for storing dictionaries of data used to generate the collision meshes
         collider_data = []
         verts_co = []
+        # Linked duplicates are fitted once, see shared_data_key()
+        shared_keys = set()
 
-        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
+        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True, use_island_records=True)
+
+        creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
+            self.creation_mode_edit[self.creation_mode_idx]
 
         for base_ob, obj in objs:
 
             convex_collision_data = {}
 
-            if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-                used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+            shared_key = None
+            if creation_mode in ['INDIVIDUAL']:
+                shared_key = self.shared_data_key(base_ob)
+                if shared_key in shared_keys:
+                    convex_collision_data['parent'] = base_ob
+                    convex_collision_data['shared_key'] = shared_key
+                    collider_data.append(convex_collision_data)
+                    continue
 
-            else:  # self.obj_mode  == "OBJECT" or self.use_loose_mesh:
-                used_vertices = self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+            # (N, 3) local space coordinates of the used (all or selected) vertices
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
 
             if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
 
-            ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-
-            creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
-                self.creation_mode_edit[self.creation_mode_idx]
+            if shared_key is not None:
+                # The hull is built in local space and placed with the transform of every instance
+                shared_keys.add(shared_key)
+                convex_collision_data['parent'] = base_ob
+                convex_collision_data['verts_loc'] = used_vertices
+                convex_collision_data['shared_key'] = shared_key
+                collider_data.append(convex_collision_data)
+                continue
 
+            ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
 
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
 
@@ -81,51 +101,55 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(convex_collision_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-
-                verts_co = verts_co + ws_vtx_co
-
-                convex_collision_data = {}
-                convex_collision_data['parent'] = self.active_obj
-                convex_collision_data['verts_loc'] = verts_co
-                collider_data = [convex_collision_data]
+                # get array of all vertex coordinates in global space
+                verts_co.append(ws_vtx_co)
 
+        if verts_co:
+            convex_collision_data = {}
+            convex_collision_data['parent'] = self.active_obj
+            convex_collision_data['verts_loc'] = np.concatenate(verts_co)
+            collider_data = [convex_collision_data]
 
         bpy.context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        shared_meshes = {}
+        parents = []
         for convex_collision_data in collider_data:
             # get data from dictionary
             parent = convex_collision_data['parent']
-            verts_loc = convex_collision_data['verts_loc']
+            shared_key = convex_collision_data.get('shared_key')
 
-            bm = bmesh.new()
-            for v in verts_loc:
-                bm.verts.new(v)  # add a new vert
+            if shared_key in shared_meshes:
+                me = shared_meshes[shared_key]
+            else:
+                verts_loc = convex_collision_data['verts_loc']
 
-            ch = bmesh.ops.convex_hull(bm, input=bm.verts)
+                max_vertices = self.prefs.hull_vertex_limit if self.prefs.use_hull_vertex_limit else None
+                bm = convex_hull_bmesh(verts_loc, max_vertices=max_vertices,
+                                       vertex_ratio=self.current_settings_dic['decimate'])
 
-            bmesh.ops.delete(
-                bm,
-                geom=ch["geom_unused"],
-                context='VERTS',
-            )
+                me = bpy.data.meshes.new("mesh")
+                bm.to_mesh(me)
+                bm.free()
 
-            me = bpy.data.meshes.new("mesh")
-            bm.to_mesh(me)
-            bm.free()
+                if shared_key is not None:
+                    shared_meshes[shared_key] = me
 
-            new_collider = bpy.data.objects.new('colliders', me)
-            context.scene.collection.objects.link(new_collider)
+            new_collider = self.new_collider_object(context, me)
+
+            if shared_key is not None:
+                new_collider.matrix_world = parent.matrix_world
 
             self.custom_set_parent(context, parent, new_collider)
 
             # save collision objects to delete when canceling the operation
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            parents.append(parent)
             super().set_collider_name(new_collider, parent.name)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -136,4 +160,4 @@ class OBJECT_OT_add_convex_hull(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time("Convex Collider", elapsed_time)
         self.report({'INFO'}, f"Convex Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
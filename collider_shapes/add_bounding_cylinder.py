@@ -3,11 +3,10 @@ from math import radians
 import bpy
 import numpy as np
 from bpy.types import Operator
-from mathutils import Vector
 
-from ..bmesh_operations.cylinder_generation import welzl
+from ..bmesh_operations.cylinder_generation import minimum_enclosing_circle, split_axis_coordinates
+from ..bmesh_operations.primitive_templates import primitive_template, write_primitive_mesh
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
-from .utilities import get_sca_matrix, get_rot_matrix, get_loc_matrix
 
 tmp_name = 'cylindrical_collider'
 
@@ -17,7 +16,7 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
     bl_label = "Add Cylinder"
     bl_description = 'Create cylindrical colliders based on the selection'
 
-    def generate_cylinder_object(self, context, radius, depth, location, rotation_euler=False):
+    def generate_cylinder_object(self, context, radius, depth, location, rotation_euler=False, mesh=None):
         """
         Create cylindrical collider for every selected object in object mode.
 
@@ -27,6 +26,7 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
             depth (float): Depth of the cylinder.
             location (tuple): Location of the cylinder.
             rotation_euler (tuple, optional): Rotation of the cylinder.
+            mesh (bpy.types.Mesh, optional): Already built cylinder mesh to use, e.g. of a linked duplicate.
 
         Returns:
             bpy.types.Object: The created cylindrical collider.
@@ -34,15 +34,13 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
 
         global tmp_name
 
-        # add new cylindrical mesh
-        bpy.ops.mesh.primitive_cylinder_add(vertices=self.current_settings_dic['cylinder_segments'],
-                                            radius=radius,
-                                            depth=depth,
-                                            end_fill_type='TRIFAN',
-                                            calc_uvs=True, )
+        if mesh is None:
+            # add new cylindrical mesh
+            mesh = bpy.data.meshes.new(tmp_name)
+            self.build_collider_mesh(mesh, {'radius': radius, 'depth': depth})
 
-        new_collider = context.object
-        new_collider.name = tmp_name
+        new_collider = bpy.data.objects.new(tmp_name, mesh)
+        context.collection.objects.link(new_collider)
 
         new_collider.location = location
 
@@ -56,11 +54,16 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
 
         return new_collider
 
-    def get_used_vertices(self, base_ob, obj):
-        if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-            return self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-        else:
-            return self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+    def build_collider_mesh(self, mesh, fit):
+        """
+        Write a cylinder with the fitted radius and depth, centered at the origin along Z, into mesh.
+
+        Args:
+            mesh (bpy.types.Mesh): The mesh to replace the geometry of.
+            fit (dict): The fitted 'radius' and 'depth' of the cylinder.
+        """
+        template = primitive_template('cylinder', self.current_settings_dic['cylinder_segments'])
+        write_primitive_mesh(mesh, template, (fit['radius'], fit['radius'], fit['depth']))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -72,6 +75,7 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
 
         self.use_space = True
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.use_global_local_switches = True
 
         # cylinder specific
@@ -123,67 +127,68 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
         # Initialize lists to store collider data and vertex coordinates
         collider_data = []
         verts_co = []
+        # Linked duplicates are fitted once in local space, see shared_data_key()
+        shared_fits = {}
 
         # Get the pre-processed mesh objects from the context
-        objs = self.get_pre_processed_mesh_objs(context)
+        objs = self.get_pre_processed_mesh_objs(context, use_island_records=True)
 
         # Iterate through each base object and its corresponding processed object
         for base_ob, obj in objs:
             # Initialize a dictionary to store data for the bounding cylinder
             bounding_cylinder_data = {}
 
-            # Get the vertices that will be used for processing based on the mode and object type
-            used_vertices = self.get_used_vertices(base_ob, obj)
-
-            # If no vertices are found, skip to the next object
-            if not used_vertices:
-                continue
-
             # Decompose the object's world matrix into location, rotation, and scale components
             matrix_WS = obj.matrix_world
-            loc, rot, sca = matrix_WS.decompose()
+            _, _, sca = matrix_WS.decompose()
 
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
 
-            if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
-                coordinates = []
-                height = []
+            shared_key = None
+            if creation_mode in ['INDIVIDUAL'] and self.my_space == 'LOCAL':
+                shared_key = self.shared_data_key(base_ob)
+                if shared_key is not None:
+                    # The fit is scaled, so only duplicates with the same scale share it.
+                    shared_key += (tuple(sca),)
+                if shared_key in shared_fits:
+                    radius, depth, local_center = shared_fits[shared_key]
+                    center = matrix_WS @ local_center
+                    bounding_cylinder_data['parent'] = base_ob
+                    bounding_cylinder_data['radius'] = radius
+                    bounding_cylinder_data['depth'] = depth
+                    bounding_cylinder_data['center_point'] = [center[0], center[1], center[2]]
+                    bounding_cylinder_data['shared_key'] = shared_key
+                    collider_data.append(bounding_cylinder_data)
+                    continue
+
+            # Get the (N, 3) local space vertex array that will be used for processing based on the mode and object type
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
 
-                co = self.get_vertex_coordinates(
-                    obj, self.my_space, used_vertices)
-                bounding_box, center = self.generate_bounding_box(co)
+            # If no vertices are found, skip to the next object
+            if used_vertices is None:
+                continue
 
-                for vertex in used_vertices:
-
-                    # Ignore Scale
-                    if self.my_space == 'LOCAL':
-                        v = vertex.co @ get_sca_matrix(sca)
-                    else:
-                        # Scale has to be applied before location
-                        v = vertex.co @ get_sca_matrix(
-                            sca) @ get_loc_matrix(loc) @ get_rot_matrix(rot)
-
-                    if self.cylinder_axis == 'X':
-                        coordinates.append([v.y, v.z])
-                        height.append(v.x)
-                    elif self.cylinder_axis == 'Y':
-                        coordinates.append([v.x, v.z])
-                        height.append(v.y)
-                    elif self.cylinder_axis == 'Z':
-                        coordinates.append([v.x, v.y])
-                        height.append(v.z)
+            if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
+                co = self.get_vertex_coordinates(obj, self.my_space, used_vertices)
+                bounding_box, center = self.generate_bounding_box(co)
+                local_center = center
 
                 if self.my_space == 'LOCAL':
-                    center = sum((Vector(matrix_WS @ Vector(b))
-                                  for b in bounding_box), Vector()) / 8.0
+                    # Ignore rotation and location, the collider copies the parent's rotation instead
+                    v_co = used_vertices * np.array(sca)
+                    center = matrix_WS @ center
                 else:
-                    center = sum((Vector(b)
-                                  for b in bounding_box), Vector()) / 8.0
+                    v_co = co
+
+                coordinates, height = split_axis_coordinates(v_co, self.cylinder_axis)
 
-                depth = abs(max(height) - min(height))
-                nsphere = welzl(np.array(coordinates))
-                radius = np.sqrt(nsphere.sqr_radius)
+                depth = abs(float(height.max()) - float(height.min()))
+                _, radius = minimum_enclosing_circle(coordinates)
+
+                if shared_key is not None:
+                    shared_fits[shared_key] = (radius, depth, local_center)
+                    bounding_cylinder_data['shared_key'] = shared_key
 
                 bounding_cylinder_data['parent'] = base_ob
                 bounding_cylinder_data['radius'] = radius
@@ -193,46 +198,31 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
                 collider_data.append(bounding_cylinder_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
+                verts_co.append(self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices))
 
-                if self.shape == 'LOCAL':
-                    ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                    verts_co = verts_co + self.transform_vertex_space(ws_vtx_co, self.active_obj)
-                else:
-                    ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
-
-                coordinates = []
-                height = []
+        if verts_co:
+            verts_co = np.concatenate(verts_co)
+            bounding_cylinder_data = {}
 
-                bounding_box, center = self.generate_bounding_box(verts_co)
-                center = sum((Vector(b) for b in bounding_box), Vector()) / 8.0
+            bounding_box, center = self.generate_bounding_box(verts_co)
+            coordinates, height = split_axis_coordinates(verts_co, self.cylinder_axis)
 
-                for v in verts_co:
-                    if self.cylinder_axis == 'X':
-                        coordinates.append([v.y, v.z])
-                        height.append(v.x)
-                    elif self.cylinder_axis == 'Y':
-                        coordinates.append([v.x, v.z])
-                        height.append(v.y)
-                    elif self.cylinder_axis == 'Z':
-                        coordinates.append([v.x, v.y])
-                        height.append(v.z)
+            depth = abs(float(height.max()) - float(height.min()))
 
-                depth = abs(max(height) - min(height))
+            _, radius = minimum_enclosing_circle(coordinates)
 
-                nsphere = welzl(np.array(coordinates))
-                radius = np.sqrt(nsphere.sqr_radius)
-
-                bounding_cylinder_data['parent'] = self.active_obj
-                bounding_cylinder_data['radius'] = radius
-                bounding_cylinder_data['depth'] = depth
-                bounding_cylinder_data['center_point'] = [
-                    center[0], center[1], center[2]]
-                collider_data = [bounding_cylinder_data]
+            bounding_cylinder_data['parent'] = self.active_obj
+            bounding_cylinder_data['radius'] = radius
+            bounding_cylinder_data['depth'] = depth
+            bounding_cylinder_data['center_point'] = [
+                center[0], center[1], center[2]]
+            collider_data = [bounding_cylinder_data]
 
         bpy.context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        shared_meshes = {}
+        parents = []
         for bounding_cylinder_data in collider_data:
             global tmp_name
 
@@ -240,6 +230,7 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
             radius = bounding_cylinder_data['radius']
             depth = bounding_cylinder_data['depth']
             center = bounding_cylinder_data['center_point']
+            shared_key = bounding_cylinder_data.get('shared_key')
 
             if self.my_space == 'GLOBAL':
                 new_collider = self.generate_cylinder_object(
@@ -247,16 +238,21 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
 
             else:  # if self.my_space == 'LOCAL':
                 new_collider = self.generate_cylinder_object(context, radius, depth, center,
-                                                             rotation_euler=parent.rotation_euler)
+                                                             rotation_euler=parent.rotation_euler,
+                                                             mesh=shared_meshes.get(shared_key))
                 new_collider.scale = (1.0, 1.0, 1.0)
+                if shared_key is not None:
+                    shared_meshes[shared_key] = new_collider.data
 
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            self.fit_cache.append((new_collider, bounding_cylinder_data))
+            parents.append(parent)
 
             super().set_collider_name(new_collider, parent.name)
             self.custom_set_parent(context, parent, new_collider)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -267,4 +263,4 @@ class OBJECT_OT_add_bounding_cylinder(OBJECT_OT_add_bounding_object, Operator):
         self.report(
             {'INFO'}, f"Convex Cylindrical Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
@@ -1,91 +1,12 @@
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
-from mathutils import Vector
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
+from ..bmesh_operations.kdop_generation import KDOP_NORMALS, generate_kdop, principal_axes_normals
 
 tmp_name = 'kdop_collider'
 
-def get_10dop_normals():
-    # 5 slab directions = 10 half-space planes
-    return [
-        Vector((1, 0, 0)),  Vector((-1, 0, 0)),
-        Vector((0, 1, 0)),  Vector((0, -1, 0)),
-        Vector((0, 0, 1)),  Vector((0, 0, -1)),
-        Vector((1, 1, 0)).normalized(),  Vector((-1, -1, 0)).normalized(),  # was missing
-        Vector((0, 1, 1)).normalized(),  Vector((0, -1, -1)).normalized(),  # was missing
-    ]
-
-def get_18dop_normals():
-    normals = []
-    normals.extend([
-        Vector((1, 0, 0)), Vector((-1, 0, 0)),
-        Vector((0, 1, 0)), Vector((0, -1, 0)),
-        Vector((0, 0, 1)), Vector((0, 0, -1)),
-    ])
-    normals.extend([
-        Vector((1, 1, 0)).normalized(),
-        Vector((1, -1, 0)).normalized(),
-        Vector((-1, 1, 0)).normalized(),
-        Vector((-1, -1, 0)).normalized(),
-        Vector((1, 0, 1)).normalized(),
-        Vector((1, 0, -1)).normalized(),
-        Vector((-1, 0, 1)).normalized(),
-        Vector((-1, 0, -1)).normalized(),
-        Vector((0, 1, 1)).normalized(),
-        Vector((0, 1, -1)).normalized(),
-        Vector((0, -1, 1)).normalized(),
-        Vector((0, -1, -1)).normalized(),
-    ])
-    return normals
-
-def get_26dop_normals():
-    normals = get_18dop_normals()
-    normals.extend([
-        Vector((1, 1, 1)).normalized(),
-        Vector((1, 1, -1)).normalized(),
-        Vector((1, -1, 1)).normalized(),
-        Vector((1, -1, -1)).normalized(),
-        Vector((-1, 1, 1)).normalized(),
-        Vector((-1, 1, -1)).normalized(),
-        Vector((-1, -1, 1)).normalized(),
-        Vector((-1, -1, -1)).normalized(),
-    ])
-    return normals
-
-def generate_kdop(bm_input, normals):
-    """Generate k-DOP by intersecting half-spaces via plane clipping."""
-    verts = [v.co.copy() for v in bm_input.verts]
-    if not verts:
-        return bmesh.new()
-
-    # Each normal n defines a half-space: n·x <= d_max
-    planes = [(n, max(v.dot(n) for v in verts)) for n in normals]
-
-    # Seed geometry: a cube large enough to contain the final k-DOP
-    max_extent = max(abs(c) for v in verts for c in v)
-    bm = bmesh.new()
-    bmesh.ops.create_cube(bm, size=(max_extent + 1.0) * 6)
-
-    for n, d in planes:
-        # Geometry refs must be refreshed each iteration — stale refs cause silent failures
-        geom = bm.verts[:] + bm.edges[:] + bm.faces[:]
-        bmesh.ops.bisect_plane(
-            bm,
-            geom=geom,
-            dist=1e-5,
-            plane_co=n * d,
-            plane_no=n,
-            clear_outer=True,
-            clear_inner=False,
-        )
-        # Fill the open loop left by this cut BEFORE the next bisect runs.
-        # Without this, subsequent cuts operate on a mesh with holes and
-        # progressively destroy it until nothing remains.
-        bmesh.ops.holes_fill(bm, edges=bm.edges, sides=0)
-
-    return bm
 
 class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
     """Create K-Discrete Oriented Polytope (k-DOP) colliders based on the selection"""
@@ -104,9 +25,20 @@ class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
         default='18',
     )
 
+    dop_orientation: bpy.props.EnumProperty(
+        name="k-DOP Orientation",
+        description="Orientation of the k-DOP directions",
+        items=[
+            ('WORLD', "World Axes", "Align the k-DOP directions to the world axes"),
+            ('PRINCIPAL', "Principal Axes", "Align the k-DOP directions to the principal axes of the vertices"),
+        ],
+        default='WORLD',
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.shape = 'convex_shape'
         self.initial_shape = 'convex_shape'
 
@@ -150,15 +82,13 @@ class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
         collider_data = []
         verts_co = []
 
-        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
+        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True, use_island_records=True)
 
         for base_ob, obj in objs:
             convex_collision_data = {}
 
-            if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-                used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-            else:  # self.obj_mode  == "OBJECT" or self.use_loose_mesh:
-                used_vertices = self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+            # (N, 3) local space coordinates of the used (all or selected) vertices
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
 
             if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
@@ -174,41 +104,36 @@ class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
                 convex_collision_data['verts_loc'] = ws_vtx_co
                 collider_data.append(convex_collision_data)
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                verts_co = verts_co + ws_vtx_co
-                convex_collision_data = {}
-                convex_collision_data['parent'] = self.active_obj
-                convex_collision_data['verts_loc'] = verts_co
-                collider_data = [convex_collision_data]
+                # get array of all vertex coordinates in global space
+                verts_co.append(ws_vtx_co)
+
+        if verts_co:
+            convex_collision_data = {}
+            convex_collision_data['parent'] = self.active_obj
+            convex_collision_data['verts_loc'] = np.concatenate(verts_co)
+            collider_data = [convex_collision_data]
 
         bpy.context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        parents = []
         for convex_collision_data in collider_data:
             # get data from dictionary
             parent = convex_collision_data['parent']
             verts_loc = convex_collision_data['verts_loc']
 
-            bm = bmesh.new()
-            for v in verts_loc:
-                bm.verts.new(v)  # add a new vert
-
             # Select normals based on desired k-DOP type
-            if self.dop_type == '10':
-                normals = get_10dop_normals()
-            elif self.dop_type == '18':
-                normals = get_18dop_normals()
-            elif self.dop_type == '26':
-                normals = get_26dop_normals()
+            normals = KDOP_NORMALS[self.dop_type]()
+            if self.dop_orientation == 'PRINCIPAL':
+                normals = principal_axes_normals(verts_loc, normals)
 
-            # Generate k-DOP from the convex hull
-            bm_kdop = generate_kdop(bm, normals)
+            # Generate k-DOP from the half-space intersection
+            bm_kdop = generate_kdop(verts_loc, normals)
 
             # Create a new mesh
             me = bpy.data.meshes.new(f"{self.dop_type}-DOP")
             bm_kdop.to_mesh(me)
             bm_kdop.free()
-            bm.free()
 
             new_collider = bpy.data.objects.new('colliders', me)
             context.scene.collection.objects.link(new_collider)
@@ -217,10 +142,11 @@ class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
 
             # save collision objects to delete when canceling the operation
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            parents.append(parent)
             super().set_collider_name(new_collider, parent.name)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -231,4 +157,4 @@ class OBJECT_OT_add_bounding_kdop(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time(f"{self.dop_type}-DOP Collider", elapsed_time)
         self.report({'INFO'}, f"{self.dop_type}-DOP Collider: {float(elapsed_time):.4f}s")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
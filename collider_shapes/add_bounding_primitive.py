@@ -1,7 +1,3 @@
-import queue
-import subprocess
-import threading
-
 import blf
 import bmesh
 import bpy
@@ -13,12 +9,16 @@ from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix, Quaternion
 
 from .. import __package__ as base_package
+from ..bmesh_operations.geometry_fingerprint import match_duplicate_meshes
 from ..bmesh_operations.mesh_edit import delete_non_selected_verts
-from ..bmesh_operations.mesh_split_by_island import create_objs_from_island
+from ..bmesh_operations.mesh_split_by_island import MeshIsland, create_objs_from_island, get_island_records
+from ..bmesh_operations.point_prefilter import prefilter_hull_candidates
+from ..bmesh_operations.vertex_arrays import bmesh_vertex_coordinates, mesh_join, mesh_vertex_coordinates, \
+    transform_coordinates
 from ..groups.user_groups import set_object_color, set_default_group_values
 from ..properties.constants import DECIMATE_NAME, VALID_OBJECT_TYPES
 from ..pyshics_materials.material_functions import assign_physics_material, create_default_material, \
-    set_active_physics_material, set_material
+    create_physics_material, remove_materials, set_active_physics_material, set_material
 
 # How long the viewport-navigation HUD dimming stays on after the view was
 # last seen changing (see draw_viewport_overlay). Short enough to feel
@@ -161,7 +161,7 @@ def _local_child_collection(parent_collection, name):
     return None
 
 
-def set_origin_to_center_of_mass(obj, depsgraph=None):
+def set_origin_to_center_of_mass(obj, depsgraph=None, offset=None):
     """
     Sets the origin of the given object to its center of mass.
 
@@ -171,10 +171,20 @@ def set_origin_to_center_of_mass(obj, depsgraph=None):
         loop, pass a single depsgraph obtained before the loop to avoid O(N²)
         re-evaluations: each obj.location assignment dirties the depsgraph, and
         evaluated_depsgraph_get() forces a full re-evaluation on every call.
+    offset: Optional local space center of mass returned by a previous call for
+        another object sharing obj's mesh data. The mesh has already been moved
+        then, so only the origin of obj is moved.
+
+    Returns:
+    mathutils.Vector: The local space offset the mesh was moved by, or None.
     """
     if obj.type != 'MESH':
         print(f"Object '{obj.name}' is not a mesh. Cannot calculate center of mass.")
-        return
+        return None
+
+    if offset is not None:
+        obj.location = obj.matrix_world @ offset
+        return offset
 
     # Ensure the object has up-to-date evaluated data
     if depsgraph is None:
@@ -185,15 +195,14 @@ def set_origin_to_center_of_mass(obj, depsgraph=None):
     # Calculate center of mass using numpy for better performance
     if len(mesh.vertices) == 0:
         print(f"Object '{obj.name}' has no vertices. Cannot calculate center of mass.")
-        return
+        return None
     
     # Use numpy for faster vertex operations. obj.matrix_world is a 4x4
     # mathutils.Matrix; numpy's `@` can't multiply it directly against an
-    # (N, 3) array (shape mismatch), so the rotation/scale submatrix and
-    # translation are applied explicitly instead.
-    verts_local = numpy.array([v.co for v in mesh.vertices])
-    mat_world = numpy.array(obj.matrix_world)
-    verts_world = verts_local @ mat_world[:3, :3].T + mat_world[:3, 3]
+    # (N, 3) array (shape mismatch), so transform_coordinates() applies the
+    # rotation/scale submatrix and translation explicitly instead.
+    verts_local = mesh_vertex_coordinates(mesh)
+    verts_world = transform_coordinates(verts_local, obj.matrix_world)
     com = numpy.mean(verts_world, axis=0)
 
     # Calculate the offset
@@ -204,11 +213,28 @@ def set_origin_to_center_of_mass(obj, depsgraph=None):
     # only to compute the center of mass - modifiers such as the convex hull
     # / decimate modifiers used by Auto Convex can change the vertex count,
     # so its vertices no longer line up 1:1 with obj.data.vertices here.
-    for vertex in obj.data.vertices:
-        vertex.co = vertex.co - offset
+    obj.data.transform(mathutils.Matrix.Translation(-offset))
 
     # Move the object's origin to the center of mass
     obj.location = mathutils.Vector(com)
+    return offset
+
+
+def object_world_matrix(obj):
+    """
+    World matrix of obj computed from its parent and loc/rot/scale instead of read from matrix_world, which is only
+    updated by the depsgraph (see custom_set_parent()).
+
+    Parameters:
+    obj (bpy.types.Object): The object.
+
+    Returns:
+    mathutils.Matrix: The world matrix of obj.
+    """
+    if obj.parent is None:
+        return obj.matrix_basis.copy()
+    return obj.parent.matrix_world @ obj.matrix_parent_inverse @ obj.matrix_basis
+
 
 def geometry_node_group_empty_new():
     group = bpy.data.node_groups.new("Convex_Hull", 'GeometryNodeTree')
@@ -365,13 +391,13 @@ def draw_viewport_overlay(self, context):
         self.navigation_view_snapshot = view_snapshot
     self.navigation = time.time() < self.navigation_hold_until
 
-    # An external subprocess job (CoACD/V-HACD, see _launch_async_process()
-    # below) is running asynchronously. None of the per-row settings below
+    # External subprocess jobs (CoACD/V-HACD, see _drain_async_progress()
+    # below) are running asynchronously. None of the per-row settings below
     # (D/S/A/etc.) apply to anything yet - there are no colliders to adjust
-    # until the job finishes - so showing them as if they were live would be
+    # until the jobs finish - so showing them as if they were live would be
     # misleading. Replace the whole settings HUD with a dedicated status
     # overlay instead, and skip building it at all.
-    if getattr(self, '_async_process', None) is not None:
+    if getattr(self, '_async_jobs', None) is not None:
         draw_async_job_overlay(self, context)
         return
 
@@ -633,8 +659,8 @@ def draw_viewport_overlay(self, context):
 
 def draw_async_job_overlay(self, context):
     """Centered status overlay shown in place of the normal settings HUD
-    while an external subprocess job (CoACD/V-HACD, launched via
-    _launch_async_process()) is running. Deliberately not just another row
+    while external subprocess jobs (CoACD/V-HACD, see
+    auto_Convex/job_scheduler.py) are running. Deliberately not just another row
     in the regular HUD: that list reads as "these are live, interactive
     settings", which isn't true while a job is running - there's nothing to
     adjust until it produces colliders. A distinct, centered, warning-styled
@@ -756,7 +782,7 @@ def _get_stripe_shader():
     """Lazily compile and cache the diagonal-stripe shader used by
     draw_animated_stripes(). Compiling a GPUShader is comparatively
     expensive; the overlay redraws on every timer tick while an async job
-    is running (see _poll_coacd_process()/_poll_vhacd_process()), so this
+    is running (see _poll_coacd_jobs()/_poll_vhacd_jobs()), so this
     must happen once per Blender session, not once per draw call."""
     global _stripe_shader
     if _stripe_shader is not None:
@@ -891,7 +917,6 @@ class OBJECT_OT_add_bounding_object():
     object collider_shapes"""
     bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR', 'BLOCKING'}
     # GRAB_CURSOR + BLOCKING enables wrap-around mouse feature.
-    bm = []
 
     # Shared external-subprocess-job plumbing, used by both
     # COACD_OT_convex_decomposition and VHACD_OT_convex_decomposition to run
@@ -899,75 +924,78 @@ class OBJECT_OT_add_bounding_object():
     # blocking Blender's main thread with Popen.wait() (#660). Both
     # operators drive their own poll/finish/cancel state machines - the
     # per-tool flow genuinely differs (CoACD has an extra per-hull decimate
-    # pass, V-HACD doesn't) - but share these three generic pieces: how a
-    # subprocess is launched and its stdout captured, how that stdout is
-    # drained into a live status string, and how that status is drawn (see
-    # draw_async_job_overlay() above). Subclasses set self._async_process /
+    # pass, V-HACD doesn't) - but share the same job scheduler
+    # (auto_Convex/job_scheduler.py), which runs the subprocesses
+    # concurrently and captures their stdout, how that stdout is drained
+    # into a live status string, and how that status is drawn (see
+    # draw_async_job_overlay() above). Subclasses set self._async_jobs /
     # self._async_start_time / self._async_job_label and override
     # _parse_progress_line() for their own CLI's output format.
-    def _launch_async_process(self, cmd, cwd):
-        """Launch cmd with its stdout/stderr piped through a daemon reader
-        thread into a queue, instead of letting it inherit the console.
-        _drain_async_progress() then pulls from that queue on Blender's main
-        thread (never blocking it) to keep the status overlay live.
-
-        The reader splits on '\\r' as well as '\\n': some CLIs (V-HACD) print
-        progress updates separated only by carriage returns, the same way a
-        terminal progress bar would - readline() alone would silently buffer
-        all of those into one giant line until a real newline eventually
-        showed up, making progress updates arrive in chunky, stale bursts
-        instead of smoothly.
-        """
-        process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                   text=True, bufsize=1)
-        q = queue.Queue()
-
-        def _reader():
-            try:
-                buf = ''
-                while True:
-                    ch = process.stdout.read(1)
-                    if not ch:
-                        break
-                    if ch in ('\n', '\r'):
-                        if buf:
-                            q.put(buf)
-                            buf = ''
-                    else:
-                        buf += ch
-                if buf:
-                    q.put(buf)
-            except Exception:
-                pass
-
-        threading.Thread(target=_reader, daemon=True).start()
-
-        self._async_stdout_queue = q
-        self._async_status_text = ''
-        return process
-
-    def _parse_progress_line(self, line):
-        """Override per-operator: return an updated status string for this
-        line, or None if the line doesn't change the current status. Default
-        implementation never updates - the overlay just shows elapsed time."""
+    def _parse_progress_line(self, job, line):
+        """Override per-operator: return an updated status string of the job
+        for this line, or None if the line doesn't change its status. May also
+        update job.fraction. Default implementation never updates - the
+        overlay just shows the job counts and elapsed time."""
         return None
 
     def _drain_async_progress(self):
-        """Pull whatever lines the reader thread has queued since the last
-        poll and refresh self._async_status_text via _parse_progress_line().
-        queue.Queue.get_nowait() never blocks - it either returns
-        immediately or raises Empty."""
-        q = getattr(self, '_async_stdout_queue', None)
-        if q is None:
+        """Pull whatever lines the reader threads of the running jobs have
+        queued since the last poll, refresh their status via
+        _parse_progress_line() and combine them into
+        self._async_status_text. Never blocks."""
+        jobs = getattr(self, '_async_jobs', None)
+        if jobs is None:
             return
-        while True:
-            try:
-                line = q.get_nowait()
-            except queue.Empty:
-                break
-            status = self._parse_progress_line(line)
-            if status is not None:
-                self._async_status_text = status
+        for job in jobs.running:
+            for line in job.read_output():
+                status = self._parse_progress_line(job, line)
+                if status is not None:
+                    job.status = status
+        self._async_status_text = jobs.progress_text()
+
+    def merge_duplicate_jobs(self, collider_data):
+        """Drop the decomposition jobs whose mesh is a moved, rotated or uniformly scaled copy of the mesh of an
+        earlier job, see match_duplicate_meshes(). The earlier job lists them in 'instances' instead, so the
+        decomposition runs once per unique geometry and instance_results() maps its result onto every copy."""
+        for convex_collision_data in collider_data:
+            convex_collision_data['instances'] = []
+
+        if not self.prefs.use_duplicate_geometry_reuse or len(collider_data) < 2:
+            return collider_data
+
+        matches = match_duplicate_meshes([data['mesh'] for data in collider_data])
+        unique_data = []
+        for convex_collision_data, match in zip(collider_data, matches):
+            if match is None:
+                unique_data.append(convex_collision_data)
+                continue
+
+            index, matrix = match
+            collider_data[index]['instances'].append({
+                'parent': convex_collision_data['parent'],
+                'mtx_world': convex_collision_data['mtx_world'],
+                'matrix': Matrix(matrix.tolist()),
+            })
+            bpy.data.meshes.remove(convex_collision_data['mesh'])
+
+        return unique_data
+
+    @staticmethod
+    def instance_results(job, colliders):
+        """Decomposition results for the instances merge_duplicate_jobs() attached to job: copies of the colliders
+        decomposed for job, with their mesh mapped onto the geometry of each instance."""
+        results = []
+        for instance in job.get('instances', []):
+            copies = []
+            for collider in colliders:
+                new_collider = collider.copy()
+                new_collider.data = collider.data.copy()
+                new_collider.data.transform(instance['matrix'])
+                for collection in collider.users_collection:
+                    collection.objects.link(new_collider)
+                copies.append(new_collider)
+            results.append({'colliders': copies, 'parent': instance['parent'], 'mtx_world': instance['mtx_world']})
+        return results
 
     @staticmethod
     def calculate_center_of_mass(obj):
@@ -1028,34 +1056,12 @@ class OBJECT_OT_add_bounding_object():
         # set the location back to the old location
         obj.location = ob_loc
 
-    @classmethod
-    def split_coordinates_xyz(cls, v_co_list):
-        """Split a list of vertex locations into lists for the X Y Z component """
-        positionsX = []
-        positionsY = []
-        positionsZ = []
-
-        # generate a lists of all x, y and z coordinates to find the min and max
-        for co in v_co_list:
-            positionsX.append(co[0])
-            positionsY.append(co[1])
-            positionsZ.append(co[2])
-
-        return positionsX, positionsY, positionsZ
-
     @classmethod
     def generate_bounding_box(cls, v_co):
-        """get the min and max coordinates for the bounding box"""
-
-        positionsX, positionsY, positionsZ = cls.split_coordinates_xyz(v_co)
-
-        min_x = min(positionsX)
-        min_y = min(positionsY)
-        min_z = min(positionsZ)
-
-        max_x = max(positionsX)
-        max_y = max(positionsY)
-        max_z = max(positionsZ)
+        """get the min and max coordinates for the bounding box of an (N, 3) coordinate array"""
+        v_co = numpy.asarray(v_co, dtype=numpy.float64)
+        min_x, min_y, min_z = (float(c) for c in v_co.min(axis=0))
+        max_x, max_y, max_z = (float(c) for c in v_co.max(axis=0))
 
         verts = [
             (max_x, max_y, min_z),
@@ -1128,11 +1134,6 @@ class OBJECT_OT_add_bounding_object():
         child.matrix_parent_inverse = parent.matrix_world.inverted()
         child.matrix_world = mtx
 
-    @classmethod
-    def bmesh(cls, bm):
-        # append bmesh to class for it not to be deleted
-        cls.bm.append(bm)
-
     @classmethod
     def class_collider_name(cls, shape_identifier, user_group, basename='Basename', exclude=None,
                             cache=None):
@@ -1319,14 +1320,19 @@ class OBJECT_OT_add_bounding_object():
         ratio. Forces a depsgraph evaluation per collider (via
         mod.face_count), so callers debounce this rather than calling it on
         every MOUSEMOVE delta."""
-        dec_amount = self.current_settings_dic['decimate']
-        # I had to iterate over all object because it crashed when just iterating over the modifiers.
-        self.face_counts = []
-        for obj in self.new_colliders_list:
-            for mod in obj.modifiers:
-                if mod in self.decimate_modifiers:
-                    mod.ratio = dec_amount
-                    self.face_counts.append(mod.face_count)
+        if self.use_hull_simplification:
+            # The ratio drives the hull simplification in execute() instead of a modifier.
+            self.execute(context)
+            self.face_counts = [len(obj.data.polygons) for obj in self.new_colliders_list]
+        else:
+            dec_amount = self.current_settings_dic['decimate']
+            # I had to iterate over all object because it crashed when just iterating over the modifiers.
+            self.face_counts = []
+            for obj in self.new_colliders_list:
+                for mod in obj.modifiers:
+                    if mod in self.decimate_modifiers:
+                        mod.ratio = dec_amount
+                        self.face_counts.append(mod.face_count)
 
         self.report({'INFO'}, "Total collider face count:" + str(sum(self.face_counts)))
         self.draw_callback_px(context)
@@ -1375,16 +1381,19 @@ class OBJECT_OT_add_bounding_object():
 
     @staticmethod
     def remove_objects(list):
-        """Remove list of objects and their exclusively-owned mesh data."""
+        """Remove list of objects and their exclusively-owned mesh data. Mesh data shared by several of the
+        removed objects (see shared_data_key()) is removed with them too."""
         ids = []
+        mesh_users = {}
         for ob in list:
             if ob:
                 try:
-                    if isinstance(ob.data, bpy.types.Mesh) and ob.data.users == 1:
-                        ids.append(ob.data)
+                    if isinstance(ob.data, bpy.types.Mesh):
+                        mesh_users[ob.data] = mesh_users.get(ob.data, 0) + 1
                     ids.append(ob)
                 except ReferenceError:
                     pass
+        ids.extend(me for me, count in mesh_users.items() if me.users == count)
         if ids:
             bpy.data.batch_remove(ids)
 
@@ -1440,98 +1449,82 @@ class OBJECT_OT_add_bounding_object():
         return new_mesh
 
     @staticmethod
-    def get_edit_mode_vertices_local_space(obj, use_modifiers=False):
-        """ Get vertices from the bmesh. Returns a list of all or selected vertices. Returns None if there are no
-        vertices to return"""
+    def get_vertex_array_local_space(obj, use_modifiers=False, edit_mode=False):
+        """ Get the local space vertex positions of obj as an (N, 3) float64 array. In edit mode only the selected
+        vertices are returned. Returns None if there are no vertices to return.
+
+        Every shape operator consumes the result of this as a whole array (one foreach_get() for the coordinates,
+        one for the selection mask) rather than iterating MeshVertex/BMVert objects, see vertex_arrays.py. For a
+        MeshIsland record the island's own coordinates are returned."""
+        if isinstance(obj, MeshIsland):
+            return obj.verts if len(obj.verts) else None
+
         me = obj.data
 
         # len(obj.modifiers) has to be bigger than 0. If there are no modifiers are assigned to the object the simple mesh can be used.
         # If len(obj.modifiers) == 0, the vertices are not selected and used_vertices is empty for some reason.
         if use_modifiers and len(obj.modifiers) > 0:
-            # Get mesh information with the modifiers applied
-
-            # Fix for Bug: #249
-            for mod in obj.modifiers:
-                mod.show_on_cage = True
-                mod.show_in_editmode = True
+            if edit_mode:
+                # Fix for Bug: #249
+                for mod in obj.modifiers:
+                    mod.show_on_cage = True
+                    mod.show_in_editmode = True
 
             me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
+
+            # Get mesh information with the modifiers applied
             depsgraph = bpy.context.evaluated_depsgraph_get()
             bm = bmesh.new()
             bm.from_object(obj, depsgraph)
             OBJECT_OT_add_bounding_object.merge_object_instances(bm, obj, depsgraph)
-            bm.verts.ensure_lookup_table()
+            coords = bmesh_vertex_coordinates(bm, selected_only=edit_mode)
+            bm.free()
 
         else:  # use_modifiers == False
-            # Get a BMesh representation
-            me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
-            bm = bmesh.from_edit_mesh(me)
+            if edit_mode:
+                # Write the edit-mode BMesh back to obj.data so that its
+                # coordinates and selection flags can be read in bulk.
+                obj.update_from_editmode()
+            else:
+                # update mesh data. This is needed to get the current mesh data after editing the mesh (adding,
+                # deleting, transforming)
+                me.update()
+            coords = mesh_vertex_coordinates(me, selected_only=edit_mode)
 
-        used_vertices = [v for v in bm.verts if v.select]
-        if len(used_vertices) == 0:
+        if len(coords) == 0:
             return None
 
-        # This is needed for the bmesh not bo be destroyed, even if the variable isn't used later.
-        OBJECT_OT_add_bounding_object.bmesh(bm)
-        return used_vertices
+        return coords
 
-    @staticmethod
-    def get_object_mode_vertices_local_space(obj, use_modifiers=False):
-        """ Get vertices from the bmesh. Returns a list of all or selected vertices. Returns None if there are no vertices to return """
-        me = obj.data
-        me.update()  # update mesh data. This is needed to get the current mesh data after editing the mesh (adding, deleting, transforming)
-
-        if use_modifiers and len(obj.modifiers) > 0:
-            # Get mesh information with the modifiers applied
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            bm = bmesh.new()
-            bm.from_object(obj, depsgraph)
-            OBJECT_OT_add_bounding_object.merge_object_instances(bm, obj, depsgraph)
-            bm.verts.ensure_lookup_table()
-            used_vertices = bm.verts
-
-            # This is needed for the bmesh not bo be destroyed, even if the variable isn't used later.
-            OBJECT_OT_add_bounding_object.bmesh(bm)
+    def get_used_vertex_array(self, base_ob, obj):
+        """ Local space vertex array of obj for the current operator mode, see get_vertex_array_local_space(). EDIT
+        is only supported for 'MESH' type objects and only if the active object is a 'MESH'. Shapes that only depend
+        on the convex hull of the vertices (use_point_prefilter) get the hull candidates only."""
+        edit_mode = (self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH'
+                     and not self.use_loose_mesh)
+        coords = self.get_vertex_array_local_space(obj, use_modifiers=self.my_use_modifier_stack, edit_mode=edit_mode)
 
-        else:
-            # Get a BMesh representation
-            used_vertices = me.vertices
+        if coords is not None and self.use_point_prefilter and self.prefs.use_extreme_point_prefilter:
+            coords = prefilter_hull_candidates(coords)
 
-        if len(used_vertices) == 0:
-            return None
-
-        return used_vertices
+        return coords
 
     @staticmethod
     def transform_vertex_space(vertex_co, obj):
-        # iterate over vertex coordinates to transform the positions to the appropriate space
-        ws_vertex_co = []
-        for i in range(len(vertex_co)):
-            co = vertex_co[i]
-            ws_vertex_co.append(obj.matrix_world.inverted() @ co)
-
-        return ws_vertex_co
+        """ Transform an (N, 3) array of world space coordinates into the local space of obj. The world matrix is
+        inverted once for the whole array."""
+        return transform_coordinates(vertex_co, obj.matrix_world.inverted())
 
     @staticmethod
-    def get_vertex_coordinates(obj, space, used_vertices):
-        """ returns vertex and face information for the bounding box based on the given coordinate space (e.g., world or local)"""
-
-        # Modify the BMesh, can do anything here...
-        co = []
-
+    def get_vertex_coordinates(obj, space, vertex_co):
+        """ returns the (N, 3) local space coordinate array vertex_co in the given coordinate space (e.g., world or
+        local)"""
         if space == 'GLOBAL':
             # get world space coordinates of the vertices
-            for v in used_vertices:
-                v_local = v
-                v_global = obj.matrix_world @ v_local.co
-
-                co.append(v_global)
+            return transform_coordinates(vertex_co, obj.matrix_world)
 
-        else:  # space == 'LOCAL'
-            for v in used_vertices:
-                co.append(v.co)
-
-        return co
+        # space == 'LOCAL'
+        return vertex_co
 
     @staticmethod
     def merge_object_instances(bm, obj, depsgraph):
@@ -1692,14 +1685,24 @@ class OBJECT_OT_add_bounding_object():
         if not obj.modifiers:
             return
 
+        me = self.bake_modifier_mesh(context, obj, cache_key=cache_key)
+
+        old_data = obj.data
+        obj.data = me.copy() if cache_key else me
+        obj.modifiers.clear()
+
+        if old_data.users == 0:
+            bpy.data.meshes.remove(old_data)
+
+    def bake_modifier_mesh(self, context, obj, cache_key=None):
+        """Mesh of obj with its modifier stack evaluated and instances merged, see apply_all_modifiers(). obj itself
+        is left untouched.
+
+        With a `cache_key` the returned mesh is the one kept in self._modifier_bake_cache and must not be modified
+        or assigned to an object; copy it for that. Without one the caller owns the new mesh."""
         cached_mesh = self._modifier_bake_cache.get(cache_key) if cache_key else None
         if cached_mesh is not None and cached_mesh.name in bpy.data.meshes:
-            old_data = obj.data
-            obj.data = cached_mesh.copy()
-            obj.modifiers.clear()
-            if old_data.users == 0:
-                bpy.data.meshes.remove(old_data)
-            return
+            return cached_mesh
 
         depsgraph = context.evaluated_depsgraph_get()
         me = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), depsgraph=depsgraph)
@@ -1710,15 +1713,9 @@ class OBJECT_OT_add_bounding_object():
         bm.to_mesh(me)
         bm.free()
 
-        old_data = obj.data
-        obj.data = me
-        obj.modifiers.clear()
-
-        if old_data.users == 0:
-            bpy.data.meshes.remove(old_data)
-
         if cache_key:
-            self._modifier_bake_cache[cache_key] = me.copy()
+            self._modifier_bake_cache[cache_key] = me
+        return me
 
     @staticmethod
     def remove_all_modifiers(context, obj):
@@ -1819,6 +1816,83 @@ class OBJECT_OT_add_bounding_object():
         return new_obj
 
     def primitive_postprocessing(self, context, bounding_object, base_object_collections):
+        self.set_collections(bounding_object, base_object_collections)
+
+        if self.prefs.use_col_collection:
+            collection_name = self.prefs.col_collection_name
+            self.add_to_collections(context, bounding_object, collection_name, color=self.prefs.col_collection_color)
+
+        self.postprocess_collider(context, bounding_object, self.resolve_physics_material(context))
+
+    def batch_postprocessing(self, context, colliders, parents):
+        """primitive_postprocessing() for all colliders of a run, each linked to the collections of its parent.
+
+        The physics material and the collider collection are resolved once, and the collections of all colliders
+        and parents are looked up in a single pass (see collections_of_objects()) instead of one users_collection
+        search per object. Nothing here evaluates the depsgraph."""
+        material = self.resolve_physics_material(context)
+
+        col_collection = None
+        if self.prefs.use_col_collection:
+            col_collection = self.create_collection(context, self.prefs.col_collection_name)
+            col_collection.color_tag = self.prefs.col_collection_color
+
+        users = self.collections_of_objects(set(colliders) | set(parents))
+
+        for bounding_object, parent in zip(colliders, parents):
+            collections = list(users[parent])
+            if col_collection is not None and col_collection not in collections:
+                collections.append(col_collection)
+
+            old_collections = users[bounding_object]
+            for col in collections:
+                if col not in old_collections:
+                    col.objects.link(bounding_object)
+            for col in old_collections:
+                if col not in collections:
+                    col.objects.unlink(bounding_object)
+
+            self.postprocess_collider(context, bounding_object, material)
+
+    @staticmethod
+    def collections_of_objects(objects):
+        """The users_collection of every object in objects. Each users_collection lookup searches every collection
+        of the file, so for many objects all collections are searched once instead.
+
+        Returns:
+            dict: The list of collections of each object.
+        """
+        users = {obj: [] for obj in objects}
+        collections = [scene.collection for scene in bpy.data.scenes]
+        collections.extend(bpy.data.collections)
+
+        for col in collections:
+            for obj in col.objects:
+                if obj in users:
+                    users[obj].append(col)
+
+        return users
+
+    def resolve_physics_material(self, context):
+        """The physics material postprocess_collider() assigns, making the default one the active physics material
+        if there is none yet. None if the colliders keep their original materials."""
+        if context.scene.active_physics_material:
+            mat_name = context.scene.active_physics_material.name
+        elif self.prefs.physics_material_name:
+            mat_name = self.prefs.physics_material_name
+            mat = create_default_material()
+            if mat:
+                set_active_physics_material(context, mat.name)
+        else:
+            mat_name = ''
+
+        if self.use_keep_original_materials and self.keep_original_material:
+            return None
+        return create_physics_material(mat_name)
+
+    def postprocess_collider(self, context, bounding_object, material):
+        """The part of primitive_postprocessing() that doesn't depend on the collections: group, display,
+        modifiers, physics material and collider properties."""
         self.set_object_collider_group(bounding_object)
 
         self.set_viewport_drawing(context, bounding_object)
@@ -1826,16 +1900,11 @@ class OBJECT_OT_add_bounding_object():
             add_weld_modifier(context, bounding_object)
 
         self.add_displacement_modifier(context, bounding_object)
-        self.set_collections(bounding_object, base_object_collections)
-
-        if self.prefs.use_col_collection:
-            collection_name = self.prefs.col_collection_name
-            self.add_to_collections(context, bounding_object, collection_name, color=self.prefs.col_collection_color)
 
         if self.use_remesh:
             self.add_remesh_modifier(context, bounding_object)
 
-        if self.use_decimation:
+        if self.use_decimation and not self.use_hull_simplification:
             self.add_decimate_modifier(context, bounding_object)
 
         if self.use_geo_nodes_hull:
@@ -1845,23 +1914,18 @@ class OBJECT_OT_add_bounding_object():
                 print("Update to a newer Blender Version to access all addon features")
 
         if not self.prefs.use_parent_to:
-            mtx = bounding_object.matrix_world
+            mtx = bounding_object.matrix_world.copy()
             bounding_object.parent = None
             bounding_object.matrix_world = mtx
 
-        prefs = bpy.context.preferences.addons[base_package].preferences
-        if context.scene.active_physics_material:
-            mat_name = context.scene.active_physics_material.name
-        elif prefs.physics_material_name:
-            mat_name = prefs.physics_material_name
-            mat = create_default_material()
-            if mat:
-                set_active_physics_material(context, mat.name)
-        else:
-            mat_name = ''
-
         if self.use_keep_original_materials == False or self.keep_original_material == False:
-            assign_physics_material(bounding_object, mat_name)
+            if bounding_object.mode != 'OBJECT':
+                # Edit mode assigns the material to the selected faces only.
+                assign_physics_material(bounding_object, material.name if material else '')
+            else:
+                remove_materials(bounding_object)
+                if material:
+                    set_material(bounding_object, material)
 
         bounding_object['isCollider'] = True
         bounding_object['collider_group'] = self.collision_groups[self.collision_group_idx].mode
@@ -1872,8 +1936,83 @@ class OBJECT_OT_add_bounding_object():
         else:
             bounding_object.show_wire = False
 
+    @staticmethod
+    def modifier_stack_signature(obj):
+        """Hashable settings of every modifier of obj, or None if the stack refers to other datablocks (e.g. a
+        Boolean cutter or a node group), whose result can differ between objects with the same settings."""
+        ignored = {'name', 'show_expanded', 'is_active', 'show_in_editmode', 'show_on_cage', 'show_render',
+                   'use_pin_to_last'}
+        signature = []
+        for mod in obj.modifiers:
+            values = []
+            for prop in mod.bl_rna.properties:
+                if prop.is_readonly or prop.identifier in ignored:
+                    continue
+                if prop.type == 'COLLECTION':
+                    return None
+                value = getattr(mod, prop.identifier)
+                if prop.type == 'POINTER':
+                    # Nested settings such as a bevel profile are not compared.
+                    if isinstance(value, bpy.types.ID):
+                        return None
+                    continue
+                if isinstance(value, set):
+                    value = tuple(sorted(value))
+                elif not isinstance(value, str) and hasattr(value, '__len__'):
+                    value = tuple(value)
+                values.append((prop.identifier, value))
+            signature.append((mod.type, tuple(values)))
+        return tuple(signature)
+
+    def shared_data_key(self, base_ob):
+        """Key of the local space collider geometry base_ob shares with its linked duplicates: objects with the
+        same key get the same collider mesh, fitted once and placed with each object's own transform. None if
+        base_ob has to be fitted on its own."""
+        if self.use_loose_mesh or self.obj_mode == 'EDIT' or base_ob.type != 'MESH' or base_ob.data.users < 2:
+            return None
+
+        signature = ()
+        if self.my_use_modifier_stack and base_ob.modifiers:
+            signature = self.modifier_stack_signature(base_ob)
+            if signature is None:
+                return None
+
+        # A mirroring transform turns the shared geometry inside out.
+        return base_ob.data, signature, base_ob.matrix_world.is_negative
+
+    @staticmethod
+    def new_collider_object(context, mesh, name='colliders'):
+        """Create a collider object for already built (e.g. shared) collider mesh data."""
+        new_collider = bpy.data.objects.new(name, mesh)
+        context.scene.collection.objects.link(new_collider)
+        return new_collider
+
+    def get_island_records(self, context, base_ob, obj, use_world):
+        """Split obj into MeshIsland records for get_pre_processed_mesh_objs(). Only the modifier stack in edit mode
+        still needs a temporary object, as the modifiers have to be evaluated on the selected part only; it is
+        removed again right away."""
+        if self.obj_mode == 'EDIT' and self.my_use_modifier_stack and obj.modifiers:
+            tmp_ob = obj.copy()
+            tmp_ob.data = obj.data.copy()
+            self.add_to_collections(context, tmp_ob, 'tmp_mesh', hide=False, color=self.prefs.col_tmp_collection_color)
+            tmp_ob = delete_non_selected_verts(tmp_ob)
+            self.apply_all_modifiers(context, tmp_ob, cache_key=(base_ob, True))
+            islands = get_island_records(tmp_ob, use_world)
+            self.remove_objects([tmp_ob])
+            return islands
+
+        if self.my_use_modifier_stack and obj.modifiers:
+            return get_island_records(obj, use_world, mesh=self.bake_modifier_mesh(context, obj, (base_ob, True)))
+
+        if self.obj_mode == 'EDIT':
+            obj.update_from_editmode()
+        return get_island_records(obj, use_world, selected_only=self.obj_mode == 'EDIT')
+
     def get_pre_processed_mesh_objs(self, context, default_world_spc=True, use_local=False, local_world_spc=False,
-                                    use_mesh_copy=False, add_to_tmp_meshes=True):
+                                    use_mesh_copy=False, add_to_tmp_meshes=True, use_island_records=False):
+        """(base object, object) pairs to fit colliders to. With use_loose_mesh every face island becomes a pair of
+        its own; shape operators that only read vertex arrays pass use_island_records to get in-memory MeshIsland
+        records instead of temporary island objects."""
 
         objs = []
 
@@ -1901,8 +2040,17 @@ class OBJECT_OT_add_bounding_object():
                     self.creation_mode_idx] if self.obj_mode == 'OBJECT' else self.creation_mode_edit[
                     self.creation_mode_idx]
 
+                if use_local and self.my_space == 'LOCAL':
+                    use_world = local_world_spc
+                else:
+                    use_world = default_world_spc
+
+                if self.use_loose_mesh and use_island_records:
+                    for island in self.get_island_records(context, base_ob, obj, use_world):
+                        objs.append((base_ob, island))
+
                 # Temp meshes for Loose islands
-                if self.use_loose_mesh:
+                elif self.use_loose_mesh:
 
                     base = obj
 
@@ -1922,10 +2070,7 @@ class OBJECT_OT_add_bounding_object():
 
                     self.tmp_meshes.append(tmp_ob)
 
-                    if use_local and self.my_space == 'LOCAL':
-                        split_objs = create_objs_from_island(base, use_world=local_world_spc)
-                    else:
-                        split_objs = create_objs_from_island(base, use_world=default_world_spc)
+                    split_objs = create_objs_from_island(base, use_world=use_world)
 
                     for split in split_objs:
                         col = self.add_to_collections(context, split, 'tmp_mesh', hide=False,
@@ -1950,7 +2095,7 @@ class OBJECT_OT_add_bounding_object():
 
     def set_viewport_drawing(self, context, bounding_object):
         """ Assign material to the bounding object and set the visibility settings of the created object."""
-        if context.space_data.shading.type != 'SOLID':
+        if not self.headless and context.space_data.shading.type != 'SOLID':
             context.space_data.shading.type = 'SOLID'
         else:
             col = self.collision_groups[self.collision_group_idx].color
@@ -1999,6 +2144,10 @@ class OBJECT_OT_add_bounding_object():
         context.view_layer.objects.active = self.active_obj
         bpy.ops.object.mode_set(mode=self.obj_mode)
 
+        # confirm_colliders() removes them right away.
+        if self.headless:
+            return
+
         # Hide all temp meshes exactly once, here, rather than inside
         # primitive_postprocessing().  The old placement ran N times with N
         # objects in self.tmp_meshes → O(N²) hide_set() calls for N islands.
@@ -2049,6 +2198,14 @@ class OBJECT_OT_add_bounding_object():
         modifier = bounding_object.modifiers.new(name="Convex_Hull", type='NODES')
         modifier.node_group = group
 
+    def finish_execute(self, context):
+        """The result of execute() in the shape operators. Without invoke(), there is no modal operator to confirm
+        the colliders, so they are confirmed right away."""
+        if self.headless:
+            self.confirm_colliders(context)
+            return {'FINISHED'}
+        return {'RUNNING_MODAL'}
+
     def get_time_elapsed(self):
         t1 = time.time() - self.t0
         return t1
@@ -2084,20 +2241,51 @@ class OBJECT_OT_add_bounding_object():
 
         _remove_draw_handle(self._handle)
 
-    def join_primitives(self, context):
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.select_all(action='DESELECT')
-        last_selected = None
+    def rebuild_colliders(self, context):
+        """Apply a parameter-only change (segment count, height or width multiplier) to the current colliders.
 
-        for obj in self.new_colliders_list:
-            if obj:
-                obj.select_set(True)
-                context.view_layer.objects.active = self.new_colliders_list[0]
-                last_selected = obj
-
-        bpy.ops.object.join()
-        new_collider = self.new_colliders_list[0]
-        self.new_colliders_list = [new_collider]
+        Shapes with an analytic fit (sphere, cylinder, capsule) keep the fit of every collider in self.fit_cache and
+        define build_collider_mesh(mesh, fit), which writes the collider geometry of a fit into mesh, replacing its
+        geometry. Only the collider meshes are then rebuilt in place instead of removing all colliders and
+        re-solving every fit in execute(). Shapes without build_collider_mesh() and joined colliders, which have no
+        single fit per object, are regenerated."""
+        build_collider_mesh = getattr(self, 'build_collider_mesh', None)
+        if not self.fit_cache or self.join_primitives or build_collider_mesh is None:
+            self.execute(context)
+            return
+
+        rebuilt = set()
+        for collider, fit in self.fit_cache:
+            # Colliders of linked duplicates share their mesh, see shared_data_key().
+            if collider.data in rebuilt:
+                continue
+            rebuilt.add(collider.data)
+            build_collider_mesh(collider.data, fit)
+
+    def join_colliders(self, colliders, target=None):
+        """Merge the meshes of colliders into target, the first collider by default, and remove the others.
+
+        Unlike bpy.ops.object.join() this doesn't change the selection or the active object and doesn't evaluate
+        the depsgraph, see mesh_join(). Returns the joined collider, or None if there are no colliders."""
+        colliders = [obj for obj in colliders if obj]
+        if not colliders:
+            return None
+        if target is None:
+            target = colliders[0]
+
+        target_inverse = object_world_matrix(target).inverted()
+        matrices = [target_inverse @ object_world_matrix(obj) for obj in colliders]
+
+        # Shared mesh data (see shared_data_key()) is still used by others.
+        mesh = target.data if target.data.users == 1 else None
+        target.data = mesh_join([obj.data for obj in colliders], matrices, mesh=mesh, name=target.data.name)
+
+        self.remove_objects([obj for obj in colliders if obj != target])
+        return target
+
+    def join_primitives(self, context):
+        new_collider = self.join_colliders(self.new_colliders_list)
+        self.new_colliders_list = [new_collider] if new_collider else []
         return new_collider
 
     def __init__(self, *args, **kwargs):
@@ -2109,6 +2297,7 @@ class OBJECT_OT_add_bounding_object():
 
         # modal settings
         self.use_decimation = False
+        self.use_hull_simplification = False
         self.use_geo_nodes_hull = False
         self.use_cylinder_segments = False
         self.use_modifier_stack = False
@@ -2129,6 +2318,10 @@ class OBJECT_OT_add_bounding_object():
         self.use_width_multiplier = False
         self.use_diagonal_fill = False
 
+        # The shape only depends on the convex hull of the input vertices, so
+        # get_used_vertex_array() may drop every vertex inside it.
+        self.use_point_prefilter = False
+
         self.remesh_data = []
 
         # default shape init
@@ -2137,6 +2330,11 @@ class OBJECT_OT_add_bounding_object():
         # UI/UX
         self.ignore_input = False
 
+        # execute() without invoke(), e.g. bpy.ops.mesh.add_bounding_box('EXEC_DEFAULT') from
+        # generate_colliders(): the colliders are generated with the exact fit and confirmed right away, without
+        # touching the viewport. invoke() clears it.
+        self.headless = True
+
         self.use_recenter_origin = False
         self.debug_parenting_off = False
         self.use_custom_rotation = False
@@ -2319,31 +2517,31 @@ class OBJECT_OT_add_bounding_object():
             segment_count = max(3, int(round(value)))
             if segment_count != int(round(self.current_settings_dic['cylinder_segments'])):
                 self.current_settings_dic['cylinder_segments'] = segment_count
-                self.execute(context)
+                self.rebuild_colliders(context)
 
         elif field == 'height_active':
             height_mult = numpy.clip(value, 0, 10.0)
             if self.current_settings_dic['height_mult'] != height_mult:
                 self.current_settings_dic['height_mult'] = height_mult
-                self.execute(context)
+                self.rebuild_colliders(context)
 
         elif field == 'width_active':
             width_mult = numpy.clip(value, 0, 10.0)
             if self.current_settings_dic['width_mult'] != width_mult:
                 self.current_settings_dic['width_mult'] = width_mult
-                self.execute(context)
+                self.rebuild_colliders(context)
 
         elif field == 'sphere_segments_active':
             segments = max(2, int(round(value)))
             if segments != int(round(self.current_settings_dic['sphere_segments'])):
                 self.current_settings_dic['sphere_segments'] = segments
-                self.execute(context)
+                self.rebuild_colliders(context)
 
         elif field == 'capsule_segments_active':
             segments = max(2, int(round(value)))
             if segments != int(round(self.current_settings_dic['capsule_segments'])):
                 self.current_settings_dic['capsule_segments'] = segments
-                self.execute(context)
+                self.rebuild_colliders(context)
 
         elif field == 'remesh_active':
             # Full re-execute (rather than mirroring the MOUSEMOVE handler's
@@ -2395,30 +2593,90 @@ class OBJECT_OT_add_bounding_object():
         self.force_redraw()
 
     def invoke(self, context, event):
-        colSettings = context.scene.simple_collider
-
-        self.collider_groups = [colSettings.visibility_toggle_user_group_01,
-                                colSettings.visibility_toggle_user_group_02,
-                                colSettings.visibility_toggle_user_group_03]
-
         if context.space_data.type != 'VIEW_3D':
             self.report({'WARNING'}, "Active space must be a View3d")
             return {'CANCELLED'}
 
-        # get collision suffix from preferences
-        self.prefs = context.preferences.addons[base_package].preferences
+        self.headless = False
 
         # Active object
         if context.object is None:
             context.view_layer.objects.active = context.selected_objects[0]
         context.object.select_set(True)
 
+        self.init_generation_settings(context)
+
+        colSettings = context.scene.simple_collider
+
         # INITIAL STATE
         self.navigation = False
         self.navigation_hold_until = 0.0  # grace window keeping navigation coloring on after the view last changed
         self.navigation_timer_scheduled = False
         self.navigation_area = context.area
         self.navigation_view_snapshot = None  # (view_matrix, view_distance) as of the last draw call
+
+        # Mouse
+        self.mouse_initial_x = event.mouse_x
+        self.mouse_position = [event.mouse_x, event.mouse_y]
+
+        # Modal Settings
+        self.x_ray = context.space_data.shading.show_xray
+
+        # Display settings
+        self.color_type = context.space_data.shading.color_type
+        self.original_color_type = context.space_data.shading.color_type
+        self.original_shading_type = context.space_data.shading.type
+        # Set up scene
+        if context.space_data.shading.type == 'SOLID':
+            context.space_data.shading.color_type = colSettings.default_color_type
+
+        self.color_type = colSettings.default_color_type
+        self.shading_idx = 0
+        self.shading_modes = ['OBJECT', 'MATERIAL', 'SINGLE']
+
+        # display settings
+        self.is_solidmode = True if context.space_data.shading.type == 'SOLID' else False
+
+        # the arguments we pass to the callback
+        args = (self, context)
+        # Add the region OpenGL drawing callback
+        # draw in view space with 'POST_VIEW' and 'PRE_VIEW'
+        # self._handle = bpy.types.SpaceView3D.draw_handler_add(draw_viewport_overlay, args, 'WINDOW', 'POST_PIXEL')
+        self._handle = bpy.types.SpaceView3D.draw_handler_add(draw_viewport_overlay, args, 'WINDOW', 'POST_PIXEL')
+        _register_draw_handle(self._handle)
+
+        # add modal handler
+        context.window_manager.modal_handler_add(self)
+
+        # stored for decimate display
+        self.mouse_path = []
+
+        try:
+            self.execute(context)
+        except Exception as ex:
+            # If the initial generation fails, the draw handler and modal
+            # handler added above would otherwise outlive this operator
+            # instance. The viewport overlay callback keeps a reference to
+            # `self`, so once Blender frees this operator's RNA struct the
+            # next redraw raises a ReferenceError from draw_viewport_overlay.
+            self.cancel_cleanup(context)
+            self.report({'ERROR'}, f"Failed to generate collider: {ex}")
+            return {'CANCELLED'}
+
+        return {'RUNNING_MODAL'}
+
+    def init_generation_settings(self, context):
+        """Initial state of everything execute() reads, from the scene settings and add-on preferences. invoke()
+        sets up the viewport on top of this."""
+        colSettings = context.scene.simple_collider
+
+        self.collider_groups = [colSettings.visibility_toggle_user_group_01,
+                                colSettings.visibility_toggle_user_group_02,
+                                colSettings.visibility_toggle_user_group_03]
+
+        # get collision suffix from preferences
+        self.prefs = context.preferences.addons[base_package].preferences
+
         self.selected_objects = context.selected_objects.copy()
         self.active_obj = context.view_layer.objects.active
         self.obj_mode = context.object.mode
@@ -2431,15 +2689,14 @@ class OBJECT_OT_add_bounding_object():
 
         # General init settings
         self.new_colliders_list = []
+        # (collider, fit) pairs of shapes that can rebuild their colliders from the fit, see rebuild_colliders().
+        self.fit_cache = []
         self.tmp_meshes = []
         self.col_rotation_matrix_list = []
         self.col_center_loc_list = []
 
         self.name_count = 0
 
-        # Mouse
-        self.mouse_initial_x = event.mouse_x
-        self.mouse_position = [event.mouse_x, event.mouse_y]
         self.my_space = colSettings.default_space
 
         # Decimate face count display
@@ -2449,7 +2706,6 @@ class OBJECT_OT_add_bounding_object():
 
         # Modal Settings
         self.my_use_modifier_stack = colSettings.default_modifier_stack
-        self.x_ray = context.space_data.shading.show_xray
 
         # Modal Bools
         self.join_primitives = colSettings.default_join_primitives
@@ -2497,18 +2753,6 @@ class OBJECT_OT_add_bounding_object():
         self.numeric_input_str = ''
         self.numeric_input_field = None
 
-        # Display settings
-        self.color_type = context.space_data.shading.color_type
-        self.original_color_type = context.space_data.shading.color_type
-        self.original_shading_type = context.space_data.shading.type
-        # Set up scene
-        if context.space_data.shading.type == 'SOLID':
-            context.space_data.shading.color_type = colSettings.default_color_type
-
-        self.color_type = colSettings.default_color_type
-        self.shading_idx = 0
-        self.shading_modes = ['OBJECT', 'MATERIAL', 'SINGLE']
-
         self.creation_mode = ['INDIVIDUAL', 'SELECTION']
 
         self.creation_mode_edit = ['INDIVIDUAL', 'SELECTION']
@@ -2526,9 +2770,6 @@ class OBJECT_OT_add_bounding_object():
         # Object to Collider
         self.original_obj_data = []
 
-        # display settings
-        self.is_solidmode = True if context.space_data.shading.type == 'SOLID' else False
-
         default_alpha = 0.5
         default_decimate = 1.0
         default_offset = 0
@@ -2542,37 +2783,134 @@ class OBJECT_OT_add_bounding_object():
         self.current_settings_dic = dict.copy()
         self.ref_settings_dic = dict.copy()
 
-        # the arguments we pass to the callback
-        args = (self, context)
-        # Add the region OpenGL drawing callback
-        # draw in view space with 'POST_VIEW' and 'PRE_VIEW'
-        # self._handle = bpy.types.SpaceView3D.draw_handler_add(draw_viewport_overlay, args, 'WINDOW', 'POST_PIXEL')
-        self._handle = bpy.types.SpaceView3D.draw_handler_add(draw_viewport_overlay, args, 'WINDOW', 'POST_PIXEL')
-        _register_draw_handle(self._handle)
+    def confirm_colliders(self, context):
+        """Finish the generated colliders when the operator is confirmed: origin, rotation, display settings and the
+        optional cleanup passes. Removes the temporary meshes."""
+        colSettings = context.scene.simple_collider
 
-        # add modal handler
-        context.window_manager.modal_handler_add(self)
+        # Pass 1: origin recentre, custom rotation, modifier cleanup, display
+        # settings.  No depsgraph update needed between iterations because
+        # each collider is independent of the others.
+        #
+        # Fetch the evaluated depsgraph once before the loop.
+        # set_origin_to_center_of_mass() calls evaluated_depsgraph_get()
+        # internally; after each obj.location = com the depsgraph is
+        # dirtied, causing the next per-call get to force a full scene
+        # re-evaluation — O(N²) for N colliders.  Passing the same
+        # depsgraph to every call keeps each object's evaluated data
+        # correct (it was unmodified when the depsgraph was fetched) while
+        # eliminating the hidden per-iteration re-evaluation.
+        _depsgraph = (
+            bpy.context.evaluated_depsgraph_get()
+            if self.use_recenter_origin and not self.join_primitives
+            else None
+        )
+        # Mesh data shared by colliders of linked duplicates is only moved once.
+        recentered_meshes = {}
+        for i, obj in enumerate(self.new_colliders_list):
+            if not obj:
+                continue
 
-        # stored for decimate display
-        self.mouse_path = []
+            if not self.join_primitives:
+                if self.use_recenter_origin:
+                    # set origin causes issues. Does not work properly
+                    recentered_meshes[obj.data] = set_origin_to_center_of_mass(
+                        obj, _depsgraph, offset=recentered_meshes.get(obj.data))
+                    # center = self.calculate_center_of_mass(obj)
+                    # if not self.debug_parenting_off:
+                    #     self.set_custom_origin_location(obj, center)
+
+                if self.use_custom_rotation:
+                    if len(self.col_rotation_matrix_list) > 0:
+                        self.set_custom_rotation(obj, self.col_rotation_matrix_list[i])
+
+            # remove modifiers if they have the default value
+            if not self.prefs.keep_modifier_defaults:
+                if self.current_settings_dic['displace_offset'] == 0.0:
+                    self.del_displace_modifier(obj)
+                if self.current_settings_dic['decimate'] == 1.0:
+                    self.del_decimate_modifier(obj)
+
+            # set the display settings for the collider objects
+            obj.display_type = colSettings.display_type
+            if self.prefs.hide_render_on_creation:
+                obj.hide_render = True
+
+            if self.prefs.my_hide:
+                obj.hide_viewport = self.prefs.my_hide
+
+            if self.prefs.wireframe_mode == 'ALWAYS':
+                obj.show_wire = True
+            else:
+                obj.show_wire = False
 
-        try:
-            self.execute(context)
-        except Exception as ex:
-            # If the initial generation fails, the draw handler and modal
-            # handler added above would otherwise outlive this operator
-            # instance. The viewport overlay callback keeps a reference to
-            # `self`, so once Blender frees this operator's RNA struct the
-            # next redraw raises a ReferenceError from draw_viewport_overlay.
-            self.cancel_cleanup(context)
-            self.report({'ERROR'}, f"Failed to generate collider: {ex}")
-            return {'CANCELLED'}
+        # Pass 2: fix parent inverse matrix.  A single depsgraph update
+        # before the loop propagates the location changes from Pass 1 so
+        # that fix_inverse_matrix() reads correct matrix_world values.
+        # Skipping the per-object update inside fix_inverse_matrix() (via
+        # update_depsgraph=False) reduces 2N depsgraph evaluations to 2.
+        if self.prefs.fix_parent_inverse_mtrx:
+            from ..collider_operators.utility_operators import fix_inverse_matrix, fix_inverse_matrix_is_safe
+            bpy.context.view_layer.update()
+            skipped_names = []
+            for obj in self.new_colliders_list:
+                if not obj or not obj.parent:
+                    continue
+                if not fix_inverse_matrix_is_safe(obj):
+                    print(f"Skipping {obj.name}: parent-relative transform contains shear that "
+                          f"can't be baked without distorting the mesh.")
+                    skipped_names.append(obj.name)
+                    continue
+                # fix_inverse_matrix() re-expresses the parent-relative transform on
+                # obj.location/rotation_euler/scale rather than baking it into the mesh, so
+                # it's safe to run even when use_custom_rotation set a custom rotation above:
+                # that rotation is preserved, just relative to a now-uncancelled parent.
+                fix_inverse_matrix(obj, update_depsgraph=False)
+            bpy.context.view_layer.update()
+            if skipped_names:
+                self.report(
+                    {'WARNING'},
+                    f"Skipped {len(skipped_names)} collider(s) whose parent-relative transform "
+                    f"contains shear and can't be reset safely: {', '.join(skipped_names)}.",
+                )
+
+        # Pass 3: optional auto-apply Collider Cleanup operations, each
+        # opt-in via its own preference (both default off). Runs after the
+        # parent-inverse fix so it sees the final, cleaned-up transforms.
+        if self.prefs.auto_apply_origin_to_parent or self.prefs.auto_apply_tris_limit:
+            from ..collider_operators.utility_operators import move_origin_to_parent, set_triangle_count_limit
+
+            if self.prefs.auto_apply_origin_to_parent:
+                for obj in self.new_colliders_list:
+                    if obj:
+                        # The offset is baked into the mesh, which differs per collider.
+                        if obj.data.users > 1:
+                            obj.data = obj.data.copy()
+                        move_origin_to_parent(obj)
+                bpy.context.view_layer.update()
 
-        return {'RUNNING_MODAL'}
+            if self.prefs.auto_apply_tris_limit:
+                _tris_depsgraph = bpy.context.evaluated_depsgraph_get()
+                unreachable_names = []
+                for obj in self.new_colliders_list:
+                    if not obj:
+                        continue
+                    if not set_triangle_count_limit(obj, self.prefs.auto_apply_max_triangle_count,
+                                                    depsgraph=_tris_depsgraph):
+                        unreachable_names.append(obj.name)
+                if unreachable_names:
+                    self.report(
+                        {'WARNING'},
+                        f"Auto tris-limit: cannot reach {self.prefs.auto_apply_max_triangle_count} tris "
+                        f"even at maximum decimation for: {', '.join(unreachable_names)}.",
+                    )
 
-    def modal(self, context, event):
-        colSettings = context.scene.simple_collider
+        # Delete temporary generated meshes
+        self.remove_objects(self.tmp_meshes)
+        self.remove_empty_collection(context, 'tmp_mesh')
+        self._clear_modifier_bake_cache()
 
+    def modal(self, context, event):
         # Ignore if Alt is pressed
         if event.alt:
             self.ignore_input = True
@@ -2635,121 +2973,7 @@ class OBJECT_OT_add_bounding_object():
             if len(self.new_colliders_list) == 0:
                 self.report({'WARNING'}, "No Colliders generated")
 
-            # Pass 1: origin recentre, custom rotation, modifier cleanup, display
-            # settings.  No depsgraph update needed between iterations because
-            # each collider is independent of the others.
-            #
-            # Fetch the evaluated depsgraph once before the loop.
-            # set_origin_to_center_of_mass() calls evaluated_depsgraph_get()
-            # internally; after each obj.location = com the depsgraph is
-            # dirtied, causing the next per-call get to force a full scene
-            # re-evaluation — O(N²) for N colliders.  Passing the same
-            # depsgraph to every call keeps each object's evaluated data
-            # correct (it was unmodified when the depsgraph was fetched) while
-            # eliminating the hidden per-iteration re-evaluation.
-            _depsgraph = (
-                bpy.context.evaluated_depsgraph_get()
-                if self.use_recenter_origin and not self.join_primitives
-                else None
-            )
-            for i, obj in enumerate(self.new_colliders_list):
-                if not obj:
-                    continue
-
-                if not self.join_primitives:
-                    if self.use_recenter_origin:
-                        # set origin causes issues. Does not work properly
-                        set_origin_to_center_of_mass(obj, _depsgraph)
-                        # center = self.calculate_center_of_mass(obj)
-                        # if not self.debug_parenting_off:
-                        #     self.set_custom_origin_location(obj, center)
-
-                    if self.use_custom_rotation:
-                        if len(self.col_rotation_matrix_list) > 0:
-                            self.set_custom_rotation(obj, self.col_rotation_matrix_list[i])
-
-                # remove modifiers if they have the default value
-                if not self.prefs.keep_modifier_defaults:
-                    if self.current_settings_dic['displace_offset'] == 0.0:
-                        self.del_displace_modifier(obj)
-                    if self.current_settings_dic['decimate'] == 1.0:
-                        self.del_decimate_modifier(obj)
-
-                # set the display settings for the collider objects
-                obj.display_type = colSettings.display_type
-                if self.prefs.hide_render_on_creation:
-                    obj.hide_render = True
-
-                if self.prefs.my_hide:
-                    obj.hide_viewport = self.prefs.my_hide
-
-                if self.prefs.wireframe_mode == 'ALWAYS':
-                    obj.show_wire = True
-                else:
-                    obj.show_wire = False
-
-            # Pass 2: fix parent inverse matrix.  A single depsgraph update
-            # before the loop propagates the location changes from Pass 1 so
-            # that fix_inverse_matrix() reads correct matrix_world values.
-            # Skipping the per-object update inside fix_inverse_matrix() (via
-            # update_depsgraph=False) reduces 2N depsgraph evaluations to 2.
-            if self.prefs.fix_parent_inverse_mtrx:
-                from ..collider_operators.utility_operators import fix_inverse_matrix, fix_inverse_matrix_is_safe
-                bpy.context.view_layer.update()
-                skipped_names = []
-                for obj in self.new_colliders_list:
-                    if not obj or not obj.parent:
-                        continue
-                    if not fix_inverse_matrix_is_safe(obj):
-                        print(f"Skipping {obj.name}: parent-relative transform contains shear that "
-                              f"can't be baked without distorting the mesh.")
-                        skipped_names.append(obj.name)
-                        continue
-                    # fix_inverse_matrix() re-expresses the parent-relative transform on
-                    # obj.location/rotation_euler/scale rather than baking it into the mesh, so
-                    # it's safe to run even when use_custom_rotation set a custom rotation above:
-                    # that rotation is preserved, just relative to a now-uncancelled parent.
-                    fix_inverse_matrix(obj, update_depsgraph=False)
-                bpy.context.view_layer.update()
-                if skipped_names:
-                    self.report(
-                        {'WARNING'},
-                        f"Skipped {len(skipped_names)} collider(s) whose parent-relative transform "
-                        f"contains shear and can't be reset safely: {', '.join(skipped_names)}.",
-                    )
-
-            # Pass 3: optional auto-apply Collider Cleanup operations, each
-            # opt-in via its own preference (both default off). Runs after the
-            # parent-inverse fix so it sees the final, cleaned-up transforms.
-            if self.prefs.auto_apply_origin_to_parent or self.prefs.auto_apply_tris_limit:
-                from ..collider_operators.utility_operators import move_origin_to_parent, set_triangle_count_limit
-
-                if self.prefs.auto_apply_origin_to_parent:
-                    for obj in self.new_colliders_list:
-                        if obj:
-                            move_origin_to_parent(obj)
-                    bpy.context.view_layer.update()
-
-                if self.prefs.auto_apply_tris_limit:
-                    _tris_depsgraph = bpy.context.evaluated_depsgraph_get()
-                    unreachable_names = []
-                    for obj in self.new_colliders_list:
-                        if not obj:
-                            continue
-                        if not set_triangle_count_limit(obj, self.prefs.auto_apply_max_triangle_count,
-                                                         depsgraph=_tris_depsgraph):
-                            unreachable_names.append(obj.name)
-                    if unreachable_names:
-                        self.report(
-                            {'WARNING'},
-                            f"Auto tris-limit: cannot reach {self.prefs.auto_apply_max_triangle_count} tris "
-                            f"even at maximum decimation for: {', '.join(unreachable_names)}.",
-                        )
-
-            # Delete temporary generated meshes
-            self.remove_objects(self.tmp_meshes)
-            self.remove_empty_collection(context, 'tmp_mesh')
-            self._clear_modifier_bake_cache()
+            self.confirm_colliders(context)
 
             _remove_draw_handle(self._handle)
 
@@ -2952,7 +3176,7 @@ class OBJECT_OT_add_bounding_object():
                 if segment_count != int(round(self.current_settings_dic['cylinder_segments'])):
                     segment_count = 3 if segment_count < 3 else segment_count
                     self.current_settings_dic['cylinder_segments'] = segment_count
-                    self.execute(context)
+                    self.rebuild_colliders(context)
 
             if self.height_active:
                 # delta = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
@@ -2963,7 +3187,7 @@ class OBJECT_OT_add_bounding_object():
 
                 if self.current_settings_dic['height_mult'] != height_mult:
                     self.current_settings_dic['height_mult'] = height_mult
-                    self.execute(context)
+                    self.rebuild_colliders(context)
 
             if self.width_active:
                 offset = self.get_delta_value(delta, event, sensibility=0.002, tweak_amount=10, round_precision=1)
@@ -2973,7 +3197,7 @@ class OBJECT_OT_add_bounding_object():
 
                 if self.current_settings_dic['width_mult'] != width_mult:
                     self.current_settings_dic['width_mult'] = width_mult
-                    self.execute(context)
+                    self.rebuild_colliders(context)
 
             if self.sphere_segments_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.02, tweak_amount=10)
@@ -2983,7 +3207,7 @@ class OBJECT_OT_add_bounding_object():
                 if segments != int(round(self.current_settings_dic['sphere_segments'])):
                     segments = 2 if segments < 2 else segments
                     self.current_settings_dic['sphere_segments'] = segments
-                    self.execute(context)
+                    self.rebuild_colliders(context)
 
             if self.capsule_segments_active:
                 delta = self.get_delta_value(delta, event, sensibility=0.02, tweak_amount=10)
@@ -2992,7 +3216,7 @@ class OBJECT_OT_add_bounding_object():
                 # check if value changed to avoid regenerating collisions for the same value
                 if segments != int(round(self.current_settings_dic['capsule_segments'])):
                     self.current_settings_dic['capsule_segments'] = segments
-                    self.execute(context)
+                    self.rebuild_colliders(context)
 
         # passthrough specific events to blenders default behavior
         elif event.type in {'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
@@ -3001,6 +3225,9 @@ class OBJECT_OT_add_bounding_object():
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
+        if self.headless:
+            self.init_generation_settings(context)
+
         # get current time to calculate time elapsed
         self.t0 = time.time()
         # reset naming count:
@@ -3024,6 +3251,7 @@ class OBJECT_OT_add_bounding_object():
         self.remove_objects(self.new_colliders_list)
         self.remove_empty_collection(context, 'tmp_mesh')
         self.new_colliders_list = []
+        self.fit_cache = []
         self.original_obj_data = []
         self.tmp_meshes = []
 
@@ -1,151 +1,41 @@
-import random
-
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 from mathutils import Vector
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
+from ..bmesh_operations.bounding_sphere import minimum_enclosing_sphere
+from ..bmesh_operations.primitive_templates import primitive_template, write_primitive_mesh
+from ..bmesh_operations.vertex_arrays import as_coordinate_array, transform_coordinates
 
 tmp_sphere_name = 'sphere_collider'
 
 
-def _sphere_from_one(p):
-    return p.copy(), 0.0
-
-
-def _sphere_from_two(p1, p2):
-    center = (p1 + p2) / 2
-    radius = (p1 - p2).length / 2
-    return center, radius
-
-
-def _sphere_from_three(p1, p2, p3):
-    a = p2 - p1
-    b = p3 - p1
-    cross = a.cross(b)
-    denom = 2.0 * cross.length_squared
-    if denom < 1e-12:
-        # Degenerate: points are collinear, fall back to the pair with the largest distance
-        d12 = (p1 - p2).length
-        d13 = (p1 - p3).length
-        d23 = (p2 - p3).length
-        if d12 >= d13 and d12 >= d23:
-            return _sphere_from_two(p1, p2)
-        if d13 >= d23:
-            return _sphere_from_two(p1, p3)
-        return _sphere_from_two(p2, p3)
-    t = (b.length_squared * cross.cross(a) + a.length_squared * b.cross(cross)) / denom
-    center = p1 + t
-    radius = t.length
-    return center, radius
-
-
-def _sphere_from_four(p1, p2, p3, p4):
-    a = p2 - p1
-    b = p3 - p1
-    c = p4 - p1
-    denom = 2.0 * a.dot(b.cross(c))
-    if abs(denom) < 1e-12:
-        # Degenerate: points are coplanar, try all triangles and pick the largest sphere
-        candidates = [
-            _sphere_from_three(p1, p2, p3),
-            _sphere_from_three(p1, p2, p4),
-            _sphere_from_three(p1, p3, p4),
-            _sphere_from_three(p2, p3, p4),
-        ]
-        return max(candidates, key=lambda cr: cr[1])
-    t = (c.length_squared * a.cross(b) + b.length_squared * c.cross(a) + a.length_squared * b.cross(c)) / denom
-    center = p1 + t
-    radius = t.length
-    return center, radius
-
-
-def _base_sphere(boundary):
-    """Return (center, radius) for a sphere defined by up to 4 boundary points."""
-    n = len(boundary)
-    if n == 0:
-        return Vector((0, 0, 0)), 0.0
-    if n == 1:
-        return _sphere_from_one(boundary[0])
-    if n == 2:
-        return _sphere_from_two(boundary[0], boundary[1])
-    if n == 3:
-        return _sphere_from_three(boundary[0], boundary[1], boundary[2])
-    return _sphere_from_four(boundary[0], boundary[1], boundary[2], boundary[3])
-
-
-def _welzl(points):
-    """
-    Compute the minimum enclosing sphere using Welzl's algorithm. Shuffles points in place.
-
-    Uses an iterative formulation so that arbitrarily large point sets
-    can be handled without hitting Python's recursion limit.
-
-    See https://en.wikipedia.org/wiki/Smallest-circle_problem#Welzl's_algorithm
-    """
-    random.shuffle(points)
-    n = len(points)
-    stack = []  # (index, boundary) frames awaiting their "is p inside?" check
-    idx = 0
-    bnd = []  # points known to lie on the minimum enclosing sphere (up to 4)
-
-    while True:
-        # --- forward pass: advance to the base case ---
-        if len(bnd) < 4:
-            while idx < n:
-                stack.append((idx, bnd))
-                idx += 1
-
-        # Reached base case — compute sphere from boundary points.
-        center, radius = _base_sphere(bnd)
-
-        # --- backward pass: unwind the stack, checking each point ---
-        while stack:
-            idx, bnd = stack.pop()
-            p = points[idx]
-            if (p - center).length > radius + 1e-7:
-                # p is outside; restart forward pass from idx+1 with p on the boundary.
-                bnd = bnd + [p]
-                idx += 1
-                break
-        else:
-            # Stack fully unwound — sphere encloses all points.
-            return center, radius
-
-
-def create_sphere(pos, diameter, segments):
-    """Create a UV sphere at the given position with the specified diameter and segments."""
-    global tmp_sphere_name
+def build_sphere_mesh(mesh, diameter, segments):
+    """Write a UV sphere with the specified diameter and segments around the origin into mesh, replacing its
+    geometry. The unit sphere is tessellated once per segment count, see primitive_template()."""
+    write_primitive_mesh(mesh, primitive_template('sphere', max(2, segments)), (diameter, diameter, diameter))
+
 
-    # v_segments below 2 crashes Blender's create_uvsphere with a divide by zero.
-    segments = max(2, segments)
+def create_sphere(pos, diameter, segments, mesh=None):
+    """Create a UV sphere at the given position with the specified diameter and segments. An already built sphere
+    mesh, e.g. of a linked duplicate, is used as is."""
+    global tmp_sphere_name
 
     # Create an empty mesh and the object.
-    mesh = bpy.data.meshes.new(tmp_sphere_name)
+    shared_mesh = mesh is not None
+    if not shared_mesh:
+        mesh = bpy.data.meshes.new(tmp_sphere_name)
     basic_sphere = bpy.data.objects.new(tmp_sphere_name, mesh)
 
     # Add the object into the scene.
     bpy.context.collection.objects.link(basic_sphere)
 
-    # Select the newly created object
-    bpy.context.view_layer.objects.active = basic_sphere
-    basic_sphere.select_set(True)
     basic_sphere.location = pos
 
-    # Construct the bmesh sphere and assign it to the blender mesh.
-    bm = bmesh.new()
-    if bpy.app.version >= (3, 0, 0):
-        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, radius=diameter)
-    else:
-        bmesh.ops.create_uvsphere(bm, u_segments=segments * 2, v_segments=segments, diameter=diameter)
-
-    for f in bm.faces:
-        f.smooth = True
-
-    bm.to_mesh(mesh)
-    mesh.update()
-    bm.clear()
+    if not shared_mesh:
+        # Construct the bmesh sphere and assign it to the blender mesh.
+        build_sphere_mesh(mesh, diameter, segments)
 
     return basic_sphere
 
@@ -158,12 +48,28 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
 
     @staticmethod
     def calculate_bounding_sphere(obj, used_vertices):
-        world_points = [obj.matrix_world @ vertex.co for vertex in used_vertices]
-        return _welzl(world_points)
+        """World space (center, radius) of the minimum sphere enclosing used_vertices. used_vertices are in obj's
+        local space, either as an (N, 3) array or a vertex collection such as mesh.vertices."""
+        world_points = transform_coordinates(as_coordinate_array(used_vertices), obj.matrix_world)
+        center, radius = minimum_enclosing_sphere(world_points)
+        return Vector(center), radius
+
+    def shared_sphere_key(self, obj, base_ob):
+        """shared_data_key() of base_ob and its scale. The sphere is fitted in world space, so only linked
+        duplicates with the same uniform scale, which maps the fit of one onto the others, share it."""
+        shared_key = self.shared_data_key(base_ob)
+        if shared_key is None:
+            return None
+        scale = tuple(obj.matrix_world.to_scale())
+        magnitudes = [abs(c) for c in scale]
+        if max(magnitudes) - min(magnitudes) > 1e-6 * max(magnitudes):
+            return None
+        return shared_key + (scale,)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.use_sphere_segments = True
         self.shape = "sphere_shape"
         self.initial_shape = "sphere_shape"
@@ -207,57 +113,80 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
 
         collider_data = []
         verts_co = []
+        # Linked duplicates are fitted once, see shared_sphere_key()
+        shared_fits = {}
 
-        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True)
+        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=True, use_island_records=True)
 
         for base_ob, obj in objs:
             initial_mod_state = {}
-            context.view_layer.objects.active = obj
+            if not self.use_loose_mesh:
+                context.view_layer.objects.active = obj
             scene = context.scene
 
-            if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-                used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-
-            else:  # self.obj_mode  == "OBJECT" or self.use_loose_mesh == True:
-                used_vertices = self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-
-            if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
-                continue
-
             bounding_sphere_data = {}
 
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
                 self.creation_mode_edit[self.creation_mode_idx]
 
+            shared_key = None
+            if creation_mode in ['INDIVIDUAL']:
+                shared_key = self.shared_sphere_key(obj, base_ob)
+                if shared_key in shared_fits:
+                    local_mid_point, radius = shared_fits[shared_key]
+                    bounding_sphere_data['mid_point'] = obj.matrix_world @ local_mid_point
+                    bounding_sphere_data['radius'] = radius
+                    bounding_sphere_data['parent'] = base_ob
+                    bounding_sphere_data['shared_key'] = shared_key
+                    collider_data.append(bounding_sphere_data)
+                    continue
+
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
+
+            if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
+                continue
+
             if creation_mode in ['INDIVIDUAL'] or self.use_loose_mesh:
 
-                bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(obj,
-                                                                                                                   used_vertices)
+                bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(
+                    obj, used_vertices)
                 bounding_sphere_data['parent'] = base_ob
+                if shared_key is not None:
+                    shared_fits[shared_key] = (obj.matrix_world.inverted() @ bounding_sphere_data['mid_point'],
+                                               bounding_sphere_data['radius'])
+                    bounding_sphere_data['shared_key'] = shared_key
                 collider_data.append(bounding_sphere_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
+                # get array of all vertex coordinates in global space
+                verts_co.append(self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices))
 
-                collider_data = self.bounding_sphere_data_selection(verts_co)
+        if verts_co:
+            collider_data = self.bounding_sphere_data_selection(np.concatenate(verts_co))
 
+        shared_meshes = {}
+        parents = []
         for bounding_sphere_data in collider_data:
             mid_point = bounding_sphere_data['mid_point']
             radius = bounding_sphere_data['radius']
             parent = bounding_sphere_data['parent']
+            shared_key = bounding_sphere_data.get('shared_key')
 
-            new_collider = create_sphere(mid_point, radius, self.current_settings_dic['sphere_segments'])
+            new_collider = create_sphere(mid_point, radius, self.current_settings_dic['sphere_segments'],
+                                         mesh=shared_meshes.get(shared_key))
+            if shared_key is not None:
+                shared_meshes[shared_key] = new_collider.data
             self.custom_set_parent(context, parent, new_collider)
 
             # save collision objects to delete when canceling the operation
             self.new_colliders_list.append(new_collider)
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            self.fit_cache.append((new_collider, bounding_sphere_data))
+            parents.append(parent)
 
             super().set_collider_name(new_collider, parent.name)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -268,21 +197,17 @@ class OBJECT_OT_add_bounding_sphere(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time("Sphere Collider", elapsed_time)
         self.report({'INFO'}, f"Sphere Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
+
+    def build_collider_mesh(self, mesh, fit):
+        build_sphere_mesh(mesh, fit['radius'], self.current_settings_dic['sphere_segments'])
 
     def bounding_sphere_data_selection(self, verts_co):
         bounding_sphere_data = {}
 
-        verts_co = self.transform_vertex_space(verts_co, self.active_obj)
-
-        bm = bmesh.new()
-        for v in verts_co:
-            bm.verts.new(v)  # add a new vert
-        me = bpy.data.meshes.new("mesh")
-        bm.to_mesh(me)
-        bm.free()
-
-        bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = self.calculate_bounding_sphere(
-            self.active_obj, me.vertices)
+        # verts_co is already in world space, so it can be fitted directly
+        # rather than being round-tripped through the active object's space.
+        center, radius = minimum_enclosing_sphere(verts_co)
+        bounding_sphere_data['mid_point'], bounding_sphere_data['radius'] = Vector(center), radius
         bounding_sphere_data['parent'] = self.active_obj
         return [bounding_sphere_data]
@@ -97,6 +97,7 @@ class OBJECT_OT_add_remesh_collision(OBJECT_OT_add_bounding_object, Operator):
         bpy.ops.object.mode_set(mode='OBJECT')
 
         # Create new collider objects
+        parents = []
         for mesh_collider_data in collider_data:
             parent = mesh_collider_data['parent']
             new_collider = mesh_collider_data['new_collider']
@@ -113,23 +114,15 @@ class OBJECT_OT_add_remesh_collision(OBJECT_OT_add_bounding_object, Operator):
             super().set_collider_name(new_collider, parent.name)
 
             # save collision objects to delete when canceling the operation
-            collections = parent.users_collection
-
-            self.primitive_postprocessing(context, new_collider, collections)
             self.new_colliders_list.append(new_collider)
+            parents.append(parent)
+
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
 
         # Merge all collider objects
         if self.creation_mode[self.creation_mode_idx] == 'SELECTION' and not self.use_loose_mesh:
-            bpy.ops.object.select_all(action='DESELECT')
-            last_selected = None
-
-            for obj in self.new_colliders_list:
-                if obj:
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    last_selected = obj
-
-            bpy.ops.object.join()
+            colliders = [obj for obj in self.new_colliders_list if obj]
+            last_selected = self.join_colliders(colliders, target=colliders[-1]) if colliders else None
 
             self.new_colliders_list = [last_selected] if last_selected else []
 
@@ -143,4 +136,4 @@ class OBJECT_OT_add_remesh_collision(OBJECT_OT_add_bounding_object, Operator):
         super().print_generation_time("Mesh Collider", elapsed_time)
         self.report({'INFO'}, f"Mesh Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
@@ -1,12 +1,12 @@
-import math
-
-import bmesh
 import bpy
 import numpy as np
 from bpy.types import Operator
 from mathutils import Matrix, Vector
 
 from .add_bounding_primitive import OBJECT_OT_add_bounding_object
+from .utilities import get_rot_matrix, get_sca_matrix
+from ..bmesh_operations.oriented_box import convex_hull_arrays, minimum_oriented_box
+from ..bmesh_operations.vertex_arrays import transform_coordinates
 
 CUBE_FACE_INDICES = (
     (0, 1, 3, 2),
@@ -31,67 +31,18 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
                 for z in range(-1, 2, 2):
                     yield x, y, z
 
-    @staticmethod
-    def rotating_calipers(hull_points: np.ndarray, bases):
-        min_bb_basis = None
-        min_bb_min = None
-        min_bb_max = None
-        min_vol = math.inf
-
-        for basis in bases:
-            rot_points = hull_points.dot(np.linalg.inv(basis))
-            # Equivalent to: rot_points = hull_points.dot(np.linalg.inv(np.transpose(basis)).T)
-
-            bb_min = rot_points.min(axis=0)
-            bb_max = rot_points.max(axis=0)
-            volume = (bb_max - bb_min).prod()
-            if volume < min_vol:
-                min_bb_basis = basis
-                min_vol = volume
-
-                min_bb_min = bb_min
-                min_bb_max = bb_max
-
-        return np.array(min_bb_basis), min_bb_max, min_bb_min
-
     @classmethod
-    def obj_rotating_calipers(cls, obj):
-
-        bm = bmesh.new()
-        dg = bpy.context.evaluated_depsgraph_get()
-        bm.from_object(obj, dg)
-        OBJECT_OT_add_bounding_object.merge_object_instances(bm, obj, dg)
-
-        chull_out = bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
-        chull_geom = chull_out["geom"]
-        chull_points = np.array([bmelem.co for bmelem in chull_geom if isinstance(bmelem, bmesh.types.BMVert)])
-
-        bases = []
-
-        for elem in chull_geom:
-            if not isinstance(elem, bmesh.types.BMFace):
-                continue
-            if len(elem.verts) != 3:
-                continue
-
-            face_normal = elem.normal
-            if np.allclose(face_normal, 0, atol=0.00001):
-                continue
-
-            for e in elem.edges:
-                v0, v1 = e.verts
-                edge_vec = (v0.co - v1.co).normalized()
-                co_tangent = face_normal.cross(edge_vec)
-                basis = (edge_vec, co_tangent, face_normal)
-                bases.append(basis)
-
-        bb_basis, bb_max, bb_min = cls.rotating_calipers(chull_points, bases)
-        bm.free()
-        bb_basis_mat = bb_basis.T
+    def coords_rotating_calipers(cls, coords, location, name):
+        """Create the oriented minimum bounding box object of an (N, 3) coordinate array. coords are world space
+        positions relative to location, i.e. rotation and scale already applied, translation not."""
+        hull_points, hull_triangles, _ = convex_hull_arrays(coords)
+        bb_basis, bb_min, bb_max = minimum_oriented_box(hull_points, hull_triangles)
 
         if bb_min is None or bb_max is None:
             return None, None
 
+        bb_basis_mat = bb_basis.T
+
         bb_dim = bb_max - bb_min
         bb_center = (bb_max + bb_min) / 2
         rotation_matrix = Matrix(bb_basis_mat).to_4x4()
@@ -101,7 +52,7 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
         # as a normal object rotation, and the mesh stays clean in local space.
         scale_matrix = Matrix(np.identity(3) * bb_dim / 2).to_4x4()
 
-        bb_mesh = bpy.data.meshes.new(obj.name + "_minimum_bounding_box")
+        bb_mesh = bpy.data.meshes.new(name + "_minimum_bounding_box")
         bb_mesh.from_pydata(vertices=list(cls.gen_cube_verts()), edges=[], faces=CUBE_FACE_INDICES)
         bb_mesh.validate()
         bb_mesh.transform(scale_matrix)
@@ -110,10 +61,9 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
         bb_obj = bpy.data.objects.new(bb_mesh.name, bb_mesh)
 
         # Place the object at the bbox world-space centre with the correct
-        # rotation.  obj.location is used instead of obj.matrix_world to avoid
-        # reading a potentially stale depsgraph value; after apply_transform the
-        # object matrix is a pure translation so location == world origin.
-        bb_obj.location = obj.location + Vector(bb_center.dot(bb_basis))
+        # rotation.  location is passed in rather than read from a
+        # matrix_world to avoid a potentially stale depsgraph value.
+        bb_obj.location = Vector(location) + Vector(bb_center.dot(bb_basis))
         bb_obj.rotation_euler = rotation_matrix.to_euler()
 
         return bb_obj, None
@@ -121,6 +71,7 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_modifier_stack = True
+        self.use_point_prefilter = True
         self.use_global_local_switches = True
         self.shape = "box_shape"
         self.initial_shape = "box_shape"
@@ -160,18 +111,15 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
         # List for storing dictionaries of data used to generate the collision meshes
         collider_data = []
         verts_co = []
-        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=False)
+        objs = self.get_pre_processed_mesh_objs(context, default_world_spc=False, use_island_records=True)
 
         for base_ob, obj in objs:
             bounding_box_data = {}
 
-            if self.obj_mode == "EDIT" and base_ob.type == 'MESH' and self.active_obj.type == 'MESH' and not self.use_loose_mesh:
-                used_vertices = self.get_edit_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
-
-            else:  # self.obj_mode  == "OBJECT" or self.use_loose_mesh == True:
-                used_vertices = self.get_object_mode_vertices_local_space(obj, use_modifiers=self.my_use_modifier_stack)
+            # (N, 3) local space coordinates of the used (all or selected) vertices
+            used_vertices = self.get_used_vertex_array(base_ob, obj)
 
-            if used_vertices == None:  # Skip object if there is no Mesh data to create the collider
+            if used_vertices is None:  # Skip object if there is no Mesh data to create the collider
                 continue
 
             creation_mode = self.creation_mode[self.creation_mode_idx] if self.obj_mode == 'OBJECT' else \
@@ -184,23 +132,19 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
                 if len(used_vertices) < 3:
                     continue
 
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'LOCAL', used_vertices)
-
                 # used_vertices uses local space.
                 # store data needed to generate a bounding box in a dictionary
                 bounding_box_data['parent'] = base_ob
-                bounding_box_data['verts_loc'] = ws_vtx_co
+                bounding_box_data['verts_loc'] = used_vertices
 
                 collider_data.append(bounding_box_data)
 
             else:  # if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-                # get list of all vertex coordinates in global space
-                ws_vtx_co = self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices)
-                verts_co = verts_co + ws_vtx_co
+                # get array of all vertex coordinates in global space
+                verts_co.append(self.get_vertex_coordinates(obj, 'GLOBAL', used_vertices))
 
-        if self.creation_mode[self.creation_mode_idx] == 'SELECTION':
-            ws_vtx_co = verts_co
+        if self.creation_mode[self.creation_mode_idx] == 'SELECTION' and verts_co:
+            ws_vtx_co = np.concatenate(verts_co)
             verts_co = self.transform_vertex_space(ws_vtx_co, self.active_obj)
 
             # Don't add object if it consists of less than 3 vertices
@@ -210,30 +154,21 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
                 bounding_box_data['verts_loc'] = verts_co
                 collider_data = [bounding_box_data]
 
+        parents = []
         for bounding_box_data in collider_data:
             # get data from dictionary
             parent = bounding_box_data['parent']
             verts_loc = bounding_box_data['verts_loc']
 
-            bm = bmesh.new()
-
-            for v in verts_loc:
-                bm.verts.new(v)  # add a new vert
-            me = bpy.data.meshes.new("mesh")
-            bm.to_mesh(me)
-            bm.free()
+            # Rotation and scale of the parent are applied to the coordinates,
+            # the translation is kept separately as the new collider's location.
+            loc, rot, sca = parent.matrix_world.decompose()
+            rot_sca_co = transform_coordinates(verts_loc, get_rot_matrix(rot) @ get_sca_matrix(sca))
 
-            temp_obj = bpy.data.objects.new('temp_debug_objects', me)
-            temp_obj.matrix_world = parent.matrix_world
+            new_collider, rotation_matrix = self.coords_rotating_calipers(rot_sca_co, loc, parent.name)
 
-            root_collection = context.scene.collection
-            root_collection.objects.link(temp_obj)
-
-            self.apply_transform(temp_obj, rotation=True, scale=True)
-
-            new_collider, rotation_matrix = self.obj_rotating_calipers(temp_obj)
-
-            root_collection.objects.unlink(temp_obj)
+            if new_collider is None:
+                continue
 
             root_collection = context.scene.collection
             root_collection.objects.link(new_collider)
@@ -245,11 +180,12 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
             if rotation_matrix is not None:
                 self.col_rotation_matrix_list.append(rotation_matrix)
 
-            collections = parent.users_collection
-            self.primitive_postprocessing(context, new_collider, collections)
+            parents.append(parent)
 
             super().set_collider_name(new_collider, parent.name)
 
+        self.batch_postprocessing(context, self.new_colliders_list, parents)
+
         # Merge all collider objects
         if self.join_primitives:
             super().join_primitives(context)
@@ -260,4 +196,4 @@ class OBJECT_OT_add_aligned_bounding_box(OBJECT_OT_add_bounding_object, Operator
         super().print_generation_time("Aligned Box Collider", elapsed_time)
         self.report({'INFO'}, f"Aligned Box Collider: {float(elapsed_time)}")
 
-        return {'RUNNING_MODAL'}
+        return self.finish_execute(context)
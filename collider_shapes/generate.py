@@ -0,0 +1,103 @@
+import bpy
+
+# Shape operators generate_colliders() can run, by shape.
+SHAPE_OPERATORS = {
+    'BOX': 'mesh.add_bounding_box',
+    'ALIGNED_BOX': 'mesh.add_minimum_bounding_box',
+    'SPHERE': 'mesh.add_bounding_sphere',
+    'CYLINDER': 'mesh.add_bounding_cylinder',
+    'CAPSULE': 'mesh.add_bounding_capsule',
+    'CONVEX_HULL': 'mesh.add_bounding_convex_hull',
+    'KDOP': 'mesh.add_bounding_kdop',
+    'MESH': 'mesh.add_mesh_collision',
+    'REMESH': 'mesh.add_remesh_collision',
+}
+
+
+def _operator(shape):
+    try:
+        category, name = SHAPE_OPERATORS[shape].split('.')
+    except KeyError:
+        raise ValueError(f"Unknown collider shape '{shape}', expected one of {', '.join(SHAPE_OPERATORS)}")
+    return getattr(getattr(bpy.ops, category), name)
+
+
+def _split_settings(col_settings, operator, settings):
+    """
+    Sort the settings of generate_colliders() into scene settings and operator properties.
+
+    Returns:
+    tuple: The scene settings as {property name: value} and the operator properties as keyword arguments.
+    """
+    operator_properties = operator.get_rna_type().properties.keys()
+    scene_settings = {}
+    operator_kwargs = {}
+
+    for key, value in settings.items():
+        if hasattr(col_settings, 'default_' + key):
+            scene_settings['default_' + key] = value
+        elif key in operator_properties:
+            operator_kwargs[key] = value
+        else:
+            raise ValueError(f"Unknown collider setting '{key}'")
+
+    return scene_settings, operator_kwargs
+
+
+def generate_colliders(objects, shape, settings=None):
+    """
+    Generate colliders for objects without the modal operator, e.g. from 'blender --background'.
+
+    The shape operator runs the same fitting code as from the viewport, but without overlay, timers or display
+    changes, and the colliders are confirmed right away with the exact fit. The objects are only selected for the
+    duration of the call.
+
+    Parameters:
+    objects (list of bpy.types.Object): The objects to generate colliders for. Must be in object mode.
+    shape (str): A key of SHAPE_OPERATORS, e.g. 'BOX' or 'CONVEX_HULL'.
+    settings (dict, optional): Overrides of the defaults of the Simple Collider scene settings without the
+        'default_' prefix, e.g. {'creation_mode': 'SELECTION', 'sphere_segments': 8}, and operator properties
+        such as {'dop_type': '26'} for 'KDOP'. Everything else comes from the scene settings and add-on
+        preferences.
+
+    Returns:
+    list of bpy.types.Object: The new colliders.
+    """
+    context = bpy.context
+    operator = _operator(shape)
+    objects = list(objects)
+    if not objects:
+        return []
+
+    col_settings = context.scene.simple_collider
+    scene_settings, operator_kwargs = _split_settings(col_settings, operator, settings or {})
+
+    view_layer = context.view_layer
+    selected = [obj for obj in view_layer.objects if obj.select_get()]
+    active = view_layer.objects.active
+    defaults = {key: getattr(col_settings, key) for key in scene_settings}
+    old_objects = set(bpy.data.objects)
+
+    try:
+        for key, value in scene_settings.items():
+            setattr(col_settings, key, value)
+
+        for obj in selected:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        view_layer.objects.active = objects[0]
+
+        operator('EXEC_DEFAULT', **operator_kwargs)
+
+    finally:
+        for key, value in defaults.items():
+            setattr(col_settings, key, value)
+
+        for obj in objects:
+            obj.select_set(False)
+        for obj in selected:
+            obj.select_set(True)
+        view_layer.objects.active = active
+
+    return [obj for obj in bpy.data.objects if obj not in old_objects and obj.get('isCollider')]
@@ -213,6 +213,13 @@ class CollisionAddonPrefs(bpy.types.AddonPreferences, CollisionAddonPrefsPropert
             row = box.row()
             row.prop(self, propName)
 
+        box = layout.box()
+        row = box.row(align=True)
+        row.label(text="Performance")
+        for propName in self.props_performance:
+            row = box.row()
+            row.prop(self, propName)
+
     def draw_postprocess_panel(self, layout):
         """Draw the post processing panel"""
         box = layout.box()
@@ -554,6 +554,40 @@ class CollisionAddonPrefsProperties():
                                                                 "export pipelines that rely on the render flag",
                                                     default=True)
 
+    # Performance
+    use_extreme_point_prefilter: bpy.props.BoolProperty(name="Extreme Point Prefilter",
+                                                        description="Discard vertices that can't lie on the convex hull before fitting "
+                                                                    "spheres, cylinders, capsules, oriented boxes, k-DOPs and convex hulls. "
+                                                                    "The result is the same, it only makes dense meshes much faster to fit. "
+                                                                    "Disable to compare against a fit on every vertex",
+                                                        default=True)
+
+    use_hull_vertex_limit: bpy.props.BoolProperty(name="Limit Convex Hull Vertices",
+                                                  description="Simplify convex hull colliders with more vertices than the limit. "
+                                                              "The simplified hull still encloses the original one",
+                                                  default=True)
+
+    hull_vertex_limit: bpy.props.IntProperty(name="Convex Hull Vertex Limit",
+                                             description="Maximum number of vertices of a convex hull collider. "
+                                                         "Most physics engines reject or penalize hulls with more than 255 vertices",
+                                             default=255,
+                                             min=8,
+                                             max=4096)
+
+    use_duplicate_geometry_reuse: bpy.props.BoolProperty(name="Reuse Decomposition of Duplicates",
+                                                         description="Run Auto Convex once for objects whose geometry is a moved, rotated or "
+                                                                     "uniformly scaled copy of another selected object, and reuse its "
+                                                                     "result for the copies. Disable to decompose every copy on its own",
+                                                         default=True)
+
+    auto_convex_max_jobs: bpy.props.IntProperty(name="Concurrent Auto Convex Jobs",
+                                                description="Number of V-HACD or CoACD processes Auto Convex runs at "
+                                                            "the same time, one per object. 0 runs one per physical "
+                                                            "CPU core",
+                                                default=0,
+                                                min=0,
+                                                max=256)
+
     ###################################################################
     # VALIDATION
 
@@ -781,6 +815,14 @@ class CollisionAddonPrefsProperties():
         "hide_render_on_creation",
     ]
 
+    props_performance = [
+        "use_extreme_point_prefilter",
+        "use_hull_vertex_limit",
+        "hull_vertex_limit",
+        "use_duplicate_geometry_reuse",
+        "auto_convex_max_jobs",
+    ]
+
     props_validation_checks = [
         "validate_check_missing_collider",
         "validate_check_triangle_count",
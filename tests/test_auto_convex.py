@@ -106,6 +106,20 @@ class TestSetTempDataPath(unittest.TestCase):
                 os.chmod(tmp_dir, stat.S_IREAD | stat.S_IWRITE | stat.S_IEXEC)
 
 
+class TestCollectOutputFiles(unittest.TestCase):
+    """collect_output_files() picks V-HACD's results out of the directory of
+    a single job - everything but the exported input mesh."""
+
+    def test_input_mesh_and_variants_are_excluded(self):
+        with tempfile.TemporaryDirectory() as job_dir:
+            for name in ('Cube.obj', 'Cube000.obj', 'decomp.obj', 'decomp.stl', 'log.txt'):
+                open(os.path.join(job_dir, name), 'w').close()
+
+            result = _VHACD_OT.collect_output_files(job_dir, os.path.join(job_dir, 'Cube.obj'))
+
+        self.assertEqual(result, [os.path.join(job_dir, 'decomp.obj')])
+
+
 if __name__ == '__main__':
     # Strip Blender's argv; everything after '--' is forwarded to unittest.
     try:
@@ -0,0 +1,79 @@
+"""Tests for the batch runner driver (batch/run_batch.py). The driver itself
+doesn't use bpy; the workers it starts are covered by test_generate_colliders.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_batch.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, 'batch'))
+
+import run_batch
+
+
+class TestDiscoverInputs(unittest.TestCase):
+
+    def test_directories_are_searched_recursively(self):
+        with tempfile.TemporaryDirectory() as root:
+            root = Path(root)
+            (root / 'props').mkdir()
+            for name in ('a.blend', 'props/b.FBX', 'props/c.glb', 'notes.txt', 'props/d.obj'):
+                (root / name).touch()
+
+            inputs = run_batch.discover_inputs([str(root)])
+
+        self.assertEqual([relative for _, relative in inputs],
+                         [Path('a.blend'), Path('props/b.FBX'), Path('props/c.glb')])
+
+    def test_files_keep_their_name(self):
+        inputs = run_batch.discover_inputs(['/assets/chair.gltf', '/assets/readme.md'])
+        self.assertEqual(inputs, [(Path('/assets/chair.gltf'), Path('chair.gltf'))])
+
+
+class TestPhysicalCoreCount(unittest.TestCase):
+
+    def test_at_most_the_logical_cpus(self):
+        cores = run_batch.physical_core_count()
+        self.assertGreaterEqual(cores, 1)
+        self.assertLessEqual(cores, os.cpu_count() or 1)
+
+
+class TestRunFile(unittest.TestCase):
+
+    def _args(self, blender):
+        return argparse.Namespace(blender=blender, preset='', shape='BOX', settings={}, timeout=60)
+
+    def test_crash_is_reported(self):
+        # The Python interpreter rejects Blender's arguments and exits without
+        # writing a result, like a crashing Blender would.
+        entry = run_batch.run_file(Path('chair.blend'), Path('out/chair.blend'), self._args(sys.executable))
+
+        self.assertEqual(entry['status'], 'crashed')
+        self.assertEqual(entry['input'], 'chair.blend')
+        self.assertIn('wall_time', entry)
+
+    def test_worker_command(self):
+        cmd = run_batch.worker_command('blender', Path('a.fbx'), Path('out/a.fbx'), Path('r.json'), 'UE-default',
+                                       'SPHERE', {'sphere_segments': 8})
+
+        self.assertEqual(cmd[:5], ['blender', '--background', '--factory-startup', '--threads', '1'])
+        self.assertEqual(cmd[cmd.index('--shape') + 1], 'SPHERE')
+        self.assertEqual(cmd[cmd.index('--preset') + 1], 'UE-default')
+        self.assertEqual(cmd[cmd.index('--settings') + 1], '{"sphere_segments": 8}')
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the batch worker (batch/batch_worker.py): enabling the add-on,
+loading an asset, applying a preset, generating the colliders and saving the
+result, on a real .blend file.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_batch_worker.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+import unittest
+
+import bmesh
+import bpy
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_PROJECT_ROOT, 'batch'))
+
+import batch_worker
+
+
+def _save_cube_file(filepath, name):
+    """Save a .blend file with a single cube object and remove the cube from the current file again."""
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=2.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+
+    bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True)
+
+    bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.meshes.remove(mesh)
+
+
+class TestBatchWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp_dir.name, 'chair.blend')
+        self.target = os.path.join(self.tmp_dir.name, 'out', 'chair.blend')
+        _save_cube_file(self.source, 'chair')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _args(self, **kwargs):
+        args = dict(input=self.source, output=self.target, result='', preset='', shape='BOX', settings='{}')
+        args.update(kwargs)
+        return argparse.Namespace(**args)
+
+    def test_process_saves_the_colliders(self):
+        result = batch_worker.process(self._args(preset='UE-default'))
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(result['objects'], 1)
+        self.assertEqual(result['colliders'], 1)
+        self.assertEqual(set(result['timings']), {'load', 'generate', 'save'})
+        self.assertTrue(os.path.isfile(self.target))
+
+        bpy.ops.wm.open_mainfile(filepath=self.target)
+        colliders = [obj for obj in bpy.data.objects if obj.get('isCollider')]
+        self.assertEqual(len(colliders), 1)
+        self.assertEqual(colliders[0].parent.name, 'chair')
+        self.assertEqual(colliders[0]['collider_shape'], 'box_shape')
+        # UE-default names box colliders 'UBX_<parent>...'.
+        self.assertTrue(colliders[0].name.startswith('UBX_'), colliders[0].name)
+
+    def test_settings_are_passed_on(self):
+        result = batch_worker.process(self._args(shape='SPHERE', settings='{"sphere_segments": 8}'))
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(result['colliders'], 1)
+
+    def test_main_writes_the_result_file(self):
+        result_path = os.path.join(self.tmp_dir.name, 'result.json')
+        argv = sys.argv
+        sys.argv = ['blender', '--', '--input', self.source, '--output', self.target, '--result', result_path,
+                    '--shape', 'NO_SUCH_SHAPE']
+        try:
+            batch_worker.main()
+        finally:
+            sys.argv = argv
+
+        with open(result_path) as f:
+            result = f.read()
+        self.assertIn('"status": "failed"', result)
+        self.assertIn('ValueError', result)
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -13,6 +13,7 @@ import types as _types
 import unittest
 
 import bpy
+from mathutils import Matrix
 
 # Make the add-on importable as a package.
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -24,6 +25,7 @@ _addon = __import__(_ADDON_NAME)
 _island_mod = _addon.bmesh_operations.mesh_split_by_island
 _prim_mod = _addon.collider_shapes.add_bounding_primitive
 _OBJECT_OT_add_bounding_object = _prim_mod.OBJECT_OT_add_bounding_object
+_OBJECT_OT_add_bounding_sphere = _addon.collider_shapes.add_bounding_sphere.OBJECT_OT_add_bounding_sphere
 
 _create_objs_from_island = _island_mod.create_objs_from_island
 
@@ -291,6 +293,9 @@ class _PostprocessingFake:
         # No-op: use_col_collection is False so this is never reached.
         pass
 
+    postprocess_collider = _OBJECT_OT_add_bounding_object.postprocess_collider
+    resolve_physics_material = _OBJECT_OT_add_bounding_object.resolve_physics_material
+
 
 def _make_tri_obj(name):
     """Create a single-triangle mesh object linked to the default collection."""
@@ -402,6 +407,38 @@ class TestPrimitivePostprocessingDoesNotHideTmpMeshes(unittest.TestCase):
             )
 
 
+# -- collections_of_objects: single pass over all collections ---------------
+
+
+class TestCollectionsOfObjects(unittest.TestCase):
+    """collections_of_objects() must return the same collections as
+    users_collection for every object, looked up in one pass."""
+
+    def setUp(self):
+        self.objs = [_make_tri_obj(f'CollectionsOfObjects_{i}') for i in range(3)]
+        self.collections = [bpy.data.collections.new(f'CollectionsOfObjects_{i}') for i in range(2)]
+        for col in self.collections:
+            bpy.context.scene.collection.children.link(col)
+
+    def tearDown(self):
+        for obj in self.objs:
+            _remove_obj(obj)
+        for col in self.collections:
+            bpy.data.collections.remove(col)
+
+    def test_matches_users_collection(self):
+        self.collections[0].objects.link(self.objs[0])
+        self.collections[1].objects.link(self.objs[0])
+        self.collections[1].objects.link(self.objs[1])
+        bpy.context.collection.objects.unlink(self.objs[2])
+
+        users = _OBJECT_OT_add_bounding_object.collections_of_objects(self.objs)
+
+        for obj in self.objs:
+            self.assertEqual(set(users[obj]), set(obj.users_collection), obj.name)
+        self.assertEqual(users[self.objs[2]], [])
+
+
 # -- unique_name: O(N²) → O(N) counter-restart regression -------------------
 
 
@@ -610,6 +647,27 @@ class TestRemoveObjectsCleansUpMeshData(unittest.TestCase):
             "removed by remove_objects() despite still being used by another object"
         )
 
+    def test_shared_mesh_data_removed_with_all_users(self):
+        """Mesh data shared only by removed objects must be removed with them.
+
+        Colliders of linked duplicates share one collider mesh (see
+        shared_data_key()); cancelling the operator removes all of them at
+        once and must not leave the shared mesh behind.
+        """
+        shared_mesh_name = f'{self._PREFIX}shared_all'
+        shared_mesh = bpy.data.meshes.new(shared_mesh_name)
+        self._mesh_names.append(shared_mesh_name)
+
+        obj1 = bpy.data.objects.new(f'{self._PREFIX}shared_all_obj1', shared_mesh)
+        obj2 = bpy.data.objects.new(f'{self._PREFIX}shared_all_obj2', shared_mesh)
+        bpy.context.scene.collection.objects.link(obj1)
+        bpy.context.scene.collection.objects.link(obj2)
+        self._obj_names.extend([obj1.name, obj2.name])
+
+        _OBJECT_OT_add_bounding_object.remove_objects([obj1, obj2])
+
+        self.assertIsNone(bpy.data.meshes.get(shared_mesh_name))
+
     def test_handles_stale_object_reference(self):
         """remove_objects() must not raise on stale StructRNA references.
 
@@ -1337,6 +1395,179 @@ class TestSetOriginToCoMDepsgraphParam(unittest.TestCase):
                 msg=f'location[{axis}]: per-call={obj_percall.location[axis]:.6f} vs pre-fetched={obj_prefetch.location[axis]:.6f}',
             )
 
+    def test_shared_offset_moves_origin_only(self):
+        """Passing the offset of a previous call must only move the origin.
+
+        Colliders of linked duplicates share their mesh, which must be moved
+        to the center of mass once; the other colliders only follow with
+        their origin, so every collider keeps its world space shape.
+        """
+        obj1 = self._make_tri_mesh('s1')
+        obj2 = bpy.data.objects.new(f'{self._PREFIX}obj_s2', obj1.data)
+        bpy.context.scene.collection.objects.link(obj2)
+        self._obj_names.append(obj2.name)
+        obj2.location = (5.0, 0.0, 0.0)
+        bpy.context.view_layer.update()
+
+        before = [obj2.matrix_world @ v.co for v in obj2.data.vertices]
+
+        offset = _set_origin_to_com(obj1)
+        self.assertIsNotNone(offset)
+        self.assertIs(_set_origin_to_com(obj2, offset=offset), offset)
+        bpy.context.view_layer.update()
+
+        after = [obj2.matrix_world @ v.co for v in obj2.data.vertices]
+        for v_before, v_after in zip(before, after):
+            for axis in range(3):
+                self.assertAlmostEqual(v_before[axis], v_after[axis], places=5)
+
+
+# -- join_colliders: operator-free join ---------------------------------------
+
+
+class TestJoinCollidersWithoutOperator(unittest.TestCase):
+    """join_colliders() merges the collider meshes into the target without
+    bpy.ops.object.join(), so the selection and active object stay as they
+    are."""
+
+    _PREFIX = '__test_join_'
+
+    def setUp(self):
+        self._objs = []
+        for i in range(3):
+            mesh = bpy.data.meshes.new(f'{self._PREFIX}mesh_{i}')
+            mesh.from_pydata([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)], [], [[0, 1, 2]])
+            mesh.update()
+            obj = bpy.data.objects.new(f'{self._PREFIX}obj_{i}', mesh)
+            obj.location = (i * 2.0, 0.0, 0.0)
+            bpy.context.scene.collection.objects.link(obj)
+            self._objs.append(obj)
+        self._spy = _types.SimpleNamespace(remove_objects=_OBJECT_OT_add_bounding_object.remove_objects)
+
+    def tearDown(self):
+        for i in range(3):
+            obj = bpy.data.objects.get(f'{self._PREFIX}obj_{i}')
+            if obj is not None:
+                bpy.data.objects.remove(obj, do_unlink=True)
+        for mesh in list(bpy.data.meshes):
+            if mesh.name.startswith(self._PREFIX) and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+    def test_merges_into_first_collider(self):
+        names = [obj.name for obj in self._objs]
+        joined = _OBJECT_OT_add_bounding_object.join_colliders(self._spy, self._objs)
+
+        self.assertEqual(joined.name, names[0])
+        self.assertEqual(len(joined.data.polygons), 3)
+        self.assertIsNone(bpy.data.objects.get(names[1]))
+        self.assertIsNone(bpy.data.objects.get(names[2]))
+        # The third triangle sits 4 units along X of the joined object.
+        self.assertAlmostEqual(joined.data.vertices[6].co.x, 4.0, places=5)
+
+    def test_selection_is_untouched(self):
+        for obj in self._objs:
+            obj.select_set(False)
+        active = bpy.context.view_layer.objects.active
+
+        joined = _OBJECT_OT_add_bounding_object.join_colliders(self._spy, self._objs)
+
+        self.assertFalse(joined.select_get())
+        self.assertEqual(bpy.context.view_layer.objects.active, active)
+
+    def test_shared_target_mesh_is_not_overwritten(self):
+        shared = self._objs[0].data
+        keeper = bpy.data.objects.new(f'{self._PREFIX}keeper', shared)
+        try:
+            joined = _OBJECT_OT_add_bounding_object.join_colliders(self._spy, self._objs)
+            self.assertIsNot(joined.data, shared)
+            self.assertEqual(len(shared.polygons), 1)
+        finally:
+            bpy.data.objects.remove(keeper)
+
+
+# -- shared_data_key: modifier stack signature --------------------------------
+
+
+class TestModifierStackSignature(unittest.TestCase):
+    """Linked duplicates only share a collider if their modifier stacks are
+    equal and don't depend on other datablocks."""
+
+    _PREFIX = '__test_modsig_'
+
+    def setUp(self):
+        self._mesh = bpy.data.meshes.new(f'{self._PREFIX}mesh')
+        self._objs = [bpy.data.objects.new(f'{self._PREFIX}obj_{i}', self._mesh) for i in range(2)]
+
+    def tearDown(self):
+        for obj in self._objs:
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(self._mesh)
+
+    def _signatures(self):
+        return [_OBJECT_OT_add_bounding_object.modifier_stack_signature(obj) for obj in self._objs]
+
+    def test_equal_stacks(self):
+        for obj in self._objs:
+            obj.modifiers.new('Bevel', 'BEVEL').width = 0.2
+        first, second = self._signatures()
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        hash(first)
+
+    def test_different_settings(self):
+        for obj, width in zip(self._objs, (0.2, 0.3)):
+            obj.modifiers.new('Bevel', 'BEVEL').width = width
+        first, second = self._signatures()
+        self.assertNotEqual(first, second)
+
+    def test_modifier_name_is_ignored(self):
+        for obj, name in zip(self._objs, ('Bevel', 'Bevel.001')):
+            obj.modifiers.new(name, 'BEVEL')
+        first, second = self._signatures()
+        self.assertEqual(first, second)
+
+    def test_object_reference_is_not_shared(self):
+        mod = self._objs[0].modifiers.new('Boolean', 'BOOLEAN')
+        mod.object = self._objs[1]
+        self.assertIsNone(_OBJECT_OT_add_bounding_object.modifier_stack_signature(self._objs[0]))
+
+
+class TestSharedSphereKey(unittest.TestCase):
+    """Sphere colliders are fitted in world space, so linked duplicates only
+    share one if they have the same uniform scale."""
+
+    _PREFIX = '__test_sphere_key_'
+
+    def setUp(self):
+        self._mesh = bpy.data.meshes.new(f'{self._PREFIX}mesh')
+        self._objs = [bpy.data.objects.new(f'{self._PREFIX}obj_{i}', self._mesh) for i in range(2)]
+        self._op = _types.SimpleNamespace(use_loose_mesh=False, obj_mode='OBJECT', my_use_modifier_stack=False)
+        self._op.shared_data_key = _types.MethodType(_OBJECT_OT_add_bounding_object.shared_data_key, self._op)
+
+    def tearDown(self):
+        for obj in self._objs:
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(self._mesh)
+
+    def _keys(self, *scales):
+        for obj, scale in zip(self._objs, scales):
+            obj.matrix_world = Matrix.Diagonal((*scale, 1.0))
+        return [_OBJECT_OT_add_bounding_sphere.shared_sphere_key(self._op, obj, obj) for obj in self._objs]
+
+    def test_same_uniform_scale_is_shared(self):
+        first, second = self._keys((2.0, 2.0, 2.0), (2.0, 2.0, 2.0))
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+
+    def test_different_scale_is_not_shared(self):
+        first, second = self._keys((1.0, 1.0, 1.0), (2.0, 2.0, 2.0))
+        self.assertNotEqual(first, second)
+
+    def test_non_uniform_scale_is_fitted_on_its_own(self):
+        first, second = self._keys((1.0, 2.0, 1.0), (1.0, 2.0, 1.0))
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+
 
 # -- T-key group toggle: update_names() naming correctness -------------------
 
@@ -1691,6 +1922,90 @@ class TestCreateCollectionReusesAutoSuffixedName(unittest.TestCase):
         )
 
 
+# -- rebuild_colliders: parameter-only modal changes -------------------------
+
+
+class _RebuildSpy:
+    """Stand-in for a shape operator after execute(): one collider per cached
+    fit, a build_collider_mesh() that writes a quad of the fitted size and a
+    recording execute()."""
+
+    def __init__(self, fit_cache, join_primitives=False):
+        self.fit_cache = fit_cache
+        self.join_primitives = join_primitives
+        self.execute_calls = 0
+        self.build_calls = 0
+
+    def execute(self, context):
+        self.execute_calls += 1
+
+    def build_collider_mesh(self, mesh, fit):
+        self.build_calls += 1
+        size = fit['radius']
+        mesh.clear_geometry()
+        mesh.from_pydata([(0.0, 0.0, 0.0), (size, 0.0, 0.0), (size, size, 0.0), (0.0, size, 0.0)], [],
+                         [[0, 1, 2, 3]])
+        mesh.update()
+
+
+class TestRebuildCollidersFromFitCache(unittest.TestCase):
+    """Parameter-only changes rebuild the collider meshes in place from the
+    cached fits instead of regenerating every collider in execute()."""
+
+    def setUp(self):
+        self.collider = bpy.data.objects.new('TestRebuildCollider', bpy.data.meshes.new('TestRebuildMesh'))
+
+    def tearDown(self):
+        _remove_obj(self.collider)
+
+    def test_rebuilds_in_place_without_execute(self):
+        mesh = self.collider.data
+        spy = _RebuildSpy([(self.collider, {'radius': 2.0})])
+
+        _OBJECT_OT_add_bounding_object.rebuild_colliders(spy, bpy.context)
+
+        self.assertEqual(spy.execute_calls, 0)
+        self.assertIs(self.collider.data, mesh)
+        self.assertEqual(len(mesh.vertices), 4)
+        self.assertAlmostEqual(max(v.co.x for v in mesh.vertices), 2.0)
+
+    def test_shared_mesh_is_rebuilt_once(self):
+        duplicate = bpy.data.objects.new('TestRebuildDuplicate', self.collider.data)
+        try:
+            spy = _RebuildSpy([(self.collider, {'radius': 2.0}), (duplicate, {'radius': 2.0})])
+            _OBJECT_OT_add_bounding_object.rebuild_colliders(spy, bpy.context)
+        finally:
+            bpy.data.objects.remove(duplicate, do_unlink=True)
+
+        self.assertEqual(spy.build_calls, 1)
+        self.assertEqual(len(self.collider.data.vertices), 4)
+
+    def test_joined_colliders_are_regenerated(self):
+        spy = _RebuildSpy([(self.collider, {'radius': 2.0})], join_primitives=True)
+        _OBJECT_OT_add_bounding_object.rebuild_colliders(spy, bpy.context)
+        self.assertEqual(spy.execute_calls, 1)
+        self.assertEqual(len(self.collider.data.vertices), 0)
+
+    def test_without_fits_falls_back_to_execute(self):
+        spy = _RebuildSpy([])
+        _OBJECT_OT_add_bounding_object.rebuild_colliders(spy, bpy.context)
+        self.assertEqual(spy.execute_calls, 1)
+
+    def test_shape_without_mesh_builder_falls_back_to_execute(self):
+        class _NoBuilderSpy:
+            fit_cache = [(self.collider, {'radius': 2.0})]
+            join_primitives = False
+            execute_calls = 0
+
+            def execute(self, context):
+                self.execute_calls += 1
+
+        spy = _NoBuilderSpy()
+        _OBJECT_OT_add_bounding_object.rebuild_colliders(spy, bpy.context)
+        self.assertEqual(spy.execute_calls, 1)
+        self.assertEqual(len(self.collider.data.vertices), 0)
+
+
 if __name__ == '__main__':
     try:
         idx = sys.argv.index('--')
@@ -10,6 +10,7 @@ import sys
 import unittest
 
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector
 
 # Make the add-on importable as a package.
@@ -23,6 +24,11 @@ _sphere_mod = _addon.collider_shapes.add_bounding_sphere
 calculate_bounding_sphere = (
     _sphere_mod.OBJECT_OT_add_bounding_sphere.calculate_bounding_sphere
 )
+build_sphere_mesh = _sphere_mod.build_sphere_mesh
+
+_engine_mod = _addon.bmesh_operations.bounding_sphere
+minimum_enclosing_sphere = _engine_mod.minimum_enclosing_sphere
+approximate_enclosing_sphere = _engine_mod.approximate_enclosing_sphere
 
 # -- Helpers -----------------------------------------------------------------
 
@@ -308,6 +314,65 @@ class TestBoundingSphere(unittest.TestCase):
                        expected_radius=src_radius, places=4)
 
 
+class TestEnclosingSphereEngine(unittest.TestCase):
+    """Tests for the array based sphere engine (bmesh_operations.bounding_sphere)
+    that calculate_bounding_sphere and the validation checks share."""
+
+    def _random_points(self, count, seed):
+        rng = np.random.default_rng(seed)
+        return rng.normal(size=(count, 3)) * np.array([3.0, 1.0, 0.5]) + np.array([100.0, -20.0, 5.0])
+
+    def _max_distance(self, center, points):
+        return np.linalg.norm(points - center, axis=1).max()
+
+    def test_minimum_sphere_touches_farthest_point(self):
+        points = self._random_points(5000, seed=0)
+        center, radius = minimum_enclosing_sphere(points)
+        self.assertAlmostEqual(self._max_distance(center, points), radius, places=6)
+
+    def test_minimum_sphere_cannot_shrink(self):
+        """Moving the center in any direction must not reduce the radius."""
+        points = self._random_points(2000, seed=1)
+        center, radius = minimum_enclosing_sphere(points)
+        for offset in np.eye(3) * 1e-3:
+            self.assertGreaterEqual(self._max_distance(center + offset, points), radius - 1e-9)
+            self.assertGreaterEqual(self._max_distance(center - offset, points), radius - 1e-9)
+
+    def test_approximate_sphere_encloses_and_is_close(self):
+        points = self._random_points(20000, seed=2)
+        _, radius = minimum_enclosing_sphere(points)
+        center_approx, radius_approx = approximate_enclosing_sphere(points)
+        self.assertLessEqual(self._max_distance(center_approx, points), radius_approx + 1e-6)
+        self.assertGreaterEqual(radius_approx, radius - 1e-9)
+        self.assertLessEqual(radius_approx, radius * 1.05)
+
+    def test_approximate_sphere_of_box_is_within_bound(self):
+        """Box corners and dense box grids are the worst case of axis-only extreme points (ratio sqrt(3)/sqrt(2))."""
+        axis = np.linspace(-1.0, 1.0, 20)
+        grid = np.stack(np.meshgrid(axis, axis, axis), axis=-1).reshape(-1, 3)
+        corners = np.array([(x, y, z) for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)])
+        for points in (corners, grid, grid * np.array([3.0, 1.0, 0.2]) + np.array([10.0, 0.0, 0.0])):
+            _, radius = minimum_enclosing_sphere(points)
+            center_approx, radius_approx = approximate_enclosing_sphere(points)
+            self.assertLessEqual(self._max_distance(center_approx, points), radius_approx + 1e-6)
+            self.assertLessEqual(radius_approx, radius * 1.05)
+
+    def test_empty_input(self):
+        center, radius = minimum_enclosing_sphere(np.empty((0, 3)))
+        self.assertEqual(radius, 0.0)
+        self.assertEqual(center.shape, (3,))
+
+    def test_build_sphere_mesh_replaces_geometry_in_place(self):
+        mesh = bpy.data.meshes.new('sphere_rebuild')
+        self.addCleanup(bpy.data.meshes.remove, mesh)
+        build_sphere_mesh(mesh, 2.0, 4)
+        low_count = len(mesh.vertices)
+        build_sphere_mesh(mesh, 2.0, 8)
+        self.assertGreater(len(mesh.vertices), low_count)
+        for vert in mesh.vertices:
+            self.assertAlmostEqual(vert.co.length, 2.0, places=5)
+
+
 if __name__ == '__main__':
     # Strip Blender's argv; everything after '--' is forwarded to unittest.
     try:
@@ -14,6 +14,7 @@ import sys
 import unittest
 
 import bpy
+import numpy as np
 
 # Make the add-on importable as a package.
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -24,7 +25,17 @@ _addon = __import__(_ADDON_NAME)
 _voxel_mod = _addon.bmesh_operations.voxel_generation
 
 build_voxel_bmesh = _voxel_mod.build_voxel_bmesh
+VoxelPyramid = _voxel_mod.VoxelPyramid
+build_voxel_boxes = _voxel_mod.build_voxel_boxes
+greedy_boxes = _voxel_mod.greedy_boxes
+box_corners = _addon.bmesh_operations.box_creation.box_corners
 mesh_max_dimension = _voxel_mod.mesh_max_dimension
+VoxelBricks = _voxel_mod.VoxelBricks
+voxelize_surface = _voxel_mod._voxelize_surface
+budgeted_voxel_size = _voxel_mod._budgeted_voxel_size
+flood_fill_outside = _voxel_mod._flood_fill_outside
+flood_fill_bricks = _voxel_mod._flood_fill_bricks
+voxel_mesh_arrays = _voxel_mod.voxel_mesh_arrays
 
 
 # -- Helpers -----------------------------------------------------------------
@@ -48,6 +59,21 @@ def _holes(bm):
     return [e for e in bm.edges if len(e.link_faces) == 1]
 
 
+def _bricks_from_surface(surface):
+    """A flood filled VoxelBricks grid with the cells of a dense surface grid."""
+    cells = np.argwhere(surface)
+    bricks = VoxelBricks(surface.shape, np.unique(cells // _voxel_mod.BRICK_SIZE, axis=0))
+    bricks.surface.reshape(-1)[bricks.flat_indices(cells)] = True
+    flood_fill_bricks(bricks)
+    return bricks
+
+
+def _dense_surface(bricks):
+    occupancy = np.zeros(bricks.dims, dtype=bool)
+    occupancy[tuple(bricks.cells(bricks.surface).T)] = True
+    return occupancy
+
+
 # -- Tests -------------------------------------------------------------------
 
 
@@ -178,6 +204,207 @@ class TestVoxelGeneration(unittest.TestCase):
         self.assertEqual(_holes(bm), [])
         self.assertLessEqual(len(bm.verts), 200000)
 
+    # -- Mesh arrays -------------------------------------------------------
+
+    def test_mesh_arrays_share_vertices(self):
+        """Every corner position is emitted once, and every edge is used by
+        an even number of faces -- closed without any welding."""
+        rng = np.random.default_rng(0)
+        surface = np.zeros((12, 12, 12), dtype=bool)
+        surface[1:-1, 1:-1, 1:-1] = rng.random((10, 10, 10)) < 0.3
+        bricks = _bricks_from_surface(surface)
+        for diagonal_fill in (False, True):
+            coords, face_sizes, face_vertices = voxel_mesh_arrays(bricks, diagonal_fill, np.zeros(3), 0.5)
+            self.assertEqual(len(np.unique(coords, axis=0)), len(coords))
+            self.assertEqual(face_sizes.sum(), len(face_vertices))
+
+            starts = np.cumsum(face_sizes) - face_sizes
+            edges = []
+            for start, size in zip(starts, face_sizes):
+                face = face_vertices[start:start + size]
+                edges.extend(zip(face, np.roll(face, -1)))
+            edges = np.sort(np.array(edges), axis=1)
+            _, counts = np.unique(edges, axis=0, return_counts=True)
+            self.assertTrue((counts % 2 == 0).all())
+
+    # -- Surface voxelization ----------------------------------------------
+
+    def test_surface_voxelization_at_high_resolution(self):
+        """Every point of the surface lies in a marked cell, and no cell is
+        marked that the surface doesn't pass through (checked against the
+        distance of the cell center to the sphere)."""
+        mesh = self._sphere_mesh(radius=1.5, subdivisions=5)
+        verts = np.array([v.co for v in mesh.vertices])
+        mesh.calc_loop_triangles()
+        tris = np.array([t.vertices[:] for t in mesh.loop_triangles])
+
+        voxel_size = 3.2 / 256
+        origin = np.full(3, -1.6)
+        bricks = voxelize_surface(verts, tris, origin, voxel_size, (256, 256, 256))
+        occupancy = _dense_surface(bricks)
+        # Only the bricks the surface passes through are stored.
+        self.assertLess(len(bricks.coords), (256 // _voxel_mod.BRICK_SIZE) ** 3 // 4)
+
+        rng = np.random.default_rng(0)
+        weights = rng.dirichlet((1.0, 1.0, 1.0), size=len(tris))
+        samples = np.einsum('ij,ijk->ik', weights, verts[tris])
+        cells = np.floor((samples - origin) / voxel_size).astype(int)
+        self.assertTrue(occupancy[cells[:, 0], cells[:, 1], cells[:, 2]].all())
+
+        centers = (np.argwhere(occupancy) + 0.5) * voxel_size + origin
+        distances = np.abs(np.linalg.norm(centers, axis=1) - 1.5)
+        # Half a cell diagonal, plus the flat faces of the ico sphere.
+        self.assertLess(distances.max(), voxel_size * np.sqrt(3) / 2 + 0.01)
+
+    def test_surface_voxelization_of_grid_aligned_faces(self):
+        """A face lying exactly on a grid plane marks one layer of cells."""
+        mesh = self._cube_mesh(size=2.0)
+        verts = np.array([v.co for v in mesh.vertices])
+        mesh.calc_loop_triangles()
+        tris = np.array([t.vertices[:] for t in mesh.loop_triangles])
+
+        occupancy = _dense_surface(voxelize_surface(verts, tris, np.full(3, -2.0), 0.5, (8, 8, 8)))
+        filled = np.argwhere(occupancy)
+        np.testing.assert_array_equal(filled.min(axis=0), (2, 2, 2))
+        np.testing.assert_array_equal(filled.max(axis=0), (5, 5, 5))
+        self.assertEqual(len(filled), 4 ** 3 - 2 ** 3)
+
+    # -- Outside flood fill ------------------------------------------------
+
+    def test_flood_fill_keeps_closed_interior(self):
+        surface = np.zeros((10, 10, 10), dtype=bool)
+        surface[2:8, 2:8, 2:8] = True
+        surface[3:7, 3:7, 3:7] = False
+        outside = flood_fill_outside(surface)
+        self.assertFalse(outside[3:7, 3:7, 3:7].any())
+        self.assertEqual(outside.sum(), 10 ** 3 - 6 ** 3)
+
+    def test_flood_fill_follows_winding_channel(self):
+        """The interior is only reachable through a channel that turns
+        several corners, so no straight line from the boundary reaches it."""
+        surface = np.zeros((12, 12, 12), dtype=bool)
+        surface[1:11, 1:11, 1:11] = True
+        surface[2:10, 2:10, 2:10] = False
+        surface[2:10, 5, 2:10] = True     # wall splitting the interior
+        surface[1, 3, 3] = False          # entrance into the lower half
+        surface[8, 5, 8] = False          # gap in the wall, far from it
+        outside = flood_fill_outside(surface)
+        self.assertTrue(outside[2:10, 6:10, 2:10].all())
+
+        surface[8, 5, 8] = True
+        outside = flood_fill_outside(surface)
+        self.assertFalse(outside[2:10, 6:10, 2:10].any())
+        self.assertTrue(outside[2:10, 2:5, 2:10].all())
+
+    def test_brick_flood_fill_matches_dense_flood_fill(self):
+        """Grids spanning several bricks, with sizes that aren't a multiple
+        of the brick size."""
+        rng = np.random.default_rng(0)
+        for density in (0.1, 0.3, 0.5):
+            surface = rng.random((21, 13, 30)) < density
+            bricks = _bricks_from_surface(surface)
+            cells = np.argwhere(np.ones(surface.shape, dtype=bool))
+            filled = bricks.filled(cells).reshape(surface.shape)
+            np.testing.assert_array_equal(filled, ~flood_fill_outside(surface))
+
+    # -- Memory budget -----------------------------------------------------
+
+    def test_memory_budget_coarsens_voxel_size(self):
+        mesh = self._sphere_mesh()
+        verts, tris = _voxel_mod._mesh_local_triangles(mesh)
+        bbox_min, bbox_max = verts.min(axis=0), verts.max(axis=0)
+        budget = 256 * 1024
+        voxel_size = budgeted_voxel_size(verts, tris, bbox_min, bbox_max, 0.001, 2, budget)
+        self.assertGreater(voxel_size, 0.001)
+
+        # The brick count is taken from a coarse voxelization, whose cells
+        # are a tiny bit smaller than the bricks.
+        dims, origin = _voxel_mod._grid_dims_and_origin(bbox_min, bbox_max, voxel_size, 2)
+        self.assertLessEqual(voxelize_surface(verts, tris, origin, voxel_size, dims).nbytes, budget * 1.05)
+
+    def test_long_thin_object_keeps_fine_voxels(self):
+        """The budget is spent on the surface, so a thin rod is voxelized
+        finely along its whole length instead of being coarsened to fit a
+        cube shaped grid."""
+        mesh = _add_primitive(bpy.ops.mesh.primitive_cylinder_add, radius=0.05, depth=10.0)
+        self._meshes.append(mesh)
+        bm = build_voxel_bmesh(mesh, voxel_size=0.01, diagonal_fill=False)
+        self.addCleanup(bm.free)
+        self.assertEqual(_holes(bm), [])
+        extent = np.ptp(np.array([v.co for v in bm.verts]), axis=0)
+        self.assertLess(extent[0], 0.1 + 2 * 0.01 + 1e-4)
+        self.assertLess(extent[2], 10.0 + 2 * 0.01 + 1e-4)
+
+    # -- Occupancy pyramid -----------------------------------------------
+
+    def test_pyramid_levels_hug_grid_aligned_box(self):
+        """Coarser levels are downsampled from the finest grid, and still
+        match the bbox of a cube every voxel size divides evenly (#577)."""
+        mesh = self._cube_mesh(size=2.0)
+        pyramid = VoxelPyramid(mesh, 0.125)
+        for voxel_size in (0.125, 0.25, 0.5):
+            bm = pyramid.build_bmesh(voxel_size)
+            self.addCleanup(bm.free)
+            self.assertEqual(len(bm.verts), 8)
+            coords = np.array([v.co for v in bm.verts])
+            np.testing.assert_allclose(coords.min(axis=0), (-1.0, -1.0, -1.0), atol=1e-5)
+            np.testing.assert_allclose(coords.max(axis=0), (1.0, 1.0, 1.0), atol=1e-5)
+
+    def test_pyramid_reuses_levels(self):
+        mesh = self._sphere_mesh()
+        pyramid = VoxelPyramid(mesh, 0.05)
+        bricks, _, voxel_size = pyramid.level(0.16)
+        self.assertAlmostEqual(voxel_size, 0.15)
+        self.assertIs(pyramid.level(0.14)[0], bricks)
+        # Never finer than the voxelized surface.
+        self.assertAlmostEqual(pyramid.level(0.01)[2], 0.05)
+
+    # -- Box compound ------------------------------------------------------
+
+    def test_greedy_boxes_cover_filled_cells_once(self):
+        rng = np.random.default_rng(0)
+        filled = rng.random((9, 7, 11)) < 0.6
+        boxes = greedy_boxes(filled)
+        coverage = np.zeros(filled.shape, dtype=int)
+        for (x0, y0, z0), (x1, y1, z1) in boxes:
+            coverage[x0:x1, y0:y1, z0:z1] += 1
+        np.testing.assert_array_equal(coverage, filled)
+        self.assertIsNone(greedy_boxes(filled, max_boxes=len(boxes) - 1))
+
+    def test_greedy_boxes_merge_solid_block(self):
+        filled = np.zeros((6, 6, 6), dtype=bool)
+        filled[1:5, 2:4, 0:6] = True
+        np.testing.assert_array_equal(greedy_boxes(filled), [((1, 2, 0), (5, 4, 6))])
+
+    def test_box_compound_respects_box_limit(self):
+        mesh = self._sphere_mesh(radius=1.5)
+        for max_boxes in (1, 8, 64):
+            boxes, voxel_size = build_voxel_boxes(mesh, voxel_size=0.1, max_boxes=max_boxes)
+            self.assertLessEqual(len(boxes), max_boxes)
+            self.assertGreaterEqual(voxel_size, 0.1 - 1e-9)
+            # Voxelization is conservative: the boxes enclose the sphere.
+            np.testing.assert_array_less(boxes[:, 0].min(axis=0), -1.5 + 1e-4)
+            np.testing.assert_array_less(1.5 - 1e-4, boxes[:, 1].max(axis=0))
+
+        corners = box_corners(boxes)
+        self.assertEqual(corners.shape, (len(boxes), 8, 3))
+        np.testing.assert_allclose(corners.min(axis=1), boxes[:, 0])
+        np.testing.assert_allclose(corners.max(axis=1), boxes[:, 1])
+
+    def test_box_compound_rejects_box_limit_below_one(self):
+        mesh = self._sphere_mesh(radius=1.5)
+        with self.assertRaises(ValueError):
+            build_voxel_boxes(mesh, voxel_size=0.1, max_boxes=0)
+
+    def test_box_compound_stops_at_coarsest_grid(self):
+        """A box limit that no grid reaches ends at the single cell grid instead of coarsening forever."""
+        mesh = self._sphere_mesh(radius=1.5)
+        pyramid = VoxelPyramid(mesh, 0.1)
+        pyramid.memory_budget = 0
+        boxes, voxel_size = pyramid.build_boxes(0.1, max_boxes=1)
+        self.assertEqual(len(boxes), 1)
+        self.assertGreaterEqual(voxel_size, 3.0)
+
     # -- mesh_max_dimension ------------------------------------------------
 
     def test_mesh_max_dimension_matches_bounding_box(self):
@@ -0,0 +1,110 @@
+"""Unit tests for the 2D cross-section fitting shared by the cylinder and
+capsule colliders (bmesh_operations.cylinder_generation).
+
+Run with headless Blender::
+
+    blender --background --python tests/test_cylinder_generation.py
+"""
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_cylinder_mod = _addon.bmesh_operations.cylinder_generation
+
+convex_hull_2d = _cylinder_mod.convex_hull_2d
+minimum_enclosing_circle = _cylinder_mod.minimum_enclosing_circle
+split_axis_coordinates = _cylinder_mod.split_axis_coordinates
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _ring(segments, radius=1.0, center=(0.0, 0.0)):
+    angles = np.linspace(0.0, 2.0 * math.pi, segments, endpoint=False)
+    return np.column_stack((np.cos(angles), np.sin(angles))) * radius + np.array(center)
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestConvexHull2D(unittest.TestCase):
+
+    def test_square_with_interior_points(self):
+        rng = np.random.default_rng(0)
+        corners = np.array([(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)])
+        points = np.vstack((rng.uniform(0.1, 1.9, size=(1000, 2)), corners))
+        hull = convex_hull_2d(points)
+        self.assertEqual(len(hull), 4)
+        self.assertEqual({tuple(p) for p in hull}, {tuple(p) for p in corners})
+
+    def test_hull_is_counterclockwise(self):
+        hull = convex_hull_2d(_ring(32))
+        x, y = hull[:, 0], hull[:, 1]
+        signed_area = 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+        self.assertGreater(signed_area, 0.0)
+
+    def test_repeated_rings_collapse(self):
+        """A pipe's vertex rings all project onto the same cross-section."""
+        points = np.tile(_ring(24), (500, 1))
+        self.assertEqual(len(convex_hull_2d(points)), 24)
+
+    def test_collinear_points(self):
+        points = np.column_stack((np.linspace(0.0, 5.0, 50), np.full(50, 3.0)))
+        self.assertLess(len(convex_hull_2d(points)), 3)
+
+
+class TestMinimumEnclosingCircle(unittest.TestCase):
+
+    def test_ring(self):
+        center, radius = minimum_enclosing_circle(_ring(64, radius=2.5, center=(4.0, -1.0)))
+        np.testing.assert_allclose(center, (4.0, -1.0), atol=1e-9)
+        self.assertAlmostEqual(radius, 2.5, places=9)
+
+    def test_right_triangle(self):
+        center, radius = minimum_enclosing_circle(np.array([(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]))
+        np.testing.assert_allclose(center, (1.0, 1.0), atol=1e-9)
+        self.assertAlmostEqual(radius, math.sqrt(2.0), places=9)
+
+    def test_encloses_dense_disc(self):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-1.0, 1.0, size=(50000, 2))
+        center, radius = minimum_enclosing_circle(points)
+        distances = np.linalg.norm(points - center, axis=1)
+        self.assertLessEqual(distances.max(), radius + 1e-12)
+        self.assertGreater(distances.max(), radius - 1e-9)
+
+    def test_single_point(self):
+        center, radius = minimum_enclosing_circle(np.array([(1.0, 2.0)]))
+        np.testing.assert_allclose(center, (1.0, 2.0))
+        self.assertEqual(radius, 0.0)
+
+
+class TestSplitAxisCoordinates(unittest.TestCase):
+
+    def test_axes(self):
+        points = np.array([(1.0, 2.0, 3.0)])
+        for axis, expected_plane, expected_height in (('X', (2.0, 3.0), 1.0),
+                                                      ('Y', (1.0, 3.0), 2.0),
+                                                      ('Z', (1.0, 2.0), 3.0)):
+            plane, height = split_axis_coordinates(points, axis)
+            np.testing.assert_array_equal(plane[0], expected_plane)
+            self.assertEqual(height[0], expected_height)
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
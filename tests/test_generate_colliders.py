@@ -0,0 +1,122 @@
+"""Tests for the headless collider API (collider_shapes.generate), which runs
+the shape operators without invoke(), viewport or modal loop.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_generate_colliders.py
+"""
+import os
+import sys
+import unittest
+
+import addon_utils
+import bmesh
+import bpy
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+
+generate_colliders = _addon.collider_shapes.generate.generate_colliders
+
+
+def _addon_registered():
+    """The shape operators only exist once the add-on is enabled (in Blender
+    4.2+ under a 'bl_ext.<repo>.<name>' key)."""
+    for key in bpy.context.preferences.addons.keys():
+        if key == _ADDON_NAME or key.endswith('.' + _ADDON_NAME):
+            return hasattr(bpy.context.scene, 'simple_collider')
+    return False
+
+
+def _make_cube(name, location, size=2.0):
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=size)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+class TestGenerateCollidersArguments(unittest.TestCase):
+
+    def test_unknown_shape(self):
+        with self.assertRaises(ValueError):
+            generate_colliders([], 'TETRAHEDRON')
+
+
+class TestGenerateColliders(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # run_tests.py starts Blender with --factory-startup, so the add-on
+        # is only enabled here when it's installed and enabled by the user.
+        cls.enabled_by_test = not _addon_registered()
+        if cls.enabled_by_test:
+            addon_utils.enable(_ADDON_NAME, default_set=True)
+        if not _addon_registered():
+            raise RuntimeError(f"Could not enable the add-on '{_ADDON_NAME}'")
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.enabled_by_test:
+            addon_utils.disable(_ADDON_NAME, default_set=True)
+
+    def setUp(self):
+        self.objs = [_make_cube(f'__test_generate_{i}', (i * 5.0, 0.0, 0.0)) for i in range(2)]
+        self.other = _make_cube('__test_generate_other', (0.0, 5.0, 0.0))
+        self.colliders = []
+
+        for obj in bpy.context.view_layer.objects:
+            obj.select_set(False)
+        self.other.select_set(True)
+        bpy.context.view_layer.objects.active = self.other
+
+    def tearDown(self):
+        for obj in self.colliders + self.objs + [self.other]:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+    def test_box_per_object(self):
+        self.colliders = generate_colliders(self.objs, 'BOX')
+
+        self.assertEqual(len(self.colliders), len(self.objs))
+        self.assertEqual({collider.parent for collider in self.colliders}, set(self.objs))
+        for collider in self.colliders:
+            self.assertTrue(collider['isCollider'])
+            self.assertEqual(collider['collider_shape'], 'box_shape')
+            self.assertEqual(len(collider.data.vertices), 8)
+
+    def test_selection_is_restored(self):
+        self.colliders = generate_colliders(self.objs, 'SPHERE')
+
+        self.assertEqual(bpy.context.view_layer.objects.active, self.other)
+        self.assertEqual(set(bpy.context.selected_objects), {self.other})
+
+    def test_settings_are_applied_and_restored(self):
+        col_settings = bpy.context.scene.simple_collider
+        default = col_settings.default_creation_mode
+
+        self.colliders = generate_colliders(self.objs, 'CONVEX_HULL', {'creation_mode': 'SELECTION'})
+
+        self.assertEqual(len(self.colliders), 1)
+        self.assertEqual(col_settings.default_creation_mode, default)
+
+    def test_unknown_setting(self):
+        with self.assertRaises(ValueError):
+            generate_colliders(self.objs, 'BOX', {'no_such_setting': True})
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
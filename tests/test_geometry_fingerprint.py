@@ -0,0 +1,155 @@
+"""Unit tests for the duplicate geometry detection
+(bmesh_operations.geometry_fingerprint) used by Auto Convex.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_geometry_fingerprint.py
+"""
+import math
+import os
+import sys
+import unittest
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_fingerprint_mod = _addon.bmesh_operations.geometry_fingerprint
+
+geometry_fingerprint = _fingerprint_mod.geometry_fingerprint
+similarity_transform = _fingerprint_mod.similarity_transform
+match_duplicate_meshes = _fingerprint_mod.match_duplicate_meshes
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _random_triangles(count=60, seed=0):
+    rng = np.random.default_rng(seed)
+    coords = rng.normal(size=(count, 3))
+    face_vertices = np.arange(count - count % 3, dtype=np.int32)
+    face_sizes = np.full(len(face_vertices) // 3, 3, dtype=np.int32)
+    return coords, face_sizes, face_vertices
+
+
+def _similarity_matrix(scale=2.5):
+    matrix = Matrix.Translation((3.0, -1.0, 7.0)) @ Matrix.Rotation(math.radians(40.0), 4, (1.0, 2.0, 0.5))
+    matrix = matrix @ Matrix.Scale(scale, 4)
+    return np.array(matrix)
+
+
+def _transformed(coords, matrix):
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def _mesh(coords, face_sizes, face_vertices, name='__test_fingerprint'):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', np.asarray(coords, dtype=np.float32).ravel())
+    mesh.loops.add(len(face_vertices))
+    mesh.loops.foreach_set('vertex_index', face_vertices)
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set('loop_start', (np.cumsum(face_sizes) - face_sizes).astype(np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set('loop_total', face_sizes)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestGeometryFingerprint(unittest.TestCase):
+
+    def test_invariant_under_similarity_transform(self):
+        coords, face_sizes, face_vertices = _random_triangles()
+        moved = _transformed(coords, _similarity_matrix())
+        self.assertEqual(geometry_fingerprint(coords, face_sizes, face_vertices),
+                         geometry_fingerprint(moved, face_sizes, face_vertices))
+
+    def test_differs_for_other_geometry(self):
+        coords, face_sizes, face_vertices = _random_triangles()
+        other, _, _ = _random_triangles(seed=1)
+        self.assertNotEqual(geometry_fingerprint(coords, face_sizes, face_vertices),
+                            geometry_fingerprint(other, face_sizes, face_vertices))
+
+    def test_differs_for_other_topology(self):
+        coords, face_sizes, face_vertices = _random_triangles()
+        self.assertNotEqual(geometry_fingerprint(coords, face_sizes, face_vertices),
+                            geometry_fingerprint(coords, face_sizes, face_vertices[::-1]))
+
+    def test_degenerate_mesh(self):
+        self.assertIsNone(geometry_fingerprint(np.zeros((4, 3)), np.array([4]), np.arange(4)))
+        self.assertIsNone(geometry_fingerprint(np.zeros((0, 3)), np.array([]), np.array([])))
+
+
+class TestSimilarityTransform(unittest.TestCase):
+
+    def test_recovers_matrix(self):
+        coords, _, _ = _random_triangles()
+        matrix = _similarity_matrix()
+        np.testing.assert_allclose(similarity_transform(coords, _transformed(coords, matrix)), matrix, atol=1e-9)
+
+    def test_symmetric_mesh(self):
+        # Every PCA axis of a cube is ambiguous; the vertex order still isn't.
+        cube = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+        matrix = _similarity_matrix(scale=0.5)
+        np.testing.assert_allclose(similarity_transform(cube, _transformed(cube, matrix)), matrix, atol=1e-9)
+
+    def test_mirror_image_is_rejected(self):
+        coords, _, _ = _random_triangles()
+        self.assertIsNone(similarity_transform(coords, coords * np.array([-1.0, 1.0, 1.0])))
+
+    def test_non_uniform_scale_is_rejected(self):
+        coords, _, _ = _random_triangles()
+        self.assertIsNone(similarity_transform(coords, coords * np.array([1.0, 1.0, 2.0])))
+
+
+class TestMatchDuplicateMeshes(unittest.TestCase):
+
+    def setUp(self):
+        self._meshes = []
+
+    def tearDown(self):
+        for mesh in self._meshes:
+            bpy.data.meshes.remove(mesh)
+
+    def _new_mesh(self, coords, face_sizes, face_vertices):
+        mesh = _mesh(coords, face_sizes, face_vertices)
+        self._meshes.append(mesh)
+        return mesh
+
+    def test_copies_match_first_mesh(self):
+        coords, face_sizes, face_vertices = _random_triangles()
+        other, _, _ = _random_triangles(seed=1)
+        matrix = _similarity_matrix()
+        meshes = [
+            self._new_mesh(coords, face_sizes, face_vertices),
+            self._new_mesh(other, face_sizes, face_vertices),
+            self._new_mesh(_transformed(coords, matrix), face_sizes, face_vertices),
+        ]
+
+        matches = match_duplicate_meshes(meshes)
+
+        self.assertIsNone(matches[0])
+        self.assertIsNone(matches[1])
+        index, found = matches[2]
+        self.assertEqual(index, 0)
+        # Mesh coordinates are stored as float32.
+        np.testing.assert_allclose(found, matrix, atol=1e-4)
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for the convex hull builder and its vertex budget
+(bmesh_operations.hull_simplification) used by the Convex Hull collider.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_hull_simplification.py
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_hull_mod = _addon.bmesh_operations.hull_simplification
+convex_hull_arrays = _addon.bmesh_operations.oriented_box.convex_hull_arrays
+
+bounding_polytope = _hull_mod.bounding_polytope
+convex_hull_bmesh = _hull_mod.convex_hull_bmesh
+hull_face_planes = _hull_mod.hull_face_planes
+simplify_hull = _hull_mod.simplify_hull
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _ellipsoid(count=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(count, 3))
+    points /= np.linalg.norm(points, axis=1)[:, None]
+    return points * np.array([4.0, 1.0, 0.3]) + np.array([2.0, 0.0, -1.0])
+
+
+def _max_outside_distance(points, vertices):
+    """Largest distance of a point outside of the convex hull of vertices."""
+    hull_points, triangles, _ = convex_hull_arrays(vertices)
+    normals, _ = hull_face_planes(hull_points, triangles)
+    offsets = (hull_points @ normals.T).max(axis=0)
+    return float((points @ normals.T - offsets).max())
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestHullSimplification(unittest.TestCase):
+
+    def test_face_planes_of_box(self):
+        corners = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 2) for z in (0, 3)], dtype=np.float64)
+        points, triangles, _ = convex_hull_arrays(corners)
+        normals, areas = hull_face_planes(points, triangles)
+        # 12 triangles, but only 6 planes.
+        self.assertEqual(len(normals), 6)
+        self.assertAlmostEqual(areas.sum(), 2 * (2 * 3 + 2 * 3 + 3 * 3), places=6)
+
+    def test_vertex_budget(self):
+        points, triangles, _ = convex_hull_arrays(_ellipsoid())
+        for budget in (255, 64, 16, 8):
+            vertices = simplify_hull(points, triangles, budget)
+            self.assertLessEqual(len(vertices), budget)
+
+    def test_simplified_hull_encloses_source(self):
+        source = _ellipsoid()
+        points, triangles, _ = convex_hull_arrays(source)
+        vertices = simplify_hull(points, triangles, 32)
+        self.assertLessEqual(_max_outside_distance(source, vertices), 1e-5)
+
+    def test_small_hull_is_unchanged(self):
+        points, triangles, _ = convex_hull_arrays(_ellipsoid(count=50))
+        np.testing.assert_array_equal(simplify_hull(points, triangles, 255), points)
+
+    def test_bounding_polytope_is_the_box(self):
+        source = _ellipsoid()
+        vertices = bounding_polytope(source, 8)
+        self.assertEqual(len(vertices), 8)
+        np.testing.assert_allclose(vertices.min(axis=0), source.min(axis=0))
+        np.testing.assert_allclose(vertices.max(axis=0), source.max(axis=0))
+
+    def test_bounding_polytope_below_box_budget(self):
+        source = _ellipsoid()
+        vertices = bounding_polytope(source, 5)
+        self.assertEqual(len(vertices), 4)
+        self.assertLessEqual(_max_outside_distance(source, vertices), 1e-5)
+
+    def test_hull_bmesh_limit(self):
+        bm = convex_hull_bmesh(_ellipsoid(), max_vertices=64)
+        try:
+            self.assertLessEqual(len(bm.verts), 64)
+            self.assertTrue(all(edge.is_manifold for edge in bm.edges))
+        finally:
+            bm.free()
+
+    def test_hull_bmesh_vertex_ratio(self):
+        bm = convex_hull_bmesh(_ellipsoid(count=400), vertex_ratio=0.25)
+        try:
+            self.assertLessEqual(len(bm.verts), 100)
+        finally:
+            bm.free()
+
+    def test_hull_bmesh_without_limit(self):
+        source = _ellipsoid(count=400)
+        bm = convex_hull_bmesh(source)
+        try:
+            self.assertEqual(len(bm.verts), 400)
+        finally:
+            bm.free()
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
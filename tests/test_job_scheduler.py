@@ -0,0 +1,151 @@
+"""Tests for the Auto Convex job scheduler (auto_Convex.job_scheduler), which
+runs the V-HACD/CoACD processes of a run concurrently, each in its own
+directory. The jobs here run the Python interpreter instead of a
+decomposition executable.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_job_scheduler.py
+"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+job_scheduler = _addon.auto_Convex.job_scheduler
+
+# Writes its working directory to out.txt and prints V-HACD style progress.
+_WRITE_OUTPUT = ("import os; print('50%', end='\\r', flush=True); "
+                 "open('out.txt', 'w').write(os.getcwd()); print('100%')")
+
+
+def _python_job(script):
+    def start(job):
+        job.start([sys.executable, '-c', script])
+    return start
+
+
+def _wait_for_jobs(jobs, start, timeout=30):
+    """Poll the scheduler like the operators' timers do. Returns the finished jobs in the order they finished."""
+    finished = []
+    jobs.start_jobs(start)
+    deadline = time.time() + timeout
+    while not jobs.is_idle():
+        if time.time() > deadline:
+            raise AssertionError("jobs didn't finish")
+        finished.extend(jobs.finished_jobs())
+        jobs.start_jobs(start)
+        time.sleep(0.01)
+    return finished
+
+
+class TestDefaultMaxJobs(unittest.TestCase):
+
+    def test_physical_cores_are_at_most_the_logical_cpus(self):
+        cores = job_scheduler.physical_core_count()
+        self.assertGreaterEqual(cores, 1)
+        self.assertLessEqual(cores, os.cpu_count() or 1)
+
+    def test_threads_per_job_divide_the_cores(self):
+        cores = job_scheduler.physical_core_count()
+        self.assertEqual(job_scheduler.default_max_jobs(1), cores)
+        self.assertEqual(job_scheduler.default_max_jobs(cores * 2), 1)
+
+
+class TestJobScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.jobs = job_scheduler.JobScheduler(self.tmp_dir.name, 'test_', max_jobs=2)
+
+    def tearDown(self):
+        self.jobs.cancel()
+        self.tmp_dir.cleanup()
+
+    def test_jobs_run_in_their_own_directory(self):
+        submitted = [self.jobs.submit({'name': i}) for i in range(5)]
+
+        finished = _wait_for_jobs(self.jobs, _python_job(_WRITE_OUTPUT))
+
+        self.assertCountEqual(finished, submitted)
+        self.assertEqual(len({job.directory for job in submitted}), 5)
+        for job in submitted:
+            self.assertEqual(os.path.dirname(job.directory), self.jobs.run_directory)
+            with open(job.path('out.txt')) as f:
+                self.assertEqual(os.path.realpath(f.read()), os.path.realpath(job.directory))
+
+    def test_running_jobs_are_limited(self):
+        for i in range(5):
+            self.jobs.submit({})
+
+        self.jobs.start_jobs(_python_job('import time; time.sleep(0.2)'))
+
+        self.assertEqual(len(self.jobs.running), 2)
+        self.assertEqual(len(self.jobs.pending), 3)
+
+    def test_jobs_can_be_submitted_while_running(self):
+        self.jobs.submit({'stage': 'first'})
+
+        def start(job):
+            if job.data['stage'] == 'first':
+                self.jobs.submit({'stage': 'second'})
+            job.start([sys.executable, '-c', 'pass'])
+
+        finished = _wait_for_jobs(self.jobs, start)
+
+        self.assertEqual([job.data['stage'] for job in finished], ['first', 'second'])
+        self.assertEqual((self.jobs.done, self.jobs.total), (2, 2))
+
+    def test_output_is_read_line_by_line(self):
+        job = self.jobs.submit({})
+        _wait_for_jobs(self.jobs, _python_job(_WRITE_OUTPUT))
+
+        # The reader thread may still be queuing the last line.
+        lines = []
+        deadline = time.time() + 5
+        while len(lines) < 2 and time.time() < deadline:
+            lines.extend(job.read_output())
+            time.sleep(0.01)
+
+        self.assertEqual(lines, ['50%', '100%'])
+        self.assertEqual(job.read_output(), [])
+
+    def test_progress_text(self):
+        for i in range(4):
+            self.jobs.submit({})
+        self.jobs.start_jobs(_python_job('import time; time.sleep(5)'))
+        self.jobs.running[0].fraction = 1.0
+        self.jobs.running[1].fraction = 1.0
+
+        self.assertEqual(self.jobs.progress_text(), '50% - 0 of 4 jobs done, 2 running')
+
+    def test_cancel_kills_the_processes_and_removes_the_files(self):
+        for i in range(3):
+            self.jobs.submit({'name': i})
+        self.jobs.start_jobs(_python_job('import time; time.sleep(30)'))
+        running = list(self.jobs.running)
+
+        unfinished = self.jobs.cancel()
+
+        self.assertEqual([job.data['name'] for job in unfinished], [0, 1, 2])
+        for job in running:
+            self.assertIsNotNone(job.process.poll())
+        self.assertFalse(os.path.exists(self.jobs.run_directory))
+        self.assertTrue(self.jobs.is_idle())
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for the half-space k-DOP construction
+(bmesh_operations.kdop_generation) used by the k-DOP collider.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_kdop_generation.py
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_kdop_mod = _addon.bmesh_operations.kdop_generation
+
+KDOP_NORMALS = _kdop_mod.KDOP_NORMALS
+generate_kdop = _kdop_mod.generate_kdop
+halfspace_vertices = _kdop_mod.halfspace_vertices
+principal_axes_normals = _kdop_mod.principal_axes_normals
+support_distances = _kdop_mod.support_distances
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _random_points(count=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(count, 3)) * np.array([3.0, 1.0, 0.5]) + np.array([1.0, -2.0, 4.0])
+
+
+def _verts(bm):
+    return np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestKDopGeneration(unittest.TestCase):
+
+    def test_support_distances_match_brute_force(self):
+        points = _random_points()
+        normals = KDOP_NORMALS['26']()
+        expected = [max(p @ n for p in points) for n in normals]
+        np.testing.assert_allclose(support_distances(points, normals), expected)
+
+    def test_halfspace_vertices_of_box(self):
+        normals = KDOP_NORMALS['10']()[:6]
+        offsets = np.array([1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+        vertices = halfspace_vertices(normals, offsets, 1e-9)
+        self.assertEqual(len(vertices), 8)
+        np.testing.assert_allclose(np.abs(vertices), np.tile((1.0, 2.0, 3.0), (8, 1)))
+
+    def test_kdop_encloses_points(self):
+        points = _random_points()
+        for dop_type, normals in KDOP_NORMALS.items():
+            bm = generate_kdop(points, normals())
+            try:
+                self.assertTrue(bm.faces, dop_type)
+                for face in bm.faces:
+                    # Faces are planar, so every point is behind each face plane.
+                    distances = (points - np.array(face.verts[0].co)) @ np.array(face.normal)
+                    self.assertLessEqual(distances.max(), 1e-4, dop_type)
+            finally:
+                bm.free()
+
+    def test_face_count_matches_directions(self):
+        # Every direction supports a sphere in a single point, so each plane
+        # of the 26-DOP of a sphere is one face.
+        rng = np.random.default_rng(2)
+        sphere = rng.normal(size=(5000, 3))
+        sphere /= np.linalg.norm(sphere, axis=1)[:, None]
+        bm = generate_kdop(sphere, KDOP_NORMALS['26']())
+        try:
+            self.assertEqual(len(bm.faces), 26)
+        finally:
+            bm.free()
+
+    def test_custom_directions(self):
+        points = _random_points()
+        # Not unit length, no opposite directions and only 2 independent
+        # ones: still has to give a closed, bounded polytope.
+        bm = generate_kdop(points, np.array([(2.0, 0.0, 0.0), (1.0, 1.0, 0.0)]))
+        try:
+            verts = _verts(bm)
+            self.assertTrue(bm.faces)
+            self.assertTrue(all(edge.is_manifold for edge in bm.edges))
+            self.assertLess(np.ptp(verts, axis=0).max(), np.ptp(points, axis=0).max() * 2.0)
+        finally:
+            bm.free()
+
+    def test_principal_axes_normals_stay_unit_length(self):
+        points = _random_points() @ np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]).T
+        normals = principal_axes_normals(points, KDOP_NORMALS['18']())
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+        bm = generate_kdop(points, normals)
+        try:
+            self.assertTrue(bm.faces)
+        finally:
+            bm.free()
+
+    def test_empty_input(self):
+        bm = generate_kdop(np.empty((0, 3)), KDOP_NORMALS['18']())
+        try:
+            self.assertEqual(len(bm.verts), 0)
+        finally:
+            bm.free()
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -11,6 +11,9 @@ import time
 import unittest
 
 import bmesh
+import bpy
+import numpy as np
+from mathutils import Matrix
 
 # Make the add-on importable as a package.
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -22,6 +25,9 @@ _island_mod = _addon.bmesh_operations.mesh_split_by_island
 
 _get_face_islands = _island_mod._get_face_islands
 _construct_python_faces = _island_mod.construct_python_faces
+_get_mesh_islands = _island_mod.get_mesh_islands
+_union_find_roots = _island_mod.union_find_roots
+_get_island_records = _island_mod.get_island_records
 
 
 # -- Helpers -----------------------------------------------------------------
@@ -233,6 +239,118 @@ class TestGetFaceIslands(unittest.TestCase):
         )
 
 
+class TestGetMeshIslands(unittest.TestCase):
+    """The array based island split must match _get_face_islands()."""
+
+    def setUp(self):
+        self.mesh = bpy.data.meshes.new('island_test_mesh')
+
+    def tearDown(self):
+        bpy.data.meshes.remove(self.mesh)
+
+    def _islands_of(self, bm):
+        bm.to_mesh(self.mesh)
+        expected = _get_face_islands(list(bm.faces))
+        bm.free()
+        return _get_mesh_islands(self.mesh), expected
+
+    def test_matches_face_islands(self):
+        bm = _make_connected_grid(4, 5)
+        bmesh.ops.translate(bm, verts=bm.verts, vec=(0.0, 0.0, 1.0))
+        for i in range(3):
+            x = float(i) * 2.0 + 20.0
+            verts = [bm.verts.new(co) for co in ((x, 0.0, 0.0), (x + 1.0, 0.0, 0.0), (x, 1.0, 0.0))]
+            bm.faces.new(verts)
+
+        islands, expected = self._islands_of(bm)
+        self.assertEqual(len(islands), len(expected))
+        for island, reference in zip(islands, expected):
+            self.assertEqual(len(island['face_sizes']), len(reference['py_faces']))
+            self.assertEqual(len(island['verts']), len(reference['py_verts']))
+            self.assertEqual(sorted(map(tuple, np.round(island['verts'], 6))),
+                             sorted(tuple(round(c, 6) for c in co) for co in reference['py_verts']))
+
+    def test_non_manifold_edge_splits_islands(self):
+        """3 faces on one edge do not connect through it, like in _get_face_islands()."""
+        bm = bmesh.new()
+        a = bm.verts.new((0.0, 0.0, 0.0))
+        b = bm.verts.new((0.0, 0.0, 1.0))
+        for co in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (-1.0, 0.0, 0.0)):
+            bm.faces.new((a, b, bm.verts.new(co)))
+
+        islands, expected = self._islands_of(bm)
+        self.assertEqual(len(islands), 3)
+        self.assertEqual(len(expected), 3)
+
+    def test_face_vertices_index_island_verts(self):
+        bm = _make_bm_with_islands(4)
+        islands, _ = self._islands_of(bm)
+        for island in islands:
+            np.testing.assert_array_equal(island['face_sizes'], (3,))
+            self.assertEqual(sorted(island['face_verts']), [0, 1, 2])
+
+    def test_union_find_roots(self):
+        roots = _union_find_roots(7, (5, 1, 3, 6), (4, 3, 0, 4))
+        np.testing.assert_array_equal(roots, (0, 0, 2, 0, 4, 4, 4))
+
+    def test_selected_only(self):
+        """Faces with an unselected vertex are dropped, like with delete_non_selected_verts()."""
+        bm = _make_connected_grid(1, 3)
+        for vert in bm.verts:
+            vert.select = vert.co.x != 1.0
+        bm.to_mesh(self.mesh)
+        bm.free()
+
+        islands = _get_mesh_islands(self.mesh, selected_only=True)
+        self.assertEqual(len(islands), 1)
+        np.testing.assert_array_equal(islands[0]['face_sizes'], (4,))
+        self.assertEqual(sorted(islands[0]['verts'][:, 0]), [2.0, 2.0, 3.0, 3.0])
+
+
+class TestIslandRecords(unittest.TestCase):
+    """Island records stand in for the temporary island objects."""
+
+    def setUp(self):
+        mesh = bpy.data.meshes.new('island_record_mesh')
+        bm = _make_bm_with_islands(3)
+        bm.to_mesh(mesh)
+        bm.free()
+        self.obj = bpy.data.objects.new('island_record_obj', mesh)
+        self.obj.matrix_world = Matrix.Translation((0.0, 0.0, 5.0))
+
+    def tearDown(self):
+        mesh = self.obj.data
+        bpy.data.objects.remove(self.obj)
+        bpy.data.meshes.remove(mesh)
+
+    def test_world_space_records(self):
+        objects_before = len(bpy.data.objects)
+        meshes_before = len(bpy.data.meshes)
+        records = _get_island_records(self.obj, use_world=True)
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(len(bpy.data.objects), objects_before)
+        self.assertEqual(len(bpy.data.meshes), meshes_before)
+        for record in records:
+            np.testing.assert_allclose(record.verts[:, 2], 5.0)
+            self.assertEqual(record.matrix_world, Matrix.Identity(4))
+            self.assertEqual(record.source_matrix, self.obj.matrix_world)
+
+    def test_local_space_records(self):
+        for record in _get_island_records(self.obj, use_world=False):
+            np.testing.assert_allclose(record.verts[:, 2], 0.0)
+            self.assertEqual(record.matrix_world, self.obj.matrix_world)
+
+    def test_record_to_mesh(self):
+        record = _get_island_records(self.obj)[1]
+        mesh = record.to_mesh()
+        try:
+            self.assertEqual(len(mesh.vertices), 3)
+            self.assertEqual(len(mesh.polygons), 1)
+        finally:
+            bpy.data.meshes.remove(mesh)
+
+
 class TestConstructPythonFacesLifetime(unittest.TestCase):
     """Vertex coordinates stored by construct_python_faces must be independent
     copies, not live aliases into BMesh-backed memory.
@@ -0,0 +1,103 @@
+"""Unit tests for the batched oriented bounding box search
+(bmesh_operations.oriented_box) used by the Oriented Minimum BBox operator
+and the validation checks.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_oriented_box.py
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+from mathutils import Euler
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_obb_mod = _addon.bmesh_operations.oriented_box
+
+convex_hull_arrays = _obb_mod.convex_hull_arrays
+hull_face_frames = _obb_mod.hull_face_frames
+minimum_oriented_box = _obb_mod.minimum_oriented_box
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _rotation():
+    return np.array(Euler((0.4, -0.9, 1.3)).to_matrix())
+
+
+def _box_points(size=(4.0, 2.0, 1.0), interior=500, seed=0):
+    """Corners plus random interior points of a rotated, offset box."""
+    rng = np.random.default_rng(seed)
+    half = np.array(size) / 2
+    corners = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]) * half
+    inside = rng.uniform(-1.0, 1.0, size=(interior, 3)) * half
+    return np.vstack((corners, inside)) @ _rotation().T + np.array([3.0, -1.0, 2.0])
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestOrientedBox(unittest.TestCase):
+
+    def test_hull_arrays_of_box(self):
+        points, triangles, volume = convex_hull_arrays(_box_points())
+        self.assertEqual(len(points), 8)
+        self.assertEqual(len(triangles), 12)
+        self.assertAlmostEqual(volume, 8.0, places=3)
+
+    def test_coplanar_faces_share_frames(self):
+        points, triangles, _ = convex_hull_arrays(_box_points())
+        # 12 triangles x 3 edges, but every side edge of every face yields
+        # the same box orientation.
+        self.assertLess(len(hull_face_frames(points, triangles)), 3 * len(triangles))
+
+    def test_frames_are_right_handed_rotations(self):
+        points, triangles, _ = convex_hull_arrays(_box_points())
+        for frame in hull_face_frames(points, triangles):
+            np.testing.assert_allclose(frame @ frame.T, np.eye(3), atol=1e-6)
+            self.assertAlmostEqual(np.linalg.det(frame), 1.0, places=6)
+
+    def test_rotated_box_is_recovered(self):
+        points, triangles, _ = convex_hull_arrays(_box_points())
+        frame, bb_min, bb_max = minimum_oriented_box(points, triangles, refine=False)
+        self.assertAlmostEqual(float(np.prod(bb_max - bb_min)), 8.0, places=3)
+        np.testing.assert_allclose(np.sort(bb_max - bb_min), (1.0, 2.0, 4.0), atol=1e-4)
+
+    def test_refinement_matches_exhaustive_search_on_box(self):
+        points, triangles, _ = convex_hull_arrays(_box_points())
+        _, bb_min, bb_max = minimum_oriented_box(points, triangles, refine=True)
+        self.assertAlmostEqual(float(np.prod(bb_max - bb_min)), 8.0, places=3)
+
+    def test_refinement_on_dense_hull(self):
+        rng = np.random.default_rng(1)
+        sphere = rng.normal(size=(3000, 3))
+        sphere /= np.linalg.norm(sphere, axis=1)[:, None]
+        points, triangles, _ = convex_hull_arrays(sphere * np.array([3.0, 2.0, 1.0]))
+        _, bb_min, bb_max = minimum_oriented_box(points, triangles, refine=False)
+        _, ref_min, ref_max = minimum_oriented_box(points, triangles, refine=True)
+        exhaustive = float(np.prod(bb_max - bb_min))
+        refined = float(np.prod(ref_max - ref_min))
+        self.assertLess(refined, exhaustive * 1.01)
+
+    def test_no_valid_face_has_no_box(self):
+        points = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0)])
+        triangles = np.array([(0, 1, 2)])
+        self.assertEqual(minimum_oriented_box(points, triangles), (None, None, None))
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Unit tests for the extreme-point prefilter (bmesh_operations.point_prefilter)
+that runs in front of the enclosing-shape fitters.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_point_prefilter.py
+"""
+import os
+import sys
+import unittest
+
+import bmesh
+import numpy as np
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_prefilter_mod = _addon.bmesh_operations.point_prefilter
+_arrays_mod = _addon.bmesh_operations.vertex_arrays
+_sphere_mod = _addon.bmesh_operations.bounding_sphere
+
+hull_candidate_mask = _prefilter_mod.hull_candidate_mask
+prefilter_hull_candidates = _prefilter_mod.prefilter_hull_candidates
+MIN_PREFILTER_POINTS = _prefilter_mod.MIN_PREFILTER_POINTS
+bmesh_from_coordinates = _arrays_mod.bmesh_from_coordinates
+minimum_enclosing_sphere = _sphere_mod.minimum_enclosing_sphere
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _random_cloud(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-1.0, 1.0, size=(count, 3))
+
+
+def _hull_vertex_indices(points):
+    """Indices of the points bmesh.ops.convex_hull() puts on the hull."""
+    bm = bmesh_from_coordinates(points)
+    try:
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        bm.verts.index_update()
+        hull_verts = {v for geom in result['geom'] if isinstance(geom, bmesh.types.BMFace) for v in geom.verts}
+        return {v.index for v in hull_verts}
+    finally:
+        bm.free()
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestPointPrefilter(unittest.TestCase):
+
+    def test_dense_cloud_is_culled(self):
+        points = _random_cloud(20000)
+        kept = prefilter_hull_candidates(points)
+        self.assertLess(len(kept), len(points) // 4)
+
+    def test_hull_vertices_are_kept(self):
+        points = _random_cloud(5000, seed=1)
+        mask = hull_candidate_mask(points)
+        for index in _hull_vertex_indices(points):
+            self.assertTrue(mask[index])
+
+    def test_stretched_cloud_keeps_bounding_box(self):
+        points = _random_cloud(10000, seed=2) * np.array([50.0, 0.1, 3.0]) + np.array([4.0, -2.0, 7.0])
+        kept = prefilter_hull_candidates(points)
+        self.assertLess(len(kept), len(points) // 4)
+        np.testing.assert_array_equal(kept.min(axis=0), points.min(axis=0))
+        np.testing.assert_array_equal(kept.max(axis=0), points.max(axis=0))
+
+    def test_sphere_fit_is_unchanged(self):
+        points = _random_cloud(3000, seed=3)
+        center, radius = minimum_enclosing_sphere(points)
+        center_f, radius_f = minimum_enclosing_sphere(prefilter_hull_candidates(points))
+        self.assertAlmostEqual(radius, radius_f, places=5)
+        np.testing.assert_allclose(center_f, center, atol=1e-5)
+
+    def test_planar_input_is_unchanged(self):
+        points = _random_cloud(500, seed=4)
+        points[:, 2] = 0.5
+        self.assertTrue(hull_candidate_mask(points).all())
+
+    def test_surface_cloud_skips_the_cull(self):
+        rng = np.random.default_rng(6)
+        points = rng.normal(size=(50000, 3))
+        points /= np.linalg.norm(points, axis=1)[:, None]
+        self.assertTrue(hull_candidate_mask(points).all())
+
+    def test_small_input_is_unchanged(self):
+        points = _random_cloud(MIN_PREFILTER_POINTS - 1, seed=5)
+        self.assertTrue(hull_candidate_mask(points).all())
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
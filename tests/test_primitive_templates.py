@@ -0,0 +1,88 @@
+"""Unit tests for the cached unit primitives (bmesh_operations.primitive_templates)
+used by the Sphere, Cylinder and Capsule colliders.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_primitive_templates.py
+"""
+import os
+import sys
+import unittest
+
+import bpy
+import numpy as np
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_templates_mod = _addon.bmesh_operations.primitive_templates
+create_capsule_data = _addon.bmesh_operations.capsule_generation.create_capsule_data
+
+primitive_template = _templates_mod.primitive_template
+write_primitive_mesh = _templates_mod.write_primitive_mesh
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+def _mesh_coordinates(mesh):
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    return coords.reshape(-1, 3)
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestPrimitiveTemplates(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = bpy.data.meshes.new('primitive_template_mesh')
+
+    def tearDown(self):
+        bpy.data.meshes.remove(self.mesh)
+
+    def test_templates_are_cached(self):
+        self.assertIs(primitive_template('sphere', 8), primitive_template('sphere', 8))
+        self.assertIsNot(primitive_template('sphere', 8), primitive_template('sphere', 9))
+
+    def test_unknown_shape(self):
+        with self.assertRaises(ValueError):
+            primitive_template('cone', 8)
+
+    def test_sphere(self):
+        write_primitive_mesh(self.mesh, primitive_template('sphere', 6), (2.5, 2.5, 2.5))
+        np.testing.assert_allclose(np.linalg.norm(_mesh_coordinates(self.mesh), axis=1), 2.5, rtol=1e-6)
+        self.assertTrue(all(poly.use_smooth for poly in self.mesh.polygons))
+
+    def test_cylinder(self):
+        write_primitive_mesh(self.mesh, primitive_template('cylinder', 16), (0.5, 0.5, 3.0))
+        coords = _mesh_coordinates(self.mesh)
+        np.testing.assert_allclose(np.linalg.norm(coords[:, :2], axis=1).max(), 0.5, rtol=1e-6)
+        np.testing.assert_allclose((coords[:, 2].min(), coords[:, 2].max()), (-1.5, 1.5), rtol=1e-6)
+        self.assertEqual(len(self.mesh.uv_layers), 1)
+
+    def test_capsule_matches_capsule_data(self):
+        radius, depth = 0.7, 3.0
+        write_primitive_mesh(self.mesh, primitive_template('capsule', 12), (radius, radius, radius),
+                             half_depth=depth * 0.5)
+        expected = np.array(create_capsule_data(longitudes=12, latitudes=12, depth=depth, radius=radius)['vs'])
+        np.testing.assert_allclose(_mesh_coordinates(self.mesh), expected, atol=1e-6)
+
+    def test_rewrite_in_place(self):
+        write_primitive_mesh(self.mesh, primitive_template('sphere', 16), (1.0, 1.0, 1.0))
+        write_primitive_mesh(self.mesh, primitive_template('sphere', 4), (1.0, 1.0, 1.0))
+        self.assertEqual(len(self.mesh.vertices), len(primitive_template('sphere', 4)['coords']))
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
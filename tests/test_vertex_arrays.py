@@ -0,0 +1,181 @@
+"""Unit tests for the array-backed vertex extraction helpers
+(bmesh_operations.vertex_arrays) shared by the collider shape operators.
+
+Run with headless Blender::
+
+    blender --background --python tests/test_vertex_arrays.py
+"""
+import os
+import sys
+import unittest
+
+import bpy
+import numpy as np
+from mathutils import Euler, Matrix, Vector
+
+# Make the add-on importable as a package.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ADDON_NAME = os.path.basename(_PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(_PROJECT_ROOT))
+
+_addon = __import__(_ADDON_NAME)
+_arrays_mod = _addon.bmesh_operations.vertex_arrays
+
+mesh_vertex_coordinates = _arrays_mod.mesh_vertex_coordinates
+bmesh_vertex_coordinates = _arrays_mod.bmesh_vertex_coordinates
+transform_coordinates = _arrays_mod.transform_coordinates
+as_coordinate_array = _arrays_mod.as_coordinate_array
+bmesh_from_coordinates = _arrays_mod.bmesh_from_coordinates
+mesh_join = _arrays_mod.mesh_join
+
+
+# -- Helpers -----------------------------------------------------------------
+
+
+_VERTS = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 2.0, 0.0), (0.0, 2.0, 3.0)]
+
+
+def _make_mesh(verts=_VERTS):
+    mesh = bpy.data.meshes.new('TestVertexArrayMesh')
+    mesh.from_pydata(verts, [], [])
+    mesh.update()
+    return mesh
+
+
+def _test_matrix():
+    return Matrix.LocRotScale(Vector((1.0, -2.0, 0.5)), Euler((0.3, -0.7, 1.1)), Vector((2.0, 0.5, 1.5)))
+
+
+# -- Tests -------------------------------------------------------------------
+
+
+class TestVertexArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.mesh = _make_mesh()
+
+    def tearDown(self):
+        bpy.data.meshes.remove(self.mesh)
+
+    def test_mesh_coordinates_match_vertices(self):
+        coords = mesh_vertex_coordinates(self.mesh)
+        self.assertEqual(coords.shape, (len(_VERTS), 3))
+        np.testing.assert_allclose(coords, np.array(_VERTS), atol=1e-6)
+
+    def test_selected_only_uses_selection_mask(self):
+        for i, v in enumerate(self.mesh.vertices):
+            v.select = i % 2 == 1
+        coords = mesh_vertex_coordinates(self.mesh, selected_only=True)
+        np.testing.assert_allclose(coords, np.array(_VERTS)[1::2], atol=1e-6)
+
+    def test_empty_mesh_returns_empty_array(self):
+        empty = bpy.data.meshes.new('TestVertexArrayEmpty')
+        self.addCleanup(bpy.data.meshes.remove, empty)
+        self.assertEqual(mesh_vertex_coordinates(empty).shape, (0, 3))
+
+    def test_transform_matches_matrix_vector_product(self):
+        mtx = _test_matrix()
+        coords = transform_coordinates(mesh_vertex_coordinates(self.mesh), mtx)
+        expected = np.array([mtx @ Vector(co) for co in _VERTS])
+        np.testing.assert_allclose(coords, expected, atol=1e-5)
+
+    def test_transform_round_trip_with_inverse(self):
+        mtx = _test_matrix()
+        coords = mesh_vertex_coordinates(self.mesh)
+        round_trip = transform_coordinates(transform_coordinates(coords, mtx), mtx.inverted())
+        np.testing.assert_allclose(round_trip, coords, atol=1e-5)
+
+    def test_bmesh_round_trip(self):
+        coords = mesh_vertex_coordinates(self.mesh)
+        bm = bmesh_from_coordinates(coords)
+        self.addCleanup(bm.free)
+        self.assertEqual(len(bm.verts), len(_VERTS))
+        np.testing.assert_allclose(bmesh_vertex_coordinates(bm), coords, atol=1e-6)
+
+    def test_bmesh_from_coordinates_does_not_leak_meshes(self):
+        count = len(bpy.data.meshes)
+        bm = bmesh_from_coordinates(np.array(_VERTS))
+        bm.free()
+        self.assertEqual(len(bpy.data.meshes), count)
+
+    def test_as_coordinate_array_accepts_vertex_collections(self):
+        from_collection = as_coordinate_array(self.mesh.vertices)
+        from_list = as_coordinate_array(list(self.mesh.vertices))
+        np.testing.assert_allclose(from_collection, np.array(_VERTS), atol=1e-6)
+        np.testing.assert_allclose(from_list, from_collection)
+
+
+class TestMeshJoin(unittest.TestCase):
+
+    _QUAD = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+
+    def setUp(self):
+        self.meshes = []
+        self.materials = [bpy.data.materials.new(f'TestMeshJoin{i}') for i in range(3)]
+
+    def tearDown(self):
+        for mesh in self.meshes:
+            bpy.data.meshes.remove(mesh)
+        for material in self.materials:
+            bpy.data.materials.remove(material)
+
+    def _quad(self, materials=(), edges=()):
+        mesh = bpy.data.meshes.new('TestMeshJoinQuad')
+        mesh.from_pydata(self._QUAD + [(0.0, 0.0, 1.0)], list(edges), [(0, 1, 2, 3)])
+        mesh.update()
+        for material in materials:
+            mesh.materials.append(material)
+        mesh.polygons[0].material_index = len(materials) - 1 if materials else 0
+        self.meshes.append(mesh)
+        return mesh
+
+    def _join(self, meshes, matrices, **kwargs):
+        mesh = mesh_join(meshes, matrices, **kwargs)
+        if mesh not in self.meshes:
+            self.meshes.append(mesh)
+        return mesh
+
+    def test_concatenates_transformed_geometry(self):
+        first, second = self._quad(), self._quad()
+        offset = Matrix.Translation((2.0, 0.0, 0.0))
+        mesh = self._join([first, second], [Matrix.Identity(4), offset])
+
+        self.assertEqual(len(mesh.vertices), 10)
+        self.assertEqual(len(mesh.polygons), 2)
+        coords = mesh_vertex_coordinates(mesh)
+        np.testing.assert_allclose(coords[5:], mesh_vertex_coordinates(second) + (2.0, 0.0, 0.0), atol=1e-6)
+        self.assertEqual(tuple(mesh.polygons[1].vertices), (5, 6, 7, 8))
+
+    def test_merges_materials(self):
+        a, b, c = self.materials
+        first, second = self._quad(materials=(a, b)), self._quad(materials=(b, c))
+        mesh = self._join([first, second], [Matrix.Identity(4)] * 2)
+
+        self.assertEqual(list(mesh.materials), [a, b, c])
+        self.assertEqual([poly.material_index for poly in mesh.polygons], [1, 2])
+
+    def test_mirrored_faces_keep_outward_normals(self):
+        # The quad lies in the mirror plane: only its normal is mirrored.
+        mesh = self._join([self._quad()], [Matrix.Scale(-1.0, 4, (0.0, 0.0, 1.0))])
+        self.assertAlmostEqual(mesh.polygons[0].normal.z, -1.0, places=5)
+
+    def test_keeps_loose_edges(self):
+        mesh = self._join([self._quad(edges=[(0, 4)])], [Matrix.Identity(4)])
+        self.assertIn((0, 4), [tuple(sorted(edge.vertices)) for edge in mesh.edges])
+        self.assertEqual(len(mesh.edges), 5)
+
+    def test_writes_into_input_mesh(self):
+        first, second = self._quad(), self._quad()
+        mesh = self._join([first, second], [Matrix.Identity(4)] * 2, mesh=first)
+        self.assertIs(mesh, first)
+        self.assertEqual(len(first.polygons), 2)
+
+
+if __name__ == '__main__':
+    # Strip Blender's argv; everything after '--' is forwarded to unittest.
+    try:
+        idx = sys.argv.index('--')
+        sys.argv = [sys.argv[0]] + sys.argv[idx + 1:]
+    except ValueError:
+        sys.argv = [sys.argv[0]]
+    unittest.main()
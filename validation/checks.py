@@ -4,9 +4,11 @@ from dataclasses import dataclass
 import bmesh
 import numpy as np
 
+from ..bmesh_operations.bounding_sphere import minimum_enclosing_sphere
+from ..bmesh_operations.oriented_box import convex_hull_arrays, minimum_oriented_box
+from ..bmesh_operations.point_prefilter import prefilter_hull_candidates
+from ..bmesh_operations.vertex_arrays import mesh_vertex_coordinates, transform_coordinates
 from ..bmesh_operations.voxel_generation import mesh_max_dimension
-from ..collider_shapes.add_bounding_sphere import OBJECT_OT_add_bounding_sphere
-from ..collider_shapes.add_minimum_bounding_box import OBJECT_OT_add_aligned_bounding_box
 from ..properties.constants import VALID_OBJECT_TYPES
 
 
@@ -24,13 +26,9 @@ def _world_coords(obj, depsgraph):
     mesh = obj_eval.data
     if len(mesh.vertices) == 0:
         return np.empty((0, 3))
-    # obj.matrix_world is a 4x4 mathutils.Matrix; numpy's `@` can't multiply it
-    # directly against an (N, 3) array, so the rotation/scale submatrix and
-    # translation are applied explicitly (same pattern as
-    # add_bounding_primitive.set_origin_to_center_of_mass).
-    verts_local = np.array([v.co for v in mesh.vertices])
-    mat_world = np.array(obj.matrix_world)
-    return verts_local @ mat_world[:3, :3].T + mat_world[:3, 3]
+    # Read in bulk and transformed with one matrix multiply (see
+    # bmesh_operations/vertex_arrays.py), the same as the collider operators.
+    return transform_coordinates(mesh_vertex_coordinates(mesh), obj.matrix_world)
 
 
 def _world_aabb(obj, depsgraph):
@@ -243,47 +241,21 @@ class _ShapeMetrics:
 
 
 def _convex_hull_metrics(local_verts):
-    """Build the convex hull of `local_verts` as a scratch bmesh (the same
-    vert-only-then-convex_hull-then-delete-unused pattern already used in
-    add_bounding_convex_hull.py) and return (hull_volume, hull_vert_count,
-    min_obb_volume). The minimum-volume oriented bounding box is computed via
-    the same rotating-calipers approach as the Oriented Minimum BBox operator
-    (add_minimum_bounding_box.py), reusing its pure `rotating_calipers`
-    static method directly rather than the full obj_rotating_calipers
+    """Build the convex hull of `local_verts` and return (hull_volume,
+    hull_vert_count, min_obb_volume). The minimum-volume oriented bounding
+    box comes from the same batched search the Oriented Minimum BBox operator
+    uses (bmesh_operations/oriented_box.py), called directly on the hull
+    arrays rather than through the operator's coords_rotating_calipers
     classmethod, which additionally creates real bpy.data mesh/object side
     effects we don't want from a read-only check."""
-    bm = bmesh.new()
-    for co in local_verts:
-        bm.verts.new(co)
-    hull = bmesh.ops.convex_hull(bm, input=bm.verts)
-    bmesh.ops.delete(bm, geom=hull['geom_unused'], context='VERTS')
-    bm.verts.ensure_lookup_table()
-
-    hull_volume = abs(bm.calc_volume(signed=False))
-    hull_vert_count = len(bm.verts)
-    hull_points = np.array([v.co for v in bm.verts])
-
-    bases = []
-    for face in bm.faces:
-        if len(face.verts) != 3:
-            continue
-        face_normal = face.normal
-        if np.allclose(face_normal, 0, atol=0.00001):
-            continue
-        for e in face.edges:
-            v0, v1 = e.verts
-            edge_vec = (v0.co - v1.co).normalized()
-            co_tangent = face_normal.cross(edge_vec)
-            bases.append((edge_vec, co_tangent, face_normal))
+    hull_points, hull_triangles, hull_volume = convex_hull_arrays(local_verts)
 
     obb_volume = None
-    if bases:
-        _, bb_max, bb_min = OBJECT_OT_add_aligned_bounding_box.rotating_calipers(hull_points, bases)
-        if bb_min is not None and bb_max is not None:
-            obb_volume = float(np.prod(bb_max - bb_min))
+    frame, bb_min, bb_max = minimum_oriented_box(hull_points, hull_triangles)
+    if frame is not None:
+        obb_volume = float(np.prod(bb_max - bb_min))
 
-    bm.free()
-    return hull_volume, hull_vert_count, obb_volume
+    return hull_volume, len(hull_points), obb_volume
 
 
 def _shape_metrics(collider_obj, depsgraph):
@@ -304,7 +276,7 @@ def _shape_metrics(collider_obj, depsgraph):
         bm.free()
         if mesh_volume == 0:
             return None
-        local_verts = [v.co.copy() for v in mesh.vertices]
+        local_verts = mesh_vertex_coordinates(mesh)
     finally:
         obj_eval.to_mesh_clear()
 
@@ -418,14 +390,12 @@ def _render_mesh_shape_metrics(render_obj, depsgraph):
         if mesh_volume == 0:
             return None
 
-        mat_world = np.array(render_obj.matrix_world)
-        local_verts = np.array([v.co for v in mesh.vertices])
-        world_verts = local_verts @ mat_world[:3, :3].T + mat_world[:3, 3]
-
-        _, sphere_radius = OBJECT_OT_add_bounding_sphere.calculate_bounding_sphere(render_obj, mesh.vertices)
+        world_verts = transform_coordinates(mesh_vertex_coordinates(mesh), render_obj.matrix_world)
     finally:
         obj_eval.to_mesh_clear()
 
+    _, sphere_radius = minimum_enclosing_sphere(prefilter_hull_candidates(world_verts))
+
     hull_volume, _, obb_volume = _convex_hull_metrics(world_verts)
     if hull_volume == 0:
         return None